@@ -31,11 +31,14 @@ class AbstractApp(metaclass=ABCMeta):
         debug_all: bool = False,
         quiet_all: bool = False,
         solver: SolverName | None = None,
+        config: ConfigProtocol | None = None,
     ) -> "AbstractApp":
         """Create app without animation. For tests, scripts, and as first step for GUI.
 
         The app is always born without animation (Noop markers, no AnimationManager).
         Animation is injected later by the backend via ``enable_animation()``.
+        ``config`` defaults to a fresh AppConfig; pass ``other.config.copy()`` to
+        create an app with another app's settings.
 
         Creation flow::
 
@@ -67,7 +70,8 @@ class AbstractApp(metaclass=ABCMeta):
         from .app import _App
         from .config_impl import AppConfig
 
-        config = AppConfig()
+        if config is None:
+            config = AppConfig()
         vs = ApplicationAndViewState(config, debug_all=debug_all, quiet_all=quiet_all)
         app: _App = _App(config, vs, cube_size, solver)
 
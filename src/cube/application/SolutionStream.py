@@ -0,0 +1,155 @@
+"""Solution moves delivered while the solver is still computing them.
+
+``Solver.solution()`` solves, then undoes everything, and only then returns
+the whole solution - on big cubes the caller waits seconds for the first
+move. ``SolutionStream`` solves a copy of the cube in a worker thread and
+hands over each move as soon as the solver commits it (see
+``Operator.with_play_listener``), so a GUI can start playing the centers
+while the edges and the 3x3 stage are still being computed::
+
+    stream = SolutionStream(app)          # snapshot of app.cube, app.slv, app.config
+    for alg in stream:                    # blocking
+        ...
+
+    async for chunk in SolutionStream(app).chunks():   # event loop
+        app.op.extend_redo(chunk)
+
+The copy is solved with the source app's settings (buffer mode, solver
+options), so it finds the same solution as ``app.slv`` would. The source app
+is only read in the constructor; the stream can be consumed while it keeps
+changing. Playing the moves in order on the snapshot state
+solves the cube. Closing or abandoning the iteration aborts the copy's solver.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cube.application.AbstractApp import AbstractApp
+    from cube.domain.algs.Alg import Alg
+
+
+class SolutionStream:
+    """Solve a snapshot of an app's cube in a worker thread. See module docstring."""
+
+    __slots__ = ["_size", "_facelets", "_solver", "_config", "_app", "_thread",
+                 "_cond", "_pending", "_done", "_closed", "_error", "_waker"]
+
+    def __init__(self, app: "AbstractApp") -> None:
+        # Only the snapshot is taken here - the copy is built in the worker
+        self._size = app.cube.size
+        self._facelets = app.cube.get_facelets()
+        self._solver = app.slv.get_code
+        self._config = app.config.copy()
+        self._app: AbstractApp | None = None
+        self._thread: threading.Thread | None = None
+
+        # Guards _pending, _done and _waker, shared with the worker
+        self._cond = threading.Condition()
+        self._pending: list[Alg] = []
+        self._done = False
+        self._closed = False
+        self._error: BaseException | None = None
+        # Wakes an async consumer, set only while it waits
+        self._waker: Callable[[], None] | None = None
+
+    def start(self) -> None:
+        """Start the worker; called by the iterators, idempotent."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="solution-stream", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Abort the solve; moves not taken yet are dropped."""
+        with self._cond:
+            self._closed = True
+            app = self._app
+        if app is not None and not self._done:
+            app.op.abort()
+
+    @property
+    def done(self) -> bool:
+        """The solver finished (or failed) and every move was produced."""
+        return self._done
+
+    def __iter__(self) -> Iterator["Alg"]:
+        self.start()
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending and not self._done:
+                        self._cond.wait()
+                    chunk, done = self._take()
+                yield from chunk
+                if done:
+                    break
+            self._raise_error()
+        finally:
+            self.close()
+
+    async def chunks(self) -> AsyncIterator[list["Alg"]]:
+        """Async iterator of the moves: each chunk is all moves produced since the previous one."""
+        loop = asyncio.get_running_loop()
+        self.start()
+        try:
+            while True:
+                wake = asyncio.Event()
+                with self._cond:
+                    chunk, done = self._take()
+                    if not chunk and not done:
+                        self._waker = lambda: loop.call_soon_threadsafe(wake.set)
+                if chunk:
+                    yield chunk
+                if done:
+                    break
+                if not chunk:
+                    await wake.wait()
+            self._raise_error()
+        finally:
+            self.close()
+
+    def _take(self) -> tuple[list["Alg"], bool]:
+        # Caller holds _cond. Taking _done with the moves: none can follow it.
+        chunk, self._pending = self._pending, []
+        return chunk, self._done
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    # -- Worker thread --
+
+    def _emit(self, alg: "Alg") -> None:
+        with self._cond:
+            self._pending.append(alg)
+            self._notify()
+
+    def _notify(self) -> None:
+        self._cond.notify()
+        if self._waker is not None:
+            waker, self._waker = self._waker, None
+            waker()
+
+    def _run(self) -> None:
+        from cube.application.AbstractApp import AbstractApp
+
+        try:
+            app = AbstractApp.create_app(cube_size=self._size, quiet_all=True, config=self._config)
+            app.cube.set_facelets(self._facelets)
+            app.switch_to_solver(self._solver)
+            with self._cond:
+                self._app = app
+                closed = self._closed
+            if not closed:
+                with app.op.with_play_listener(self._emit):
+                    app.slv.solve(animation=False, debug=False)
+        except BaseException as e:
+            self._error = e
+        finally:
+            with self._cond:
+                self._done = True
+                self._notify()
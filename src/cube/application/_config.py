@@ -41,6 +41,10 @@ class AnimationSpeedConfig:
     # Timeout (seconds) for blocking mode wait — prevents permanent hang
     # if WebSocket dies without reconnect
     blocking_timeout: float = 60.0
+    # Turbo playback: max moves coalesced into one animation_batch message.
+    # The actual batch size adapts to the measured round trip and the speed
+    # index; 1 disables coalescing (one animation_start per move)
+    turbo_max_batch: int = 64
 
 
 @dataclass
@@ -102,6 +106,56 @@ class SessionConfig:
     # If the client reconnects within this window, their cube state is restored.
     # Set to 0 to disable server-side session keep-alive.
     keepalive_timeout: int = 30 * 60  # 30 minutes
+    # Hibernate dormant sessions: keep only a compact record (cube facelets,
+    # encoded history/redo, solver, toggles) and free the live app. The app is
+    # rebuilt when the client reconnects.
+    hibernate_dormant: bool = True
+    # Global budget (bytes) for hibernated records; the least recently
+    # disconnected are dropped first when it is exceeded.
+    dormant_memory_budget: int = 64 * 1024 * 1024
+    # Number of worker processes hosting sessions. 0 = all sessions in the
+    # server process. With N > 0 the server process only owns the websockets
+    # and forwards messages to N workers (see webgl/SessionSharding.py).
+    workers: int = 0
+    # Workers are pinged every worker_health_interval seconds; a worker that
+    # has not answered for worker_health_timeout seconds is restarted.
+    worker_health_interval: float = 5.0
+    worker_health_timeout: float = 15.0
+    # Let clients turn the process-wide metrics on/off and reset them with
+    # 'get_metrics'. Off: clients only read them, the operator enables
+    # collection with CUBE_METRICS=1.
+    metrics_control: bool = False
+
+
+@dataclass
+class SolveApiConfig:
+    """Stateless ``POST /api/solve`` endpoint (webgl server)."""
+    enabled: bool = False
+    # Size of the process pool running the solves
+    workers: int = 2
+    # Solves allowed to wait for a free worker; beyond that the server answers 429
+    max_queue: int = 16
+    # Per client (IP) token bucket: sustained requests per minute, and burst size
+    rate_per_minute: int = 30
+    burst: int = 10
+    # Behind a reverse proxy: rate limit on the last X-Forwarded-For entry (the
+    # proxy's) instead of the peer address. Never enable without such a proxy.
+    trust_forwarded_for: bool = False
+    # Request deadline (seconds) when the client does not send deadline_ms, and its upper bound
+    default_deadline: float = 30.0
+    max_deadline: float = 120.0
+    max_cube_size: int = 7
+
+
+@dataclass
+class BestOfConfig:
+    """Best-of-N solving (Solvers.best_of)."""
+    # Variants solved: first face color x whole cube rotation before solving
+    candidates: int = 6
+    # Size of the process pool solving the candidates, 0 = in the calling process
+    workers: int = 4
+    # Seconds to wait for the candidates; the shortest finished solution wins
+    time_budget: float = 30.0
 
 
 ########## Per-session configuration ##########
@@ -189,18 +243,25 @@ class ConfigData:
     solver_sanity_check_is_a_boy: bool = False
     lbl_sanity_check: bool = False
     first_face_color: _Color = _Color.WHITE
+    best_of_config: BestOfConfig = field(default_factory=BestOfConfig)
 
     # ── Optimizer flags ──
     optimize_odd_cube_centers_switch_centers: bool = False
     optimize_big_cube_centers_search_complete_slices: bool = True
     optimize_big_cube_centers_search_complete_slices_only_target_zero: bool = True
     optimize_big_cube_centers_search_blocks: bool = True
+    optimize_big_cube_centers_lookahead_depth: int = 0
+    optimize_big_cube_centers_lookahead_width: int = 3
+    optimize_solution: bool = True
+    optimize_solution_window: int = 0
 
     # ── Model ──
     short_part_name: bool = False
     dont_optimized_part_id: bool = False
     print_cube_as_text_during_solve: bool = False
     check_cube_sanity: bool = False
+    check_cube_sanity_incremental: bool = True
+    check_cube_sanity_full_every: int = 0
 
     # ── Operator ──
     operator_show_alg_annotation: bool = True
@@ -266,6 +327,10 @@ class ConfigData:
     # ── Logging ──
     operation_log: bool = False
     operation_log_path: str = ".logs/operation.log"
+    # Replayable binary move stream next to the text log, see OperationLog
+    operation_log_binary_path: str | None = None
+    operation_log_flush_lines: int = 1000
+    operation_log_flush_interval: float = 1.0
     last_scramble_path: str = ".logs/last_scramble.txt"
 
     # ── Celebration ──
@@ -286,6 +351,7 @@ class ConfigData:
 
     # ── Session (WebGL) ──
     session_config: SessionConfig = field(default_factory=SessionConfig)
+    solve_api_config: SolveApiConfig = field(default_factory=SolveApiConfig)
 
     # ── Listeners (NOT copied) ──
     _listeners: list[ConfigListener] = field(default_factory=list, repr=False, compare=False)
@@ -0,0 +1,49 @@
+"""Reusable apps for process-pool workers, one per pool kind and cube size.
+
+A solve pool process (POST /api/solve, best-of-N candidates) solves many
+cubes of the same few sizes. It keeps one app per size and overwrites its
+stickers for each job instead of building a new app::
+
+    app = pooled_app("solve_api", size)    # empty history and redo queue
+    ... overwrite every sticker ...
+    try:
+        app.slv.solve(animation=False)
+    except Exception:
+        discard_pooled_app("solve_api", size)
+        raise
+
+Each caller uses its own ``kind``, so config changes one makes on its apps
+(e.g. best-of-N's first face color) never reach another's.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cube.application.AbstractApp import AbstractApp
+
+# Per process: (kind, cube size) -> app
+_APPS: dict[tuple[str, int], "AbstractApp"] = {}
+
+
+def pooled_app(kind: str, size: int) -> "AbstractApp":
+    """This process's app of ``kind`` for ``size``, with empty history and redo queue.
+
+    The cube keeps the state the previous job left; the caller sets every sticker.
+    """
+    app = _APPS.get((kind, size))
+    if app is None:
+        from cube.application.AbstractApp import AbstractApp
+
+        app = _APPS[kind, size] = AbstractApp.create_app(cube_size=size, quiet_all=True)
+    else:
+        # Not op.reset(): it would rebuild the cube
+        app.op.clear_history()
+        app.op.clear_redo()
+    return app
+
+
+def discard_pooled_app(kind: str, size: int) -> None:
+    """Do not reuse the app, e.g. after a solver failed and may have left it in an odd state."""
+    _APPS.pop((kind, size), None)
@@ -0,0 +1,329 @@
+"""Compact, array-backed stack of algorithms for Operator history and redo queue.
+
+A webgl session keeps its whole history (scramble + solve, tens of thousands of
+moves on big cubes) and the solver's redo queue alive. Holding them as lists of
+Alg objects costs ~100+ bytes per move. ``AlgHistory`` stores one 4-byte code
+per simple move (see :mod:`cube.domain.algs.alg_codec`) and keeps everything
+else - HeadingAlg markers, scrambles - in a side table.
+
+Sequences, ``alg * n`` and ``alg.prime`` are stored flattened, one entry per
+simple move, as the animated path of ``Operator.play`` already records them.
+Only scrambles are kept whole, they are shown and replayed as one entry.
+
+Layout::
+
+    _codes: array('i')   >= 0  -> encoded simple alg
+                         <  0  -> -(side index + 1)
+    _side:  list[Alg]          entries referenced by negative codes, in order
+    _front, _front_side        same, for entries inserted by ``extend_left``,
+                               stored last-first
+
+Because all structures only grow/shrink at the end, append/pop and
+``extend_left`` are O(1) per entry - the redo queue is stored reversed and a
+streamed solution is added at its far end chunk by chunk. The front entries
+are moved in front of ``_codes`` only when an operation reaches them
+(``pop`` of the last main entry, ``truncate`` into them, ``snapshot``).
+``truncate_left`` drops entries from the start, front entries first.
+The total move count (``Alg.count()`` summed) is kept alongside, so
+``Operator.count`` does not decode the whole history.
+
+Reading is lazy: ``view()`` returns a read-only Sequence that decodes entries
+on access without copying the store, optionally bounded to the last N entries.
+"""
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+from cube.domain.algs import Algs, alg_codec
+from cube.domain.algs.Alg import Alg
+from cube.domain.algs.SimpleAlg import SimpleAlg
+
+# (codes, side table, move count) - see AlgHistory.snapshot
+AlgHistorySnapshot = tuple["array[int]", list[Alg], int]
+
+
+class AlgHistory:
+    """Stack of algs stored as compact integer codes. See module docstring."""
+
+    __slots__ = ["_codes", "_side", "_front", "_front_side", "_moves"]
+
+    def __init__(self, algs: Iterable[Alg] = ()) -> None:
+        self._codes: array[int] = array("i")
+        self._side: list[Alg] = []
+        # Entries before _codes, last-first: _front[-1] is the first entry
+        self._front: array[int] = array("i")
+        self._front_side: list[Alg] = []
+        self._moves = 0
+        self.extend(algs)
+
+    # -- mutation --------------------------------------------------------
+
+    def append(self, alg: Alg) -> None:
+        """Append ``alg``, flattened to its simple moves unless it is a scramble."""
+        if isinstance(alg, SimpleAlg) or Algs.is_scramble(alg):
+            self._append(alg)
+        else:
+            for a in alg.flatten():
+                self._append(a)
+
+    def _append(self, alg: Alg) -> None:
+        code: int | None = None
+        if isinstance(alg, SimpleAlg):
+            code = alg_codec.encode(alg)
+
+        if code is None:
+            self._side.append(alg)
+            code = -len(self._side)
+
+        self._codes.append(code)
+        self._moves += alg.count()
+
+    def extend(self, algs: Iterable[Alg]) -> None:
+        for a in algs:
+            self.append(a)
+
+    def extend_left(self, algs: Iterable[Alg]) -> None:
+        """Insert ``algs`` before the first entry, keeping their order. O(len(algs))."""
+        head = AlgHistory(algs)
+        front = self._front
+        front_side = self._front_side
+        for c in reversed(head._codes):
+            if c < 0:
+                front_side.append(head._side[-c - 1])
+                c = -len(front_side)
+            front.append(c)
+        self._moves += head._moves
+
+    def _merge_front(self) -> None:
+        """Move the ``extend_left`` entries to the start of ``_codes``. O(len(self))."""
+        front = self._front
+        if not front:
+            return
+        front_side = self._front_side
+        codes: array[int] = array("i")
+        side: list[Alg] = []
+        for c in reversed(front):
+            if c < 0:
+                side.append(front_side[-c - 1])
+                c = -len(side)
+            codes.append(c)
+        shift = len(side)
+        if shift:
+            # Side indices of the main entries move up by ``shift``
+            codes.extend(c - shift if c < 0 else c for c in self._codes)
+        else:
+            codes.extend(self._codes)
+        side.extend(self._side)
+        self._codes = codes
+        self._side = side
+        self._front = array("i")
+        self._front_side = []
+
+    def pop(self) -> Alg:
+        """Remove and return the last entry. Raises IndexError if empty."""
+        if not self._codes:
+            # Each front entry is merged at most once, pop stays O(1) amortized
+            self._merge_front()
+        code = self._codes.pop()
+        alg = self._side.pop() if code < 0 else alg_codec.decode(code)
+        self._moves -= alg.count()
+        return alg
+
+    def peek(self) -> Alg | None:
+        """Return the last entry without removing it, None if empty."""
+        if self._codes:
+            return self._decode(self._codes[-1])
+        if self._front:
+            return self._decode_front(self._front[0])
+        return None
+
+    def truncate(self, length: int) -> None:
+        """Drop entries until only the first ``length`` remain."""
+        if length >= len(self):
+            return
+        if length < len(self._front):
+            self._merge_front()
+        length -= len(self._front)
+        codes = self._codes
+        decode = self._decode
+        self._moves -= sum(decode(c).count() for c in codes[length:])
+        n_side = sum(1 for c in codes[length:] if c < 0)
+        del codes[length:]
+        if n_side:
+            del self._side[-n_side:]
+
+    def truncate_left(self, length: int) -> None:
+        """Drop entries from the start until only the last ``length`` remain."""
+        n = len(self) - length
+        if n <= 0:
+            return
+        front = self._front
+        n_front = min(n, len(front))
+        if n_front:
+            # The first entries are the last front codes, with the last front side entries
+            dropped = front[len(front) - n_front:]
+            self._moves -= sum(self._decode_front(c).count() for c in dropped)
+            n_side = sum(1 for c in dropped if c < 0)
+            del front[len(front) - n_front:]
+            if n_side:
+                del self._front_side[-n_side:]
+            n -= n_front
+        if not n:
+            return
+        codes = self._codes
+        decode = self._decode
+        self._moves -= sum(decode(c).count() for c in codes[:n])
+        n_side = sum(1 for c in codes[:n] if c < 0)
+        del codes[:n]
+        if n_side:
+            del self._side[:n_side]
+            # Side indices of the remaining entries move down by ``n_side``
+            self._codes = array("i", (c + n_side if c < 0 else c for c in codes))
+
+    def clear(self) -> None:
+        del self._codes[:]
+        self._side.clear()
+        del self._front[:]
+        self._front_side.clear()
+        self._moves = 0
+
+    def replace(self, algs: Iterable[Alg]) -> None:
+        """Replace the whole content (like ``lst[:] = algs``)."""
+        self.clear()
+        self.extend(algs)
+
+    # -- snapshot / restore (cheap, array copy only) -----------------------
+
+    def snapshot(self) -> AlgHistorySnapshot:
+        self._merge_front()
+        return array("i", self._codes), [*self._side], self._moves
+
+    def restore(self, snapshot: AlgHistorySnapshot) -> None:
+        codes, side, moves = snapshot
+        self._codes = array("i", codes)
+        self._side = [*side]
+        self._front = array("i")
+        self._front_side = []
+        self._moves = moves
+
+    # -- reading -----------------------------------------------------------
+
+    def _decode(self, code: int) -> Alg:
+        if code < 0:
+            return self._side[-code - 1]
+        return alg_codec.decode(code)
+
+    def _decode_front(self, code: int) -> Alg:
+        if code < 0:
+            return self._front_side[-code - 1]
+        return alg_codec.decode(code)
+
+    def __len__(self) -> int:
+        return len(self._front) + len(self._codes)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: int) -> Alg:
+        n_front = len(self._front)
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("AlgHistory index out of range")
+        if index < n_front:
+            return self._decode_front(self._front[n_front - 1 - index])
+        return self._decode(self._codes[index - n_front])
+
+    def __iter__(self) -> Iterator[Alg]:
+        decode_front = self._decode_front
+        for c in reversed(self._front):
+            yield decode_front(c)
+        decode = self._decode
+        for c in self._codes:
+            yield decode(c)
+
+    def __reversed__(self) -> Iterator[Alg]:
+        decode = self._decode
+        for c in reversed(self._codes):
+            yield decode(c)
+        decode_front = self._decode_front
+        for c in self._front:
+            yield decode_front(c)
+
+    def view(self, last: int | None = None) -> "AlgHistoryView":
+        """Lazy read-only view, optionally bounded to the last ``last`` entries.
+
+        The view is live: it reflects later appends/pops of this history.
+        """
+        return AlgHistoryView(self, last)
+
+    @property
+    def moves(self) -> int:
+        """Sum of ``count()`` over all entries, O(1)."""
+        return self._moves
+
+    def to_list(self) -> list[Alg]:
+        return [*self]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the code array (side objects not counted)."""
+        return self._codes.itemsize * len(self)
+
+    @property
+    def side_count(self) -> int:
+        """Number of entries kept as objects in the side table."""
+        return len(self._side) + len(self._front_side)
+
+    def __repr__(self) -> str:
+        return f"AlgHistory(len={len(self)}, side={self.side_count})"
+
+
+class AlgHistoryView(Sequence[Alg]):
+    """Read-only, lazily decoding window over the tail of an AlgHistory."""
+
+    __slots__ = ["_history", "_last"]
+
+    def __init__(self, history: AlgHistory, last: int | None = None) -> None:
+        self._history = history
+        self._last = last
+
+    def _start(self) -> int:
+        n = len(self._history)
+        last = self._last
+        if last is None or last >= n:
+            return 0
+        return n - max(0, last)
+
+    def __len__(self) -> int:
+        return len(self._history) - self._start()
+
+    @overload
+    def __getitem__(self, index: int) -> Alg: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Alg]: ...
+
+    def __getitem__(self, index: int | slice) -> Alg | Sequence[Alg]:
+        start = self._start()
+        size = len(self._history) - start
+        if isinstance(index, slice):
+            return [self._history[start + i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("AlgHistoryView index out of range")
+        return self._history[start + index]
+
+    def __iter__(self) -> Iterator[Alg]:
+        h = self._history
+        for i in range(self._start(), len(h)):
+            yield h[i]
+
+    def __reversed__(self) -> Iterator[Alg]:
+        h = self._history
+        for i in range(len(h) - 1, self._start() - 1, -1):
+            yield h[i]
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
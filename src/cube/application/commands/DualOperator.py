@@ -145,6 +145,10 @@ class DualOperator(OperatorProtocol):
         """
         return self._real_op.history(remove_scramble=remove_scramble)
 
+    def history_view(self, last: int | None = None) -> Sequence[Alg]:
+        """Lazy view of the real operator's history (no copy)."""
+        return self._real_op.history_view(last)
+
     def undo(self, animation: bool = True) -> Alg | None:
         """
         Undo the last operation on the real cube only.
@@ -161,6 +165,14 @@ class DualOperator(OperatorProtocol):
         """
         return self._real_op.undo(animation)
 
+    def undo_n(self, k: int, animation: bool = False) -> list[Alg]:
+        """Undo the last ``k`` operations on the real cube only, see undo()."""
+        return self._real_op.undo_n(k, animation)
+
+    def rollback_to(self, mark: int) -> list[Alg]:
+        """Roll the real cube back to history length ``mark``, see undo()."""
+        return self._real_op.rollback_to(mark)
+
     def redo(self, animation: bool = True) -> Alg | None:
         """Redo the last undone operation on the real cube only.
 
@@ -172,10 +184,18 @@ class DualOperator(OperatorProtocol):
         """Get the redo queue from the real operator."""
         return self._real_op.redo_queue()
 
+    def redo_queue_view(self, last: int | None = None) -> Sequence[Alg]:
+        """Lazy view of the real operator's redo queue (no copy)."""
+        return self._real_op.redo_queue_view(last)
+
     def clear_redo(self) -> None:
         """Clear the redo queue on the real operator."""
         self._real_op.clear_redo()
 
+    def clear_history(self) -> None:
+        """Clear the history on the real operator."""
+        self._real_op.clear_history()
+
     def enqueue_redo(self, algs: Sequence[Alg]) -> None:
         """Replace the redo queue on the real operator."""
         self._real_op.enqueue_redo(algs)
@@ -0,0 +1,170 @@
+"""Buffered operation log: the moves an Operator plays, written off the hot path.
+
+With ``config.operation_log`` on, every played alg is logged. Opening the
+file per move costs a syscall pair per quarter turn, so ``OperationLog``
+keeps the entries in memory and a daemon thread appends them every
+``operation_log_flush_interval`` seconds, sooner when
+``operation_log_flush_lines`` entries are waiting, and at exit::
+
+    log = OperationLog.for_path(".logs/operation.log", ".logs/operation.bin")
+    log.write("Operator", alg)
+    log.flush()                       # blocking, e.g. before reading the file
+
+Operators that log to the same path share one writer.
+
+Binary stream
+=============
+
+If a binary path is given, the moves are also written as a replayable stream
+of little-endian int32 records: an alg_codec code (>= 0) per simple move, or
+``-len`` followed by ``len`` UTF-8 bytes of the move's text for moves that
+have no code. Annotations are not written. :func:`read_moves` replays it::
+
+    for alg in read_moves(".logs/operation.bin"):
+        alg.play(cube)
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+from array import array
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from cube.domain.algs import alg_codec
+from cube.domain.algs.AnnotationAlg import AnnotationAlg
+
+if TYPE_CHECKING:
+    from cube.domain.algs.Alg import Alg
+
+
+class OperationLog:
+    """One log file (and optional binary stream) with its writer thread. See module docstring."""
+
+    __slots__ = ["_path", "_binary_path", "_flush_lines", "_flush_interval",
+                 "_cond", "_lines", "_codes", "_thread", "_write_lock"]
+
+    _instances: dict[str, "OperationLog"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str, binary_path: str | None = None,
+                 flush_lines: int = 1000, flush_interval: float = 1.0) -> None:
+        self._path = path
+        self._binary_path = binary_path
+        self._flush_lines = flush_lines
+        self._flush_interval = flush_interval
+
+        # Guards _lines and _codes, shared with the writer thread
+        self._cond = threading.Condition()
+        self._lines: list[str] = []
+        self._codes: array[int] = array("i")
+        self._thread: threading.Thread | None = None
+        # One writer at a time: the thread, flush() and exit
+        self._write_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, path: str, binary_path: str | None = None,
+                 flush_lines: int = 1000, flush_interval: float = 1.0) -> "OperationLog":
+        """The shared writer of ``path``, created on first use."""
+        with cls._instances_lock:
+            log = cls._instances.get(path)
+            if log is None:
+                if not cls._instances:
+                    atexit.register(cls.flush_all)
+                log = cls._instances[path] = cls(path, binary_path, flush_lines, flush_interval)
+            return log
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """Write out every shared writer, blocking."""
+        with cls._instances_lock:
+            logs = [*cls._instances.values()]
+        for log in logs:
+            log.flush()
+
+    def write(self, *s: Any) -> None:
+        """Queue one line, ``print(*s)`` style. Algs in ``s`` also go to the binary stream."""
+        line = " ".join(str(x) for x in s)
+        with self._cond:
+            self._lines.append(line)
+            if self._binary_path is not None:
+                for x in s:
+                    if not isinstance(x, str):
+                        self._encode(x)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="operation-log", daemon=True)
+                self._thread.start()
+            elif len(self._lines) >= self._flush_lines:
+                self._cond.notify()
+
+    def _encode(self, alg: "Alg") -> None:
+        # Caller holds _cond
+        codes = self._codes
+        for a in alg.flatten():
+            if isinstance(a, AnnotationAlg):
+                continue
+            code = alg_codec.encode(a)
+            if code is not None:
+                codes.append(code)
+            else:
+                text = str(a).encode()
+                codes.append(-len(text))
+                # Padded to whole records
+                codes.frombytes(text.ljust(-(-len(text) // 4) * 4, b" "))
+
+    def flush(self) -> None:
+        """Write everything queued so far, blocking."""
+        with self._write_lock:
+            with self._cond:
+                lines, self._lines = self._lines, []
+                codes, self._codes = self._codes, array("i")
+            if lines:
+                _append(self._path, ("\n".join(lines) + "\n").encode())
+            if codes and self._binary_path is not None:
+                if sys.byteorder != "little":
+                    codes.byteswap()
+                _append(self._binary_path, codes.tobytes())
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait(self._flush_interval)
+            try:
+                self.flush()
+            except OSError:
+                # Logging must never break the operator; keep trying
+                pass
+
+
+def _append(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def read_moves(binary_path: str) -> Iterator["Alg"]:
+    """Replay a binary stream written by :class:`OperationLog`, move by move."""
+    from cube.domain.algs import Algs
+
+    codes = array("i")
+    with open(binary_path, "rb") as f:
+        codes.frombytes(f.read())
+    if sys.byteorder != "little":
+        codes.byteswap()
+
+    i = 0
+    while i < len(codes):
+        code = codes[i]
+        i += 1
+        if code >= 0:
+            yield alg_codec.decode(code)
+        else:
+            n = -code
+            words = -(-n // 4)
+            yield Algs.parse(codes[i:i + words].tobytes()[:n].decode())
+            i += words
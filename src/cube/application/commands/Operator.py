@@ -1,4 +1,3 @@
-import functools
 import warnings
 from collections.abc import MutableSequence, Reversible, Sequence
 from contextlib import contextmanager
@@ -6,6 +5,8 @@ from typing import TYPE_CHECKING, Any, Callable
 
 from typing_extensions import deprecated
 
+from cube.application.commands.AlgHistory import AlgHistory, AlgHistorySnapshot, AlgHistoryView
+from cube.application.commands.OperationLog import OperationLog
 from cube.application.exceptions.app_exceptions import OpAborted
 from cube.application.state import ApplicationAndViewState
 from cube.domain.algs.Alg import Alg
@@ -15,6 +16,7 @@ from cube.domain.algs.HeadingAlg import HeadingAlg
 from cube.domain.algs.SeqAlg import SeqAlg
 from cube.domain.algs.SimpleAlg import SimpleAlg
 from cube.domain.model.Cube import Cube
+from cube.utils.metrics import METRICS
 from cube.utils.SSCode import SSCode
 
 from ...domain.solver.protocols.AnnotationProtocol import AnnotationProtocol
@@ -64,6 +66,7 @@ class Operator(OperatorProtocol):
                  "_history",
                  "_redo_queue",
                  "_in_undo_redo",
+                 "_undoing",
                  "_recording",
                  "_self_annotation_running",
                  "_aborted",
@@ -72,9 +75,10 @@ class Operator(OperatorProtocol):
                  "_animation_manager",
                  "_app_state",
                  "_annotation",
-                 "_log_path",
+                 "_op_log",
                  "_buffer",
-                 "_buffer_depth"]
+                 "_buffer_depth",
+                 "_play_listener"]
 
     def __init__(self, cube: Cube,
                  app_state: ApplicationAndViewState,
@@ -84,9 +88,12 @@ class Operator(OperatorProtocol):
 
         self._aborted: Any = None
         self._cube = cube
-        self._history: MutableSequence[Alg] = []
-        self._redo_queue: MutableSequence[Alg] = []
+        # Compact array-backed stacks, see AlgHistory
+        self._history: AlgHistory = AlgHistory()
+        self._redo_queue: AlgHistory = AlgHistory()
         self._in_undo_redo: bool = False
+        # Undo plays inverse moves that must not enter the history
+        self._undoing: bool = False
 
         # a non none indicates that recorder is running
         self._recording: MutableSequence[Alg] | None = None
@@ -113,9 +120,16 @@ class Operator(OperatorProtocol):
         self._buffer: MutableSequence[Alg] | None = None
         self._buffer_depth: int = 0  # nesting depth for with_buffer()
 
+        # See with_play_listener()
+        self._play_listener: Callable[[Alg], None] | None = None
+
         # Get config from app_state
         cfg = app_state.config
-        self._log_path = cfg.operation_log_path if cfg.operation_log else None
+        self._op_log: OperationLog | None = None
+        if cfg.operation_log:
+            self._op_log = OperationLog.for_path(cfg.operation_log_path, cfg.operation_log_binary_path,
+                                                 cfg.operation_log_flush_lines,
+                                                 cfg.operation_log_flush_interval)
 
     @property
     def app_state(self) -> ApplicationAndViewState:
@@ -166,9 +180,8 @@ class Operator(OperatorProtocol):
     # noinspection PyMethodMayBeStatic
     def log(self, *s: Any):
 
-        if ll := self._log_path:
-            with open(ll, mode="a") as f:
-                print(*(str(x) for x in s), file=f)
+        if (op_log := self._op_log) is not None:
+            op_log.write(*s)
 
     def _play(self, alg: Alg, inv: Any = False, animation: Any = True) -> None:
 
@@ -247,7 +260,10 @@ class Operator(OperatorProtocol):
             if is_annotation:
                 if isinstance(alg, HeadingAlg):
                     # HeadingAlg survives in history for queue display
-                    self._history.append(alg)
+                    if not self._undoing:
+                        self._history.append(alg)
+                    if self._play_listener is not None:
+                        self._notify_played(alg)
                 return
 
             if self._recording is not None:
@@ -255,15 +271,51 @@ class Operator(OperatorProtocol):
 
             self.log("Operator", alg)
 
-            self._cube.sanity()
-            alg.play(self._cube, False)
-            self._cube.sanity()
-            self._history.append(alg)
+            if METRICS.enabled:
+                with METRICS.timer("operator.play"):
+                    self._play_on_cube(alg)
+            else:
+                self._play_on_cube(alg)
+            if not self._undoing:
+                self._history.append(alg)
+            if self._play_listener is not None:
+                self._notify_played(alg)
             # Note: redo queue is NOT cleared on manual moves.
             # Unlike text editors, clearing the solver's redo queue on an
             # accidental key press is destructive. The queue is only cleared
             # explicitly (reset, new scramble, new solve).
 
+    def _play_on_cube(self, alg: Alg) -> None:
+        self._cube.sanity()
+        if Algs.is_scramble(alg):
+            # Nothing reads the cube during a scramble
+            with self._cube.batch_rotations():
+                alg.play(self._cube, False)
+        else:
+            alg.play(self._cube, False)
+        self._cube.sanity()
+
+    def _notify_played(self, alg: Alg) -> None:
+        # Query mode moves are rolled back, undo/redo only replay history
+        if not self._in_undo_redo and not self._cube._in_query_mode:
+            assert self._play_listener is not None
+            self._play_listener(alg)
+
+    @contextmanager
+    def with_play_listener(self, listener: Callable[[Alg], None]):
+        """Call ``listener`` with every alg committed to the history.
+
+        Only algs that stay in the history are reported, in order: moves
+        played inside with_query_restore_state() and undo/redo are not.
+        HeadingAlg markers are reported like moves. Not nestable.
+        """
+        assert self._play_listener is None, "with_play_listener() is not nestable"
+        self._play_listener = listener
+        try:
+            yield None
+        finally:
+            self._play_listener = None
+
     def play_seq(self, algs: Reversible[Alg], inv: Any):
 
         if inv:
@@ -278,21 +330,67 @@ class Operator(OperatorProtocol):
 
         :return: the undone alg, or None if history is empty
         """
-        if self.history():
+        if self._history:
             alg = self._history.pop()
-            _history = [*self._history]
             self._in_undo_redo = True
+            self._undoing = True
             try:
                 self.play(alg, True, animation=animation)
             finally:
                 self._in_undo_redo = False
-            # Restore history (play() adds to it, but undo shouldn't grow history)
-            self._history[:] = _history
+                self._undoing = False
             self._redo_queue.append(alg)
             return alg
         else:
             return None
 
+    def undo_n(self, k: int, animation: bool = False) -> list[Alg]:
+        """Undo the last ``k`` history entries (fewer if the history is shorter).
+
+        Without animation, all the inverse moves are played as one alg, in one
+        :meth:`Cube.batch_rotations` block. The undone entries are pushed to the redo queue, as by ``k`` calls
+        to :meth:`undo`.
+
+        :return: the undone entries, in the order they were played
+        """
+        history = self._history
+        k = min(k, len(history))
+        if k <= 0:
+            return []
+
+        if animation and self.animation_enabled:
+            # One by one, each undo is animated
+            undone = [self.undo(animation=True) for _ in range(k)]
+            return [a for a in reversed(undone) if a is not None]
+
+        if self._buffer:
+            # Buffered moves are not in the history yet
+            self._flush_buffer()
+
+        start = len(history) - k
+        algs = [history[i] for i in range(start, len(history))]
+        history.truncate(start)
+        self._redo_queue.extend(reversed(algs))
+
+        moves = [a for a in algs if not isinstance(a, AnnotationAlg)]
+        if moves:
+            self._in_undo_redo = True
+            self._undoing = True
+            try:
+                with self._cube.batch_rotations():
+                    self._play(SeqAlg(None, *moves), True, animation=False)
+            finally:
+                self._in_undo_redo = False
+                self._undoing = False
+        return algs
+
+    def rollback_to(self, mark: int) -> list[Alg]:
+        """Undo until the history has ``mark`` entries, see :meth:`undo_n`.
+
+        ``mark`` is a history length taken earlier, ``len(op.history_view())``.
+        """
+        return self.undo_n(len(self._history) - mark)
+
     def redo(self, animation: bool = True) -> Alg | None:
         """Redo the last undone operation. Pops from redo queue and plays forward.
 
@@ -321,20 +419,61 @@ class Operator(OperatorProtocol):
 
     def redo_queue(self) -> Sequence[Alg]:
         """Get the redo queue (operations available for redo)."""
-        return self._redo_queue[:]
+        return self._redo_queue.to_list()
+
+    def redo_queue_view(self, last: int | None = None) -> AlgHistoryView:
+        """Lazy, read-only view of the redo queue - no copy, decodes on access.
+
+        :param last: if not None, the view is bounded to the last ``last`` entries
+        (the ones that will be redone first).
+        """
+        return self._redo_queue.view(last)
 
     def clear_redo(self) -> None:
         """Clear the redo queue."""
         self._redo_queue.clear()
 
+    def clear_history(self) -> None:
+        """Clear the history, the cube is not touched (unlike :meth:`reset`)."""
+        self._history.clear()
+
     def enqueue_redo(self, algs: Sequence[Alg]) -> None:
         """Replace the redo queue with the given algorithms (e.g., solver solution).
 
         Stores in reversed order so that pop() (LIFO) yields the first step
         first — matching the same pop() semantics used by manual undo/redo.
         """
-        self._redo_queue.clear()
-        self._redo_queue.extend(reversed(algs))
+        # Reversed after flattening, the queue stores simple steps
+        self._redo_queue.replace(reversed(AlgHistory(algs)))
+
+    def extend_redo(self, algs: Sequence[Alg]) -> None:
+        """Queue ``algs`` to be redone after everything already in the redo queue.
+
+        Used to grow a solver solution while it is still being computed,
+        O(len(algs)) however long the queue already is.
+        """
+        self._redo_queue.extend_left(reversed(AlgHistory(algs)))
+
+    def truncate_redo(self, length: int) -> None:
+        """Drop redo entries until only the ``length`` to be redone first remain.
+
+        Undoes :meth:`extend_redo` of a solution that turned out to be bad.
+        """
+        # The queue is stored reversed, the entries redone last come first
+        self._redo_queue.truncate_left(length)
+
+    def snapshot_queues(self) -> tuple[AlgHistorySnapshot, AlgHistorySnapshot]:
+        """Compact copy of the history and redo queue (encoded, no Alg objects per move)."""
+        return self._history.snapshot(), self._redo_queue.snapshot()
+
+    def restore_queues(self, snapshot: tuple[AlgHistorySnapshot, AlgHistorySnapshot]) -> None:
+        """Replace history and redo queue with a :meth:`snapshot_queues` result.
+
+        The cube is not touched - the caller restores its state separately.
+        """
+        history, redo = snapshot
+        self._history.restore(history)
+        self._redo_queue.restore(redo)
 
     def history(self, *, remove_scramble: bool = False) -> Sequence[Alg]:
         """
@@ -343,13 +482,21 @@ class Operator(OperatorProtocol):
         :return:
         """
 
-        history = self._history
-
         _is = Algs.is_scramble
 
         if remove_scramble:
-            history = [a for a in history if not _is(a)]
-        return history[:]
+            return [a for a in self._history if not _is(a)]
+        return self._history.to_list()
+
+    def history_view(self, last: int | None = None) -> AlgHistoryView:
+        """Lazy, read-only view of the history - no copy, decodes on access.
+
+        Prefer it over :meth:`history` for len/bool checks and scans.
+        The view is live, it reflects later moves.
+
+        :param last: if not None, the view is bounded to the last ``last`` entries
+        """
+        return self._history.view(last)
 
     def history_as_alg(self) -> Alg:
         return SeqAlg(None, *self.history())
@@ -375,7 +522,7 @@ class Operator(OperatorProtocol):
 
     @property
     def count(self):
-        return functools.reduce(lambda n, a: n + a.count(), self._history, 0)
+        return self._history.moves
 
     def reset(self) -> None:
         """
@@ -409,11 +556,11 @@ class Operator(OperatorProtocol):
 
     @contextmanager
     def save_history(self):
-        _history = [*self._history]
+        _history = self._history.snapshot()
         try:
             yield None
         finally:
-            self._history[:] = _history
+            self._history.restore(_history)
 
     def _flush_buffer(self) -> None:
         """Flush the buffer: simplify buffered algs, then play each one.
@@ -521,7 +668,7 @@ class Operator(OperatorProtocol):
         # Save original states
         was_in_query_mode = cube._in_query_mode
         history_len_before = len(self._history)
-        saved_redo_queue = [*self._redo_queue]
+        saved_redo_queue = self._redo_queue.snapshot()
 
         # CLAUDE [#8]: move the query mode context manager to cube itself, this is not OOP programming
         cube._in_query_mode = True
@@ -531,11 +678,10 @@ class Operator(OperatorProtocol):
                 yield None
             finally:
                 # Rollback: undo all moves made during query
-                while len(self._history) > history_len_before:
-                    self.undo(animation=False)
+                self.rollback_to(history_len_before)
 
                 # Restore redo queue — undo() above pollutes it with query moves
-                self._redo_queue[:] = saved_redo_queue
+                self._redo_queue.restore(saved_redo_queue)
 
                 cube._in_query_mode = was_in_query_mode
 
@@ -14,8 +14,8 @@ from cube.config.face_tracer_config import FaceTrackerConfig, TrackerIndicatorCo
 from cube.domain.model.Color import Color
 from cube.utils.config_protocol import (
     AnimationSpeedConfigProtocol, AnimationTextDef, ArrowConfigProtocol,
-    AssistConfigProtocol, ConfigProtocol, MarkerDef, SessionConfigProtocol,
-    SoundConfigProtocol,
+    AssistConfigProtocol, BestOfConfigProtocol, ConfigProtocol, MarkerDef, SessionConfigProtocol,
+    SolveApiConfigProtocol, SoundConfigProtocol,
 )
 from cube.utils.markers_config import MarkersConfig
 from cube.utils.SSCode import SSCode
@@ -58,6 +58,20 @@ class AppConfig(ConfigProtocol):
         """Set cube sanity check flag."""
         self._data.check_cube_sanity = value
 
+    @property
+    def check_cube_sanity_incremental(self) -> bool:
+        """Sanity re-checks only the orbits touched since the last check."""
+        return self._data.check_cube_sanity_incremental
+
+    @check_cube_sanity_incremental.setter
+    def check_cube_sanity_incremental(self, value: bool) -> None:
+        self._data.check_cube_sanity_incremental = value
+
+    @property
+    def check_cube_sanity_full_every(self) -> int:
+        """In incremental mode, run a full check every N checks (0 = never)."""
+        return self._data.check_cube_sanity_full_every
+
     @property
     def short_part_name(self) -> bool:
         """Use short names for parts."""
@@ -168,6 +182,16 @@ class AppConfig(ConfigProtocol):
         """First face color for Layer 1 in beginner and LBL solvers."""
         return self._data.first_face_color
 
+    @first_face_color.setter
+    def first_face_color(self, value: Color) -> None:
+        """Set first face color."""
+        self._data.first_face_color = value
+
+    @property
+    def best_of_config(self) -> BestOfConfigProtocol:
+        """Best-of-N solving configuration (Solvers.best_of)."""
+        return self._data.best_of_config
+
     # ==========================================================================
     # Optimization settings
     # ==========================================================================
@@ -191,6 +215,35 @@ class AppConfig(ConfigProtocol):
         """Search for blocks in big cube centers."""
         return self._data.optimize_big_cube_centers_search_blocks
 
+    @property
+    def optimize_big_cube_centers_lookahead_depth(self) -> int:
+        """Steps of lookahead when picking the next center (target, source) step, 0 keeps the fixed face order.
+
+        Each candidate is played in query mode, then this many steps minus one
+        of the fixed order, and scored by center pieces placed per move.
+        Costs about width * depth steps per step played.
+        """
+        return self._data.optimize_big_cube_centers_lookahead_depth
+
+    @property
+    def optimize_big_cube_centers_lookahead_width(self) -> int:
+        """Number of candidate center steps evaluated at each lookahead decision."""
+        return self._data.optimize_big_cube_centers_lookahead_width
+
+    @property
+    def optimize_solution(self) -> bool:
+        """Shorten solutions by cancelling commuting moves (Alg.optimize) before playback."""
+        return self._data.optimize_solution
+
+    @property
+    def optimize_solution_window(self) -> int:
+        """Sliding window of Alg.optimize() for solutions, 0 disables it.
+
+        Subsequences of up to this many moves that equal the identity or a
+        single move are replaced. Costs about window * 6n^2 per move.
+        """
+        return self._data.optimize_solution_window
+
     # ==========================================================================
     # Viewer settings
     # ==========================================================================
@@ -302,6 +355,11 @@ class AppConfig(ConfigProtocol):
         """WebGL session configuration (keepalive timeout, etc.)."""
         return self._data.session_config
 
+    @property
+    def solve_api_config(self) -> SolveApiConfigProtocol:
+        """Stateless HTTP solve endpoint configuration."""
+        return self._data.solve_api_config
+
     @property
     def show_file_algs(self) -> bool:
         """Show F1-F5 file algorithm buttons in toolbar."""
@@ -374,6 +432,21 @@ class AppConfig(ConfigProtocol):
         """Path for operation log file."""
         return self._data.operation_log_path
 
+    @property
+    def operation_log_binary_path(self) -> str | None:
+        """Path for the binary move stream of the operation log, None for none."""
+        return self._data.operation_log_binary_path
+
+    @property
+    def operation_log_flush_lines(self) -> int:
+        """Queued operation log entries that trigger an early write."""
+        return self._data.operation_log_flush_lines
+
+    @property
+    def operation_log_flush_interval(self) -> float:
+        """Seconds between operation log writes."""
+        return self._data.operation_log_flush_interval
+
     @property
     def operator_show_alg_annotation(self) -> bool:
         """Show algorithm annotations."""
@@ -470,6 +543,12 @@ class AppConfig(ConfigProtocol):
         """Unregister a config change listener."""
         self._data.remove_listener(listener)
 
+    def copy(self) -> "AppConfig":
+        """Independent copy of all settings, without the change listeners."""
+        config = AppConfig()
+        config._data = self._data.copy()
+        return config
+
     # ==========================================================================
     # Single-step mode settings
     # ==========================================================================
@@ -70,6 +70,8 @@ class ApplicationAndViewState:
 
         # Logger handles debug/quiet flags with env var override
         self._logger = Logger(debug_all=debug_all, quiet_all=quiet_all)
+        # Solver loggers cache their enabled state, which follows solver_debug
+        config.add_config_listener(self._on_config_changed)
         self._speed: float = config.animation_speed_config.default_index
 
         # self._alpha_x_0: float = 0.3
@@ -362,6 +364,10 @@ class ApplicationAndViewState:
 
         return self._last_scramble_key_size
 
+    def _on_config_changed(self, field_name: str, value: object) -> None:
+        if field_name == "solver_debug":
+            self._logger.invalidate()
+
     @property
     def logger(self) -> Logger:
         """Return the logger instance."""
@@ -72,6 +72,14 @@ class Alg(ABC):
 
         return optimizer.simplify(self)
 
+    @final
+    def optimize(self, window: int = 0, cube: "Cube | None" = None) -> "SeqSimpleAlg":
+        """Like simplify(), but also cancels moves that commute, see optimizer.optimize()."""
+
+        from . import optimizer
+
+        return optimizer.optimize(self, window, cube)
+
     @abstractmethod
     def flatten(self) -> Iterator["SimpleAlg"]:
         pass
@@ -1,10 +1,11 @@
+from array import array
 from typing import Sequence
 
 from cube.domain.algs._parser import parse_alg
 from cube.domain.algs.Alg import Alg
 from cube.domain.algs.AnnotationAlg import AnnotationAlg
 from cube.domain.algs.FaceAlg import _B, _D, _F, _L, _R, _U, FaceAlg
-from cube.domain.algs.Scramble import _Scramble, _scramble
+from cube.domain.algs.Scramble import _Scramble, _scramble, scramble_codes
 from cube.domain.algs.SeqAlg import SeqAlg
 from cube.domain.algs.SimpleAlg import NSimpleAlg
 from cube.domain.algs.MiddleSliceAlg import MiddleSliceAlg
@@ -205,6 +206,11 @@ class Algs:
     def scramble(cls, cube_size, seed=None, seq_length: int | None = None) -> SeqAlg:
         return _scramble(cube_size, seed, seq_length)
 
+    @classmethod
+    def scramble_codes(cls, cube_size, seed=None, seq_length: int | None = None) -> array:
+        """The moves of :meth:`scramble` as alg_codec codes, see Scramble.apply_scramble_codes()."""
+        return scramble_codes(cube_size, seed, seq_length)
+
     @classmethod
     def is_scramble(cls, alg: Alg):
         return isinstance(alg, _Scramble)
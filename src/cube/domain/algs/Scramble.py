@@ -1,13 +1,19 @@
+from array import array
 from random import Random
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
 
 from cube.domain.algs.Alg import Alg
 from cube.domain.algs.FaceAlg import FaceAlg
 from cube.domain.algs.Inv import _Inv
 from cube.domain.algs.Mul import _Mul
 from cube.domain.algs.SeqAlg import SeqAlg
-from cube.domain.algs.SimpleAlg import SimpleAlg
+from cube.domain.algs.SimpleAlg import NSimpleAlg, SimpleAlg
 from cube.domain.algs.SliceAbleAlg import SliceAbleAlg
+from cube.domain.algs.SlicedFaceAlg import SlicedFaceAlg
+from cube.domain.algs.SlicedSliceAlg import SlicedSliceAlg
+
+if TYPE_CHECKING:
+    from cube.domain.model.Cube import Cube
 
 
 class _Scramble(SeqAlg):
@@ -80,6 +86,60 @@ def _scramble(cube_size: int, seed: Any, n: int | None = None) -> SeqAlg:
     return a
 
 
+def _contiguous(a: SimpleAlg) -> Iterator[SimpleAlg]:
+    """``a`` as moves with compact codes: a non-contiguous slice list becomes one move per run.
+
+    The slices of one move are disjoint layers of the same axis, so the
+    runs can be played in any order.
+    """
+    if isinstance(a, (SlicedFaceAlg, SlicedSliceAlg)) and not isinstance(a.slices, slice):
+        indices = sorted(a.slices)
+        start = prev = indices[0]
+        for i in [*indices[1:], None]:
+            if i is not None and i == prev + 1:
+                prev = i
+                continue
+            if isinstance(a, SlicedFaceAlg):
+                yield SlicedFaceAlg(a.face_name, a.n, slice(start, prev))
+            else:
+                yield SlicedSliceAlg(a.slice_name, a.n, slice(start, prev))
+            if i is not None:
+                start = prev = i
+    else:
+        yield a
+
+
+def scramble_codes(cube_size: int, seed: Any, n: int | None = None) -> array:
+    """The moves of ``_scramble(cube_size, seed, n)`` as compact codes, see :mod:`alg_codec`.
+
+    Same seed, same moves: applying the codes with :func:`apply_scramble_codes`
+    gives the state of playing the scramble. Moves that cancel out (``n % 4 == 0``)
+    are dropped.
+    """
+    from cube.domain.algs import alg_codec
+
+    codes = array("i")
+    for a in _scramble(cube_size, seed, n).flatten():
+        if isinstance(a, NSimpleAlg) and not a.n % 4:
+            continue
+        for m in _contiguous(a):
+            code = alg_codec.encode(m)
+            if code is None:
+                raise RuntimeError(f"Scramble move {m} has no compact code")
+            codes.append(code)
+    return codes
+
+
+def apply_scramble_codes(cube: "Cube", codes: array) -> None:
+    """Play scramble codes directly on ``cube``: no operator, no history, no animation."""
+    from cube.domain.algs import alg_codec
+
+    decode = alg_codec.decode
+    with cube.batch_rotations():
+        for code in codes:
+            decode(code).play(cube, False)
+
+
 def __scramble(cube_size: int, rnd: Random, n: int, nest) -> list[Alg]:
     def prob(p: float) -> bool:
         return rnd.random() < p
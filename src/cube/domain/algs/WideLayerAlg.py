@@ -162,3 +162,8 @@ class WideLayerAlg(AnimationAbleAlg):
     @property
     def layers(self) -> int:
         return self._layers
+
+    @property
+    def is_lowercase(self) -> bool:
+        """True for the informal lowercase form (r, 3r), False for Rw/3Rw."""
+        return self._lowercase
@@ -0,0 +1,244 @@
+"""
+Compact integer encoding of simple algorithms.
+
+Every "plain" move (face, sliced face, slice, sliced slice, middle slice,
+whole-cube rotation and wide move) is packed into one small non-negative int,
+so long move lists can be stored in an ``array`` instead of a list of objects.
+
+CODE LAYOUT (30 bits, fits a signed 32-bit array slot)
+======================================================
+
+    bits  0..1   n % 4                   rotation count
+    bits  2..7   family                  which alg class + face/slice/axis
+    bits  8..18  a                       slice start + 1  | wide layers + 2
+    bits 19..29  b                       slice stop + 1
+    bits  8..29  mask                    slice list: bit i - 1 set for index i
+
+``0`` in ``a``/``b`` means ``None`` (open slice bound), so ``R[2:]`` and
+``R[2:5]`` both round-trip. Wide layers use ``layers + 2`` so that
+``ALL_BUT_LAST`` (-1) is stored as 1. Slice lists (``[1,3]E``, as built by
+the commutator for non-adjacent slices) have their own families and are
+stored as a bit mask, if they are sorted, without repeats and their indices
+are at most ``MAX_LIST_INDEX``.
+
+Anything that does not fit - annotations, headings, scrambles, sequences,
+other slice lists, huge slice indices - is *not encodable*:
+``encode()`` returns None and the caller keeps the original object in a
+side table.
+
+Decoding is cached: moves repeat a lot, so decoded instances are shared
+(algs are immutable, sharing is safe).
+"""
+from functools import lru_cache
+
+from cube.domain.algs.FaceAlg import _B, _D, _F, _L, _R, _U, FaceAlg
+from cube.domain.algs.MiddleSliceAlg import MiddleSliceAlg
+from cube.domain.algs.SimpleAlg import NSimpleAlg, SimpleAlg
+from cube.domain.algs.SlicedFaceAlg import SlicedFaceAlg
+from cube.domain.algs.SlicedSliceAlg import SlicedSliceAlg
+from cube.domain.algs.SliceAlg import _E, _M, _S, SliceAlg
+from cube.domain.algs.WholeCubeAlg import _X, _Y, _Z, WholeCubeAlg
+from cube.domain.algs.WideLayerAlg import WideLayerAlg
+from cube.domain.exceptions import InternalSWError
+from cube.domain.model import AxisName, FaceName
+from cube.domain.model.cube_slice import SliceName
+
+__all__ = ["encode", "decode", "is_encodable", "MAX_SLICE_INDEX", "MAX_LIST_INDEX"]
+
+_N_BITS = 2
+_FAMILY_BITS = 6
+_FIELD_BITS = 11
+
+_FAMILY_SHIFT = _N_BITS
+_A_SHIFT = _FAMILY_SHIFT + _FAMILY_BITS
+_B_SHIFT = _A_SHIFT + _FIELD_BITS
+
+_FAMILY_MASK = (1 << _FAMILY_BITS) - 1
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+
+# Largest 1-based slice index (or wide layer count) that fits in a field
+MAX_SLICE_INDEX = _FIELD_MASK - 2
+# Largest index of a slice list, one bit per index in both fields
+MAX_LIST_INDEX = 2 * _FIELD_BITS
+
+_FACES: tuple[FaceName, ...] = (FaceName.U, FaceName.D, FaceName.F,
+                                FaceName.B, FaceName.L, FaceName.R)
+_SLICES: tuple[SliceName, ...] = (SliceName.M, SliceName.E, SliceName.S)
+_AXES: tuple[AxisName, ...] = (AxisName.X, AxisName.Y, AxisName.Z)
+
+# Family bases - the face/slice/axis index is added to the base
+_FAM_FACE = 0            # 6: R, L, U ...
+_FAM_SLICED_FACE = 6     # 6: R[2:3] ...
+_FAM_SLICE = 12          # 3: [:]M ...
+_FAM_SLICED_SLICE = 15   # 3: M[1:2] ...
+_FAM_MIDDLE = 18         # 3: M, E, S (single middle slice)
+_FAM_WHOLE = 21          # 3: x, y, z
+_FAM_WIDE = 24           # 6: Rw, 3Rw, [:-1]Rw ...
+_FAM_WIDE_LOWER = 30     # 6: r, 3r, [:-1]r ...
+_FAM_FACE_LIST = 36      # 6: [1,3]R ...
+_FAM_SLICE_LIST = 42     # 3: [1,3]M ...
+_FAM_END = 45
+
+# Unsliced singletons, indexed by face/slice/axis index
+_FACE_ALGS: tuple[type[FaceAlg], ...] = (_U, _D, _F, _B, _L, _R)
+_SLICE_ALGS: tuple[type[SliceAlg], ...] = (_M, _E, _S)
+_WHOLE_ALGS: tuple[type[WholeCubeAlg], ...] = (_X, _Y, _Z)
+
+_FACE_INDEX: dict[FaceName, int] = {f: i for i, f in enumerate(_FACES)}
+_SLICE_INDEX: dict[SliceName, int] = {s: i for i, s in enumerate(_SLICES)}
+_AXIS_INDEX: dict[AxisName, int] = {a: i for i, a in enumerate(_AXES)}
+
+
+def _pack(n: int, family: int, a: int = 0, b: int = 0) -> int:
+    return (n % 4) | (family << _FAMILY_SHIFT) | (a << _A_SHIFT) | (b << _B_SHIFT)
+
+
+def _bound(v: int | None) -> int | None:
+    """Encode one slice bound, None if it doesn't fit."""
+    if v is None:
+        return 0
+    if not isinstance(v, int) or not 1 <= v <= MAX_SLICE_INDEX:
+        return None
+    return v + 1
+
+
+def _list_fields(slices: "slice | object") -> tuple[int, int] | None:
+    """Fields of a slice list as a bit mask, None if it doesn't fit (see module docstring)."""
+    if not isinstance(slices, (list, tuple)) or not slices:
+        return None
+    mask = 0
+    prev = 0
+    for i in slices:
+        if not isinstance(i, int) or not prev < i <= MAX_LIST_INDEX:
+            return None
+        mask |= 1 << (i - 1)
+        prev = i
+    return mask & _FIELD_MASK, mask >> _FIELD_BITS
+
+
+def _slice_fields(slices: "slice | object") -> tuple[int, int] | None:
+    # Index lists have their own families (_list_fields), so that their
+    # exact form (and str()) is preserved.
+    if not isinstance(slices, slice) or slices.step is not None:
+        return None
+    a = _bound(slices.start)
+    b = _bound(slices.stop)
+    if a is None or b is None:
+        return None
+    return a, b
+
+
+def encode(alg: SimpleAlg) -> int | None:
+    """
+    Encode a simple alg into a non-negative int.
+
+    :return: the code, or None if the alg has no compact form
+    """
+    if not isinstance(alg, NSimpleAlg):
+        return None
+
+    n = alg.n
+    t = type(alg)
+
+    if t in _FACE_ALGS:
+        assert isinstance(alg, FaceAlg)
+        return _pack(n, _FAM_FACE + _FACE_INDEX[alg.face_name])
+
+    if t is SlicedFaceAlg:
+        assert isinstance(alg, SlicedFaceAlg)
+        fields = _slice_fields(alg.slices)
+        if fields is not None:
+            return _pack(n, _FAM_SLICED_FACE + _FACE_INDEX[alg.face_name], *fields)
+        fields = _list_fields(alg.slices)
+        if fields is None:
+            return None
+        return _pack(n, _FAM_FACE_LIST + _FACE_INDEX[alg.face_name], *fields)
+
+    if t in _SLICE_ALGS:
+        assert isinstance(alg, SliceAlg)
+        return _pack(n, _FAM_SLICE + _SLICE_INDEX[alg.slice_name])
+
+    if t is SlicedSliceAlg:
+        assert isinstance(alg, SlicedSliceAlg)
+        fields = _slice_fields(alg.slices)
+        if fields is not None:
+            return _pack(n, _FAM_SLICED_SLICE + _SLICE_INDEX[alg.slice_name], *fields)
+        fields = _list_fields(alg.slices)
+        if fields is None:
+            return None
+        return _pack(n, _FAM_SLICE_LIST + _SLICE_INDEX[alg.slice_name], *fields)
+
+    if t is MiddleSliceAlg:
+        assert isinstance(alg, MiddleSliceAlg)
+        return _pack(n, _FAM_MIDDLE + _SLICE_INDEX[alg.slice_name])
+
+    if t in _WHOLE_ALGS:
+        assert isinstance(alg, WholeCubeAlg)
+        return _pack(n, _FAM_WHOLE + _AXIS_INDEX[alg.axis_name])
+
+    if t is WideLayerAlg:
+        assert isinstance(alg, WideLayerAlg)
+        layers = alg.layers + 2
+        if not 1 <= layers <= _FIELD_MASK:
+            return None
+        base = _FAM_WIDE_LOWER if alg.is_lowercase else _FAM_WIDE
+        return _pack(n, base + _FACE_INDEX[alg.face_name], layers)
+
+    return None
+
+
+def is_encodable(alg: SimpleAlg) -> bool:
+    return encode(alg) is not None
+
+
+def _unbound(v: int) -> int | None:
+    return v - 1 if v else None
+
+
+def _unlist(a: int, b: int) -> list[int]:
+    mask = a | b << _FIELD_BITS
+    return [i + 1 for i in range(MAX_LIST_INDEX) if mask >> i & 1]
+
+
+@lru_cache(maxsize=4096)
+def decode(code: int) -> SimpleAlg:
+    """
+    Decode a code produced by :func:`encode`.
+
+    Decoded instances are cached and shared, they are immutable.
+    The rotation count comes back normalized to ``n % 4``.
+    """
+    if code < 0:
+        raise InternalSWError(f"Not an alg code: {code}")
+
+    n = code & 3
+    family = (code >> _FAMILY_SHIFT) & _FAMILY_MASK
+    a = (code >> _A_SHIFT) & _FIELD_MASK
+    b = (code >> _B_SHIFT) & _FIELD_MASK
+
+    alg: NSimpleAlg
+
+    if family < _FAM_SLICED_FACE:
+        alg = _FACE_ALGS[family - _FAM_FACE]()
+    elif family < _FAM_SLICE:
+        alg = SlicedFaceAlg(_FACES[family - _FAM_SLICED_FACE], 1, slice(_unbound(a), _unbound(b)))
+    elif family < _FAM_SLICED_SLICE:
+        alg = _SLICE_ALGS[family - _FAM_SLICE]()
+    elif family < _FAM_MIDDLE:
+        alg = SlicedSliceAlg(_SLICES[family - _FAM_SLICED_SLICE], 1, slice(_unbound(a), _unbound(b)))
+    elif family < _FAM_WHOLE:
+        alg = MiddleSliceAlg(_SLICES[family - _FAM_MIDDLE])
+    elif family < _FAM_WIDE:
+        alg = _WHOLE_ALGS[family - _FAM_WHOLE]()
+    elif family < _FAM_FACE_LIST:
+        lowercase = family >= _FAM_WIDE_LOWER
+        face = _FACES[family - (_FAM_WIDE_LOWER if lowercase else _FAM_WIDE)]
+        alg = WideLayerAlg(face, a - 2, lowercase=lowercase)
+    elif family < _FAM_SLICE_LIST:
+        alg = SlicedFaceAlg(_FACES[family - _FAM_FACE_LIST], 1, _unlist(a, b))
+    elif family < _FAM_END:
+        alg = SlicedSliceAlg(_SLICES[family - _FAM_SLICE_LIST], 1, _unlist(a, b))
+    else:
+        raise InternalSWError(f"Unknown alg family {family} in code {code}")
+
+    return alg.with_n(n)
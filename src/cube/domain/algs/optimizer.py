@@ -1,9 +1,15 @@
-from collections.abc import Iterator, MutableSequence
-from typing import Sequence
+import threading
+from collections.abc import Callable, Iterator, MutableSequence
+from typing import TYPE_CHECKING, Sequence
 
 from cube.domain.algs.Alg import Alg
 from cube.domain.algs.SeqAlg import SeqSimpleAlg
 from cube.domain.algs.SimpleAlg import NSimpleAlg, SimpleAlg
+from cube.domain.model import AxisName, FaceName
+from cube.domain.model.cube_slice import SliceName
+
+if TYPE_CHECKING:
+    from cube.domain.model.Cube import Cube
 
 
 def simplify(self: Alg) -> SeqSimpleAlg:
@@ -20,6 +26,196 @@ def simplify(self: Alg) -> SeqSimpleAlg:
     return SeqSimpleAlg(None, *combined)
 
 
+def optimize(self: Alg, window: int = 0, cube: "Cube | None" = None) -> SeqSimpleAlg:
+    """Stronger simplify(): also reorders moves that commute.
+
+    Moves about the same axis commute (R, L, M, x, Rw, [2:3]R ...), so each
+    run of same-axis moves is regrouped and cancels as a whole: ``R L R'``
+    becomes ``L``, ``U D U D'`` becomes ``U2``. Runs are repeated until
+    nothing changes, together with the adjacent merging of simplify().
+
+    With ``window`` > 1 (needs ``cube`` for its size), every subsequence of
+    up to ``window`` moves is also checked against the sticker permutation
+    it makes: it is dropped if it is the identity, or replaced by a single
+    move with the same permutation. Costs about window * 6n^2 per move.
+    """
+    algs: Sequence[SimpleAlg] = list(self.flatten())
+
+    perm_of: Callable[[NSimpleAlg], tuple[int, ...]] | None = None
+    if window > 1:
+        assert cube is not None, "The window search needs a cube for its size"
+        perm_of = _permutations(cube)
+
+    while True:
+        n = len(algs)
+        algs = _combine(_regroup_axis_runs(algs))
+        if perm_of is not None:
+            algs = _window_replace(algs, window, perm_of)
+        if len(algs) >= n:
+            break
+
+    return SeqSimpleAlg(None, *algs)
+
+
+_FACE_AXIS: dict[FaceName, AxisName] = {
+    FaceName.R: AxisName.X, FaceName.L: AxisName.X,
+    FaceName.U: AxisName.Y, FaceName.D: AxisName.Y,
+    FaceName.F: AxisName.Z, FaceName.B: AxisName.Z,
+}
+_SLICE_AXIS: dict[SliceName, AxisName] = {
+    SliceName.M: AxisName.X, SliceName.E: AxisName.Y, SliceName.S: AxisName.Z,
+}
+
+
+def _axis_key(a: SimpleAlg) -> tuple[AxisName, str] | None:
+    """(axis the move turns about, face/slice/axis it names), None if it isn't a move."""
+    from cube.domain.algs.FaceAlgBase import FaceAlgBase
+    from cube.domain.algs.SliceAlgBase import SliceAlgBase
+    from cube.domain.algs.WholeCubeAlg import WholeCubeAlg
+    from cube.domain.algs.WideLayerAlg import WideLayerAlg
+
+    if isinstance(a, (FaceAlgBase, WideLayerAlg)):
+        return _FACE_AXIS[a.face_name], a.face_name.value
+    if isinstance(a, SliceAlgBase):
+        return _SLICE_AXIS[a.slice_name], a.slice_name.value
+    if isinstance(a, WholeCubeAlg):
+        return a.axis_name, a.axis_name.value
+    return None
+
+
+def _regroup_axis_runs(algs: Sequence[SimpleAlg]) -> list[SimpleAlg]:
+    """Merge same-form moves within each run of same-axis moves, see optimize()."""
+    result: list[SimpleAlg] = []
+    run: list[NSimpleAlg] = []
+    run_axis: AxisName | None = None
+
+    for a in algs:
+        key = _axis_key(a) if isinstance(a, NSimpleAlg) else None
+        if key is None or key[0] is not run_axis:
+            result.extend(_merge_run(run))
+            run = []
+            run_axis = key[0] if key else None
+        if key is None:
+            # Non-move (e.g. HeadingAlg) - ends the run, passes through
+            result.append(a)
+        else:
+            assert isinstance(a, NSimpleAlg)
+            run.append(a)
+
+    result.extend(_merge_run(run))
+    return result
+
+
+def _merge_run(run: list[NSimpleAlg]) -> list[NSimpleAlg]:
+    if len(run) < 2:
+        return [a for a in run if a.n % 4]
+
+    merged: list[NSimpleAlg] = []
+    for a in run:
+        for i, m in enumerate(merged):
+            if type(m) is type(a) and m.same_form(a):
+                merged[i] = m.with_n(m.n + a.n)
+                break
+        else:
+            merged.append(a)
+
+    # Keep moves of the same face/slice adjacent (in first-seen order) for
+    # the disjoint slices merge of _combine()
+    order: dict[str, int] = {}
+
+    def group(m: NSimpleAlg) -> int:
+        key = _axis_key(m)
+        assert key is not None
+        return order.setdefault(key[1], len(order))
+
+    merged.sort(key=group)
+
+    return [m for m in merged if m.n % 4]
+
+
+# Cube size -> permutation function, see _permutations()
+_PERMUTATIONS: dict[int, Callable[[NSimpleAlg], tuple[int, ...]]] = {}
+
+
+def _permutations(cube: "Cube") -> Callable[[NSimpleAlg], tuple[int, ...]]:
+    """Sticker permutation of a move on a cube of ``cube``'s size.
+
+    Position ``j`` of the result is the index of the sticker that the move
+    brings to ``j``, in Cube._facelet_edges() order. Stickers are followed
+    by a moveable attribute, so equal colors never hide a swap. One scratch
+    cube per size, shared by all threads: playing on it is serialized.
+    """
+    perm_of = _PERMUTATIONS.get(cube.size)
+    if perm_of is None:
+        # Two threads may both build one, they agree and the first stays
+        perm_of = _PERMUTATIONS.setdefault(cube.size, _new_permutations(cube))
+    return perm_of
+
+
+def _new_permutations(cube: "Cube") -> Callable[[NSimpleAlg], tuple[int, ...]]:
+    from cube.domain.model.Cube import Cube
+
+    scratch = Cube(cube.size, cube.sp)
+    # noinspection PyProtectedMember
+    stickers = list(scratch._facelet_edges())
+    cache: dict[str, tuple[int, ...]] = {}
+    # optimize() runs in the event loop and in SolutionStream workers at once
+    lock = threading.Lock()
+
+    def perm_of(a: NSimpleAlg) -> tuple[int, ...]:
+        key = str(a)
+        perm = cache.get(key)
+        if perm is None:
+            with lock:
+                for i, pe in enumerate(stickers):
+                    pe.moveable_attributes["_optimizer_id"] = i
+                a.play(scratch, False)
+                perm = cache[key] = tuple(pe.moveable_attributes["_optimizer_id"] for pe in stickers)
+        return perm
+
+    return perm_of
+
+
+def _window_replace(algs: Sequence[SimpleAlg], window: int,
+                    perm_of: Callable[[NSimpleAlg], tuple[int, ...]]) -> list[SimpleAlg]:
+    """Drop identity subsequences of up to ``window`` moves, replace those equal to one move."""
+    # Single moves a subsequence may collapse to: every move seen, any n
+    single: dict[tuple[int, ...], NSimpleAlg] = {}
+    for a in algs:
+        if isinstance(a, NSimpleAlg):
+            for n in (1, 2, 3):
+                single.setdefault(perm_of(a.with_n(n)), a.with_n(n))
+
+    identity = tuple(range(len(next(iter(single)))) if single else ())
+    result: list[SimpleAlg] = []
+    i = 0
+    while i < len(algs):
+        a = algs[i]
+        best: tuple[int, NSimpleAlg | None] | None = None
+        if isinstance(a, NSimpleAlg):
+            perm = perm_of(a)
+            for j in range(i + 1, min(len(algs), i + window)):
+                b = algs[j]
+                if not isinstance(b, NSimpleAlg):
+                    break
+                p = perm_of(b)
+                perm = tuple(perm[k] for k in p)
+                if perm == identity:
+                    best = j, None
+                elif perm in single:
+                    best = j, single[perm]
+        if best is None:
+            result.append(a)
+            i += 1
+        else:
+            j, replacement = best
+            if replacement is not None:
+                result.append(replacement)
+            i = j + 1
+
+    return result
+
+
 def _resolve_slices_to_set(slices: "slice | Sequence[int]") -> frozenset[int] | None:
     """Resolve a slice spec to an explicit set of indices.
 
@@ -113,7 +113,9 @@ IMPLEMENTATION:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+import numpy as np
 
 from cube.application.exceptions.ExceptionInternalSWError import InternalSWError
 from cube.domain.algs.Alg import Alg
@@ -222,6 +224,30 @@ class SliceAlgorithmResult:
         return self.whole_slice_alg[slice_index + 1] * self.n
 
 
+@dataclass(frozen=True)
+class _SliceTranslation:
+    """
+    The size-dependent part of translating target coordinates to a source face
+    through one slice, precomputed for every center coordinate.
+
+    Attributes:
+        slice_alg: The base slice algorithm (M, E, or S)
+        n: Number of rotations from source to target
+        source_coords: ``source_coords[row, col]`` is the source position of
+                       ``(row, col)`` on the target face, shape (n_slices, n_slices, 2)
+        slice_index: ``slice_index[row, col]`` is the 0-based slice through
+                     ``(row, col)`` on the target face, shape (n_slices, n_slices)
+        whole_cube_base_alg: The whole-cube rotation on this slice's axis
+        whole_cube_alg: The full whole-cube algorithm (e.g. X2)
+    """
+    slice_alg: SliceAlg
+    n: int
+    source_coords: np.ndarray
+    slice_index: np.ndarray
+    whole_cube_base_alg: WholeCubeAlg
+    whole_cube_alg: Alg
+
+
 
 
 
@@ -392,38 +418,23 @@ class Face2FaceTranslator:
         if not (0 <= row < n_slices and 0 <= col < n_slices):
             raise ValueError(f"Coordinate {target_coord} out of bounds for center grid (n_slices={n_slices})")
 
-        target_name = target_face.name
-        source_name = source_face.name
-
         # Find shared edge (None if faces are opposite)
         shared_edge = Face2FaceTranslator._find_shared_edge(target_face, source_face)
 
-        # Compute all slice algorithms - each has its own source_coord
-        layout = target_face.cube.layout
-        all_slice_algorithms = Face2FaceTranslator._compute_slice_algorithms(
-            target_face.cube,
-            target_name, source_name, target_coord, n_slices
-        )
-
-        # Derive whole-cube algorithms (1 for adjacent, 2 for opposite faces)
-        whole_cube_algs = Face2FaceTranslator.derive_whole_cube_alg(layout, target_name, source_name)
-
-        # Build lookup for whole-cube algs by their axis name
-        whole_cube_by_axis: dict[AxisName, tuple[WholeCubeAlg, Alg]] = {}
-        for base_alg, _, alg in whole_cube_algs:
-            whole_cube_by_axis[base_alg.axis_name] = (base_alg, alg)
-
-        # Each slice algorithm becomes one FaceTranslationResult
+        # Each connecting slice becomes one FaceTranslationResult, its
+        # source_coord and slice index looked up in the per-size tables
         results: list[FaceTranslationResult] = []
-        for slice_alg in all_slice_algorithms:
-            slice_name = slice_alg.whole_slice_alg.slice_name
-            # Get axis for this slice (direction not used here, but documents the relationship)
-            axis_name, _same_direction = layout.get_axis_for_slice(slice_name)
-            whole_cube_base_alg, whole_cube_alg = whole_cube_by_axis[axis_name]
+        for st in Face2FaceTranslator._slice_translations(target_face.cube, target_face.name, source_face.name):
+            slice_alg = SliceAlgorithmResult(
+                st.slice_alg,
+                int(st.slice_index[row, col]),
+                st.n,
+                Point(*st.source_coords[row, col].tolist()),
+            )
 
             results.append(FaceTranslationResult(
-                whole_cube_base_alg=whole_cube_base_alg,
-                whole_cube_alg=whole_cube_alg,
+                whole_cube_base_alg=st.whole_cube_base_alg,
+                whole_cube_alg=st.whole_cube_alg,
                 slice_algorithm=slice_alg,
                 shared_edge=shared_edge,
             ))
@@ -474,11 +485,71 @@ class Face2FaceTranslator:
             )
         """
 
-        unit_transform = source_face.cube.layout.translate_target_from_source(
-            source_face, target_face, source_coord,
-            slice_name)
+        if source_face is target_face:
+            raise ValueError("Cannot translate from a face to itself")
+
+        center_map = Face2FaceTranslator.center_map(source_face.cube, source_face.name, target_face.name, slice_name)
+        row, col = source_coord
+        n_slices = len(center_map)
+        if not (0 <= row < n_slices and 0 <= col < n_slices):
+            raise ValueError(f"Coordinate {source_coord} out of bounds (n_slices={n_slices})")
 
-        return unit_transform.of_cube(source_face.cube)(*source_coord)
+        return Point(*center_map[row, col].tolist())
+
+    @staticmethod
+    def translate_points_target_from_source(
+            source_face: Face,
+            target_face: Face,
+            source_coords: Sequence[tuple[int, int]],
+            slice_name: SliceName
+    ) -> list[Point]:
+        """
+        :meth:`translate_target_from_source` for several points (e.g. the corners
+        of a block) with one array lookup.
+
+        Coordinates are not bounds-checked.
+        """
+        if source_face is target_face:
+            raise ValueError("Cannot translate from a face to itself")
+
+        center_map = Face2FaceTranslator.center_map(source_face.cube, source_face.name, target_face.name, slice_name)
+        rows, cols = zip(*source_coords)
+        return [Point(*p) for p in center_map[list(rows), list(cols)].tolist()]
+
+    @staticmethod
+    def center_map(cube: Cube, source: FaceName, target: FaceName, slice_name: SliceName) -> np.ndarray:
+        """
+        Dense index map of center coordinates from ``source`` to ``target`` along ``slice_name``.
+
+        ``center_map(...)[row, col]`` is the (row, col) on ``target`` where content
+        at (row, col) on ``source`` appears, shape (n_slices, n_slices, 2).
+        Depends only on the cube size, so it is computed once per size and
+        (source, target, slice) triple and cached in the layout.
+        """
+        n_slices = cube.n_slices
+        maps = Face2FaceTranslator._size_tables(cube, "center_map")
+
+        key = (source, target, slice_name)
+        result = maps.get(key)
+        if result is None:
+            walk_info = cube.sized_layout.create_walking_info(slice_name)
+            transform = walk_info.get_transform(cube.face(source), cube.face(target)).of_n_slices(n_slices)
+            result = np.array([[transform(r, c) for c in range(n_slices)] for r in range(n_slices)],
+                              dtype=np.intp).reshape(n_slices, n_slices, 2)
+            result.flags.writeable = False
+            maps[key] = result
+        return result
+
+    @staticmethod
+    def _size_tables(cube: Cube, name: str) -> dict:
+        """
+        The per-size dict of tables ``name``, held in the layout cache.
+
+        One cache entry per size keeps the lookup cheap: the hot paths hash
+        only their face/slice key.
+        """
+        cache_key = ("Face2FaceTranslator", name, cube.n_slices)
+        return cube.layout.cache_manager.get(cache_key, dict).compute(dict)
 
     @staticmethod
     def _translate_via_slice_geometry(
@@ -748,68 +819,80 @@ class Face2FaceTranslator:
         return face1.find_shared_edge(face2)
 
     @staticmethod
-    def _compute_slice_algorithms(
+    def _slice_translations(
             cube: Cube,
             target_name: FaceName,
             source_name: FaceName,
-            target_coord: tuple[int, int],
-            n_slices: int,
-    ) -> list[SliceAlgorithmResult]:
+    ) -> list[_SliceTranslation]:
         """
-        Compute slice algorithm(s) that bring content from source to target at target_coord.
+        Per-size tables for translating target coordinates to the source face,
+        one per slice connecting the faces (1 for adjacent faces, 2 for opposite).
 
-        Each slice algorithm has its OWN source_coord derived from CubeWalkingInfo,
+        Each slice has its OWN source coordinates, derived from CubeWalkingInfo,
         since different slices traverse different paths between faces.
-
-        Returns:
-            List of SliceAlgorithmResult (1 for adjacent faces, 2 for opposite faces)
         """
+        tables = Face2FaceTranslator._size_tables(cube, "slice_translations")
+        key = (target_name, source_name)
+        translations: list[_SliceTranslation] | None = tables.get(key)
+        if translations is None:
+            translations = tables[key] = Face2FaceTranslator._build_slice_translations(cube, target_name, source_name)
+        return translations
+
+    @staticmethod
+    def _build_slice_translations(
+            cube: Cube,
+            target_name: FaceName,
+            source_name: FaceName,
+    ) -> list[_SliceTranslation]:
+        n_slices = cube.n_slices
+        layout = cube.layout
+
         # Find ALL slices that connect source and target
-        connecting_slices = cube.layout.get_all_slices_for_faces(source_name, target_name)
+        connecting_slices = layout.get_all_slices_for_faces(source_name, target_name)
 
         if not connecting_slices:
             raise InternalSWError(f"No slice connects {source_name} to {target_name}")
 
-        results: list[SliceAlgorithmResult] = []
-        source_face = cube.face(source_name)
-        target_face = cube.face(target_name)
-
-        # Map slice names to algorithm objects
-        slice_name_to_alg: dict[SliceName, SliceAlg] = {
-            SliceName.M: Algs.MM,
-            SliceName.E: Algs.EE,
-            SliceName.S: Algs.SS,
-        }
+        # Derive whole-cube algorithms (1 for adjacent, 2 for opposite faces), by axis
+        whole_cube_by_axis: dict[AxisName, tuple[WholeCubeAlg, Alg]] = {}
+        for base_alg, _, alg in Face2FaceTranslator.derive_whole_cube_alg(layout, target_name, source_name):
+            whole_cube_by_axis[base_alg.axis_name] = (base_alg, alg)
 
         sized_layout = cube.sized_layout
+        results: list[_SliceTranslation] = []
 
         for slice_name in connecting_slices:
-            slice_alg = slice_name_to_alg[slice_name]
-
-            # Get walking info for this slice
-            walk_info = sized_layout.create_walking_info(slice_name)
-
             # Compute n: how many rotations to move from source to target
             # In the face_infos cycle, content at index i moves to index (i+1) % 4
-            faces = walk_info.faces
-            face_names = [f.name for f in faces]
-            source_idx = face_names.index(source_name)
-            target_idx = face_names.index(target_name)
-            steps = (target_idx - source_idx) % 4
+            face_names = [f.name for f in sized_layout.create_walking_info(slice_name).faces]
+            steps = (face_names.index(target_name) - face_names.index(source_name)) % 4
             # Convert 3 steps to -1 (more efficient)
             n = steps if steps <= 2 else steps - 4
 
-            # Derive source_coord using CubeWalkingInfo
             # To get source_coord from target_coord, translate from target back to source
-            source_coord = walk_info.translate_point(target_face, source_face, Point(*target_coord))
+            source_coords = Face2FaceTranslator.center_map(cube, target_name, source_name, slice_name)
 
-            # Compute slice index (0-based)
             slice: Slice = sized_layout.get_slice(slice_name)
-            slice_index = slice.compute_slice_index(target_name, target_coord, n_slices)
+            slice_index = np.array(
+                [[slice.compute_slice_index(target_name, (r, c), n_slices) for c in range(n_slices)]
+                 for r in range(n_slices)],
+                dtype=np.intp)
+            slice_index.flags.writeable = False
 
-            results.append(SliceAlgorithmResult(slice_alg, slice_index, n, source_coord))
+            axis_name, _same_direction = layout.get_axis_for_slice(slice_name)
+            whole_cube_base_alg, whole_cube_alg = whole_cube_by_axis[axis_name]
 
-        if not results:
-            raise InternalSWError(f"No slice algorithm computed for {source_name} to {target_name}")
+            results.append(_SliceTranslation(
+                _SLICE_ALGS[slice_name], n, source_coords, slice_index,
+                whole_cube_base_alg, whole_cube_alg,
+            ))
 
         return results
+
+
+# Map slice names to algorithm objects
+_SLICE_ALGS: dict[SliceName, SliceAlg] = {
+    SliceName.M: Algs.MM,
+    SliceName.E: Algs.EE,
+    SliceName.S: Algs.SS,
+}
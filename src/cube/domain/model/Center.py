@@ -46,15 +46,8 @@ class Center(Part, Colorable):
     def is3x3(self) -> bool:
         assert self._slices, "is3x3 should not be called on 2x2 center with no slices"
 
-        slices: Iterator[CenterSlice] = self.all_slices
-
-        c = next(slices).color
-
-        for s in slices:
-            if c != s.color:
-                return False
-
-        return True
+        self.cube.color_stats  # rebuild if stale
+        return self._slices[0][0].edge._bucket.uniform  # type: ignore[union-attr]
 
     @property
     def all_slices(self) -> Iterator["CenterSlice"]:
@@ -135,7 +135,7 @@ The model uses the BOY (Blue-Orange-Yellow) color scheme by default:
 
 from collections.abc import Generator, Iterable, MutableSequence
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Collection, Protocol, Tuple
+from typing import TYPE_CHECKING, Collection, Hashable, Protocol, Tuple
 
 from cube.domain.exceptions import InternalSWError
 from cube.utils.Cache import CacheManager
@@ -168,6 +168,8 @@ if TYPE_CHECKING:
     from .Cube3x3Colors import Cube3x3Colors
     from .CubeListener import CubeListener
     from .CubeQueries2 import CubeQueries2
+    from .CubeSanity import IncrementalCubeSanity
+    from ._color_stats import CubeColorStats
     from .FacesColorsProvider import FacesColorsProvider
 
 
@@ -333,7 +335,11 @@ class Cube(CubeSupplier):
         "_slice_m", "_slice_e", "_slice_s",
         "_slices",
         "_modify_counter",
+        "_quarter_turns",
         "_last_sanity_counter",
+        "_sanity_touched",
+        "_incremental_sanity",
+        "_color_stats",
         "_original_scheme",
         "_cqr",
         "_sp",
@@ -342,6 +348,7 @@ class Cube(CubeSupplier):
         "_has_textures",
         "_is_moves_visible",
         "_mutation_cache",
+        "_batch_rotations",
     ]
 
     _front: Face
@@ -363,7 +370,11 @@ class Cube(CubeSupplier):
         self._size = size
         self._sp = sp
         self._modify_counter = 0
+        self._quarter_turns = 0
         self._last_sanity_counter = 0
+        # Keys reported by modified(touched=...) since last sanity, None = unknown change
+        self._sanity_touched: list[Hashable] | None = None
+        self._incremental_sanity: "IncrementalCubeSanity | None" = None
         # Color scheme is set during layout creation below
         self._in_query_mode: bool = False  # Skip texture updates during query operations
         self._has_visible_presentation: bool = False  # True if visible backend is connected
@@ -372,6 +383,8 @@ class Cube(CubeSupplier):
         self._listeners: list["CubeListener"] = []
         self._is_even_cube_shadow: bool = False
         self._mutation_cache: CacheManager = CacheManager.create(sp.config)
+        # See batch_rotations()
+        self._batch_rotations = False
 
         from cube.domain.geometric.cube_layout import CubeLayout as CL
         from cube.domain.geometric._SizedCubeLayout import _SizedCubeLayout
@@ -400,6 +413,8 @@ class Cube(CubeSupplier):
         assert self._size >= 2
         self._modify_counter = 0
         self._last_sanity_counter = 0
+        self._sanity_touched = None
+        self._incremental_sanity = None
         self._mutation_cache.clear()
 
         self._color_2_face = {}
@@ -487,6 +502,9 @@ class Cube(CubeSupplier):
         for s in self._slices.values():
             s.finish_init()
 
+        from ._color_stats import CubeColorStats
+        self._color_stats = CubeColorStats(self)
+
         # self.front.edge_top.annotate()
 
     @property
@@ -871,18 +889,53 @@ class Cube(CubeSupplier):
     def get_slice(self, name: SliceName) -> Slice:
         return self._slices[name]
 
-    def reset_after_faces_changes(self):
+    def reset_after_faces_changes(self, touched: Hashable | None = None):
         """
         Call after faces colors aare changes, M, S, E rotations
+        :param touched: see :meth:`modified`
         :return:
         """
         self._color_2_face.clear()
 
-        for f in self.faces:
-            f.reset_after_faces_changes()
+        if not self._batch_rotations:
+            for f in self.faces:
+                f.reset_after_faces_changes()
 
         # and make if some watch me
-        self.modified()
+        self.modified(touched)
+
+    @contextmanager
+    def batch_rotations(self) -> Generator[None, None, None]:
+        """Apply a long run of rotations (e.g. a scramble) at the lowest cost.
+
+        Inside the block the per-rotation work that only serves readers is
+        skipped: the part position ids are reset once on exit instead of
+        after every slice move, and sanity checks run once on exit. Nothing
+        may read the cube inside the block. Nested blocks join the outer one.
+        """
+        if self._batch_rotations:
+            yield
+            return
+
+        self._batch_rotations = True
+        try:
+            yield
+        finally:
+            self._batch_rotations = False
+            for f in self.faces:
+                f.reset_after_faces_changes()
+            self.sanity()
+
+    def reset_after_colors_changes(self) -> None:
+        """Call after sticker colors were written directly, not by a rotation.
+
+        Also drops the cached colors ids, which rotations keep up to date.
+        """
+        for p in (*self.edges, *self.corners, *self.centers):
+            p.reset_colors_id()
+            for s in p.all_slices:
+                s.reset_colors_id()
+        self.reset_after_faces_changes()
 
     @contextmanager
     def with_faces_color_provider(self, provider: "FacesColorsProvider") -> Generator[None, None, None]:
@@ -1463,10 +1516,38 @@ class Cube(CubeSupplier):
 
         return parts
 
-    def modified(self) -> None:
+    def modified(self, touched: Hashable | None = None) -> None:
+        """
+        Mark the cube as modified.
+
+        :param touched: what was rotated, for the incremental sanity check -
+               ``("face", FaceName)`` or ``("slice", SliceName, indexes)``.
+               None means unknown, the next sanity check is a full one.
+               Each call with a ``touched`` key is one layer quarter turn,
+               see :attr:`quarter_turns`.
+        """
         self._modify_counter += 1
         self._mutation_cache.clear()
 
+        if touched is None:
+            self._sanity_touched = None
+            # colors may have been written directly
+            self._color_stats.dirty = True
+        else:
+            self._quarter_turns += 1
+            if self._sanity_touched is not None:
+                self._sanity_touched.append(touched)
+
+    @property
+    def quarter_turns(self) -> int:
+        """Number of layer quarter turns applied to the model since creation.
+
+        Counts what the model actually did: a face or slice-set turn by 2 is two,
+        a whole cube rotation is three (two faces and the middle slices).
+        Never reset, take differences.
+        """
+        return self._quarter_turns
+
     def is_sanity(self, force_check=False) -> bool:
         # noinspection PyBroadException
         try:
@@ -1558,6 +1639,9 @@ class Cube(CubeSupplier):
 
         if not force_check and self._modify_counter == self._last_sanity_counter:
             return
+        if self._batch_rotations and not force_check:
+            # Checked once, at the end of the batch
+            return
 
         # if True:
         #     return
@@ -1570,17 +1654,43 @@ class Cube(CubeSupplier):
             raise
 
     def _do_sanity(self, force_check=False):
-        if not (force_check or self.config.check_cube_sanity):
+        touched = self._sanity_touched
+        self._sanity_touched = []
+
+        config = self.config
+        if not (force_check or config.check_cube_sanity):
+            # Nothing validated, the next check must be a full one
+            self._sanity_touched = None
             return
 
-        from .CubeSanity import CubeSanity
+        from .CubeSanity import CubeSanity, IncrementalCubeSanity
 
-        CubeSanity.do_sanity(self)
+        if not config.check_cube_sanity_incremental:
+            CubeSanity.do_sanity(self)
+            return
+
+        incremental = self._incremental_sanity
+        if incremental is None:
+            incremental = self._incremental_sanity = IncrementalCubeSanity(self)
+
+        try:
+            incremental.check(touched, force_full=force_check)
+        except:
+            # keep failing until the state is fully validated again
+            self._sanity_touched = None
+            raise
 
         return
 
+    @property
+    def color_stats(self) -> "CubeColorStats":
+        """Live sticker color counters, see :mod:`._color_stats`."""
+        return self._color_stats.ensure()
+
     @property
     def solved(self) -> bool:
+        if self.color_stats.n_non_uniform:
+            return False  # O(1) reject - some part isn't even reduced
         return (self._front.solved and
                 self._left.solved and
                 self._right.solved and
@@ -1590,7 +1700,7 @@ class Cube(CubeSupplier):
 
     @property
     def is3x3(self):
-        return all(f.is3x3 for f in self.faces) and self.match_original_scheme
+        return self.color_stats.n_non_uniform == 0 and self.match_original_scheme
 
     def reset(self, cube_size=None):
         """
@@ -2062,12 +2172,39 @@ class Cube(CubeSupplier):
             face.center.get_slice((0, 0)).edges[0]._color = color
 
         # Reset caches (required after direct color changes)
-        self.reset_after_faces_changes()
-        self.modified()  # Increment counter so sanity cache works correctly
+        self.reset_after_colors_changes()
 
         # Validate
         assert self.is_sanity(force_check=True), "Invalid cube state after set_3x3_colors"
 
+    def _facelet_edges(self) -> Iterable[PartEdge]:
+        """Every sticker once, in a fixed order for a given size."""
+        for face in self.faces:
+            for s in face.slices:
+                yield s.get_face_edge(face)
+
+    def get_facelets(self) -> bytes:
+        """All sticker colors as one byte each, see :meth:`set_facelets`.
+
+        6 * size^2 bytes - a compact snapshot of the cube colors, e.g. to
+        keep a dormant session without its object graph.
+        """
+        index = {c: i for i, c in enumerate(Color)}
+        return bytes(index[pe.color] for pe in self._facelet_edges())
+
+    def set_facelets(self, facelets: bytes) -> None:
+        """Restore sticker colors saved by :meth:`get_facelets` on a cube of the same size."""
+        colors = list(Color)
+        edges = list(self._facelet_edges())
+        if len(facelets) != len(edges):
+            raise InternalSWError(f"Got {len(facelets)} facelets for a cube of size {self.size},"
+                                  f" expected {len(edges)}")
+        for pe, c in zip(edges, facelets):
+            pe._color = colors[c]
+
+        # Reset caches (required after direct color changes)
+        self.reset_after_colors_changes()
+
     @property
     def in_query_mode(self):
         return self._in_query_mode
@@ -14,6 +14,7 @@ from cube.domain.exceptions import InternalSWError
 
 if TYPE_CHECKING:
     from cube.domain.solver.protocols.OperatorProtocol import OperatorProtocol
+    from .RotationWhatIf import RotationWhatIf
 from cube.domain.geometric.geometry_types import Point
 
 from ..algs import Alg, Algs, NSimpleAlg
@@ -297,6 +298,15 @@ class CubeQueries2:
         else:
             return None
 
+    def what_if(self, alg: Alg) -> "RotationWhatIf":
+        """
+        Evaluate a face or slice alg played 0-3 times without touching the cube.
+        Cheaper than :meth:`rotate_and_check` when the predicate is a color
+        match count, see :mod:`cube.domain.model.RotationWhatIf`.
+        """
+        from .RotationWhatIf import RotationWhatIf
+        return RotationWhatIf(self._cube, alg)
+
     def rotate_face_and_check(self, f: Face, pred: Callable[[], bool],
                               op: "OperatorProtocol") -> int:
         """
@@ -32,10 +32,34 @@ WHAT GETS VALIDATED
    - Each "orbit" (set of 2 equivalent positions) must have exactly 2 pieces
    - Exception: odd cubes have 1 middle edge slice (not 2)
 
-4. 3x3-SPECIFIC (only when cube.is3x3 is True):
+4. COLOR COUNTERS:
+   - The live per-part color histograms behind is3x3/solved (_color_stats.py)
+     must match a recount of the stickers
+
+5. 3x3-SPECIFIC (only when cube.is3x3 is True):
    - All 6 centers exist with valid colors
    - All 12 edges exist with valid color combinations
 
+INCREMENTAL MODE
+================
+
+A full check recounts every center and edge orbit - O(N²) per quarter turn,
+too slow to keep on for big cubes outside development. When
+``config.check_cube_sanity_incremental`` is set, Face.rotate and Slice.rotate
+report what they touched (see ``Cube.modified(touched=...)``) and
+IncrementalCubeSanity re-checks only the orbits whose pieces were moved:
+
+    - touched keys are resolved once (per cube size) through
+      Cube.get_rotate_face_and_slice_involved_parts /
+      Cube.get_rotate_slice_involved_parts into orbit ids, then cached
+    - each dirty orbit is recounted from precomputed member tables
+      (24 stickers, or 6/12 for the odd middle orbit)
+
+Any modification that doesn't report what it touched (reset, set_3x3_colors,
+direct color edits) falls back to a full check, so does
+``force_check=True``. ``config.check_cube_sanity_full_every`` adds a
+periodic full check every N incremental checks (0 = never).
+
 WHY THIS MATTERS FOR EVEN CUBES
 ===============================
 
@@ -50,12 +74,15 @@ Example corruption: After a bug, blue face has 5 blue + 11 red centers.
 """
 
 import sys
-from typing import Hashable, Mapping, Sequence
+from collections import Counter
+from typing import Hashable, Iterable, Mapping, Sequence
 
 from cube.domain.exceptions import InternalSWError
+from cube.utils.metrics import METRICS
 
 from ._elements import CHelper, PartColorsID
 from .Cube import Cube
+from .PartSlice import CenterSlice, CornerSlice, EdgeWing
 from cube.domain.model.Color import Color
 from ..geometric.cube_color_scheme import CubeColorScheme
 
@@ -85,6 +112,8 @@ class CubeSanity:
             For is_sanity() behavior (return bool instead of raise), use:
             cube.is_sanity(force_check=True)
         """
+        METRICS.inc("sanity.full")
+
         # Step 1: Validate all 8 corners exist with valid color combinations
         # Derived from the cube's layout: each corner is 3 adjacent faces
         layout = cube.layout
@@ -100,6 +129,9 @@ class CubeSanity:
         # Step 3: Validate edge piece distribution
         CubeSanity._check_nxn_edges(cube)
 
+        # Step 3b: The live color counters (is3x3/solved) must match the stickers
+        cube.color_stats.verify()
+
         # Step 4: For reduced 3x3 cubes, also validate centers and edges exist
         if not cube.is3x3:
             return
@@ -144,7 +176,7 @@ class CubeSanity:
                         m = "!!!"
                     else:
                         m = "+++"
-                    print(clr, _k, f"{m}{len(_v)}{m}", v, file=sys.stderr)
+                    print(clr, _k, f"{m}{len(_v)}{m}", _v, file=sys.stderr)
 
             clr_n = sum(len(s) for s in clr_dist.values())
 
@@ -209,7 +241,7 @@ class CubeSanity:
                         m = "!!!"
                     else:
                         m = "+++"
-                    print(clr, _k, f"{m}{len(_v)}{m}", v, file=sys.stderr)
+                    print(clr, _k, f"{m}{len(_v)}{m}", _v, file=sys.stderr)
 
             clr_n = sum(len(s) for s in clr_dist.values())
 
@@ -238,3 +270,155 @@ class CubeSanity:
                         _print_clr()
                         print(s, file=sys.stderr)
                         raise InternalSWError(s)
+
+
+class IncrementalCubeSanity:
+    """Re-validates only the orbits touched since the last check.
+
+    One instance per cube size, owned by the Cube (created lazily by
+    Cube._do_sanity, dropped on reset). See "INCREMENTAL MODE" in the module
+    docstring.
+    """
+
+    __slots__ = ["_cube", "_n_slices",
+                 "_center_orbit_of", "_center_members", "_center_middle",
+                 "_edge_members", "_edge_middle",
+                 "_touched_cache", "_checks_since_full"]
+
+    def __init__(self, cube: Cube) -> None:
+        self._cube = cube
+        n_slices = cube.n_slices
+        self._n_slices = n_slices
+        inv = cube.inv
+
+        # Center orbit id: the smallest of the 4 equivalent (r, c) points
+        self._center_orbit_of: dict[tuple[int, int], tuple[int, int]] = {}
+        self._center_members: dict[tuple[int, int], list[CenterSlice]] = {}
+        cqr = cube.cqr
+        for r in range(n_slices):
+            for c in range(n_slices):
+                self._center_orbit_of[(r, c)] = min(cqr.get_four_center_points(r, c))
+
+        for f in cube.faces:
+            center = f.center
+            for rc, orbit in self._center_orbit_of.items():
+                self._center_members.setdefault(orbit, []).append(center.get_center_slice(rc))
+
+        self._center_middle: tuple[int, int] | None = None
+        if n_slices % 2:
+            self._center_middle = (n_slices // 2, n_slices // 2)
+
+        # Edge orbit id: min(i, inv(i))
+        self._edge_members: dict[int, list[EdgeWing]] = {}
+        for e in cube.edges:
+            for i in range(n_slices):
+                self._edge_members.setdefault(min(i, inv(i)), []).append(e.get_slice(i))
+
+        self._edge_middle: int | None = n_slices // 2 if n_slices % 2 else None
+
+        self._touched_cache: dict[Hashable, tuple[frozenset[tuple[int, int]], frozenset[int], bool]] = {}
+        self._checks_since_full = 0
+
+    def check(self, touched: Iterable[Hashable] | None, force_full: bool = False) -> None:
+        """Validate the cube, raise InternalSWError if invalid.
+
+        Args:
+            touched: keys reported through Cube.modified() since the last
+                check, None if something unknown was modified (full check).
+            force_full: run CubeSanity.do_sanity regardless.
+        """
+        full_every = self._cube.config.check_cube_sanity_full_every
+
+        if (touched is None or force_full or
+                (full_every and self._checks_since_full >= full_every)):
+            self._checks_since_full = 0
+            CubeSanity.do_sanity(self._cube)
+            return
+
+        self._checks_since_full += 1
+
+        center_orbits: set[tuple[int, int]] = set()
+        edge_orbits: set[int] = set()
+        corners = False
+        resolve = self._resolve
+        for key in touched:
+            c, e, k = resolve(key)
+            center_orbits.update(c)
+            edge_orbits.update(e)
+            corners = corners or k
+
+        if corners:
+            layout = self._cube.layout
+            cs: CubeColorScheme = layout.colors_schema()
+            for _, corner in layout.corner_faces().items():
+                f1, f2, f3 = corner.face_names
+                self._cube.find_corner_by_colors(CHelper.colors_id((cs[f1], cs[f2], cs[f3])))
+
+        for orbit in center_orbits:
+            self._check_center_orbit(orbit)
+
+        for orbit in edge_orbits:
+            self._check_edge_orbit(orbit)
+
+        if METRICS.enabled:
+            METRICS.inc("sanity.incremental")
+            METRICS.inc("sanity.orbits_checked", len(center_orbits) + len(edge_orbits))
+
+    def _resolve(self, key: Hashable) -> tuple[frozenset[tuple[int, int]], frozenset[int], bool]:
+        """Map a touched key to (center orbits, edge orbits, corners touched)."""
+        resolved = self._touched_cache.get(key)
+        if resolved is not None:
+            return resolved
+
+        cube = self._cube
+        kind, *args = key  # type: ignore[misc]
+        if kind == "face":
+            parts = cube.get_rotate_face_and_slice_involved_parts(*args)
+        elif kind == "slice":
+            parts = cube.get_rotate_slice_involved_parts(*args)
+        else:
+            raise InternalSWError(f"Unknown sanity touched key {key}")
+
+        inv = cube.inv
+        center_orbit_of = self._center_orbit_of
+        centers: set[tuple[int, int]] = set()
+        edges: set[int] = set()
+        corners = False
+        for p in parts:
+            if isinstance(p, CenterSlice):
+                centers.add(center_orbit_of[p.index])
+            elif isinstance(p, EdgeWing):
+                i = p.index
+                edges.add(min(i, inv(i)))
+            elif isinstance(p, CornerSlice):
+                corners = True
+
+        resolved = (frozenset(centers), frozenset(edges), corners)
+        self._touched_cache[key] = resolved
+        return resolved
+
+    def _check_center_orbit(self, orbit: tuple[int, int]) -> None:
+        expected = 1 if orbit == self._center_middle else 4
+        members = self._center_members[orbit]
+        counts = Counter(s.color for s in members)
+        for clr in self._cube.layout.colors():
+            n = counts.get(clr, 0)
+            if n != expected:
+                at = [(m.face.name, m.index) for m in members if m.color == clr]
+                msg = (f"CENTER pieces: Invalid orbit count for color {clr}. "
+                       f"Orbit at positions {orbit}: expected {expected}, found {n} pieces at {at}")
+                print(msg, file=sys.stderr)
+                raise InternalSWError(msg)
+
+    def _check_edge_orbit(self, orbit: int) -> None:
+        expected = 1 if orbit == self._edge_middle else 2
+        members = self._edge_members[orbit]
+        counts = Counter(w.colors_id for w in members)
+        for clr in self._cube.original_scheme.edge_colors():
+            n = counts.get(clr, 0)
+            if n != expected:
+                at = [(w.parent.name, w.index) for w in members if w.colors_id == clr]
+                msg = (f"EDGE pieces: Invalid orbit count for color-pair {clr}. "
+                       f"Orbit at slices {orbit}: expected {expected}, found {n} pieces at {at}")
+                print(msg, file=sys.stderr)
+                raise InternalSWError(msg)
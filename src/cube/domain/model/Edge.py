@@ -102,19 +102,9 @@ class Edge(Part):
         """
         assert self._slices, f"is3x3 should not be called on 2x2 edge {self._name} with no slices"
 
-        slices = self.all_slices
-
-        s0 = next(slices)
-
-        c1, c2 = (s0.e1.color, s0.e2.color)
-
-        for s in slices:
-            _c1, _c2 = (s.e1.color, s.e2.color)
-
-            if c1 != _c1 or c2 != _c2:
-                return False
-
-        return True
+        self.cube.color_stats  # rebuild if stale
+        s0 = self._slices[0]
+        return s0.e1._bucket.uniform and s0.e2._bucket.uniform  # type: ignore[union-attr]
 
     @property
     def all_slices(self) -> Iterator[EdgeWing]:
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Tuple, TypeAlias
 
 from cube.domain.exceptions import InternalSWError
 from cube.utils.Cache import CacheManager
+from cube.utils.metrics import METRICS
 
 if TYPE_CHECKING:
     from .FacesColorsProvider import FacesColorsProvider
@@ -589,6 +590,12 @@ class Face(SuperElement, Hashable, Colorable):
     def rotate(self, n_rotations=1) -> None:
         # Get cached rotation cycles (computed once, then reused)
         edge_cycles, slice_cycles = self._get_rotation_cycles()
+        touched = ("face", self._name)  # for the incremental sanity check
+
+        if METRICS.enabled:
+            q = n_rotations % 4
+            METRICS.inc("face.quarter_turns", q)
+            METRICS.inc("model.4cycles", q * (len(edge_cycles) + len(slice_cycles)))
 
         def _rotate() -> None:
             # Apply all precomputed PartEdge 4-cycles
@@ -605,7 +612,7 @@ class Face(SuperElement, Hashable, Colorable):
             # Update texture directions for all affected stickers
             # See: design2/face-slice-rotation.md for details
             self._update_texture_directions_after_rotate(1)
-            self.cube.modified()
+            self.cube.modified(touched)
             self.cube.sanity()
 
     def _update_texture_directions_after_rotate(self, quarter_turns: int) -> None:
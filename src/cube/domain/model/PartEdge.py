@@ -5,6 +5,7 @@ from cube.domain.model.Color import Color
 from cube.domain.model.Colorable import Colorable
 
 if TYPE_CHECKING:
+    from ._color_stats import ColorBucket
     from .PartSlice import PartSlice
     from .Cube import Cube
     from .Face import Face
@@ -48,7 +49,7 @@ class PartEdge(Colorable):
     """
     __slots__ = ["_face", "_parent", "_color", "_annotated_by_color",
                  "_annotated_fixed_location", "_texture_direction",
-                 "fixed_attributes", "moveable_attributes"]
+                 "fixed_attributes", "moveable_attributes", "_bucket"]
 
     _face: _Face
     _color: Color
@@ -84,6 +85,9 @@ class PartEdge(Colorable):
 
         self._parent: _PartSlice
 
+        # Color counters of (part, face), set by CubeColorStats. See _color_stats.py
+        self._bucket: "ColorBucket | None" = None
+
     @property
     def face(self) -> _Face:
         return self._face
@@ -133,6 +137,8 @@ class PartEdge(Colorable):
 
         See: design2/partedge-attribute-system.md for visual diagrams
         """
+        if self._bucket is not None and self._color is not source._color:
+            self._bucket.recolor(self._color, source._color)
         self._color = source._color
         self._annotated_by_color = source._annotated_by_color
         self._texture_direction = source._texture_direction
@@ -228,6 +234,19 @@ class PartEdge(Colorable):
         # Key optimization: save dict REFERENCES, not copies
         m_attrs = (p0.moveable_attributes, p1.moveable_attributes, p2.moveable_attributes, p3.moveable_attributes)
 
+        # Update color counters, nothing to do if the cycle stays in one bucket
+        b0 = p0._bucket
+        if not (b0 is p1._bucket and b0 is p2._bucket and b0 is p3._bucket):
+            c0, c1, c2, c3 = colors
+            if c0 is not c1:
+                b0.recolor(c0, c1)  # type: ignore[union-attr]
+            if c1 is not c2:
+                p1._bucket.recolor(c1, c2)  # type: ignore[union-attr]
+            if c2 is not c3:
+                p2._bucket.recolor(c2, c3)  # type: ignore[union-attr]
+            if c3 is not c0:
+                p3._bucket.recolor(c3, c0)  # type: ignore[union-attr]
+
         # Rotate: p0 ← p1 ← p2 ← p3 ← p0
         p0._color, p1._color, p2._color, p3._color = colors[1], colors[2], colors[3], colors[0]
         p0._annotated_by_color, p1._annotated_by_color, p2._annotated_by_color, p3._annotated_by_color = \
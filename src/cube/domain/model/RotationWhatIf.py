@@ -0,0 +1,134 @@
+"""What-if evaluation of a face or slice rotation, without touching the cube.
+
+Solvers often ask "how many pieces would be solved if I played ``alg`` 0, 1, 2
+or 3 times?". Playing it inside ``op.with_query_restore_state()`` costs four
+rotations, their sanity passes, texture updates and the undo.
+
+A face or slice turn is a set of disjoint sticker 4-cycles (the same cycles
+``Face.rotate``/``Slice.rotate`` apply). So the color that lands on a sticker
+after ``k`` plays is simply the color found ``k`` steps along its cycle - the
+score for all four rotations is a circular cross-correlation of the ring
+colors against the target colors, read once::
+
+    what_if = cube.cqr.what_if(slice_alg)
+    scores = what_if.scores(row_pieces)      # [k=0, k=1, k=2, k=3]
+
+Only the geometry is evaluated: anything that reads colors indirectly (e.g.
+a face color provider whose marks move with the pieces) must be expressed via
+``target``, see :meth:`RotationWhatIf.color_after`.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+
+from cube.domain.algs import Alg, FaceAlgBase, SimpleAlg, SliceAlgBase
+from cube.domain.exceptions import InternalSWError
+from cube.domain.model.Color import Color
+from cube.domain.model.Cube import Cube
+from cube.domain.model.PartEdge import PartEdge
+from cube.domain.model.PartSlice import PartSlice
+
+# sticker -> (its 4-cycle, index in cycle, steps along the cycle per play)
+_Position = tuple[Sequence[PartEdge], int, int]
+
+
+class RotationWhatIf:
+    """Colors the cube would have after playing a face/slice alg 0-3 times.
+
+    Supports single-axis moves: face algs (including sliced face moves) and
+    slice algs, or anything that simplifies to one of them. Build it with
+    ``cube.cqr.what_if(alg)``; it reads the cube lazily, so create a new one
+    after the cube changes.
+    """
+
+    __slots__ = ["_cube", "_positions"]
+
+    def __init__(self, cube: Cube, alg: Alg) -> None:
+        self._cube = cube
+        self._positions: dict[PartEdge, _Position] = {}
+
+        if not isinstance(alg, SimpleAlg):
+            # e.g. ``slice_alg * 2`` or ``alg.prime``
+            simple = alg.simplify().algs
+            if len(simple) == 1:
+                alg = simple[0]
+
+        if isinstance(alg, SliceAlgBase):
+            indexes = alg.normalize_slice_index(n_max=cube.n_slices,
+                                                _default=range(1, cube.n_slices + 1))
+            self._add_slice(alg.slice_name, indexes, alg.n)
+
+        elif isinstance(alg, FaceAlgBase):
+            layers = alg.normalize_slice_index(n_max=1 + cube.n_slices, _default=[1])
+            # mirrors Cube.rotate_face_and_slice
+            actual, neg_slice_index, slice_name = cube.get_face_and_rotation_info(alg.face_name, layers)
+            slice_n = -alg.n if neg_slice_index else alg.n
+            for i in actual:
+                if i == 0:
+                    edge_cycles, _ = cube.face(alg.face_name)._get_rotation_cycles()
+                    self._add_cycles(edge_cycles, alg.n)  # Face.rotate: n steps
+                else:
+                    si = cube.inv(i - 1) if neg_slice_index else i - 1
+                    self._add_slice(slice_name, [si], slice_n)
+        else:
+            raise InternalSWError(f"What-if supports only face and slice algs, got {alg}")
+
+    def _add_slice(self, slice_name, indexes: Iterable[int], n: int) -> None:
+        edge_cycles, _ = self._cube.get_slice(slice_name)._get_rotation_cycles(tuple(indexes))
+        self._add_cycles(edge_cycles, -n)  # Slice.rotate negates n
+
+    def _add_cycles(self, cycles: Iterable[Sequence[PartEdge]], steps: int) -> None:
+        # One rotate step is PartEdge.rotate_4cycle: c[j] <- c[j+1], so after
+        # k plays of ``steps`` steps, c[j] shows the color of c[j + k*steps]
+        step = steps % 4
+        positions = self._positions
+        for cycle in cycles:
+            for j, pe in enumerate(cycle):
+                positions[pe] = (cycle, j, step)
+
+    def color_after(self, pe: PartEdge, k: int) -> Color:
+        """Color ``pe`` would show after playing the alg ``k`` times."""
+        pos = self._positions.get(pe)
+        if pos is None:
+            return pe.color
+        cycle, j, step = pos
+        return cycle[(j + k * step) % 4].color
+
+    def moves(self, pe: PartEdge) -> bool:
+        """True if the alg moves this sticker."""
+        return pe in self._positions
+
+    def scores(self, pieces: Iterable[PartSlice],
+               target: Callable[[PartEdge, int], Color] | None = None) -> list[int]:
+        """Number of ``pieces`` (as positions) fully matching after 0..3 plays.
+
+        :param target: wanted color of a sticker position after ``k`` plays,
+               default ``pe.face.color`` as it is now - right as long as the
+               alg doesn't move what defines the face colors
+        :return: ``[score_0, score_1, score_2, score_3]``
+        """
+        scores = [0, 0, 0, 0]
+        positions = self._positions
+        for piece in pieces:
+            ok = [True, True, True, True]
+            for pe in piece.edges:
+                pos = positions.get(pe)
+                if target is None:
+                    want = pe.face.color
+                    if pos is None:
+                        if pe.color != want:
+                            ok = [False, False, False, False]
+                            break
+                        continue
+                    cycle, j, step = pos
+                    for k in range(4):
+                        if ok[k] and cycle[(j + k * step) % 4].color != want:
+                            ok[k] = False
+                else:
+                    for k in range(4):
+                        if ok[k] and self.color_after(pe, k) != target(pe, k):
+                            ok[k] = False
+            for k in range(4):
+                if ok[k]:
+                    scores[k] += 1
+        return scores
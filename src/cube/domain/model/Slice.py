@@ -175,6 +175,7 @@ from .Edge import Edge
 from .SliceName import SliceName
 from .SuperElement import SuperElement
 from cube.utils.Cache import CacheManager
+from cube.utils.metrics import METRICS
 from ..geometric.slice_layout import SliceLayout
 
 if TYPE_CHECKING:
@@ -486,16 +487,27 @@ class Slice(SuperElement):
             # print()
             pass
 
+        if slices_indexes is not None and not isinstance(slices_indexes, int):
+            slices_indexes = tuple(slices_indexes)  # iterated more than once below
+        # for the incremental sanity check
+        touched = ("slice", self._name, slices_indexes)
+
+        if METRICS.enabled:
+            q = n % 4
+            edge_cycles, slice_cycles = self._get_rotation_cycles(slices_indexes)
+            METRICS.inc("slice.quarter_turns", q)
+            METRICS.inc("model.4cycles", q * (len(edge_cycles) + len(slice_cycles)))
+
         _p()
         for _ in range(n % 4):
             self._rotate(slices_indexes)
             _p()
-            self.cube.modified()
+            self.cube.modified(touched)
             # Update texture directions after each step (like Face.rotate)
             self._update_texture_directions_after_rotate(1, slices_indexes)
 
         _p()
-        self.cube.reset_after_faces_changes()
+        self.cube.reset_after_faces_changes(touched)
         _p()
         self.cube.sanity()
         _p()
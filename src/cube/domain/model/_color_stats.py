@@ -0,0 +1,140 @@
+"""Live sticker color counters - O(1) is3x3 / solved checks.
+
+Every sticker (PartEdge) belongs to exactly one *bucket*: the stickers of one
+part on one face (a face's center, one side of an edge, one corner sticker).
+A bucket keeps a histogram of its stickers' colors, so "all stickers of this
+part on this face have the same color" is ``len(histogram) == 1``.
+
+    Center.is3x3   <=>  its bucket is uniform
+    Edge.is3x3     <=>  both its buckets are uniform
+    Cube.is3x3     <=>  no bucket is non-uniform (a single cube-level counter)
+
+The histograms are updated by the rotation primitives
+(``PartEdge.rotate_4cycle`` / ``PartEdge.copy_color``) - only stickers whose
+color actually moved between *different* buckets cost anything; a face
+rotation's center cycles stay within one bucket and are skipped.
+
+Direct writes to ``PartEdge._color`` bypass the counters. Such code must
+call ``Cube.reset_after_faces_changes()`` / ``Cube.modified()`` (as it
+already must, to reset the other caches), which marks the stats dirty; they
+are rebuilt on the next read. A rotation that finds a stale histogram marks
+them dirty too.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cube.domain.exceptions import InternalSWError
+
+if TYPE_CHECKING:
+    from .Color import Color
+    from .Cube import Cube
+    from .Face import Face
+    from .Part import Part
+    from .PartEdge import PartEdge
+
+
+class ColorBucket:
+    """Color histogram of the stickers of one part on one face."""
+
+    __slots__ = ["_stats", "_stickers", "_counts", "_uniform"]
+
+    def __init__(self, stats: CubeColorStats, stickers: list[PartEdge]) -> None:
+        self._stats = stats
+        self._stickers = stickers
+        # keyed by Color._value_ - str hash is cached, Enum.__hash__ is slow
+        self._counts: dict[str, int] = {}
+        self._uniform = True
+
+    @property
+    def uniform(self) -> bool:
+        """True if all stickers in this bucket have the same color."""
+        return self._uniform
+
+    def recolor(self, old: Color, new: Color) -> None:
+        """One sticker of this bucket changed from ``old`` to ``new``."""
+        counts = self._counts
+        o = old._value_
+        n = counts.get(o, 0)
+        if n == 0:
+            # someone wrote a color without telling us
+            self._stats.dirty = True
+            return
+        if n == 1:
+            del counts[o]
+        else:
+            counts[o] = n - 1
+        o = new._value_
+        counts[o] = counts.get(o, 0) + 1
+
+        uniform = len(counts) == 1
+        if uniform is not self._uniform:
+            self._uniform = uniform
+            self._stats.n_non_uniform += -1 if uniform else 1
+
+    def recount(self) -> None:
+        counts: dict[str, int] = {}
+        for s in self._stickers:
+            c = s._color._value_
+            counts[c] = counts.get(c, 0) + 1
+        self._counts = counts
+        self._uniform = len(counts) == 1
+
+
+class CubeColorStats:
+    """All buckets of a cube plus the cube-level non-uniform counter.
+
+    Created by Cube._reset(), one per cube structure.
+    """
+
+    __slots__ = ["_buckets", "n_non_uniform", "dirty"]
+
+    def __init__(self, cube: Cube) -> None:
+        self._buckets: list[ColorBucket] = []
+        self.n_non_uniform = 0
+        self.dirty = False
+
+        parts: list[Part] = [*cube.centers, *cube.edges, *cube.corners]
+        for part in parts:
+            by_face: dict[Face, list[PartEdge]] = {}
+            for s in part.all_slices:
+                for pe in s.edges:
+                    by_face.setdefault(pe.face, []).append(pe)
+            for stickers in by_face.values():
+                bucket = ColorBucket(self, stickers)
+                for pe in stickers:
+                    pe._bucket = bucket
+                self._buckets.append(bucket)
+
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recount all buckets from the stickers, O(N²)."""
+        n = 0
+        for b in self._buckets:
+            b.recount()
+            if not b.uniform:
+                n += 1
+        self.n_non_uniform = n
+        self.dirty = False
+
+    def ensure(self) -> CubeColorStats:
+        """Rebuild if dirty, return self."""
+        if self.dirty:
+            self.rebuild()
+        return self
+
+    def verify(self) -> None:
+        """Raise InternalSWError if the live counters differ from a recount."""
+        if self.dirty:
+            return
+        live = [(dict(b._counts), b.uniform) for b in self._buckets]
+        n_live = self.n_non_uniform
+        self.rebuild()
+        for (counts, uniform), b in zip(live, self._buckets):
+            if counts != b._counts or uniform != b.uniform:
+                raise InternalSWError(f"COLOR STATS: bucket {b._stickers[0].parent} drifted: "
+                                      f"live {counts}, actual {b._counts}")
+        if n_live != self.n_non_uniform:
+            raise InternalSWError(f"COLOR STATS: non uniform count drifted: "
+                                  f"live {n_live}, actual {self.n_non_uniform}")
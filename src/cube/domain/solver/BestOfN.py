@@ -0,0 +1,194 @@
+"""Best-of-N solving: solve the same cube several ways, keep the shortest solution.
+
+The solvers make fixed choices - the first face color (config.first_face_color),
+then which piece to bring first from the orientation the cube is in - and the
+solution length varies a lot with them. A *candidate* is one such variant:
+a first face color and a whole-cube rotation played before solving (whole-cube
+rotations are free, they count no moves)::
+
+    solution, results = Solvers.best_of(op, SolverName.CFOP)
+    for c in results.candidates:           # CandidateStats
+        print(c.name, c.moves, c.wall_s)
+
+The candidates are solved in a process pool (config.best_of_config), each
+process on a copy of the cube state. The shortest solution finished within
+``time_budget`` wins. The first candidate is always the plain solve (the
+configured first face color, no rotation), so the result is never longer
+than ``solver.solution()`` when that one finishes in time. If none finishes,
+the plain solve runs in the calling process.
+
+Like POST /api/solve, a candidate that is already running cannot be
+interrupted: it finishes in the background and its result is dropped.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from cube.domain.model.Color import Color
+from cube.domain.solver.solver import CandidateStats, SolverResults
+from cube.domain.solver.SolverName import SolverName
+
+if TYPE_CHECKING:
+    from cube.domain.algs.Alg import Alg
+    from cube.domain.solver.protocols import OperatorProtocol
+
+# Tried in this order for each color, the plain solve first
+_ROTATIONS: tuple[str, ...] = ("", "y", "y2", "y'")
+
+
+@dataclass(frozen=True)
+class Candidate:
+    first_face_color: Color
+    # Whole-cube rotation played before solving, "" for none
+    rotation: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"{self.first_face_color.name} {self.rotation}".rstrip()
+
+
+def candidates(colors: list[Color], n: int) -> list[Candidate]:
+    """The first ``n`` variants: every color of ``colors`` (first is the plain solve), then each rotation."""
+    return [Candidate(color, rotation) for rotation in _ROTATIONS for color in colors][:max(1, n)]
+
+
+# -- Pool process side --
+
+# Pool kind of the reused apps, see cube.application.app_pool
+_POOL_KIND = "best_of"
+
+
+def solve_candidate(size: int, facelets: bytes, solver: SolverName,
+                    candidate: Candidate) -> tuple[list[str], int, float]:
+    """Solve one candidate, in a pool process: (optimized solution moves, its count(), wall seconds)."""
+    from cube.application.app_pool import discard_pooled_app, pooled_app
+    from cube.domain.algs import Algs
+    from cube.domain.algs.AnnotationAlg import AnnotationAlg
+    from cube.domain.algs.SeqAlg import SeqAlg
+    from cube.domain.exceptions import InternalSWError
+
+    app = pooled_app(_POOL_KIND, size)
+    app.cube.set_facelets(facelets)
+    app.config.first_face_color = candidate.first_face_color
+    app.switch_to_solver(solver)
+
+    start = time.perf_counter()
+    try:
+        if candidate.rotation:
+            app.op.play(Algs.parse(candidate.rotation))
+        app.slv.solve(animation=False, debug=False)
+    except Exception:
+        discard_pooled_app(_POOL_KIND, size)
+        raise
+    wall_s = time.perf_counter() - start
+    if not app.cube.solved:
+        raise InternalSWError(f"Candidate {candidate.name} did not reach a solved cube")
+
+    algs = [a for a in app.op.history_view() if not isinstance(a, AnnotationAlg)]
+    solution = SeqAlg(None, *algs).optimize()
+    return [str(a) for a in solution.algs], solution.count(), wall_s
+
+
+# -- Caller side --
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
+
+
+def _reset_pool() -> None:
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL, _POOL_WORKERS
+    if _POOL is None or _POOL_WORKERS != workers:
+        _reset_pool()
+        # spawn, not fork: the caller may run an asyncio loop and threads
+        _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _POOL_WORKERS = workers
+    return _POOL
+
+
+def best_of(op: "OperatorProtocol", solver: SolverName, n: int | None = None,
+            time_budget: float | None = None, workers: int | None = None) -> tuple["Alg", SolverResults]:
+    """Shortest solution of ``op.cube`` among ``n`` candidates, see module docstring.
+
+    Parameters left None come from config.best_of_config. The cube is not
+    changed. ``results.candidates`` has the stats of every candidate, in
+    the order they were submitted.
+    """
+    from cube.domain.algs import Algs
+
+    config = op.app_state.config
+    best_of_config = config.best_of_config
+    n = best_of_config.candidates if n is None else n
+    time_budget = best_of_config.time_budget if time_budget is None else time_budget
+    workers = best_of_config.workers if workers is None else workers
+
+    cube = op.cube
+    first = config.first_face_color
+    colors = [first, *(f.original_color for f in cube.faces if f.original_color is not first)]
+    variants = candidates(colors, n)
+    facelets = cube.get_facelets()
+
+    stats = [CandidateStats(c.name) for c in variants]
+    solutions: list[list[str] | None] = [None] * len(variants)
+
+    def finished(i: int, result: tuple[list[str], int, float]) -> None:
+        solutions[i], stats[i].moves, stats[i].wall_s = result
+
+    deadline = time.monotonic() + time_budget
+
+    if workers > 0:
+        pool = _pool(workers)
+        futures: list[Future[tuple[list[str], int, float]]] = [
+            pool.submit(solve_candidate, cube.size, facelets, solver, c) for c in variants
+        ]
+        wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        for i, future in enumerate(futures):
+            if not future.done():
+                future.cancel()
+                stats[i].error = "timeout"
+            elif (error := future.exception()) is not None:
+                stats[i].error = repr(error)
+                if isinstance(error, BrokenProcessPool):
+                    # A pool process died (e.g. OOM); start a fresh pool next time
+                    _reset_pool()
+            else:
+                finished(i, future.result())
+    else:
+        for i, c in enumerate(variants):
+            if time.monotonic() >= deadline:
+                stats[i].error = "timeout"
+                continue
+            try:
+                finished(i, solve_candidate(cube.size, facelets, solver, c))
+            except Exception as e:
+                stats[i].error = repr(e)
+
+    results = SolverResults()
+    results._candidates = stats
+
+    best: int | None = None
+    for i, moves in enumerate(solutions):
+        if moves is not None and (best is None or stats[i].moves < stats[best].moves):  # type: ignore[operator]
+            best = i
+
+    if best is None:
+        # Nothing finished in time: the plain solve, here
+        from cube.domain.solver.Solvers import Solvers
+
+        return Solvers.by_name(solver, op).solution().optimize(), results
+
+    moves = solutions[best]
+    assert moves is not None
+    return Algs.parse(" ".join(moves)) if moves else Algs.alg(None), results
@@ -165,7 +165,8 @@ class NxNSolverOrchestrator(AbstractSolver):
             return sr
 
         if what == SolveStep.NxNEdges:
-            results = self._reducer.reduce(self._is_debug_enabled)
+            with self._step("reduce"):
+                results = self._reducer.reduce(self._is_debug_enabled)
             sr._was_partial_edge_parity = results.partial_edge_parity_detected
             return sr
 
@@ -193,7 +194,8 @@ class NxNSolverOrchestrator(AbstractSolver):
         # - Only detected later in L3Cross when 1 or 3 edges are flipped
         # - Handled by the retry loop below via EvenCubeEdgeParityException
         #
-        reduction_results = self._reducer.reduce(debug)
+        with self._step("reduce"):
+            reduction_results = self._reducer.reduce(debug)
         if reduction_results.partial_edge_parity_detected:
             partial_edge_detected = True
 
@@ -244,21 +246,23 @@ class NxNSolverOrchestrator(AbstractSolver):
             if self._cube.solved:
                 break
 
-            self.debug(f"@@@@ Iteration # {attempt}")
+            self.debug(lambda: f"@@@@ Iteration # {attempt}")
 
             try:
                 if parity_detector is not None:
                     # Use parity detector in QUERY MODE:
                     # - with_query_restore_state(): All moves are rolled back after
                     # - Parity detector raises exceptions, orchestrator catches and fixes
-                    with self._op.with_query_restore_state():
+                    with self._step(f"parity_detect#{attempt}"), self._op.with_query_restore_state():
                         parity_detector.solve_3x3(debug, what)
                     # No exception = no parity, state restored
                     # Now let actual solver solve
-                    self._solver_3x3.solve_3x3(debug, what)
+                    with self._step(f"3x3#{attempt}"):
+                        self._solver_3x3.solve_3x3(debug, what)
                 else:
                     # Solver can detect parity itself (BeginnerSolver3x3, CFOP)
-                    self._solver_3x3.solve_3x3(debug, what)
+                    with self._step(f"3x3#{attempt}"):
+                        self._solver_3x3.solve_3x3(debug, what)
 
             except EvenCubeEdgeParityException:
                 # =============================================================
@@ -267,13 +271,14 @@ class NxNSolverOrchestrator(AbstractSolver):
                 # Detected by L3Cross: 1 or 3 edges flipped (impossible on 3x3)
                 # L3Cross throws, orchestrator catches and fixes via reducer.
                 # After fix, edges are disturbed -> need to re-reduce
-                self.debug(f"Catch even edge parity in iteration #{attempt}")
+                self.debug(lambda: f"Catch even edge parity in iteration #{attempt}")
                 if even_edge_parity_detected:
                     raise InternalSWError("Edge parity detected twice - fix_edge_parity failed")
                 even_edge_parity_detected = True
                 self._op.enter_single_step_mode(SSCode.NxN_EDGE_PARITY_FIX)
-                self._reducer.fix_edge_parity()  # Flip all inner slices of any edge
-                self._reducer.reduce(debug)       # Re-reduce (fix disturbs pairing)
+                with self._step("edge_parity_fix"):
+                    self._reducer.fix_edge_parity()  # Flip all inner slices of any edge
+                    self._reducer.reduce(debug)       # Re-reduce (fix disturbs pairing)
                 continue  # retry
 
             except EvenCubeCornerSwapException:
@@ -286,13 +291,14 @@ class NxNSolverOrchestrator(AbstractSolver):
                 #
                 # The corner swap algorithm swaps diagonal corners on U face.
                 # Any diagonal swap fixes parity - only requirement is yellow up.
-                self.debug(f"Catch corner swap in iteration #{attempt}")
+                self.debug(lambda: f"Catch corner swap in iteration #{attempt}")
                 if corner_swap_detected:
                     raise InternalSWError("Corner parity detected twice - fix_corner_parity failed")
                 corner_swap_detected = True
                 self._op.enter_single_step_mode(SSCode.NxN_CORNER_PARITY_FIX)
-                self._reducer.fix_corner_parity()  # Swap diagonal corners
-                self._reducer.reduce(debug)         # Re-reduce (fix disturbs edges)
+                with self._step("corner_parity_fix"):
+                    self._reducer.fix_corner_parity()  # Swap diagonal corners
+                    self._reducer.reduce(debug)         # Re-reduce (fix disturbs edges)
                 continue  # retry
 
             # Verify solved after ALL step (same check as original)
@@ -1,11 +1,16 @@
 """Solver factory - creates solver instances using orchestrator pattern."""
 
+from typing import TYPE_CHECKING
+
 from cube.domain.exceptions import InternalSWError
 from cube.domain.solver.protocols import OperatorProtocol
 
-from .solver import Solver
+from .solver import Solver, SolverResults
 from .SolverName import SolverName
 
+if TYPE_CHECKING:
+    from cube.domain.algs.Alg import Alg
+
 
 class Solvers:
     """
@@ -153,6 +158,20 @@ class Solvers:
         parent_logger = op.cube.sp.logger
         return DirectLayerByLayerNxNSolver(op, parent_logger)
 
+    @staticmethod
+    def best_of(op: OperatorProtocol, solver_id: SolverName, n: int | None = None,
+                time_budget: float | None = None, workers: int | None = None) -> "tuple[Alg, SolverResults]":
+        """
+        Solve the cube as ``n`` variants in parallel and return the shortest solution.
+
+        Variants are first face colors and whole-cube rotations, solved in worker
+        processes on a copy of the state; the cube is not changed. The stats of
+        each variant are in ``SolverResults.candidates``. See BestOfN.
+        """
+        from .BestOfN import best_of
+
+        return best_of(op, solver_id, n, time_budget, workers)
+
     @classmethod
     def next_solver(cls, current: SolverName, op: OperatorProtocol) -> Solver:
         """Get the next solver in rotation (skips hidden, unimplemented, and incompatible solvers)."""
@@ -307,10 +307,10 @@ class _2x2L1Corners(SolverHelper):
             # now bring source cornet into under it  FRD
 
             if sc().on_face(wf):
-                self.debug(f"LO-Corners C1. source {sc()} is on top")
+                self.debug(lambda: f"LO-Corners C1. source {sc()} is on top")
                 self._bring_top_corner_to_f_r_d(sc())
             else:
-                self.debug(f"LO-Corners C2. source {sc()} is on bottom")
+                self.debug(lambda: f"LO-Corners C2. source {sc()} is on bottom")
                 self._bring_bottom_corner_to_f_r_d(sc())
 
             # Now source is on FRD
@@ -318,7 +318,7 @@ class _2x2L1Corners(SolverHelper):
 
             # is the white is on the down
             if sc().face_color(wf.opposite) == white_color:
-                self.debug(f"{white_color} is on bottom")
+                self.debug(lambda: f"{white_color} is on bottom")
                 self.op.play(Algs.R.prime + Algs.D.prime * 2 + Algs.R + Algs.D)
                 assert self.cube.front.corner_bottom_right is sc()
                 assert sc().face_color(wf.opposite) != white_color
@@ -25,6 +25,7 @@ from cube.domain.model import Color, Corner
 from cube.domain.model.Face import Face
 from cube.domain.solver._2x2_beginner._l3_utils import find_yellow_color, find_white_face, bring_white_to_down
 from cube.domain.solver.AnnWhat import AnnWhat
+from cube.domain.solver.common.LastLayerRecognizer import corner_ring
 from cube.domain.solver.common.SolverHelper import StepSolver
 from cube.domain.solver.protocols import SolverElementsProvider
 
@@ -160,45 +161,39 @@ class L3Permute(StepSolver):
                       white_color: Color, yellow_color: Color) -> int:
         """Check if any U rotation aligns top with bottom. No moves made.
 
+        Reads the top corners once (see LastLayerRecognizer ring order): a
+        clockwise turn of ``up`` moves ring corner k to k+1.
+
         :return >= 0 if is aligned the number o required rotations to align
         """
 
-        n = 0
-        with self.op.with_query_restore_state():
-            for _ in range(4):
-                if self._all_in_position(up, down, white_color, yellow_color):
-                    return n
-                self.op.play(Algs.U)
-                n += 1
+        top = corner_ring(up)
+        top_ids = [c.colors_id - {yellow_color} for c in top]
+        below_ids = [self._corner_below(c, up, down).colors_id - {white_color} for c in top]
+
+        for n in range(4):
+            if all(top_ids[k] == below_ids[(k + n) % 4] for k in range(4)):
+                return n
 
-            return -1
+        return -1
+
+    def _corner_below(self, corner: Corner, up: Face, down: Face) -> Corner:
+        """The corner of ``down`` sharing ``corner``'s two side faces."""
+        sides = [f for f in self.cube.faces if f is not up and corner in f.corners]
+        return next(c for c in down.corners if all(c in f.corners for f in sides))
 
     def _try_u_alignment(self, up: Face, down: Face,
                          white_color: Color, yellow_color: Color) -> bool:
         """Apply U rotations to align top layer with bottom. Returns True if aligned."""
 
-        def _try() -> int:
-
-            n = 0
-            with self.op.with_query_restore_state():
-                for _ in range(4):
-                    if self._all_in_position(up, down, white_color, yellow_color):
-                        return n
-                    self.op.play(Algs.U)
-                    n += 1
-
-                return -1
-
-
-        # After 4 U rotations we're back to the original state
         n = self._is_u_aligned(up, down, white_color, yellow_color)
         if n < 0:
             return False
         else:
-            self.op.play( (Algs.U * n).simplify())
+            if n:
+                self.op.play((Algs.of_face(up.name) * n).simplify())
             return True
 
-
     def _corner_in_position(self, top_corner: Corner, bottom_corner: Corner,
                             white_color: Color, yellow_color: Color) -> bool:
         """Check if a single top corner matches the bottom corner below it."""
@@ -179,7 +179,7 @@ class Solver2x2IDA(Solver2x2Base):
         if slot == 7 and co == 0:
             return  # Already in place with correct orientation
 
-        self.debug(f"DBL piece at slot {slot} co={co}, rotating to fix")
+        self.debug(lambda: f"DBL piece at slot {slot} co={co}, rotating to fix")
         for alg in _ORIENT_TABLE[(slot, co)]:
             self.op.play(alg)
 
@@ -197,7 +197,7 @@ class Solver2x2IDA(Solver2x2Base):
         # IDA* search returns a list of move indices
         solution: list[int] = ida_solve(perm, twist, tables)
 
-        self.debug(f"IDA* solution: {len(solution)} moves")
+        self.debug(lambda: f"IDA* solution: {len(solution)} moves")
         assert len(solution) <= 11, f"IDA* returned {len(solution)} moves (max is 11)"
 
         # Play each move on the physical cube
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING
 
 from cube.domain.model.Color import Color
@@ -204,39 +204,28 @@ class BeginnerSolver3x3(BaseSolver, Solver3x3Protocol):
 
         self._select_best_start_color()
 
-        # Execute appropriate solve steps
+        # Execute appropriate solve steps, they are cumulative and each one
+        # is recorded in SolverResults.steps
         # Note: L3 steps may raise parity exceptions on even cubes
-        match what:
-            case SolveStep.L1x:
-                self.l1_cross.solve()
-
-            case SolveStep.L1:
-                self.l1_cross.solve()
-                self.l1_corners.solve(self.l1_cross)
-
-            case SolveStep.L2:
-                self.l1_cross.solve()
-                self.l1_corners.solve(self.l1_cross)
-                self.l2.solve()
-
-            case SolveStep.L3x:
-                self.l1_cross.solve()
-                self.l1_corners.solve(self.l1_cross)
-                self.l2.solve()
-                self.l3_cross.solve()
-
-            case SolveStep.ALL | SolveStep.L3:
-                self.l1_cross.solve()
-                self.l1_corners.solve(self.l1_cross)
-                self.l2.solve()
-                self.l3_cross.solve()
-                self.l3_corners.solve()
-
-            case SolveStep.F2L:
-                # F2L is CFOP terminology, but support it here too
-                self.l1_cross.solve()
-                self.l1_corners.solve(self.l1_cross)
-                self.l2.solve()
+        stages: list[tuple[SolveStep, Callable[[], object]]] = [
+            (SolveStep.L1x, self.l1_cross.solve),
+            (SolveStep.L1, lambda: self.l1_corners.solve(self.l1_cross)),
+            (SolveStep.L2, self.l2.solve),
+            (SolveStep.L3x, self.l3_cross.solve),
+            (SolveStep.L3, self.l3_corners.solve),
+        ]
+        n_stages = {
+            SolveStep.L1x: 1,
+            SolveStep.L1: 2,
+            # F2L is CFOP terminology, but support it here too
+            SolveStep.L2: 3, SolveStep.F2L: 3,
+            SolveStep.L3x: 4,
+            SolveStep.ALL: 5, SolveStep.L3: 5,
+        }.get(what, 0)
+
+        for step, solve in stages[:n_stages]:
+            with self._step(step.name):
+                solve()
 
         return sr
 
@@ -291,7 +280,7 @@ class BeginnerSolver3x3(BaseSolver, Solver3x3Protocol):
         best_face, grade = _find_best_l1_face(self._cube.faces, white)
 
         if best_face is not None and best_face.color != white:
-            self._logger.debug(None, f"L1 grade {grade} on {best_face.color}, using as start color")
+            self._logger.debug(None, lambda: f"L1 grade {grade} on {best_face.color}, using as start color")
             self.cmn._start_color = best_face.color
         else:
             self.cmn._start_color = white
@@ -67,7 +67,7 @@ class L2(SolverHelper):
 
         if st.match:
             # because we have cross and L1, so if it matches then it is in position
-            self.debug(f"L2-C0. {st.position} matches")
+            self.debug(lambda: f"L2-C0. {st.position} matches")
             return
 
         with self.ann.annotate((edge_id, AnnWhat.Moved), (self.cube.front.edge_top, AnnWhat.FixedPosition),
@@ -85,7 +85,7 @@ class L2(SolverHelper):
         assert not st.actual.on_face(down)
 
         if not st.actual.on_face(up):
-            self.debug(f"L2-C1. source {st.actual} is not on top")
+            self.debug(lambda: f"L2-C1. source {st.actual} is not on top")
 
             self._bring_edge_to_front_right(st.actual)
 
@@ -96,7 +96,7 @@ class L2(SolverHelper):
             assert st.actual.on_face(up)
 
         else:
-            self.debug(f"L2-C2. source {st.actual} is on top")
+            self.debug(lambda: f"L2-C2. source {st.actual} is on top")
 
         # now source is no top
 
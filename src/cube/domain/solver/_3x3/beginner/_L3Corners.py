@@ -3,6 +3,7 @@ from cube.domain.exceptions import EvenCubeCornerSwapException, InternalSWError
 from cube.domain.model import Corner, FaceName, Part
 from cube.domain.model.Face import Face
 from cube.domain.solver.AnnWhat import AnnWhat
+from cube.domain.solver.common.LastLayerRecognizer import auf_count
 from cube.domain.solver.common.SolverHelper import SolverHelper
 from cube.domain.tracker.Tracker import CornerTracker
 from cube.domain.solver.protocols import SolverElementsProvider
@@ -26,7 +27,7 @@ class L3Corners(SolverHelper):
 
         yf: Face = self.white_face.opposite
 
-        return self.cqr.rotate_face_and_check(yf, self._is_solved, self.op) >= 0
+        return auf_count(yf, edges=False) >= 0
 
     def solve(self):
 
@@ -4,6 +4,7 @@ from cube.domain.model import Edge, FaceName, Part
 from cube.domain.model.Face import Face
 from cube.domain.solver.AnnWhat import AnnWhat
 from cube.domain.solver.common.BaseSolver import BaseSolver
+from cube.domain.solver.common.LastLayerRecognizer import auf_count
 from cube.domain.solver.common.SolverHelper import SolverHelper
 from cube.domain.tracker.Tracker import EdgeTracker
 
@@ -26,7 +27,7 @@ class L3Cross(SolverHelper):
 
         yf: Face = self.white_face.opposite
 
-        return self.cqr.rotate_face_and_check(yf, self._is_solved, self.op) >= 0
+        return auf_count(yf, corners=False) >= 0
 
     def solve(self):
 
@@ -42,7 +43,7 @@ class L3Cross(SolverHelper):
         # 'yellow' face
         yf: Face = self.white_face.opposite
 
-        n = self.cqr.rotate_face_and_check(yf, self._is_solved, self.op)
+        n = auf_count(yf, corners=False)
         if n >= 0:
             if n > 0:
                 # the query solves by rotate  n, so we need
@@ -84,7 +85,7 @@ class L3Cross(SolverHelper):
         bottom = int(yf.edge_bottom.match_face(yf))
         n: int = left + right + top + bottom
 
-        self.debug(f"L3 cross-color: {n} match {yf}")
+        self.debug(lambda: f"L3 cross-color: {n} match {yf}")
 
         if n not in [0, 2, 4]:
             if self.cube.n_slices % 2 == 0 or self.cube.is_even_cube_shadow:
@@ -139,9 +140,9 @@ class L3Cross(SolverHelper):
 
         right = EdgeTracker.of_position(yf.edge_right)
 
-        self.debug(f"L3-Cross-Pos, right before moving:{right}")
+        self.debug(lambda: f"L3-Cross-Pos, right before moving:{right}")
         self._bring_edge_to_right_up(right.actual)
-        self.debug(f"L3-Cross-Pos, right after moving:{right}")
+        self.debug(lambda: f"L3-Cross-Pos, right after moving:{right}")
 
         assert right.match
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from cube.domain.solver._3x3.shared.L1Cross import L1Cross
@@ -99,26 +100,24 @@ class CFOP3x3(BaseSolver, Solver3x3Protocol):
         if what is None:
             what = SolveStep.ALL
 
-        # Execute appropriate solve steps
-        match what:
+        # Steps are cumulative, each one is recorded in SolverResults.steps
+        stages: list[tuple[SolveStep, Callable[[], object]]] = [
+            (SolveStep.L1x, self.l1_cross.solve),
+            (SolveStep.F2L, self.f2l.solve),
+            (SolveStep.OLL, self.oll.solve),
+            (SolveStep.PLL, self.pll.solve),
+        ]
+        n_stages = {
             # CFOP knows only L1 cross, so L1x and L1 are the same
-            case SolveStep.L1x | SolveStep.L1:
-                self.l1_cross.solve()
-
-            case SolveStep.F2L | SolveStep.L2:
-                self.l1_cross.solve()
-                self.f2l.solve()
-
-            case SolveStep.OLL | SolveStep.L3x:
-                self.l1_cross.solve()
-                self.f2l.solve()
-                self.oll.solve()
-
-            case SolveStep.ALL | SolveStep.L3 | SolveStep.PLL:
-                self.l1_cross.solve()
-                self.f2l.solve()
-                self.oll.solve()
-                self.pll.solve()
+            SolveStep.L1x: 1, SolveStep.L1: 1,
+            SolveStep.F2L: 2, SolveStep.L2: 2,
+            SolveStep.OLL: 3, SolveStep.L3x: 3,
+            SolveStep.ALL: 4, SolveStep.L3: 4, SolveStep.PLL: 4,
+        }.get(what, 0)
+
+        for step, solve in stages[:n_stages]:
+            with self._step(step.name):
+                solve()
 
         return sr
 
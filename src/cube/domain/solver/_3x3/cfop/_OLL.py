@@ -1,4 +1,3 @@
-import re
 from typing import Tuple
 
 from cube.domain.algs import Algs
@@ -7,6 +6,7 @@ from cube.domain.exceptions import EvenCubeEdgeParityException, InternalSWError
 from cube.domain.model import FaceName, Part
 from cube.domain.model.Face import Face
 from cube.domain.solver.common.BaseSolver import BaseSolver
+from cube.domain.solver.common.LastLayerRecognizer import PatternTable, oll_code, rotations
 from cube.domain.solver.common.SolverHelper import StepSolver
 
 _algs: dict[str, Alg | str] = {}
@@ -17,6 +17,9 @@ class OLL(StepSolver):
     Credits to https://ruwix.com/the-rubiks-cube/advanced-cfop-fridrich/orient-the-last-layer-oll/
     """
 
+    # Built on first use from _get_algs_db(), shared by all instances
+    _table: PatternTable | None = None
+
     def __init__(self, slv: BaseSolver) -> None:
         super().__init__(slv, "OLL")
         self._algs_db: list[Tuple[str, str, str]] = []
@@ -38,7 +41,8 @@ class OLL(StepSolver):
         Can be solved only by rotate
         :return:
         """
-        return self.cqr.rotate_face_and_check(self.yellow_face, lambda: self.is_solved, self.op) >= 0
+        # Turning the face doesn't change which stickers have its color
+        return self.is_solved
 
     def solve(self):
 
@@ -66,33 +70,25 @@ class OLL(StepSolver):
 
     def _do_oll(self) -> None:
 
-        state: str = ""
-        alg: Alg | None = None
-        description = ""
-        for r in range(4):
-            state = self._encode_state()
-            self.debug(f"Found state after {r} rotations:\n{state}")
-
-            description_alg: tuple[str, Alg] | None = self._get_state_alg(state)
-
-            if description_alg is not None:
-                description, alg = description_alg
-                break  # found
-
-            # if r == 3:
-            #     break  # don't rotate again, we failed to found
+        match = self._get_table().lookup(self.cube)
 
-            self.play(Algs.Y)
+        if match is None:
+            raise InternalSWError(f"Unknown OLL state:\n {self._encode_state()}")
 
-        if alg is None:
-            raise InternalSWError(f"Unknown OLL state:\n {state}")
+        self.debug(lambda: f"Found OLL alg '{match.name}' {match.alg} after {match.pre}")
 
-        self.debug(f"Found OLL alg '{description}' {alg}")
-
-        self.play(alg)
+        self.play(match.pre + match.alg)
 
         assert self.is_solved
 
+    def _get_table(self) -> PatternTable:
+        """Every y rotation of every case of _get_algs_db(), see LastLayerRecognizer."""
+        table = OLL._table
+        if table is None:
+            cases = [(description, alg) for _, description, alg in self._get_algs_db()]
+            table = OLL._table = PatternTable(oll_code, cases, rotations(Algs.Y))
+        return table
+
     def _check_edge_parity(self) -> None:
         """
         Check for edge parity and raise exception if detected.
@@ -110,7 +106,7 @@ class OLL(StepSolver):
 
         if n_edges not in [0, 2, 4]:
             if self.cube.n_slices % 2 == 0 or self.cube.is_even_cube_shadow:
-                self.debug(f"OLL: Edge parity detected ({n_edges} edges matching)")
+                self.debug(lambda: f"OLL: Edge parity detected ({n_edges} edges matching)")
                 raise EvenCubeEdgeParityException()
             else:
                 # on odd cube it should be solved by edges
@@ -169,54 +165,6 @@ class OLL(StepSolver):
 
         return "\n".join([s1, s2, s3, s4])
 
-    def _get_state_alg(self, state: str) -> Tuple[str, Alg] | None:
-
-        d_alg = self._get_state_alg_raw(state)
-
-        if not d_alg:
-            return None
-
-        alg = d_alg[1]
-        description = d_alg[0]
-        self.debug(f"Found (raw) alg: {description} : {alg}")
-
-        if isinstance(alg, str):
-            alg = Algs.parse(alg, compat_3x3=True)
-
-        return description, alg
-
-    def _get_state_alg_raw(self, state: str) -> Tuple[str, Alg | str] | None:
-        """
-
-        Credits to https://ruwix.com/the-rubiks-cube/advanced-cfop-fridrich/orient-the-last-layer-oll/
-
-        Why case ond not dictionary ? Se we can check coverage
-        :param state:
-        :return:
-        """
-
-        # normalize it to my form
-        state2 = state.strip().replace("\n", ", ")
-        state = state.strip().replace("\n", "")
-        self.debug(f"Comparing state:{state2}")
-
-        dbs: list[tuple[str, str, str]] = self._get_algs_db()
-
-        for d in dbs:
-
-            st0 = d[0]
-
-            st = re.sub(r'\s+', "", st0)
-            st = st.lower()
-
-            assert len(st) == 12, str((st0, d[1]))
-            assert st.count("y") + st.count("-") == 12, str((st0, d[1]))
-
-            if st == state:
-                return d[1], d[2]
-
-        return None
-
     def _get_algs_db(self) -> list[Tuple[str, str, str]]:
 
         """
@@ -244,7 +192,8 @@ class OLL(StepSolver):
            --  Y   Y      --
                --  --  Y
 
-        Whitespaces are ignored.
+        Whitespaces are ignored. The patterns document the cases; matching
+        uses a LastLayerRecognizer table built from the algs.
 
 
         :return:
@@ -9,6 +9,7 @@ from cube.domain.exceptions import (
 )
 from cube.domain.model import Part
 from cube.domain.solver.common.BaseSolver import BaseSolver
+from cube.domain.solver.common.LastLayerRecognizer import PatternTable, auf_count, pll_code, rotations
 from cube.domain.solver.common.SolverHelper import StepSolver
 
 
@@ -20,6 +21,42 @@ class PLL(StepSolver):
 
     """
 
+    # Cases in the order they were matched, see _get_table()
+    _CASES: list[Tuple[str, str]] = [
+        # Edges Only
+        ("Ua Perm", "M2' U M U2 M' U M2'"),
+        ("Ub Perm", "M2' U' M U2' M' U' M2'"),
+        ("Z Perm", "(M2' U' M2' U') M' (U2 M2' U2) M'"),
+        ("H Perm", "(M2' U M2') U2 (M2' U M2')"),
+
+        # Corners Only
+        ("Aa Perm", "x (R' U R') D2 (R U' R') D2 R2 x'"),
+        ("Ab Perm", "x R2' D2 (R U R') D2 (R U' R) x'"),
+        ("E Perm", "x' (R U' R' D) (R U R' D') (R U R' D) (R U' R' D') x"),
+
+        # Swap Adjacent Corners
+        ("Ra Perm", "y' (L U2 L' U2) L F' (L' U' L U) L F L2' U"),
+        ("Rb Perm", "(R' U2 R U2') R' F (R U R' U') R' F' R2 U'"),
+        ("Ja Perm", "y' (L' U' L F) (L' U' L U) L F' L2' U L U'"),
+        ("Jb Perm", "(R U R' F') (R U R' U') R' F R2 U' R' U'"),
+        ("T Perm", "(R U R' U') R' F R2 U' R' U' R U R' F'"),
+        ("F Perm", "(R' U' F') (R U R' U') (R' F R2 U') (R' U' R U) (R' U R)"),
+
+        # Swap Diagonal Corners
+        ("V Perm", "(R' U R' U') y (R' F' R2 U') (R' U R' F) R F"),
+        ("Y Perm", "F (R U' R' U') (R U R' F') (R U R' U') (R' F R F')"),
+        ("Na Perm", "(R U R' U) (R U R' F') (R U R' U') (R' F R2 U') R' U2 (R U' R')"),
+        ("Nb Perm", "(R' U R U') (R' F' U' F) (R U R' F) R' F' (R U' R)"),
+
+        # Double Cycles
+        ("Ga Perm", "R2 U (R' U R' U') (R U' R2) D U' (R' U R D') U"),
+        ("Gb Perm", "(F' U' F) (R2 u R' U) (R U' R u') R2'"),
+        ("Gc Perm", "R2 U' (R U' R U) (R' U R2 D') (U R U' R') D U'"),
+        ("Gd Perm", "(R U R') y' (R2 u' R U') (R' U R' u) R2"),
+    ]
+
+    _table: PatternTable | None = None
+
     def __init__(self, slv: BaseSolver) -> None:
         super().__init__(slv, "PLL")
 
@@ -32,7 +69,7 @@ class PLL(StepSolver):
         Can be solved only by rotate
         :return:
         """
-        return self.cqr.rotate_face_and_check(self.yellow_face, lambda: self.is_solved, self.op) >= 0
+        return auf_count(self.yellow_face) >= 0
 
     def solve(self):
 
@@ -56,14 +93,14 @@ class PLL(StepSolver):
 
         assert self.is_solved
 
-    def _rotate_and_solve(self):
-        rotate_alg = self.cqr.rotate_face_and_check_get_alg(self.cmn.white_face.opposite,
-                                                            lambda: self.is_solved, self.op)
+    def _rotate_and_solve(self) -> bool:
+        yf = self.yellow_face
+        n = auf_count(yf)
 
-        if rotate_alg:
-            self.play(rotate_alg)
+        if n > 0:
+            self.play(self.cmn.face_rotate(yf) * n)
 
-        return rotate_alg
+        return n >= 0
 
     def _do_pll(self):
         description_alg = self._search_pll_alg()
@@ -71,7 +108,7 @@ class PLL(StepSolver):
         if description_alg is not None:
             # Found a PLL alg - apply it
             search_alg, description, alg = description_alg
-            self.debug(f"Found PLL alg '{description}' {alg}")
+            self.debug(lambda: f"Found PLL alg '{description}' {alg}")
             self.play((search_alg + alg).simplify())
             self._rotate_and_solve()  # because all our searching U
 
@@ -100,7 +137,7 @@ class PLL(StepSolver):
 
         search_alg, description, alg = description_alg
 
-        self.debug(f"Found PLL alg '{description}' {alg}")
+        self.debug(lambda: f"Found PLL alg '{description}' {alg}")
 
         self.play((search_alg + alg).simplify())
 
@@ -181,183 +218,32 @@ class PLL(StepSolver):
     def _search_pll_alg(self) -> Tuple[Alg, str, Alg] | None:
 
         """
-        We need both Y and U !!!
-        :return:
+        Recognize the case from one read of the up layer (see LastLayerRecognizer).
+        :return: (the Y/U rotation to play before the alg, description, alg)
         """
 
-        #new todo use cube.application.commands.Operator.Operator.with_query_restore_state
-
-        rotate_while_search = self.cube.config.solver_pll_rotate_while_search
-
-        search_alg: Alg = Algs.no_op()
-
-        try:
-            for y in range(4):
-
-                for u in range(4):
+        match = self._get_table().lookup(self.cube)
 
-                    description_alg: Tuple[str, Alg] | None = self._get_state_alg()
-
-                    if description_alg is not None:
-                        return search_alg.simplify(), description_alg[0], description_alg[1]
-
-                    if rotate_while_search:
-                        self.play(Algs.U)  #
-                    else:
-                        Algs.U.play(self.cube)
-                        search_alg += Algs.U
-
-                # well we want to rotate, to leave cube in original state so it is easier to debug
-                if rotate_while_search:
-                    self.play(Algs.Y)  #
-                else:
-                    Algs.Y.play(self.cube)
-                    search_alg = search_alg + Algs.Y
-
-        finally:
-            search_alg.simplify().inv().play(self.cube)
-
-        return None
-
-    def _get_state_alg(self) -> Tuple[str, Alg] | None:
-
-        d_alg = self._get_state_alg_raw()
-
-        if not d_alg:
+        if match is None:
             return None
 
-        alg = d_alg[1]
-        description = d_alg[0]
-        self.debug(f"Found (raw) alg: {description} : {alg}")
+        self.debug(lambda: f"Found (raw) alg: {match.name} : {match.alg}")
 
-        if isinstance(alg, str):
-            alg = Algs.parse(alg, compat_3x3=True)
+        if self.cube.config.solver_pll_rotate_while_search:
+            # Show the rotations as their own moves
+            self.play(match.pre)
+            return Algs.no_op(), match.name, match.alg
 
-        return description, alg
+        return match.pre, match.name, match.alg
 
-    def _get_state_alg_raw(self) -> Tuple[str, Alg | str] | None:
-        """
+    @staticmethod
+    def _get_table() -> PatternTable:
+        """Every Y then U rotation of every case, in the order the old trial search tried them.
 
         Credits to https://ruwix.com/the-rubiks-cube/advanced-cfop-fridrich/orient-the-last-layer-oll/
                     https://cubingcheatsheet.com/algs3x_pll.html
-
-        :return:
         """
-
-        cube = self.cube
-
-        def is_r0(permute: Tuple[Part, ...]):
-            """
-            permute = p1, p2, p3
-            --> belongs
-            p1 --> p2 --p3 --> p1
-            :param permute: p1, p2 [p3]
-            :return:
-            """
-
-            assert len(permute) > 1
-            p: Part
-            for i, p in enumerate(permute[:-1]):
-
-                if p.required_position is not permute[i + 1]:
-                    return False
-            return permute[-1].required_position is permute[0]  # p3-->p1
-
-        def is_r(*permutes: Tuple[Part, ...]):
-            """
-            --> belongs
-            p1 --> p2 --p3 --> p1
-            :param permutes: see :is_r0
-            :return:
-            """
-
-            others = set(cube.up.parts)
-
-            for permute in permutes:
-                if not is_r0(permute):
-                    return False
-                others -= set(permute)
-
-            return all(p.in_position for p in others)
-
-        lu = cube.lu
-        bu = cube.bu
-        ru = cube.ru
-        fu = cube.fu
-
-        flu = cube.flu
-        blu = cube.blu
-        bru = cube.bru
-        fru = cube.fru
-
-        # Edges Only
-        if is_r((ru, lu, fu)):
-            return "Ua Perm", "M2' U M U2 M' U M2'"
-        elif is_r((lu, ru, fu)):
-            return "Ub Perm", "M2' U' M U2' M' U' M2'"
-
-        elif is_r((lu, fu), (bu, ru)):
-            return "Z Perm", "(M2' U' M2' U') M' (U2 M2' U2) M'"
-
-        elif is_r((lu, ru), (fu, bu)):
-            return "H Perm", "(M2' U M2') U2 (M2' U M2')"
-
-        # Corners Only
-        elif is_r((blu, bru, fru)):
-            return "Aa Perm", "x (R' U R') D2 (R U' R') D2 R2 x'"
-
-        elif is_r((blu, fru, bru)):
-            return "Ab Perm", "x R2' D2 (R U R') D2 (R U' R) x'"
-
-        elif is_r((flu, blu), (fru, bru)):
-            return "E Perm", "x' (R U' R' D) (R U R' D') (R U R' D) (R U' R' D') x"
-
-        # Swap Adjacent Corners
-
-        elif is_r((lu, bu), (fru, bru)):
-            return "Ra Perm", "y' (L U2 L' U2) L F' (L' U' L U) L F L2' U"
-
-        elif is_r((blu, bru), (fu, ru)):
-            return "Rb Perm", "(R' U2 R U2') R' F (R U R' U') R' F' R2 U'"
-
-        elif is_r((blu, bru), (lu, bu)):
-            return "Ja Perm", "y' (L' U' L F) (L' U' L U) L F' L2' U L U'"
-
-        elif is_r((fru, bru), (fu, ru)):
-            return "Jb Perm", "(R U R' F') (R U R' U') R' F R2 U' R' U'"
-
-        elif is_r((lu, ru), (bru, fru)):
-            return "T Perm", "(R U R' U') R' F R2 U' R' U' R U R' F'"
-
-        elif is_r((fu, bu), (fru, bru)):
-            return "F Perm", "(R' U' F') (R U R' U') (R' F R2 U') (R' U' R U) (R' U R)"
-
-        # Swap Diagonal Corners
-
-        elif is_r((blu, fru), (bu, ru)):
-            return "V Perm", "(R' U R' U') y (R' F' R2 U') (R' U R' F) R F"
-
-        elif is_r((blu, fru), (lu, bu)):
-            return "Y Perm", "F (R U' R' U') (R U R' F') (R U R' U') (R' F R F')"
-
-        elif is_r((flu, bru), (lu, ru)):
-            return "Na Perm", "(R U R' U) (R U R' F') (R U R' U') (R' F R2 U') R' U2 (R U' R')"
-
-        elif is_r((blu, fru), (lu, ru)):
-            return "Nb Perm", "(R' U R U') (R' F' U' F) (R U R' F) R' F' (R U' R)"
-
-        # Double Cycles
-
-        elif is_r((flu, blu, bru), (lu, ru, bu)):
-            return "Ga Perm", "R2 U (R' U R' U') (R U' R2) D U' (R' U R D') U"
-
-        elif is_r((flu, bru, blu), (ru, lu, bu)):
-            return "Gb Perm", "(F' U' F) (R2 u R' U) (R U' R u') R2'"
-
-        elif is_r((blu, flu, fru), (lu, ru, fu)):
-            return "Gc Perm", "R2 U' (R U' R U) (R' U R2 D') (U R U' R') D U'"
-        elif is_r((flu, blu, bru), (lu, fu, bu)):
-            return "Gd Perm", "(R U R') y' (R2 u' R U') (R' U R' u) R2"
-
-        else:
-            return None
+        table = PLL._table
+        if table is None:
+            table = PLL._table = PatternTable(pll_code, PLL._CASES, rotations(Algs.Y, *rotations(Algs.U)))
+        return table
@@ -230,7 +230,7 @@ class Kociemba3x3(AbstractSolver, Solver3x3Protocol):
         # Store debug state
         _d = self._debug_override
         try:
-            self._debug_override = debug
+            self._set_debug_override(debug)
 
             # Convert cube state to Kociemba's 54-char format
             # This works for both 3x3 and reduced NxN (reads outer layer)
@@ -263,7 +263,7 @@ class Kociemba3x3(AbstractSolver, Solver3x3Protocol):
                 self._op.play(alg)
 
         finally:
-            self._debug_override = _d
+            self._set_debug_override(_d)
 
         return sr
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, final
 
 from cube.domain.algs.Alg import Alg
@@ -8,9 +9,11 @@ from cube.domain.model import Cube
 from cube.domain.solver import Solver
 from cube.domain.solver.common.CenterBlockStatistics import CenterBlockStatistics
 from cube.domain.solver.common.CommonOp import CommonOp
+from cube.domain.solver.common.StepRecorder import record_step
 from cube.domain.solver.protocols import OperatorProtocol
-from cube.domain.solver.solver import SolverResults, SolveStep
+from cube.domain.solver.solver import SolverResults, SolveStep, StepStats
 from cube.utils.logger_protocol import ILogger, LazyArg
+from cube.utils.metrics import METRICS, MetricsSnapshot
 
 if TYPE_CHECKING:
     pass
@@ -73,6 +76,7 @@ class AbstractSolver(Solver, ABC):
         2. OpAborted is caught and handled cleanly (no red traceback)
         3. Debug flag is managed
         4. Statistics are reset before and displayed after solving
+        5. Per-step timing and move counts are recorded in ``result.steps``
 
         Args:
             debug: Override debug mode (None = use config)
@@ -83,7 +87,7 @@ class AbstractSolver(Solver, ABC):
             SolverResults with parity information
         """
         if debug is not None:
-            self._debug_override = debug
+            self._set_debug_override(debug)
 
         try:
             with self._op.with_animation(animation=animation):
@@ -94,16 +98,26 @@ class AbstractSolver(Solver, ABC):
 
                     self.reset_block_statistics()
                     count_before = self._op.count
-                    result = self._solve_impl(what)
+                    timer: AbstractContextManager[None]
+                    if METRICS.enabled:
+                        metrics_before: MetricsSnapshot | None = METRICS.snapshot()
+                        timer = METRICS.timer(f"solver.{self.get_code.name}.{what.name}")
+                    else:
+                        metrics_before, timer = None, nullcontext()
+                    with timer, record_step(self._op, what.name, self.name, root=True) as step:
+                        result = self._solve_impl(what)
+                    result._steps = step
+                    if metrics_before is not None:
+                        result._metrics = METRICS.snapshot() - metrics_before
                     count_after = self._op.count
-                    self.debug(f"Solve {what.name} used {count_after - count_before} moves (total: {count_after})")
+                    self.debug(lambda: f"Solve {what.name} used {count_after - count_before} moves (total: {count_after})")
                     self.display_statistics()
                     return result
                 except OpAborted:
                     # User aborted - this is normal, not an error
                     return SolverResults()
         finally:
-            self._debug_override = None
+            self._set_debug_override(None)
 
     @property
     def _is_2x2_solver(self) -> bool:
@@ -176,6 +190,10 @@ class AbstractSolver(Solver, ABC):
             what=what,
         )
 
+    def _step(self, name: str) -> AbstractContextManager[StepStats | None]:
+        """Record the block as a step of the current solve, see ``SolverResults.steps``."""
+        return record_step(self._op, name, self.name)
+
     @abstractmethod
     def _solve_impl(self, what: SolveStep) -> SolverResults:
         """Implement solver logic here. Called by solve().
@@ -217,18 +235,18 @@ class AbstractSolver(Solver, ABC):
         summary = stats.get_summary_stats()
         total_blocks = sum(summary.values())
         total_pieces = sum(size * count for size, count in summary.items())
-        self.debug(f"[Center Block Statistics] {total_blocks} blocks, {total_pieces} pieces moved")
+        self.debug(lambda: f"[Center Block Statistics] {total_blocks} blocks, {total_pieces} pieces moved")
         for topic in stats.get_all_topics():
             display_topic = topic.replace(my_prefix, "")
             topic_stats = stats.get_topic_stats(topic)
             if topic_stats:
                 parts = [f"{size}x1:{count}" for size, count in sorted(topic_stats.items())]
                 total = sum(topic_stats.values())
-                self.debug(f"  [{display_topic}] {', '.join(parts)} (total: {total} blocks)")
+                self.debug(lambda: f"  [{display_topic}] {', '.join(parts)} (total: {total} blocks)")
             else:
-                self.debug(f"  [{display_topic}] (no blocks)")
+                self.debug(lambda: f"  [{display_topic}] (no blocks)")
         parts = [f"{size}x1:{count}" for size, count in sorted(summary.items())]
-        self.debug(f"  [SUMMARY] {', '.join(parts)} (total: {total_blocks} blocks)")
+        self.debug(lambda: f"  [SUMMARY] {', '.join(parts)} (total: {total_blocks} blocks)")
 
     def _run_child_solver(self, child: Solver, what: SolveStep) -> SolverResults:
         """Run a child solver, propagating debug override if set.
@@ -237,6 +255,7 @@ class AbstractSolver(Solver, ABC):
         Propagates the parent's debug override to the child, but only if explicitly set.
         If parent's debug is None (use config), child also uses its own config.
         Animation is set to None to inherit from parent's current animation state.
+        The child's steps are recorded under the parent's current step.
 
         Args:
             child: The child solver to run
@@ -269,6 +288,12 @@ class AbstractSolver(Solver, ABC):
         else:
             return self._debug_override
 
+    def _set_debug_override(self, debug: bool | None) -> None:
+        """Set _debug_override; the loggers cache what it resolves to."""
+        if debug != self._debug_override:
+            self._debug_override = debug
+            self.__logger.invalidate()
+
     @property
     def is_debug_enabled(self):
         return self.op.app_state.is_debug(self._is_debug_enabled)
@@ -283,9 +308,13 @@ class AbstractSolver(Solver, ABC):
 
         Args:
             *args: Arguments to print. Can be regular values or Callable[[], Any]
-                   for lazy evaluation.
+                   for lazy evaluation. Pass f-strings as ``lambda: f"..."``:
+                   the logger's enabled state is cached, so disabled debug
+                   costs a lookup, but an eager f-string is formatted anyway.
         """
-        self.__logger.debug(None, *args)
+        logger = self.__logger
+        if logger.is_debug():
+            logger.debug(None, *args)
 
     @property
     @final
@@ -301,18 +330,13 @@ class AbstractSolver(Solver, ABC):
         if self.is_solved:
             return Algs.alg(None)
 
-        n = len(self.op.history())
-        solution_algs: list[Alg] = []
+        n = len(self.op.history_view())
 
         with self._op.with_animation(animation=False):
 
             with self._op.save_history():  # not really needed
                 self.solve(debug=False, animation=False)
-                while n < len(self.op.history()):
-                    step = self.op.undo(animation=False)
-                    # s=str(step)
-                    if step:
-                        solution_algs.insert(0, step)
+                solution_algs = self.op.rollback_to(n)
 
             return Algs.alg(None, *solution_algs)
 
@@ -28,17 +28,12 @@ class BaseSolver(AbstractSolver, ABC):
         if self.is_solved:
             return Algs.alg(None)
 
-        n = len(self.op.history())
-        solution_algs: list[Alg] = []
+        n = len(self.op.history_view())
 
         with self._op.with_animation(animation=False):
 
             with self._op.save_history():  # not really needed
                 self.solve(debug=False, animation=False)
-                while n < len(self.op.history()):
-                    step = self.op.undo(animation=False)
-                    # s=str(step)
-                    if step:
-                        solution_algs.insert(0, step)
+                solution_algs = self.op.rollback_to(n)
 
             return Algs.alg(None, *solution_algs)
@@ -0,0 +1,203 @@
+"""Last-layer pattern recognition: read a layer once, look the case up in a table.
+
+The last-layer steps used to find their case by turning the cube (y) or the
+top layer (U) and re-testing predicates after each turn. Here the layer is
+read once into a compact code, and a table built once per process maps the
+code of every rotation of every case to the case, the rotation to play
+before it and its alg::
+
+    match = OLL_TABLE.lookup(cube)      # cube.up is the last layer
+    if match is not None:
+        op.play(match.pre + match.alg)
+
+Ring order
+==========
+
+A face's layer is read clockwise as seen from outside the face, starting at
+the top edge: sides ``edge_top, edge_right, edge_bottom, edge_left`` with
+the corner between side ``s`` and ``s+1`` being ``corner_top_right,
+corner_bottom_right, corner_bottom_left, corner_top_left``. Turning the face
+clockwise moves the piece of side ``s`` to side ``s+1``. On U this is
+B, R, F, L.
+
+Tables
+======
+
+A :class:`PatternTable` is built by simulation on a scratch 3x3: for each
+rotation ``pre`` (in search order) and each case ``alg``, the state that
+``pre + alg`` solves is ``alg.inv()`` then ``pre.inv()`` played on a solved
+cube; its code maps to the case, first one wins. So the table agrees with
+the read by construction, whatever the geometry.
+
+The codes are relative to the layer's own colors, so they do not depend on
+the color scheme: :func:`oll_code` marks which side stickers have the top
+color, :func:`pll_code` gives each side sticker as the side whose center has
+its color.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+from cube.domain.algs import Algs
+from cube.domain.algs.Alg import Alg
+from cube.domain.model import Color, Corner, Edge
+from cube.domain.model.Cube import Cube
+from cube.domain.model.Face import Face
+from cube.utils.service_provider import IServiceProvider
+
+
+def edge_ring(face: Face) -> list[Edge]:
+    """The edges of ``face`` in ring order, see module docstring."""
+    return [face.edge_top, face.edge_right, face.edge_bottom, face.edge_left]
+
+
+def corner_ring(face: Face) -> list[Corner]:
+    """The corners of ``face`` in ring order: corner ``s`` is between sides ``s`` and ``s+1``."""
+    return [face.corner_top_right, face.corner_bottom_right, face.corner_bottom_left, face.corner_top_left]
+
+
+def side_stickers(face: Face) -> list[Color]:
+    """The 12 side stickers of the layer of ``face``, clockwise.
+
+    Per side ``s``: the corner before it, its edge, the corner after it,
+    each read on side ``s``'s face.
+    """
+    edges = edge_ring(face)
+    corners = corner_ring(face)
+    stickers: list[Color] = []
+    for s, edge in enumerate(edges):
+        side = edge.get_other_face(face)
+        stickers.append(corners[s - 1].face_color(side))
+        stickers.append(edge.face_color(side))
+        stickers.append(corners[s].face_color(side))
+    return stickers
+
+
+def oll_code(face: Face) -> int:
+    """12 bits, one per side sticker (clockwise, see :func:`side_stickers`): has the face's color."""
+    color = face.color
+    code = 0
+    for c in side_stickers(face):
+        code = code << 1 | (c == color)
+    return code
+
+
+def pll_code(face: Face) -> int | None:
+    """2 bits per side sticker: the side (0-3, ring order) whose center has its color.
+
+    None if a side sticker has none of the side colors, i.e. the layer is
+    not oriented.
+    """
+    side_colors = [e.get_other_face(face).color for e in edge_ring(face)]
+    code = 0
+    for c in side_stickers(face):
+        try:
+            code = code << 2 | side_colors.index(c)
+        except ValueError:
+            return None
+    return code
+
+
+def auf_count(face: Face, edges: bool = True, corners: bool = True) -> int:
+    """How many clockwise turns of ``face`` make its layer's pieces match their faces, or -1.
+
+    Only the pieces selected by ``edges``/``corners`` are checked. Same
+    answer as turning the face and testing match_faces, without turning.
+    """
+    face_color = face.color
+    edge_list = edge_ring(face)
+    sides = [e.get_other_face(face) for e in edge_list]
+    side_colors = [s.color for s in sides]
+
+    # The face stickers do not move relative to the face
+    if edges and any(e.face_color(face) != face_color for e in edge_list):
+        return -1
+    corner_list = corner_ring(face)
+    if corners and any(c.face_color(face) != face_color for c in corner_list):
+        return -1
+
+    # Side stickers as side indices; a piece on side s goes to side s+n
+    edge_sides = [side_colors.index(e.face_color(sides[s])) if e.face_color(sides[s]) in side_colors else -1
+                  for s, e in enumerate(edge_list)]
+    corner_sides = [side_colors.index(c.face_color(sides[s])) if c.face_color(sides[s]) in side_colors else -1
+                    for s, c in enumerate(corner_list)]
+
+    for n in range(4):
+        if edges and any(edge_sides[s] != (s + n) % 4 for s in range(4)):
+            continue
+        # Corner s is between sides s and s+1: checking its side-s sticker is
+        # enough once its face sticker matches (the other one follows)
+        if corners and any(corner_sides[s] != (s + n) % 4 for s in range(4)):
+            continue
+        return n
+    return -1
+
+
+class LastLayerCase(NamedTuple):
+    """A recognized case: play ``pre`` (a rotation), then ``alg``."""
+    name: str
+    pre: Alg
+    alg: Alg
+
+
+class PatternTable:
+    """Code of the up layer -> :class:`LastLayerCase`, built on first lookup. See module docstring."""
+
+    __slots__ = ["_read", "_cases", "_pre_moves", "_table"]
+
+    def __init__(self, read: Callable[[Face], int | None],
+                 cases: Sequence[tuple[str, str | Alg]],
+                 pre_moves: Sequence[Alg]) -> None:
+        """
+        :param read: the code of a layer, e.g. :func:`oll_code`
+        :param cases: (name, alg) in priority order; string algs are parsed 3x3-compatible
+        :param pre_moves: rotations tried before each case, in search order
+        """
+        self._read = read
+        self._cases = cases
+        self._pre_moves = pre_moves
+        self._table: dict[int, LastLayerCase] | None = None
+
+    def lookup(self, cube: Cube) -> LastLayerCase | None:
+        """The case of ``cube.up``'s layer, or None if it is not one of the cases."""
+        code = self._read(cube.up)
+        if code is None:
+            return None
+        return self._get_table(cube.sp).get(code)
+
+    def _get_table(self, sp: IServiceProvider) -> dict[int, LastLayerCase]:
+        table = self._table
+        if table is None:
+            table = self._table = self._build(sp)
+        return table
+
+    def _build(self, sp: IServiceProvider) -> dict[int, LastLayerCase]:
+        cube = Cube(3, sp=sp)
+        cases = [(name, Algs.parse(alg, compat_3x3=True) if isinstance(alg, str) else alg)
+                 for name, alg in self._cases]
+
+        table: dict[int, LastLayerCase] = {}
+        for pre in self._pre_moves:
+            pre_inv = pre.inv()
+            for name, alg in cases:
+                cube.reset()
+                alg.inv().play(cube)
+                pre_inv.play(cube)
+                code = self._read(cube.up)
+                if code is not None:
+                    table.setdefault(code, LastLayerCase(name, pre, alg))
+        return table
+
+
+def rotations(move: Alg, *then: Alg) -> list[Alg]:
+    """``move * i`` for i in 0..3, each followed by every ``then`` (search order of the old trial loops)."""
+    result: list[Alg] = []
+    for i in range(4):
+        first = (move * i).simplify() if i else Algs.no_op()
+        if then:
+            result.extend((first + t).simplify() for t in then)
+        else:
+            result.append(first)
+    return result
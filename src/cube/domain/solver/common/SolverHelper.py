@@ -55,10 +55,14 @@ class SolverHelper(CubeSupplier, SolverElementsProvider):
 
         Args:
             *args: Arguments to print. Can be regular values or Callable[[], Any]
-                   for lazy evaluation.
+                   for lazy evaluation. Pass f-strings as ``lambda: f"..."``:
+                   the logger's enabled state is cached, so disabled debug
+                   costs a lookup, but an eager f-string is formatted anyway.
             level: Optional debug level. If set, checks level <= threshold.
         """
-        self._logger.debug(None, *args, level=level)
+        logger = self.__logger
+        if logger.is_debug(level=level):
+            logger.debug(None, *args, level=level)
 
     @property
     def cube(self) -> Cube:
@@ -0,0 +1,52 @@
+"""Records per-step timing and move counts into ``SolverResults.steps``.
+
+The step being recorded is kept in a context variable, so nesting follows the
+call stack: a step opened inside another one becomes its child, and a child
+solver's ``solve()`` (see ``AbstractSolver._run_child_solver``) attaches its
+root step under the parent's current step without passing anything around.
+
+Outside a solve (no current step) :func:`record_step` records nothing.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from cube.domain.solver.protocols import OperatorProtocol
+from cube.domain.solver.solver import StepStats
+
+_current: ContextVar[StepStats | None] = ContextVar("solve_step", default=None)
+
+
+@contextmanager
+def record_step(op: OperatorProtocol, name: str, solver: str = "",
+                root: bool = False) -> Iterator[StepStats | None]:
+    """Record the block as step ``name``.
+
+    :param root: start a new tree if no step is current (used by ``AbstractSolver.solve``)
+    """
+    parent = _current.get()
+    if parent is None and not root:
+        yield None
+        return
+
+    step = StepStats(name, solver)
+    if parent is not None:
+        parent.children.append(step)
+
+    token = _current.set(step)
+    cube = op.cube
+    wall0 = time.perf_counter()
+    cpu0 = time.process_time()
+    moves0 = op.count
+    qt0 = cube.quarter_turns
+    try:
+        yield step
+    finally:
+        step.wall_s = time.perf_counter() - wall0
+        step.cpu_s = time.process_time() - cpu0
+        step.moves = op.count - moves0
+        step.quarter_turns = cube.quarter_turns - qt0
+        _current.reset(token)
@@ -37,6 +37,13 @@ class _CompleteSlice:
     n_matches: int  # number of pieces match color
 
 
+@dataclass(frozen=True)
+class _CenterStep:
+    target: FaceTracker
+    source: FaceTracker
+    estimate: int  # pieces it may place: min(missing on target, target color on source)
+
+
 class NxNCenters(SolverHelper):
     """
     Solves center pieces on NxN cubes (N > 3).
@@ -158,6 +165,8 @@ class NxNCenters(SolverHelper):
 
         self._OPTIMIZE_BIG_CUBE_CENTERS_SEARCH_COMPLETE_SLICES_ONLY_TARGET_ZERO = cfg.optimize_big_cube_centers_search_complete_slices_only_target_zero
         self._OPTIMIZE_BIG_CUBE_CENTERS_SEARCH_BLOCKS = cfg.optimize_big_cube_centers_search_blocks
+        self._LOOKAHEAD_DEPTH = cfg.optimize_big_cube_centers_lookahead_depth
+        self._LOOKAHEAD_WIDTH = cfg.optimize_big_cube_centers_lookahead_width
 
         # Use CommutatorHelper for block search operations
         self._comm_helper = CommutatorHelper(slv)
@@ -266,6 +275,13 @@ class NxNCenters(SolverHelper):
         #   there should be empty target slice in the target face (see config)
         #   this slice is swapped, and not filled by other step(becuase it's sources are on back)
         # To overcome it we swap only if number sources is > n//2
+
+        if self._LOOKAHEAD_DEPTH > 0:
+            # LOOKAHEAD: pick each (target, source) step by trying the most
+            # promising ones, the loop below finishes what no candidate improves
+            while self._do_best_step(holder, faces):
+                self._asserts_is_boy(faces)
+
         while True:
             if not self._do_faces(holder, faces, False, True):
                 break
@@ -290,6 +306,104 @@ class NxNCenters(SolverHelper):
 
         return work_done
 
+    def _do_best_step(self, tracker_holder: "FacesTrackerHolder", faces: Sequence[FaceTracker]) -> bool:
+        """
+        Play the (target, source) step that places the most center pieces per move.
+
+        Each of the first LOOKAHEAD_WIDTH candidates is played in query mode,
+        followed by LOOKAHEAD_DEPTH - 1 steps of the fixed order (the first
+        candidate each time), and rolled back. The candidate whose run placed
+        the most pieces per move is played. Only a step that places pieces
+        is played, so the total placed grows with each call and the lookahead
+        ends.
+
+        :return: False if no candidate places a piece
+        """
+        best: tuple[_CenterStep, int, int] | None = None
+        best_score = 0.0
+        for step in self._candidate_steps(faces):
+            placed, moves = self._try_step(tracker_holder, step, faces)
+            if placed <= 0:
+                continue
+            score = placed / max(moves, 1)
+            if best is None or score > best_score:
+                best = (step, placed, moves)
+                best_score = score
+
+        if best is None:
+            return False
+
+        step, placed, moves = best
+        self.debug(lambda: f"Lookahead: {step.target.color} from {step.source.color}, "
+                           f"{placed} pieces in {moves} moves", level=1)
+        self._play_step(tracker_holder, step, faces)
+        return True
+
+    def _try_step(self, tracker_holder: "FacesTrackerHolder", step: _CenterStep,
+                  faces: Sequence[FaceTracker]) -> tuple[int, int]:
+        """
+        Play ``step`` and its continuation in query mode, the cube and trackers are restored.
+
+        :return: pieces placed and moves played; the pieces placed by ``step`` alone if
+                 it places none, so such a step is never chosen
+        """
+        op = self.op
+        # Markers are restored after the rollback, to the faces they were on
+        with tracker_holder.preserve_physical_faces(), self._comm_helper.suspended_statistics():
+            with op.with_query_restore_state():
+                placed_before = self._count_placed(faces)
+                moves_before = op.count
+
+                self._play_step(tracker_holder, step, faces)
+
+                if self._count_placed(faces) > placed_before:
+                    for _ in range(self._LOOKAHEAD_DEPTH - 1):
+                        next_steps = self._candidate_steps(faces)
+                        if not next_steps:
+                            break
+                        self._play_step(tracker_holder, next_steps[0], faces)
+
+                return self._count_placed(faces) - placed_before, op.count - moves_before
+
+    def _candidate_steps(self, faces: Sequence[FaceTracker]) -> list[_CenterStep]:
+        """
+        The first LOOKAHEAD_WIDTH (target, source) pairs: unsolved targets in
+        the greedy face order, for each its sources with most pieces first.
+        """
+        width = self._LOOKAHEAD_WIDTH
+        steps: list[_CenterStep] = []
+        for target in faces:
+            target_face = target.face
+            color = target.color
+            if self._is_face_solved(target_face, color):
+                continue
+            missing = self.count_missing(target_face, color)
+            target_steps: list[_CenterStep] = []
+            for source in faces:
+                if source is target:
+                    continue
+                available = self.count_color_on_face(source.face, color)
+                if available:
+                    target_steps.append(_CenterStep(target, source, min(missing, available)))
+
+            target_steps.sort(key=lambda s: s.estimate, reverse=True)
+            steps.extend(target_steps)
+            if len(steps) >= width:
+                break
+
+        return steps[:width]
+
+    def _play_step(self, tracker_holder: "FacesTrackerHolder", step: _CenterStep,
+                   faces: Sequence[FaceTracker]) -> bool:
+        color = step.target.color
+        with self.ann.annotate(h2=f"{color.long} face"):
+            self.cmn.bring_face_front(step.target.face)
+            return self._do_center_from_face_direct(tracker_holder, self.cube.front, False, color,
+                                                    step.source.face, faces)
+
+    def _count_placed(self, faces: Iterable[FaceTracker]) -> int:
+        return sum(self.count_color_on_face(f.face, f.color) for f in faces)
+
     # def _print_faces(self):
     #
     #     for f in self._faces:
@@ -305,13 +419,13 @@ class NxNCenters(SolverHelper):
     def _do_center(self, tracker_holder: "FacesTrackerHolder", face_loc: FaceTracker, minimal_bring_one_color, use_back_too: bool, faces: Iterable[FaceTracker]) -> bool:
 
         if self._is_face_solved(face_loc.face, face_loc.color):
-            self.debug( f"Face is already done {face_loc.face}", level=1)
+            self.debug( lambda: f"Face is already done {face_loc.face}", level=1)
             return False
 
         color = face_loc.color
 
         if minimal_bring_one_color and self._has_color_on_face(face_loc.face, color):
-            self.debug( f"{face_loc.face} already has at least one {color}", level=3)
+            self.debug( lambda: f"{face_loc.face} already has at least one {color}", level=3)
             return False
 
         sources:Set[Face] = OrderedSet(self.cube.faces) - {face_loc.face}
@@ -319,14 +433,14 @@ class NxNCenters(SolverHelper):
             sources -= {face_loc.face.opposite}
 
         if all(not self._has_color_on_face(f, color) for f in sources):
-            self.debug( f"For face {face_loc.face}, No color {color} available on  {sources}", level=1)
+            self.debug( lambda: f"For face {face_loc.face}, No color {color} available on  {sources}", level=1)
             return False
 
-        self.debug( f"Need to work on {face_loc.face}", level=1)
+        self.debug( lambda: f"Need to work on {face_loc.face}", level=1)
 
         work_done = self.__do_center(tracker_holder, face_loc, minimal_bring_one_color, use_back_too, faces)
 
-        self.debug( f"After working on {face_loc.face} {work_done=}, "
+        self.debug( lambda: f"After working on {face_loc.face} {work_done=}, "
                            f"solved={self._is_face_solved(face_loc.face, face_loc.color)}", level=1)
 
         return work_done
@@ -348,16 +462,16 @@ class NxNCenters(SolverHelper):
 
 
         if self._is_face_solved(face, color):
-            self.debug(f"Face is already done {face}", level=1)
+            self.debug(lambda: f"Face is already done {face}", level=1)
             return False
 
         if minimal_bring_one_color and self._has_color_on_face(face_loc.face, color):
-            self.debug(f"{face_loc.face} already has at least one {color}", level=3)
+            self.debug(lambda: f"{face_loc.face} already has at least one {color}", level=3)
             return False
 
         cmn = self.cmn
 
-        self.debug(f"Working on face {face}", level=1)
+        self.debug(lambda: f"Working on face {face}", level=1)
 
         with self.ann.annotate(h2=f"{face_loc.color.long} face"):
             cube = self.cube
@@ -450,7 +564,7 @@ class NxNCenters(SolverHelper):
                         raise InternalSWError(f"Slice was not fixed {rc}, " +
                                               f"required={color}, " +
                                               f"actual={after_fixed_color}")
-                    self.debug(f"Fixed slice {rc}", level=3)
+                    self.debug(lambda: f"Fixed slice {rc}", level=3)
                     work_done = True
                     if minimal_bring_one_color:
                         return work_done
@@ -658,7 +772,7 @@ class NxNCenters(SolverHelper):
         # =========================================================
         if self._preserve_cage:
             if n_rotate:
-                self.debug( f"  [CAGE] Undoing source rotation: {rotate_source_alg.prime * n_rotate}", level=1)
+                self.debug( lambda: f"  [CAGE] Undoing source rotation: {rotate_source_alg.prime * n_rotate}", level=1)
                 op.play(rotate_source_alg.prime * n_rotate)
 
             if did_f_prime_setup:
@@ -687,12 +801,12 @@ class NxNCenters(SolverHelper):
         )
 
         if not big_blocks:
-            self.debug(f"  No unsolved blocks found for {color} on {face.name}", level=2)
+            self.debug(lambda: f"  No unsolved blocks found for {color} on {face.name}", level=2)
             return False
 
         # Log found blocks
         large_blocks = [(b.size, b) for _, b in big_blocks if b.size > 1]
-        self.debug(f"  Found {len(big_blocks)} unsolved blocks on {face.name}, "
+        self.debug(lambda: f"  Found {len(big_blocks)} unsolved blocks on {face.name}, "
                    f"{len(large_blocks)} larger than 1x1", level=1)
 
         for _, big_block in big_blocks:
@@ -707,7 +821,7 @@ class NxNCenters(SolverHelper):
                                         source_face,
                                         big_block[0], big_block[1],
                                         _SearchBlockMode.ExactMatch, faces):
-                self.debug(f"    ✓ Block {block_dims[0]}x{block_dims[1]} ({block_size} pieces) "
+                self.debug(lambda: f"    ✓ Block {block_dims[0]}x{block_dims[1]} ({block_size} pieces) "
                            f"from {source_face.name} to {face.name}", level=1)
                 work_done = True
 
@@ -13,7 +13,8 @@ Coordinate system: Bottom-Up, Left-to-Right (BULR/LTR)
 - X increases rightward (ltr_x)
 """
 import sys
-from collections.abc import Callable, Collection, Iterable, Iterator
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Tuple
 
@@ -32,6 +33,7 @@ from cube.domain.solver.common.CenterBlockStatistics import CenterBlockStatistic
 from cube.domain.solver.common.SolverHelper import SolverHelper
 from cube.domain.solver.common.big_cube.commutator._supported_faces import _get_supported_pairs
 from cube.domain.solver.protocols import SolverElementsProvider
+from cube.utils.metrics import METRICS
 
 
 @dataclass(frozen=True)
@@ -122,6 +124,36 @@ class CommutatorResult:
     _secret: _InternalCommData | None = None
 
 
+@dataclass(frozen=True)
+class CommutatorBatchResult:
+    """Result of execute_commutator_batch method.
+
+    One commutator moves all blocks of the batch together: its slice moves
+    cover the columns (or rows) of every target block at once, so each
+    block does its own 3-cycle s1 → t → s2 → s1 as if executed alone.
+
+    Attributes:
+        slice_name: Slice used in the combined algorithm (E, S, or M).
+        algorithm: The combined algorithm including setup/undo.
+        results: Per-block dry-run results, in the order of the input pairs.
+            Their blocks describe each 3-cycle; their algorithms are the
+            single-block ones.
+    """
+    slice_name: SliceName
+    algorithm: Alg
+    results: tuple[CommutatorResult, ...]
+
+
+@dataclass(frozen=True)
+class _BatchPlan:
+    results: tuple[CommutatorResult, ...]
+    source_blocks: tuple[Block, ...]
+    source_setup_n_rotate: int
+    on_front_rotate_n: int
+    target_points: tuple[Point, ...]
+    target_points_after_rotate: tuple[Point, ...]
+
+
 class CommutatorHelper(SolverHelper):
     """
     Helper for the block commutator algorithm on NxN cubes.
@@ -170,6 +202,16 @@ class CommutatorHelper(SolverHelper):
         """Get accumulated block solving statistics."""
         return self._statistics
 
+    @contextmanager
+    def suspended_statistics(self) -> Iterator[None]:
+        """Commutators executed inside are not recorded, e.g. when trying moves in query mode."""
+        saved = self._statistics
+        self._statistics = CenterBlockStatistics()
+        try:
+            yield None
+        finally:
+            self._statistics = saved
+
     @classmethod
     def _select_translation_result(
         cls, results: list[FaceTranslationResult]
@@ -460,12 +502,10 @@ class CommutatorHelper(SolverHelper):
         # Step 3: xpt is on target_face, find where it maps to on source_face translate_target_from_source(
         # source_face, target_face, coord) finds where coord on target_face goes on source_face
         slice_name = internal_data.trans_data.slice_algorithm.whole_slice_alg.slice_name
-        xpt_on_source_begin = Face2FaceTranslator.translate_target_from_source(
-            target_face, source_face, xpt_begin, slice_name
+        # Both block corners in one lookup
+        xpt_on_source_begin, xpt_on_source_end = Face2FaceTranslator.translate_points_target_from_source(
+            target_face, source_face, [xpt_begin, xpt_end], slice_name
         )
-        xpt_on_source_end = Face2FaceTranslator.translate_target_from_source(
-            target_face, source_face, xpt_end, slice_name
-        ) if tp_begin != tp_end else xpt_on_source_begin
 
         # Step 4: Apply su' (inverse setup) to get final xp in original coordinates
         source_setup_n_rotate = self._find_rotation_idx(source_block, natural_source_block)
@@ -500,23 +540,12 @@ class CommutatorHelper(SolverHelper):
         slice_alg_data: SliceAlgorithmResult = internal_data.trans_data.slice_algorithm
         slice_base_alg: SliceAlg = slice_alg_data.whole_slice_alg
 
-        on_front_rotate: Alg = Algs.of_face(target_face.name) * on_front_rotate_n
-
         # Build the commutator
         inner_slice_alg: Alg = self._get_slice_alg(slice_base_alg, target_block, target_face.name) * slice_alg_data.n
         second_inner_slice_alg: Alg = self._get_slice_alg(slice_base_alg, target_block_after_rotate,
                                                           target_face.name) * slice_alg_data.n
 
-        cum = Algs.seq_alg(None,
-                           inner_slice_alg,
-                           on_front_rotate,
-                           second_inner_slice_alg,
-                           on_front_rotate.prime,
-                           inner_slice_alg.prime,
-                           on_front_rotate,
-                           second_inner_slice_alg.prime,
-                           on_front_rotate.prime
-                           )
+        cum = self._commutator_alg(target_face, on_front_rotate_n, inner_slice_alg, second_inner_slice_alg)
 
         if not dry_run:
 
@@ -591,6 +620,186 @@ class CommutatorHelper(SolverHelper):
             _secret=None  # Don't cache after execution
         )
 
+    def can_batch(
+            self,
+            source_face: Face,
+            target_face: Face,
+            blocks: Sequence[tuple[Block, Block]],
+    ) -> bool:
+        """
+        Check if the (source_block, target_block) pairs can be moved by one
+        commutator, see execute_commutator_batch().
+        """
+        return self._plan_batch(source_face, target_face, blocks) is not None
+
+    def execute_commutator_batch(
+            self,
+            source_face: Face,
+            target_face: Face,
+            blocks: Sequence[tuple[Block, Block]],
+            preserve_state: bool = True,
+            dry_run: bool = False,
+    ) -> CommutatorBatchResult:
+        """
+        Move several blocks from source_face to target_face with one commutator.
+
+        The slice moves of execute_commutator() act on whole columns (or rows),
+        so blocks that are disjoint and line up can share them: the combined
+        commutator slices the columns of all target blocks, rotates the target
+        face once and slices their rotated columns. Each block then does the
+        same 3-cycle s1 → t → s2 → s1 as execute_commutator() would do, for one
+        setup and one commutator instead of one per block.
+
+        COMPATIBILITY (see can_batch()):
+        ================================
+        - All source blocks need the same source setup rotation.
+        - All target blocks need the same target face rotation direction.
+        - The target blocks together cover exactly the product of their
+          columns and rows, otherwise the combined slices would also move
+          the cells where the column of one block crosses the row of another.
+        - The rotated columns must not intersect the columns (as for one block).
+        - No cell of any 3-cycle is in another block's 3-cycle, so the result
+          is the same as executing the blocks one after the other.
+
+        Args:
+            source_face: Source face (where pieces come from)
+            target_face: Target face (where pieces go to)
+            blocks: (source_block, target_block) pairs
+            preserve_state: If True, preserve cube state (edges and corners return)
+            dry_run: If True, only compute the result
+
+        Returns:
+            CommutatorBatchResult with the combined algorithm and per-block results
+
+        Raises:
+            ValueError: If the blocks can't be moved by one commutator
+        """
+        plan = self._plan_batch(source_face, target_face, blocks)
+        if plan is None:
+            raise ValueError(f"Blocks {blocks} can't be moved by one commutator {source_face.name}->{target_face.name}")
+
+        slice_name = plan.results[0].slice_name
+        slice_base_alg: SliceAlg = Algs.of_slice(slice_name)
+
+        # Same translation for all blocks (face pair decides), take its n from the first
+        slice_alg_data = self._do_commutator(source_face, target_face, plan.results[0].target_block) \
+            .trans_data.slice_algorithm
+
+        inner_slice_alg: Alg = self._get_slice_alg_for_points(
+            slice_base_alg, plan.target_points, target_face.name) * slice_alg_data.n
+        second_inner_slice_alg: Alg = self._get_slice_alg_for_points(
+            slice_base_alg, plan.target_points_after_rotate, target_face.name) * slice_alg_data.n
+
+        cum = self._commutator_alg(target_face, plan.on_front_rotate_n, inner_slice_alg, second_inner_slice_alg)
+
+        n_rotate = plan.source_setup_n_rotate
+        source_setup_alg = Algs.of_face(source_face.name) * n_rotate if n_rotate else Algs.NOOP
+
+        if not dry_run:
+
+            def _cells(face: Face, blocks: Iterable[Block]) -> Iterator[CenterSlice]:
+                for block in blocks:
+                    for pt in block.cells:
+                        yield face.center.get_center_slice(pt)
+
+            mf = self.cube.sp.marker_factory
+
+            with self.ann.annotate(
+                    (_cells(source_face, plan.source_blocks), AnnWhat.Moved),
+                    (_cells(target_face, (r.target_block for r in plan.results)), AnnWhat.FixedPosition),
+                    additional_markers=[(_cells(source_face, (r.second_block for r in plan.results)),
+                                         AnnWhat.Moved, mf.at_risk)],
+                    h2=lambda: f", {len(plan.results)} blocks commutator"
+            ):
+                if n_rotate:
+                    self.op.play(source_setup_alg)
+                self.op.play(cum)
+
+            if preserve_state and n_rotate:
+                self.op.play(source_setup_alg.prime)
+
+            for r in plan.results:
+                self._statistics.add_block(topic=self._topic, block_size=r.target_block.size)
+
+        return CommutatorBatchResult(
+            slice_name=slice_name,
+            algorithm=(source_setup_alg + cum + source_setup_alg.prime).simplify(),
+            results=plan.results,
+        )
+
+    def _plan_batch(
+            self,
+            source_face: Face,
+            target_face: Face,
+            blocks: Sequence[tuple[Block, Block]],
+    ) -> _BatchPlan | None:
+        """The combined commutator data, or None if the blocks are not compatible."""
+        if not blocks:
+            return None
+
+        cube = self.cube
+        cqr = cube.cqr
+
+        results: list[CommutatorResult] = []
+        source_blocks: list[Block] = []
+        n_rotates: set[int] = set()
+        directions: set[int] = set()
+        for source_block, target_block in blocks:
+            result = self.execute_commutator(source_face, target_face, target_block, source_block, dry_run=True)
+            results.append(result)
+            source_blocks.append(source_block.normalize)
+            n_rotates.add(self._find_rotation_idx(source_block, result.natural_source_block))
+            direction, _ = self._compute_rotate_on_target(cube, target_face.name, result.slice_name, target_block)
+            directions.add(direction)
+
+        if len(n_rotates) != 1 or len(directions) != 1:
+            return None
+        on_front_rotate_n = directions.pop()
+
+        # Every cell in at most one 3-cycle
+        target_cells: set[Point] = set()
+        source_cells: set[Point] = set()
+        n_target = n_source = 0
+        for result, source_block in zip(results, source_blocks):
+            target_cells.update(result.target_block.cells)
+            n_target += result.target_block.size
+            for block in (source_block, result.second_block):
+                source_cells.update(block.cells)
+                n_source += block.size
+        if len(target_cells) != n_target or len(source_cells) != n_source:
+            return None
+
+        ex, other = self._slice_extractors(result.slice_name, target_face.name)
+
+        # The combined slices cross only the target cells
+        columns = {ex(p) for p in target_cells}
+        rows = {other(p) for p in target_cells}
+        if len(target_cells) != len(columns) * len(rows):
+            return None
+
+        rotated = [Point(*cqr.rotate_point_clockwise(p, on_front_rotate_n)) for p in target_cells]
+        if columns & {ex(p) for p in rotated}:
+            return None
+
+        return _BatchPlan(tuple(results), tuple(source_blocks), n_rotates.pop(), on_front_rotate_n,
+                          tuple(target_cells), tuple(rotated))
+
+    def _commutator_alg(self, target_face: Face, on_front_rotate_n: int,
+                        inner_slice_alg: Alg, second_inner_slice_alg: Alg) -> Alg:
+        """[inner, F second F'] with F the target face rotation."""
+        on_front_rotate: Alg = Algs.of_face(target_face.name) * on_front_rotate_n
+
+        return Algs.seq_alg(None,
+                            inner_slice_alg,
+                            on_front_rotate,
+                            second_inner_slice_alg,
+                            on_front_rotate.prime,
+                            inner_slice_alg.prime,
+                            on_front_rotate,
+                            second_inner_slice_alg.prime,
+                            on_front_rotate.prime
+                            )
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -697,6 +906,40 @@ class CommutatorHelper(SolverHelper):
         # M[n:n] notation works for a single slice at position n
         return base_slice_alg[v1 + 1:v2 + 1]
 
+    def _slice_extractors(self, slice_name: SliceName,
+                          on_face: FaceName) -> tuple[Callable[[Point], int], Callable[[Point], int]]:
+        """(coordinate the slice moves by, the other coordinate) of points on ``on_face``."""
+
+        def exc(point: Point) -> int:
+            # extract column
+            return point[1]
+
+        def exr(point: Point) -> int:
+            # extract row
+            return point[0]
+
+        if self.cube.layout.get_slice(slice_name).does_slice_cut_rows_or_columns(on_face) == CLGColRow.ROW:
+            # cut rows so we extract columns
+            return exc, exr
+        else:
+            return exr, exc
+
+    def _get_slice_alg_for_points(self, base_slice_alg: SliceAlg,
+                                  points: Iterable[Point], on_face: FaceName) -> Alg:
+        """Like _get_slice_alg(), for the columns/rows of any set of points."""
+        slice_name = base_slice_alg.slice_name
+        ex, _ = self._slice_extractors(slice_name, on_face)
+
+        values = {ex(p) for p in points}
+        if not self.cube.layout.get_slice(slice_name).does_slice_of_face_start_with_face(on_face):
+            values = {self.cube.inv(v) for v in values}
+
+        indices = sorted(v + 1 for v in values)
+        if indices[-1] - indices[0] + 1 == len(indices):
+            # Contiguous - same notation as _get_slice_alg
+            return base_slice_alg[indices[0]:indices[-1]]
+        return base_slice_alg[indices]
+
     def _find_rotation_idx(self, actual_source_block: Block, natural_source_block: Block) -> int:
         """
         Find how many clockwise rotations of source face align actual to expected.
@@ -1186,6 +1429,8 @@ class CommutatorHelper(SolverHelper):
                 return piece.color != color and not is_marked_solved(piece)
             blocks = helper.search_big_block(face, color, cell_predicate=unsolved_predicate)
         """
+        METRICS.inc("commutator.block_searches")
+
         center = face.center
         res: list[tuple[int, Block]] = []
         n = self.n_slices
@@ -256,7 +256,8 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
                 return SolverResults()
 
             try:
-                return self._solve_impl2(what)
+                with self._step(f"attempt#{iteration}"):
+                    return self._solve_impl2(what)
 
             except SolverFaceColorsChangedNeedRestartException:
                 self.debug("Retrying after face colors changed")
@@ -267,7 +268,8 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
                     raise InternalSWError("Edge parity detected twice")
                 even_edge_parity_detected = True
                 self.debug("Even cube edge parity detected, fixing...")
-                self._nxn_edges.do_even_full_edge_parity_on_any_edge()
+                with self._step("edge_parity_fix"):
+                    self._nxn_edges.do_even_full_edge_parity_on_any_edge()
                 continue
 
             except EvenCubeCornerSwapException:
@@ -275,7 +277,8 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
                     raise InternalSWError("Corner swap parity detected twice")
                 corner_swap_detected = True
                 self.debug("Even cube corner swap parity detected, fixing...")
-                self._nxn_corners.fix_corner_parity()
+                with self._step("corner_parity_fix"):
+                    self._nxn_corners.fix_corner_parity()
                 continue
 
         raise InternalSWError(f"Too many iterations ({max_iterations}) for solver")
@@ -309,45 +312,54 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
         match what:
             case SolveStep.LBL_L1_Ctr:
                 # Layer 1 centers only
-                self._solve_layer1_centers(th)
+                with self._step(SolveStep.LBL_L1_Ctr.name):
+                    self._solve_layer1_centers(th)
 
             case SolveStep.LBL_L1_EDGES:
                 # Layer 1 cross (centers + edges paired + edges positioned)
                 self._solve_impl2_with_tracker(SolveStep.LBL_L1_Ctr, th)
-                self._solve_layer1_edges(th)
+                with self._step(SolveStep.LBL_L1_EDGES.name):
+                    self._solve_layer1_edges(th)
 
             case SolveStep.L1x:
                 # Layer 1 cross (centers + edges paired + edges positioned)
                 self._solve_impl2_with_tracker(SolveStep.LBL_L1_EDGES, th)
-                self._solve_layer1_cross(th)
+                with self._step(SolveStep.L1x.name):
+                    self._solve_layer1_cross(th)
 
             case SolveStep.LBL_L1:
                 # Layer 1 complete (centers + edges + corners)
                 self._solve_impl2_with_tracker(SolveStep.L1x, th)
-                self._solve_layer1_corners(th)
+                with self._step(SolveStep.LBL_L1.name):
+                    self._solve_layer1_corners(th)
 
             case SolveStep.LBL_L2_SLICES:
                 # Layer 1 + middle slices centers only (for debugging)
                 self._solve_impl2_with_tracker(SolveStep.LBL_L1, th)
-                self._solve_l2_slices(th)
+                with self._step(SolveStep.LBL_L2_SLICES.name):
+                    self._solve_l2_slices(th)
 
             case SolveStep.LBL_L3_CENTER:
                 self._solve_impl2_with_tracker(SolveStep.LBL_L2_SLICES, th)
-                self._solve_layer3_centers(th)
+                with self._step(SolveStep.LBL_L3_CENTER.name):
+                    self._solve_layer3_centers(th)
 
 
             case SolveStep.LBL_L3_EDGES:
                 self._solve_impl2_with_tracker(SolveStep.LBL_L3_CENTER, th)
-                self._solve_layer3_edges(th)
+                with self._step(SolveStep.LBL_L3_EDGES.name):
+                    self._solve_layer3_edges(th)
 
             case SolveStep.LBL_L3_CROSS:
                 self._solve_impl2_with_tracker(SolveStep.LBL_L3_EDGES, th)
-                self._solve_layer3_cross(th)
+                with self._step(SolveStep.LBL_L3_CROSS.name):
+                    self._solve_layer3_cross(th)
 
             case SolveStep.ALL:
                 # Full solve (currently only up to Layer 1 + slices centers)
                 self._solve_impl2_with_tracker(SolveStep.LBL_L3_CROSS, th)
-                self._solve_layer3_corners(th)
+                with self._step(SolveStep.L3.name):
+                    self._solve_layer3_corners(th)
 
             case _:
                 raise ValueError(f"Unsupported step: {what}")
@@ -482,7 +494,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l1_tracker = self._get_layer1_tracker(th)
-        self.debug(f"Solving Layer 1 centers ({l1_tracker.color.name} face only)")
+        self.debug(lambda: f"Solving Layer 1 centers ({l1_tracker.color.name} face only)")
 
         with self.op.annotation.annotate(h2=f"L1 centers ({l1_tracker.color.name})"):
             centers = NxNCenters(self, preserve_cage=False, tracker_holder=th)
@@ -495,7 +507,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l1_tracker = self._get_layer1_tracker(th)
-        self.debug(f"Solving Layer 1 edges ({l1_tracker.color.name} face only)")
+        self.debug(lambda: f"Solving Layer 1 edges ({l1_tracker.color.name} face only)")
 
         with self.op.annotation.annotate(h2=f"L1 edges ({l1_tracker.color.name})"):
             # Use solve_face_edges to solve only Layer 1 face edges
@@ -507,7 +519,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l1_tracker = self._get_layer1_tracker(th)
-        self.debug(f"Solving Layer 1 cross ({l1_tracker.color.name} layer)")
+        self.debug(lambda: f"Solving Layer 1 cross ({l1_tracker.color.name} layer)")
 
         with self.op.annotation.annotate(h2=f"L1 cross ({l1_tracker.color.name})"):
             # Solve using shadow cube approach with Solvers3x3
@@ -519,7 +531,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l1_tracker = self._get_layer1_tracker(th)
-        self.debug(f"Solving Layer 1 corners ({l1_tracker.color.name} layer)")
+        self.debug(lambda: f"Solving Layer 1 corners ({l1_tracker.color.name} layer)")
 
         with self.op.annotation.annotate(h2=f"L1 corners ({l1_tracker.color.name})"):
             # Solve using shadow cube approach with Solvers3x3
@@ -742,7 +754,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l3_tracker = self._get_layer1_tracker(th).opposite
-        self.debug(f"Solving Layer 3 centers ({l3_tracker.color.name} face only)")
+        self.debug(lambda: f"Solving Layer 3 centers ({l3_tracker.color.name} face only)")
 
         with self.op.annotation.annotate(h2=f"L3 centers ({l3_tracker.color.name})"):
             centers = NxNCenters(self, preserve_cage=False, tracker_holder=th)
@@ -762,7 +774,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l3_tracker = self._get_layer1_tracker(th).opposite
-        self.debug(f"Solving Layer 3 edges ({l3_tracker.color.name} face only)")
+        self.debug(lambda: f"Solving Layer 3 edges ({l3_tracker.color.name} face only)")
 
         with self.op.annotation.annotate(h2=f"L3 edges ({l3_tracker.color.name})"):
             self._l3_edges.do_l3_edges(l3_tracker)
@@ -776,7 +788,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l1_tracker = self._get_layer1_tracker(th).opposite
-        self.debug(f"Solving Layer 3 cross ({l1_tracker.color.name} layer)")
+        self.debug(lambda: f"Solving Layer 3 cross ({l1_tracker.color.name} layer)")
 
         with self.op.annotation.annotate(h2=f"L3 cross ({l1_tracker.color.name})"):
             # Solve using shadow cube approach with Solvers3x3
@@ -788,7 +800,7 @@ class DirectLayerByLayerNxNSolver(BaseSolver):
             return
 
         l3_tracker = self._get_layer1_tracker(th).opposite
-        self.debug(f"Solving Layer 3 corners ({l3_tracker.color.name} layer)")
+        self.debug(lambda: f"Solving Layer 3 corners ({l3_tracker.color.name} layer)")
 
         with self.op.annotation.annotate(h2=f"L3 corners ({l3_tracker.color.name})"):
             # Solve using shadow cube approach with Solvers3x3
@@ -284,7 +284,7 @@ class _LBLNxNEdges(SolverHelper):
             target_face_color = target_face.color
 
             self.debug(
-                f"Found source EdgeWing for target {untracked_source_wing.parent_name_index_colors} : {untracked_source_wing} / {untracked_source_wing.index}")
+                lambda: f"Found source EdgeWing for target {untracked_source_wing.parent_name_index_colors} : {untracked_source_wing} / {untracked_source_wing.index}")
 
             self.debug(lambda: f"on faces {untracked_source_wing.faces()} {untracked_source_edge.name}")
 
@@ -30,7 +30,7 @@ Algorithm for ring center solving:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Callable, Tuple
 
 from cube.domain.algs import SlicedSliceAlg
 from cube.domain.algs.Algs import Algs
@@ -46,6 +46,9 @@ from cube.domain.solver.direct.lbl._common import setup_l1, _get_side_face_track
 from cube.domain.solver.direct.lbl._sanity import SanityChecker
 
 if TYPE_CHECKING:
+    from cube.domain.model.Color import Color
+    from cube.domain.model.PartEdge import PartEdge
+    from cube.domain.model.RotationWhatIf import RotationWhatIf
     from cube.domain.solver.direct.lbl.DirectLayerByLayerNxNSolver import DirectLayerByLayerNxNSolver
 
 
@@ -200,6 +203,23 @@ class _LBLSlices(SolverHelper):
 
         return count
 
+    def _count_all_rows_solved_what_if(self, l1_tracker: FaceTracker, n_rows: int,
+                                       what_if: RotationWhatIf,
+                                       target: Callable[[PartEdge, int], Color]) -> list[int]:
+        """Like count_all_rows_solved, for each of the 4 what-if rotations."""
+        counts = [0, 0, 0, 0]
+        counting = [True, True, True, True]
+        for face_row in range(n_rows):
+            pieces = list(_get_row_pieces(self.cube, l1_tracker, face_row))
+            scores = what_if.scores(pieces, target)
+            for k in range(4):
+                if counting[k]:
+                    if scores[k] == len(pieces):
+                        counts[k] += 1
+                    else:
+                        counting[k] = False  # Stop at first unsolved slice
+        return counts
+
     # =========================================================================
     # Sanity check delegation (public API for child helpers)
     # =========================================================================
@@ -265,17 +285,26 @@ class _LBLSlices(SolverHelper):
 
         n_to_solve = min(_lbl_config.NUMBER_OF_SLICES_TO_SOLVE, n_slices)
 
-        # Count total solved pieces across all rows (rotation 0)
-        best_count = self.count_all_rows_solved(l1_tracker, n_to_solve)
-        best_rot = 0
+        # Count solved rows for each rotation without playing it. The odd-cube
+        # trackers follow the fixed centers, so after k rotations each face
+        # gets the color of the center that lands on it.
+        what_if = cube.cqr.what_if(center_slice_alg)
+        mid = n_slices // 2
+        face_colors = [
+            {f.name: what_if.color_after(f.center.get_center_slice((mid, mid)).edge, k) for f in cube.faces}
+            for k in range(4)
+        ]
+        counts = self._count_all_rows_solved_what_if(
+            l1_tracker, n_to_solve, what_if,
+            lambda pe, k: face_colors[k][pe.face.name]
+        )
 
-        with self.op.with_query_restore_state():
-            for n_rot in range(1, 4):
-                    self.play(center_slice_alg)
-                    count = self.count_all_rows_solved(l1_tracker, n_to_solve)
-                    if count > best_count:
-                        best_count = count
-                        best_rot = n_rot
+        best_count = counts[0]
+        best_rot = 0
+        for n_rot in range(1, 4):
+            if counts[n_rot] > best_count:
+                best_count = counts[n_rot]
+                best_rot = n_rot
 
         if best_rot > 0:
             self.debug(lambda : f"Global center-slice pre-align: {best_rot}x rotation "
@@ -323,13 +352,12 @@ class _LBLSlices(SolverHelper):
     def _find_row_best_pre_alignment(self, face_row: int, l1_tracker: FaceTracker) -> Tuple[SlicedSliceAlg, int] | None:
         """Find the best slice pre-alignment rotation count (0-3).
 
-        Uses with_query_restore_state() to test each rotation without
-        affecting the cube. Returns the number of rotations that maximizes
-        already-correct pieces, or 0 if no rotation helps.
+        Scores all four rotations with a what-if evaluation (no cube moves).
+        Returns the number of rotations that maximizes already-correct pieces,
+        or None if no rotation helps.
 
-        Face colors are frozen during the query to prevent tracker displacement:
-        slice rotations move center pieces (and their tracker marks), which can
-        cause two trackers to temporarily point to the same face.
+        Rows holding a center tracker are skipped: rotating them would move the
+        tracker marks and change face colors.
         """
 
 
@@ -347,20 +375,19 @@ class _LBLSlices(SolverHelper):
             self.debug(lambda : f"☑️☑️☑️☑️☑️☑️☑️☑️☑️ Protecting row {face_row} it contains center tracker ☑️☑️☑️☑️☑️☑️☑️☑️☑️ ")
             return None
 
-        # Count currently solved pieces (rotation 0) #claude: skip if it is the max available
-        best_count = sum(1 for e in _get_row_pieces(cube, l1_tracker, face_row) if e.match_faces)
+        # Solved pieces for rotations 0..3, the row has no center tracker so
+        # face colors don't change
+        counts = cube.cqr.what_if(slice_alg).scores(_get_row_pieces(cube, l1_tracker, face_row))
+
+        best_count = counts[0]
         if best_count == _common.get_expected_number_of_row_pieces(cube):
             return None  # already solved
 
         best_rotations = 0
-
-        with self.op.with_query_restore_state():
-            for n_rotations in range(1, 4):
-                self.play(slice_alg)
-                count = sum(1 for e in _get_row_pieces(cube, l1_tracker, face_row) if e.match_faces)
-                if count > best_count:
-                    best_count = count
-                    best_rotations = n_rotations
+        for n_rotations in range(1, 4):
+            if counts[n_rotations] > best_count:
+                best_count = counts[n_rotations]
+                best_rotations = n_rotations
 
         if best_rotations == 0:
             return None
@@ -393,7 +420,7 @@ class _LBLSlices(SolverHelper):
         """Solve ring centers for a single slice with optional pre-alignment.
 
         Strategy:
-        1. Find the best pre-alignment rotation (0-3) using query mode
+        1. Find the best pre-alignment rotation (0-3) by what-if evaluation
         2. If improvement found: apply pre-alignment rotation
         3. Run the core solver (which handles the rest regardless)
 
@@ -413,7 +440,7 @@ class _LBLSlices(SolverHelper):
                 if alg_best_rotations is not None:
                     slice_alg = alg_best_rotations[0]
                     best_rotations = alg_best_rotations[1]
-                    self.debug(f"Pre-align row {face_row}: rotating slice {best_rotations}x")
+                    self.debug(lambda: f"Pre-align row {face_row}: rotating slice {best_rotations}x")
                     # Preserve tracker positions across the slice rotation.
                     # The rotation moves center pieces (and their tracker marks) between
                     # faces. We want the pieces to move, but tracker marks must stay on
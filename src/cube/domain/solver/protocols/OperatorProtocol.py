@@ -43,10 +43,22 @@ class OperatorProtocol(Protocol, metaclass=ABCMeta):
         """Get the operation history."""
         ...
 
+    def history_view(self, last: int | None = None) -> Sequence["Alg"]:
+        """Lazy, read-only view of the history (no copy), optionally the last N entries."""
+        ...
+
     def undo(self, animation: bool = True) -> "Alg | None":
         """Undo the last operation. Pushes the undone alg to the redo queue."""
         ...
 
+    def undo_n(self, k: int, animation: bool = False) -> list["Alg"]:
+        """Undo the last ``k`` operations at once, returns them in played order."""
+        ...
+
+    def rollback_to(self, mark: int) -> list["Alg"]:
+        """Undo until the history has ``mark`` entries (a ``len(history_view())`` taken earlier)."""
+        ...
+
     def redo(self, animation: bool = True) -> "Alg | None":
         """Redo the last undone operation. Pops from redo queue and plays forward."""
         ...
@@ -55,10 +67,18 @@ class OperatorProtocol(Protocol, metaclass=ABCMeta):
         """Get the redo queue (operations available for redo)."""
         ...
 
+    def redo_queue_view(self, last: int | None = None) -> Sequence["Alg"]:
+        """Lazy, read-only view of the redo queue (no copy), optionally the last N entries."""
+        ...
+
     def clear_redo(self) -> None:
         """Clear the redo queue."""
         ...
 
+    def clear_history(self) -> None:
+        """Clear the history without changing the cube."""
+        ...
+
     def enqueue_redo(self, algs: Sequence["Alg"]) -> None:
         """Replace the redo queue with the given algorithms (e.g., solver solution)."""
         ...
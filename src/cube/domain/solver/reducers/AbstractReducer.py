@@ -136,18 +136,18 @@ class AbstractReducer(ReducerProtocol, SolverElementsProvider, ABC):
         summary = stats.get_summary_stats()
         total_blocks = sum(summary.values())
         total_pieces = sum(size * count for size, count in summary.items())
-        self.debug(f"[Center Block Statistics] {total_blocks} blocks, {total_pieces} pieces moved")
+        self.debug(lambda: f"[Center Block Statistics] {total_blocks} blocks, {total_pieces} pieces moved")
         for topic in stats.get_all_topics():
             display_topic = topic.replace(my_prefix, "")
             topic_stats = stats.get_topic_stats(topic)
             if topic_stats:
                 parts = [f"{size}x1:{count}" for size, count in sorted(topic_stats.items())]
                 total = sum(topic_stats.values())
-                self.debug(f"  [{display_topic}] {', '.join(parts)} (total: {total} blocks)")
+                self.debug(lambda: f"  [{display_topic}] {', '.join(parts)} (total: {total} blocks)")
             else:
-                self.debug(f"  [{display_topic}] (no blocks)")
+                self.debug(lambda: f"  [{display_topic}] (no blocks)")
         parts = [f"{size}x1:{count}" for size, count in sorted(summary.items())]
-        self.debug(f"  [SUMMARY] {', '.join(parts)} (total: {total_blocks} blocks)")
+        self.debug(lambda: f"  [SUMMARY] {', '.join(parts)} (total: {total_blocks} blocks)")
 
     # ---- ReducerProtocol interface (abstract) ----
 
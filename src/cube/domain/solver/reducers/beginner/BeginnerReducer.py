@@ -9,6 +9,7 @@ from __future__ import annotations
 from cube.domain.tracker.FacesTrackerHolder import FacesTrackerHolder
 from cube.domain.solver.common.CenterBlockStatistics import CenterBlockStatistics
 from cube.domain.solver.common.big_cube.NxNCenters import NxNCenters
+from cube.domain.solver.common.StepRecorder import record_step
 from cube.domain.solver.protocols import OperatorProtocol
 from cube.domain.solver.protocols.ReducerProtocol import ReductionResults
 from cube.domain.solver.reducers.AbstractReducer import AbstractReducer
@@ -94,7 +95,7 @@ class BeginnerReducer(AbstractReducer):
 
     def solve_centers(self) -> None:
         """Solve only centers (first part of reduction)."""
-        with FacesTrackerHolder(self) as holder:
+        with record_step(self.op, "NxNCenters"), FacesTrackerHolder(self) as holder:
             centers = NxNCenters(self)
             centers.solve(holder)
             # Accumulate stats from temporary NxNCenters instance
@@ -108,7 +109,8 @@ class BeginnerReducer(AbstractReducer):
         Returns:
             True if edge parity was detected/fixed during reduction.
         """
-        return self._nxn_edges.solve()
+        with record_step(self.op, "NxNEdges"):
+            return self._nxn_edges.solve()
 
     def fix_edge_parity(self) -> None:
         """Fix even cube edge parity (OLL parity).
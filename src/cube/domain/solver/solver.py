@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
@@ -10,6 +12,7 @@ from cube.domain.solver.SolverName import SolverName
 
 if TYPE_CHECKING:
     from cube.domain.algs.Alg import Alg
+    from cube.utils.metrics import MetricsSnapshot
 
 from cube.domain.solver.common.CenterBlockStatistics import CenterBlockStatistics
 
@@ -85,6 +88,57 @@ class SolveStep(Enum):
         return self._description
 
 
+@dataclass
+class StepStats:
+    """Cost of one solve step, see :attr:`SolverResults.steps`.
+
+    ``children`` are the steps that ran inside this one - the centers/edges of
+    a reduction, L1/L2/L3 of a 3x3 attempt, or the root step of a child solver.
+    ``moves`` is the ``op.count`` delta (0 for steps run in query mode),
+    ``quarter_turns`` the model layer turns (``Cube.quarter_turns`` delta).
+    """
+
+    name: str
+    solver: str = ""
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    moves: int = 0
+    quarter_turns: int = 0
+    children: list[StepStats] = field(default_factory=list)
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, StepStats]]:
+        """Depth first, yields (depth, step), self first."""
+        yield depth, self
+        for c in self.children:
+            yield from c.walk(depth + 1)
+
+    def find(self, name: str) -> StepStats | None:
+        """First step (depth first) with this name."""
+        return next((s for _, s in self.walk() if s.name == name), None)
+
+    def format(self) -> str:
+        lines: list[str] = []
+        for depth, s in self.walk():
+            label = "  " * depth + s.name + (f" [{s.solver}]" if s.solver else "")
+            lines.append(f"{label:<40} {s.wall_s:>9.4f}s {s.cpu_s:>9.4f}s cpu"
+                         f" {s.moves:>7} moves {s.quarter_turns:>8} qt")
+        return "\n".join(lines)
+
+
+@dataclass
+class CandidateStats:
+    """One variant of a best-of-N solve, see :attr:`SolverResults.candidates`.
+
+    ``moves`` is the length of the candidate's (optimized) solution, None if
+    it did not finish within the time budget or failed (see ``error``).
+    """
+
+    name: str
+    moves: int | None = None
+    wall_s: float = 0.0
+    error: str = ""
+
+
 class SolverResults:
 
     def __init__(self) -> None:
@@ -92,6 +146,9 @@ class SolverResults:
         self._was_corner_swap = False
         self._was_partial_edge_parity = False
         self._was_even_edge_parity = False
+        self._metrics: MetricsSnapshot | None = None
+        self._steps: StepStats | None = None
+        self._candidates: list[CandidateStats] | None = None
 
     @property
     def was_corner_swap(self) -> bool:
@@ -112,6 +169,27 @@ class SolverResults:
                 self._was_even_edge_parity or
                 self._was_partial_edge_parity)
 
+    @property
+    def metrics(self) -> MetricsSnapshot | None:
+        """Hot-path metrics recorded during this solve, None if metrics were disabled.
+
+        See cube.utils.metrics.
+        """
+        return self._metrics
+
+    @property
+    def steps(self) -> StepStats | None:
+        """Per-step timing and move counts of this solve, the root is the whole solve.
+
+        None if the solve was aborted.
+        """
+        return self._steps
+
+    @property
+    def candidates(self) -> list[CandidateStats] | None:
+        """Every variant tried by a best-of-N solve (Solvers.best_of), None for a plain solve."""
+        return self._candidates
+
     def parity_summary(self) -> str:
         """Return a summary of detected parities."""
         parities: list[str] = []
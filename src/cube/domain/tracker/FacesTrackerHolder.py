@@ -41,6 +41,7 @@ from cube.domain.model.FacesColorsProvider import FacesColorsProvider
 from cube.domain.model.PartEdge import PartEdge
 from cube.domain.tracker._face_trackers_factory import NxNCentersFaceTrackers
 from cube.domain.tracker._face_trackers import FaceTracker
+from cube.utils.metrics import METRICS
 
 if TYPE_CHECKING:
     from cube.domain.model.Cube import Cube
@@ -132,6 +133,7 @@ class FacesTrackerHolder(FacesColorsProvider):
         # Generate unique holder ID for this instance
         FacesTrackerHolder._holder_unique_id += 1
         self._holder_id = FacesTrackerHolder._holder_unique_id
+        METRICS.inc("tracker.holders")
 
         self._is_for_status_querying = is_for_status_querying
         self._cube = slv.cube
@@ -233,6 +235,7 @@ class FacesTrackerHolder(FacesColorsProvider):
             return self._face_colors_cache
 
         # Rebuild cache - trackers may have moved to different faces
+        METRICS.inc("tracker.face_colors_scans")
         self._face_colors_cache = {}
         for tracker in self._trackers:
             self._face_colors_cache[tracker.face.name] = tracker.color
@@ -30,6 +30,7 @@ from typing import TYPE_CHECKING
 from cube.application.AbstractApp import AbstractApp
 from cube.presentation.gui import BackendRegistry
 from cube.presentation.gui.commands import Commands
+from cube.utils.metrics import METRICS
 
 if TYPE_CHECKING:
     from cube.domain.solver.SolverName import SolverName
@@ -132,6 +133,7 @@ def run_with_backend(
     commands: str | None = None,
     debug_all: bool = False,
     quiet_all: bool = False,
+    metrics: bool = False,
 ) -> int:
     """Run the application with the specified backend.
 
@@ -149,6 +151,8 @@ def run_with_backend(
             Example: "SCRAMBLE_1,SOLVE_ALL,QUIT" or "SPEED_UP+SPEED_UP+SCRAMBLE_1"
         debug_all: Enable debug_all mode for verbose logging (default: False).
         quiet_all: Suppress all debug output (default: False).
+        metrics: Collect hot-path metrics (cube.utils.metrics) and print them
+            on exit (default: False).
 
     Returns:
         Exit code (0 for success, 1 for error).
@@ -164,6 +168,9 @@ def run_with_backend(
         >>> run_with_backend("tkinter")  # Run with tkinter
         >>> run_with_backend("headless", commands="SCRAMBLE_1,SOLVE_ALL,QUIT")
     """
+    if metrics:
+        METRICS.enabled = True
+
     window = None
     try:
         # Create application and window via single coordination point
@@ -212,6 +219,10 @@ def run_with_backend(
         if window is not None:
             window.cleanup()
 
+        if metrics:
+            print("Metrics:")
+            print(METRICS.snapshot().format())
+
     return 0
 
 
@@ -280,6 +291,11 @@ def main(args: list[str] | None = None) -> int:
         action="store_true",
         help="Suppress all debug output"
     )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Collect hot-path metrics (moves, 4-cycles, sanity, timers) and print them on exit"
+    )
 
     parsed = parser.parse_args(args)
 
@@ -293,6 +309,7 @@ def main(args: list[str] | None = None) -> int:
         commands=parsed.commands,
         debug_all=parsed.debug_all,
         quiet_all=parsed.quiet,
+        metrics=parsed.metrics,
     )
 
 
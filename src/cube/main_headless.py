@@ -15,6 +15,7 @@ Usage:
     python -m cube.main_headless --key-sequence="1?Q"
     python -m cube.main_headless --debug-all
     python -m cube.main_headless --quiet
+    python -m cube.main_headless --commands="SCRAMBLE_1,SOLVE_ALL,QUIT" --metrics
 """
 import sys
 
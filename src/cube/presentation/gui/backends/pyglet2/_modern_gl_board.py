@@ -31,6 +31,15 @@ Shadow Faces:
     - L (Left): offset -75 units in X
     - D (Down): offset -50 units in Y
     - B (Back): offset -200 units in Z
+
+Vertex Buffers:
+    Cell positions, normals and border lines never change for a given
+    size and set of shadow faces, so they are written once into
+    preallocated structured arrays (one row of 6 triangle vertices and
+    one row of 8 line vertices per cell, main faces then shadow faces).
+    After a move only the RGB of the cells whose color changed is
+    rewritten, and the static/animated split is a boolean mask over the
+    rows. Markers are few and still generated per cell.
 """
 from __future__ import annotations
 
@@ -39,9 +48,11 @@ from typing import TYPE_CHECKING
 import numpy as np
 from numpy import ndarray
 
+from cube.domain.model.Color import Color, color2rgb_float
 from cube.domain.model.FaceName import FaceName
 
 from ._modern_gl_arrow import Arrow3D, create_arrows_from_markers
+from ._modern_gl_cell import _LINE_COLOR
 from ._modern_gl_constants import (
     FACE_TRANSFORMS,
     SHADOW_OFFSETS,
@@ -57,6 +68,23 @@ if TYPE_CHECKING:
     from ._modern_gl_cell import ModernGLCell
 
 
+# Same layouts as ModernGLCell.generate_face_vertices / generate_line_vertices
+_FACE_VERTEX = np.dtype([("position", np.float32, 3), ("normal", np.float32, 3), ("color", np.float32, 3)])
+_LINE_VERTEX = np.dtype([("position", np.float32, 3), ("color", np.float32, 3)])
+
+# Cell corners are [lb, rb, rt, lt]
+_TRIANGLE_CORNERS = [0, 1, 2, 0, 2, 3]    # lb rb rt, lb rt lt
+_LINE_CORNERS = [0, 1, 1, 2, 2, 3, 3, 0]  # bottom, right, top, left
+
+_COLOR_INDEX: dict[Color, int] = {c: i for i, c in enumerate(Color)}
+_RGB = np.array([color2rgb_float(c) for c in Color], dtype=np.float32)
+
+
+def _flat(vertices: ndarray) -> ndarray:
+    """Structured vertex rows as the flat float32 array the renderer takes."""
+    return vertices.view(np.float32).reshape(-1)
+
+
 class ModernGLBoard:
     """Manages all 6 cube faces for ModernGL rendering.
 
@@ -78,6 +106,11 @@ class ModernGLBoard:
         '_cube', '_vs', '_size',
         '_faces',         # Main 6 faces
         '_shadow_faces',  # Shadow faces (when enabled)
+        '_shadow_modes',  # Faces that _shadow_faces were created for
+        '_buffer_faces',  # Faces the buffers were built for, in row order
+        '_face_buffer',   # (n_cells, 6) of _FACE_VERTEX
+        '_line_buffer',   # (n_cells, 8) of _LINE_VERTEX
+        '_buffer_colors', # Color index per buffer row, -1 = not written yet
     ]
 
     def __init__(self, cube: "Cube", vs: "ApplicationAndViewState | None") -> None:
@@ -93,6 +126,12 @@ class ModernGLBoard:
 
         self._faces: dict[FaceName, ModernGLFace] = {}
         self._shadow_faces: dict[FaceName, ModernGLFace] = {}
+        self._shadow_modes: tuple[FaceName, ...] = ()
+
+        self._buffer_faces: list[ModernGLFace] = []
+        self._face_buffer: ndarray = np.zeros((0, 6), _FACE_VERTEX)
+        self._line_buffer: ndarray = np.zeros((0, 8), _LINE_VERTEX)
+        self._buffer_colors: ndarray = np.zeros(0, np.intp)
 
         self._create_faces()
 
@@ -129,12 +168,10 @@ class ModernGLBoard:
         is correct for the visible side.
         """
         self._shadow_faces.clear()
-
-        if self._vs is None:
-            return
+        self._shadow_modes = self._current_shadow_modes()
 
         for face_name, offset in SHADOW_OFFSETS.items():
-            if self._vs.get_draw_shadows_mode(face_name):
+            if face_name in self._shadow_modes:
                 # Get base transform and apply offset
                 center, right, up = FACE_TRANSFORMS[face_name]
                 shadow_center = np.array(center, dtype=np.float32) + np.array(offset, dtype=np.float32)
@@ -153,6 +190,13 @@ class ModernGLBoard:
                 face.normal = -face.normal
                 self._shadow_faces[face_name] = face
 
+    def _current_shadow_modes(self) -> tuple[FaceName, ...]:
+        """Faces whose shadow is enabled in the view state."""
+        if self._vs is None:
+            return ()
+        vs = self._vs
+        return tuple(f for f in SHADOW_OFFSETS if vs.get_draw_shadows_mode(f))
+
     def update(self) -> None:
         """Update all faces from current cube state.
 
@@ -171,12 +215,67 @@ class ModernGLBoard:
             cube_face = cube.face(face_name)
             gl_face.update(cube_face)
 
-        # Recreate and update shadow faces (in case shadow mode changed)
-        self._create_shadow_faces()
+        # Recreate shadow faces if shadow mode changed, then update them
+        if self._current_shadow_modes() != self._shadow_modes:
+            self._create_shadow_faces()
         for face_name, gl_face in self._shadow_faces.items():
             cube_face = cube.face(face_name)
             gl_face.update(cube_face)
 
+        self._update_buffers()
+
+    def _update_buffers(self) -> None:
+        """Rewrite the RGB of the cells whose color changed, see module docstring.
+
+        Rebuilds the buffers first if the faces changed (size or shadow mode).
+        """
+        faces = [*self._faces.values(), *self._shadow_faces.values()]
+        if faces != self._buffer_faces:
+            self._build_buffers(faces)
+
+        codes = np.fromiter(
+            (_COLOR_INDEX[c] for gl_face in faces for c in gl_face.colors),
+            dtype=np.intp, count=len(self._buffer_colors),
+        )
+        changed = codes != self._buffer_colors
+        if changed.any():
+            self._face_buffer["color"][changed] = _RGB[codes[changed]][:, None, :]
+            self._buffer_colors = codes
+
+    def _build_buffers(self, faces: list[ModernGLFace]) -> None:
+        """Write the static attributes (positions, normals, line color) of ``faces``."""
+        corners = np.concatenate([f.cell_corners for f in faces])
+        normals = np.concatenate([np.broadcast_to(f.normal, (len(f.cell_corners), 3)) for f in faces])
+        n_cells = len(corners)
+
+        face_buffer = np.zeros((n_cells, 6), _FACE_VERTEX)
+        face_buffer["position"] = corners[:, _TRIANGLE_CORNERS]
+        face_buffer["normal"] = normals[:, None, :]
+
+        line_buffer = np.zeros((n_cells, 8), _LINE_VERTEX)
+        line_buffer["position"] = corners[:, _LINE_CORNERS]
+        line_buffer["color"] = _LINE_COLOR
+
+        self._buffer_faces = faces
+        self._face_buffer = face_buffer
+        self._line_buffer = line_buffer
+        self._buffer_colors = np.full(n_cells, -1, np.intp)
+
+    def _animated_mask(self, animated_parts: "set[PartSlice] | None") -> ndarray | None:
+        """Buffer rows of the animated cells, or None if no cell is animated.
+
+        Shadow faces are never animated.
+        """
+        if not animated_parts:
+            return None
+        cells = [cell for gl_face in self._faces.values() for cell in gl_face.cells]
+        mask = np.zeros(len(self._buffer_colors), dtype=bool)
+        mask[:len(cells)] = np.fromiter(
+            (cell.part_slice is not None and cell.part_slice in animated_parts for cell in cells),
+            dtype=bool, count=len(cells),
+        )
+        return mask if mask.any() else None
+
     def generate_geometry(
         self,
         animated_parts: "set[PartSlice] | None" = None,
@@ -190,7 +289,10 @@ class ModernGLBoard:
     ]:
         """Generate all vertex data for rendering.
 
-        Separates geometry into static and animated parts.
+        Separates geometry into static and animated parts. Faces and
+        border lines come from the preallocated buffers (see module
+        docstring); without animation they are views of them, valid
+        until the next update().
 
         Args:
             animated_parts: Set of PartSlices being animated, or None
@@ -199,80 +301,56 @@ class ModernGLBoard:
             Tuple of (face_triangles, line_data, animated_faces, animated_lines,
                       marker_triangles, animated_marker_triangles)
         """
-        face_verts: list[float] = []
-        line_verts: list[float] = []
-        animated_face_verts: list[float] = []
-        animated_line_verts: list[float] = []
+        mask = self._animated_mask(animated_parts)
+
         marker_verts: list[float] = []
+        marker_line_verts: list[float] = []
         animated_marker_verts: list[float] = []
+        animated_marker_line_verts: list[float] = []
 
-        # Main faces
+        # All markers (including cross/character lines) via toolkit
+        row = 0
         for gl_face in self._faces.values():
-            self._generate_face_verts(
-                gl_face, animated_parts,
-                face_verts, line_verts,
-                animated_face_verts, animated_line_verts,
-                marker_verts, animated_marker_verts,
-            )
+            for cell in gl_face.cells:
+                if mask is not None and mask[row]:
+                    cell.generate_marker_vertices(animated_marker_verts, animated_marker_line_verts)
+                else:
+                    cell.generate_marker_vertices(marker_verts, marker_line_verts)
+                row += 1
 
         # Shadow faces (never animated - they're static copies)
         for gl_face in self._shadow_faces.values():
-            self._generate_face_verts(
-                gl_face, None,  # No animation for shadows
-                face_verts, line_verts,
-                [], [],  # Don't collect animated verts
-                marker_verts, [],  # Markers only on static for shadow
-            )
+            for cell in gl_face.cells:
+                cell.generate_marker_vertices(marker_verts, marker_line_verts)
+
+        if mask is None:
+            face_triangles = _flat(self._face_buffer)
+            line_data = _flat(self._line_buffer)
+            animated_faces: np.ndarray | None = None
+            animated_lines: np.ndarray | None = None
+        else:
+            static = ~mask
+            face_triangles = _flat(self._face_buffer[static])
+            line_data = _flat(self._line_buffer[static])
+            animated_faces = _flat(self._face_buffer[mask])
+            animated_lines = _flat(self._line_buffer[mask])
+
+        if marker_line_verts:
+            line_data = np.concatenate([line_data, np.array(marker_line_verts, dtype=np.float32)])
+        if animated_marker_line_verts:
+            assert animated_lines is not None
+            animated_lines = np.concatenate(
+                [animated_lines, np.array(animated_marker_line_verts, dtype=np.float32)])
 
         return (
-            np.array(face_verts, dtype=np.float32),
-            np.array(line_verts, dtype=np.float32),
-            np.array(animated_face_verts, dtype=np.float32) if animated_face_verts else None,
-            np.array(animated_line_verts, dtype=np.float32) if animated_line_verts else None,
+            face_triangles,
+            line_data,
+            animated_faces,
+            animated_lines,
             np.array(marker_verts, dtype=np.float32) if marker_verts else None,
             np.array(animated_marker_verts, dtype=np.float32) if animated_marker_verts else None,
         )
 
-    def _generate_face_verts(
-        self,
-        gl_face: ModernGLFace,
-        animated_parts: "set[PartSlice] | None",
-        face_verts: list[float],
-        line_verts: list[float],
-        animated_face_verts: list[float],
-        animated_line_verts: list[float],
-        marker_verts: list[float] | None = None,
-        animated_marker_verts: list[float] | None = None,
-    ) -> None:
-        """Generate vertices for one face."""
-        for cell in gl_face.cells:
-            # Check if this cell is animated
-            is_animated = (
-                animated_parts is not None
-                and cell.part_slice is not None
-                and cell.part_slice in animated_parts
-            )
-
-
-            if is_animated:
-                cell.generate_face_vertices(animated_face_verts)
-                cell.generate_line_vertices(animated_line_verts)
-                # All markers (including cross/character lines) via toolkit
-                if animated_marker_verts is not None:
-                    cell.generate_marker_vertices(animated_marker_verts, animated_line_verts)
-                else:
-                    # Still need line-based markers even without marker verts
-                    cell.generate_marker_vertices([], animated_line_verts)
-            else:
-                cell.generate_face_vertices(face_verts)
-                cell.generate_line_vertices(line_verts)
-                # All markers (including cross/character lines) via toolkit
-                if marker_verts is not None:
-                    cell.generate_marker_vertices(marker_verts, line_verts)
-                else:
-                    # Still need line-based markers even without marker verts
-                    cell.generate_marker_vertices([], line_verts)
-
     def generate_per_cell_textured_geometry(
         self,
         animated_parts: "set[PartSlice] | None" = None,
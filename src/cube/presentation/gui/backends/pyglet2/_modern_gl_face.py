@@ -66,6 +66,8 @@ class ModernGLFace:
     __slots__ = [
         'face_name', 'center', 'right', 'up', 'normal',
         '_cells', '_size',
+        '_cell_corners',  # (size*size, 4, 3), row-major; fixed for a face
+        '_colors',        # Cell colors from the last update(), row-major
     ]
 
     def __init__(
@@ -97,6 +99,13 @@ class ModernGLFace:
 
         # Cells will be created when update() is called
         self._cells: list[ModernGLCell] = []
+        self._colors: list[Color] = []
+
+        # Cell positions never change for a face, compute them once
+        cell_size = HALF_CUBE_SIZE * 2 / size
+        self._cell_corners = np.array(
+            [self._calc_cell_corners(row, col, cell_size) for row in range(size) for col in range(size)],
+        ).reshape(size * size, 4, 3)
 
     def update(self, cube_face: "Face") -> None:
         """Update cells from current cube state.
@@ -107,24 +116,23 @@ class ModernGLFace:
             cube_face: The cube Face object with current colors
         """
         self._cells.clear()
+        self._colors.clear()
         size = self._size
-
-        # Face geometry
-        face_size = HALF_CUBE_SIZE * 2  # Full face size
-        cell_size = face_size / size
+        cell_corners = self._cell_corners
 
         for row in range(size):
             for col in range(size):
-                # Get color and part_slice for this cell
-                color = self._get_cell_color(cube_face, row, col)
-                rgb = color2rgb_float(color)
+                # Get part_slice for this cell
                 part_slice = self._get_cell_part_slice(cube_face, row, col)
 
                 # Get PartEdge for this face (for texture lookup from c_attributes)
                 part_edge = part_slice.get_face_edge(cube_face) if part_slice else None
 
-                # Calculate cell corners
-                corners = self._calc_cell_corners(row, col, cell_size)
+                color = part_edge.color if part_edge is not None else cube_face.original_color
+                rgb = color2rgb_float(color)
+                self._colors.append(color)
+
+                corners = list(cell_corners[row * size + col])
 
                 cell = ModernGLCell(
                     row=row,
@@ -254,6 +262,16 @@ class ModernGLFace:
         """Get all cells on this face."""
         return self._cells
 
+    @property
+    def cell_corners(self) -> ndarray:
+        """Corners [lb, rb, rt, lt] of all cells, shape (size*size, 4, 3), row-major like cells."""
+        return self._cell_corners
+
+    @property
+    def colors(self) -> list[Color]:
+        """Cell colors from the last update(), in the order of cells."""
+        return self._colors
+
     def get_center_point(self) -> ndarray:
         """Get the center point of this face in world space."""
         return self.center.copy()
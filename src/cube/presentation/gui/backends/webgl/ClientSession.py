@@ -9,6 +9,7 @@ Unlike the web backend which sends rendering commands per frame,
 this backend sends:
 - cube_state: face colors as NxN grid of RGB values
 - animation_start: face rotation event for client-side animation
+- animation_batch: several playback moves at once (turbo playback)
 - animation_stop: cancel client animations
 - text_update: solver status, move count, animation text
 """
@@ -24,9 +25,15 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from cube.application.exceptions.ExceptionAppExit import AppExit
-from cube.presentation.gui.backends.webgl.CubeStateSerializer import apply_cube_colors, extract_cube_state
+from cube.presentation.gui.backends.webgl.CubeStateSerializer import (
+    apply_cube_colors,
+    extract_cube_state,
+    sticker_cells,
+    sticker_delta,
+)
 from cube.presentation.gui.backends.webgl.FlowStateMachine import FlowEvent, FlowState, FlowStateMachine
 from cube.presentation.gui.backends.webgl.SessionState import SessionStateSnapshot
+from cube.presentation.gui.backends.webgl.TurboPacer import TurboPacer
 from cube.presentation.gui.commands import Command, CommandContext
 from cube.utils.log_stream_buffer import LogStreamBuffer
 from cube.version import get_version
@@ -35,14 +42,18 @@ if TYPE_CHECKING:
     from aiohttp.web import WebSocketResponse
 
     from cube.application.AbstractApp import AbstractApp
+    from cube.application.SolutionStream import SolutionStream
     from cube.domain.algs.Alg import Alg
     from cube.domain.model import Edge, Part
     from cube.domain.model.Cube import Cube
     from cube.domain.model.Face import Face
+    from cube.domain.model.PartEdge import PartEdge
+    from cube.presentation.gui.backends.webgl.SessionHibernation import HibernatedSession
     from cube.presentation.gui.backends.webgl.WebglAnimationManager import WebglAnimationManager
     from cube.presentation.gui.backends.webgl.WebglEventLoop import WebglEventLoop
     from cube.presentation.gui.backends.webgl.WebglRenderer import WebglRenderer
     from cube.presentation.gui.commands import CommandSequence
+    from cube.utils.config_protocol import ConfigProtocol
 
 
 @dataclass
@@ -55,6 +66,15 @@ class ClientInfo:
     connected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+@dataclass
+class _TurboBatch:
+    """Moves collected for one animation_batch message."""
+    cells: dict[PartEdge, tuple[str, int]]  # see sticker_cells
+    moves: list[dict[str, object]] = field(default_factory=list)
+    # A move without animation changed the cube: the next delta has all stickers
+    all_changed: bool = False
+
+
 class ClientSession:
     """An independent cube session for a single WebSocket client.
 
@@ -69,14 +89,16 @@ class ClientSession:
         event_loop: "WebglEventLoop",
         client_info: ClientInfo,
         gui_test_mode: bool = False,
+        config: "ConfigProtocol | None" = None,
     ) -> None:
         self._ws = ws
         self._event_loop = event_loop
         self.client_info = client_info
 
-        # Create independent app for this session
+        # Create independent app for this session, with its own copy of the server's settings
         from cube.application.AbstractApp import AbstractApp
-        self._app: AbstractApp = AbstractApp.create_app()
+        self._app: AbstractApp = AbstractApp.create_app(
+            config=config.copy() if config is not None else None)
         self._gui_test_mode = gui_test_mode
 
         self._app.cube.has_visible_presentation = True
@@ -122,8 +144,8 @@ class ClientSession:
         # single redo/undo/face-turn, transition FSM from ANIMATING → READY/IDLE
         def _on_am_queue_drained() -> None:
             if self._fsm.state == FlowState.ANIMATING:
-                has_redo = bool(self._app.op.redo_queue())
-                has_history = bool(self._app.op.history())
+                has_redo = bool(self._app.op.redo_queue_view())
+                has_history = bool(self._app.op.history_view())
                 self._fsm.send(FlowEvent.ANIM_DONE, has_redo=has_redo, has_history=has_history)
                 self.send_state()
 
@@ -140,6 +162,17 @@ class ClientSession:
         # Client count — set externally by SessionManager
         self._client_count: int = 0
 
+        # Turbo playback: batch sizing and the batch being collected
+        self._turbo_pacer: TurboPacer = TurboPacer()
+        self._turbo_batch: _TurboBatch | None = None
+
+        # Streaming two-phase solve, see _two_phase_solve(). _stream_stalled
+        # is the turbo flag of a forward playback waiting for solver moves.
+        self._solve_stream: SolutionStream | None = None
+        self._solve_task: asyncio.Task[None] | None = None
+        self._stream_stalled: bool | None = None
+        self._fsm.on_transition(self._on_flow_transition)
+
     @property
     def app(self) -> "AbstractApp":
         return self._app
@@ -200,21 +233,107 @@ class ClientSession:
             self.on_client_connected()
             return
 
+        if self._solve_stream is not None and self._fsm.state == FlowState.SOLVING:
+            # Streaming solve before its first moves - the first chunk ends SOLVING
+            self.on_client_connected()
+            return
+
         # Cancel any in-flight animation state
         am.cancel_animation()
+        self._turbo_pacer.cancel()
+        self._stream_stalled = None
         # FSM RECONNECT: transitions to IDLE or READY based on queue
-        has_redo = bool(self._app.op.redo_queue())
-        has_history = bool(self._app.op.history())
-        self._fsm.send_reconnect(has_redo=has_redo)
+        # (a streaming solve still delivers moves)
+        has_redo = bool(self._app.op.redo_queue_view())
+        has_history = bool(self._app.op.history_view())
+        self._fsm.send_reconnect(has_redo=has_redo or self._solve_stream is not None)
         actions = self._fsm.allowed_actions(has_redo=has_redo, has_history=has_history)
         print(
             f"Session reattached: {self.client_info.session_id[:8]} → {self._fsm.state.value} "
-            f"redo={len(self._app.op.redo_queue())} history={len(self._app.op.history())} "
+            f"redo={len(self._app.op.redo_queue_view())} history={len(self._app.op.history_view())} "
             f"play_all={actions.get('play_all')}",
             flush=True,
         )
         self.on_client_connected()
 
+    # -- Hibernation (dormant sessions, see SessionHibernation) --
+
+    @property
+    def can_hibernate(self) -> bool:
+        """False during a one-phase solve — the solver thread owns the app —
+        and while a streaming solve still delivers moves."""
+        return not self._animation_manager._blocking_mode and self._solve_stream is None
+
+    def hibernate(self) -> "HibernatedSession":
+        """Compact record of this session, to be rebuilt by from_hibernated().
+
+        In-flight animations are cancelled, as on reattach(). The caller
+        frees the session with cleanup().
+        """
+        from cube.presentation.gui.backends.webgl.SessionHibernation import HibernatedSession
+
+        assert self.can_hibernate, "Can't hibernate a session while the solver is running"
+        self._animation_manager.cancel_animation()
+
+        app = self._app
+        vs = app.vs
+        cfg = app.config
+        return HibernatedSession(
+            client_info=self.client_info,
+            cube_size=app.cube.size,
+            facelets=app.cube.get_facelets(),
+            queues=app.op.snapshot_queues(),
+            solver=app.slv.get_code,
+            animation_enabled=app.op.animation_enabled,
+            speed_index=vs.get_speed_index,
+            slice_start=vs.slice_start,
+            slice_stop=vs.slice_stop,
+            config={key: bool(getattr(cfg, key)) for key in self._CONFIG_BOOL_KEYS},
+            default_scramble=self._default_scramble,
+            redo_source=self._fsm.redo_source,
+            redo_tainted=self._fsm.redo_tainted,
+        )
+
+    @classmethod
+    def from_hibernated(
+        cls,
+        record: "HibernatedSession",
+        ws: "WebSocketResponse",
+        event_loop: "WebglEventLoop",
+        gui_test_mode: bool = False,
+        config: "ConfigProtocol | None" = None,
+    ) -> "ClientSession":
+        """Rebuild a session from hibernate() on a new WebSocket.
+
+        The flow state comes back as after a reconnect: READY if the redo
+        queue is not empty, IDLE otherwise.
+        """
+        session = cls(ws, event_loop, record.client_info, gui_test_mode, config)
+
+        app = session._app
+        vs = app.vs
+        if record.cube_size != app.cube.size:
+            vs.cube_size = record.cube_size
+            app.reset(record.cube_size)
+        app.switch_to_solver(record.solver)
+        app.cube.set_facelets(record.facelets)
+        app.op.restore_queues(record.queues)
+        app.op.toggle_animation_on(record.animation_enabled)
+
+        vs._speed = record.speed_index
+        vs.slice_start = record.slice_start
+        vs.slice_stop = record.slice_stop
+        cfg = app.config
+        for key, value in record.config.items():
+            setattr(cfg, key, value)
+        session._default_scramble = record.default_scramble
+
+        fsm = session._fsm
+        fsm.send_reconnect(has_redo=bool(app.op.redo_queue_view()))
+        fsm.redo_source = record.redo_source
+        fsm.redo_tainted = record.redo_tainted
+        return session
+
     # -- Send helpers (unicast to this session's WebSocket) --
 
     def _send(self, message: str) -> None:
@@ -257,9 +376,9 @@ class ClientSession:
             return True
 
         done: list[dict[str, str]] = [
-            self._serialize_alg(a) for a in op.history() if _include(a)
+            self._serialize_alg(a) for a in op.history_view() if _include(a)
         ]
-        redo_list = list(reversed(op.redo_queue()))
+        redo_list = list(reversed(op.redo_queue_view()))
         redo: list[dict[str, str]] = [
             self._serialize_alg(a) for a in redo_list if _include(a)
         ]
@@ -279,7 +398,7 @@ class ClientSession:
         # Stop at the first HeadingAlg with h1 (phase boundary).
         h1_text: str | None = None
         h2_text: str | None = None
-        for alg_entry in reversed(op.history()):
+        for alg_entry in reversed(op.history_view()):
             if isinstance(alg_entry, _HeadingAlg):
                 if alg_entry.h1:
                     h1_text = alg_entry.h1
@@ -390,6 +509,40 @@ class ClientSession:
         The model change has already been applied before this is called,
         so extract_cube_state returns the post-move state. This ensures the
         client applies the correct final state when the animation completes.
+        """
+        event = self._animation_event(alg, duration_ms, is_undo=is_undo)
+        event["state"] = extract_cube_state(self._app.cube)
+        self._send(json.dumps(event))
+
+    def add_batched_animation(self, alg: "Alg", duration_ms: int, *, is_undo: bool = False) -> None:
+        """Collect an applied move into the current turbo batch.
+
+        Called by the AM in batch mode instead of send_animation_start().
+        Each move carries the sticker delta from the previous collected move
+        rather than a full state, read from the slices the move rotated.
+        """
+        from cube.domain import algs as alg_types
+
+        batch = self._turbo_batch
+        assert batch is not None, "add_batched_animation outside of _play_batch"
+        cube = self._app.cube
+        if batch.all_changed or not isinstance(alg, alg_types.AnimationAbleAlg):
+            batch.all_changed = False
+            parts = cube.get_all_part_slices()
+        else:
+            _, parts = alg.get_animation_objects(cube)
+        event = self._animation_event(alg, duration_ms, is_undo=is_undo)
+        event["delta"] = sticker_delta(batch.cells, parts)
+        batch.moves.append(event)
+
+    def add_batched_change(self) -> None:
+        """A move without animation was applied in the current turbo batch."""
+        batch = self._turbo_batch
+        assert batch is not None, "add_batched_change outside of _play_batch"
+        batch.all_changed = True
+
+    def _animation_event(self, alg: "Alg", duration_ms: int, *, is_undo: bool) -> dict[str, object]:
+        """Build the animation_start event for an already applied move.
 
         Sends physical layer columns (0-based from the negative side of the axis)
         so the client knows which stickers to animate. For example on a 4x4:
@@ -422,10 +575,7 @@ class ClientSession:
         alg_str: str = str(alg)
         alg_type: str = type(alg).__name__
 
-        # Embed post-move state so the client has correct colors at animation end
-        state = extract_cube_state(self._app.cube)
-
-        self._send(json.dumps({
+        return {
             "type": "animation_start",
             "face": face_name,
             "direction": direction,
@@ -434,8 +584,7 @@ class ClientSession:
             "alg": alg_str,
             "alg_type": alg_type,
             "is_undo": is_undo,
-            "state": state,
-        }))
+        }
 
     def send_play_empty(self) -> None:
         """Tell client there are no more moves to play."""
@@ -553,12 +702,12 @@ class ClientSession:
 
     def on_client_connected(self) -> None:
         """Send initial state to newly connected client."""
-        has_redo = bool(self._app.op.redo_queue())
-        has_history = bool(self._app.op.history())
+        has_redo = bool(self._app.op.redo_queue_view())
+        has_history = bool(self._app.op.history_view())
         print(
             f"Session {self.client_info.session_id[:8]} - sending initial state: "
-            f"fsm={self._fsm.state.value} redo={len(self._app.op.redo_queue())} "
-            f"history={len(self._app.op.history())} "
+            f"fsm={self._fsm.state.value} redo={len(self._app.op.redo_queue_view())} "
+            f"history={len(self._app.op.history_view())} "
             f"play_all={self._fsm.allowed_actions(has_redo=has_redo, has_history=has_history).get('play_all')}",
             flush=True,
         )
@@ -620,11 +769,11 @@ class ClientSession:
                 data.get("on_left_to_right", 0.0), data.get("on_left_to_top", 0.0),
             )
 
-        elif msg_type == "play_next_redo":
-            self._handle_play_next(forward=True)
-
-        elif msg_type == "play_next_undo":
-            self._handle_play_next(forward=False)
+        elif msg_type in ("play_next_redo", "play_next_undo"):
+            # Turbo acks carry the batch seq — stale after a stop
+            if self._turbo_pacer.on_ack(data.get("seq"), data.get("hold_ms")):
+                self._handle_play_next(forward=msg_type == "play_next_redo",
+                                       turbo=bool(data.get("turbo", False)))
 
         elif msg_type == "animation_done":
             self._animation_manager.on_client_animation_done()
@@ -647,6 +796,9 @@ class ClientSession:
         elif msg_type == "console_unsubscribe":
             self._handle_console_unsubscribe()
 
+        elif msg_type == "get_metrics":
+            self._handle_get_metrics(data.get("enable"), bool(data.get("reset", False)))
+
         elif msg_type == "resize":
             pass
 
@@ -724,6 +876,30 @@ class ClientSession:
                 setattr(cfg, key, bool(settings[key]))
         self.send_state()
 
+    # -- Admin --
+
+    def _handle_get_metrics(self, enable: object, reset: bool) -> None:
+        """Admin: reply with the process-wide hot-path metrics (cube.utils.metrics).
+
+        ``enable`` (bool, optional) turns collection on/off, ``reset`` clears
+        the registry after the snapshot is taken. The registry is shared by
+        all sessions, so both are honored only with
+        session_config.metrics_control; otherwise the reply is read-only and
+        carries an ``error``.
+        """
+        from cube.utils.metrics import METRICS
+        reply: dict[str, object] = {"type": "metrics"}
+        control = self._app.config.session_config.metrics_control
+        if (enable is not None or reset) and not control:
+            reply["error"] = "Metrics control is disabled on this server"
+            enable, reset = None, False
+        if enable is not None:
+            METRICS.enabled = bool(enable)
+        snapshot = METRICS.snapshot()
+        if reset:
+            METRICS.reset()
+        self._send(json.dumps({**reply, "enabled": METRICS.enabled, **snapshot.to_dict()}))
+
     # -- Console stream handlers --
 
     def _handle_console_subscribe(self) -> None:
@@ -777,10 +953,10 @@ class ClientSession:
                 self._app.scramble(self._default_scramble, None, animation=False, verbose=True)
             # Clear history so scramble moves don't appear in redo queue.
             # Scramble is a starting point, not an undoable operation.
-            op._history.clear()
+            op.clear_history()
             # Scramble done — transition back based on queue state
-            has_redo = bool(op.redo_queue())
-            has_history = bool(op.history())
+            has_redo = bool(op.redo_queue_view())
+            has_history = bool(op.history_view())
             self._fsm.send(FlowEvent.ANIM_DONE, has_redo=has_redo, has_history=has_history)
             self.send_state()
             return
@@ -792,8 +968,8 @@ class ClientSession:
             op = self._app.op
             op.undo(animation=op.animation_enabled)
             if not op.animation_enabled:
-                has_redo = bool(op.redo_queue())
-                has_history = bool(op.history())
+                has_redo = bool(op.redo_queue_view())
+                has_history = bool(op.history_view())
                 self._fsm.send(FlowEvent.ANIM_DONE, has_redo=has_redo, has_history=has_history)
             self.send_state()
             return
@@ -804,8 +980,8 @@ class ClientSession:
             op = self._app.op
             op.redo(animation=op.animation_enabled)
             if not op.animation_enabled:
-                has_redo = bool(op.redo_queue())
-                has_history = bool(op.history())
+                has_redo = bool(op.redo_queue_view())
+                has_history = bool(op.history_view())
                 self._fsm.send(FlowEvent.ANIM_DONE, has_redo=has_redo, has_history=has_history)
             self.send_state()
             return
@@ -822,6 +998,7 @@ class ClientSession:
         if command_name == "reset_session":
             self._fsm.send(FlowEvent.RESET_SESSION)
             self._animation_manager.cancel_animation()
+            self._turbo_pacer.cancel()
             prev_solver = self._app.slv.get_code
             self._app.reset(self._app.config.cube_size)  # Reset to config default
             self._app.switch_to_solver(prev_solver)
@@ -998,13 +1175,13 @@ class ClientSession:
                 alg = alg.inv()
             op = self._app.op
             # Detect manual move while solver redo queue exists → tainted
-            if self._fsm.redo_source == "solver" and op.redo_queue():
+            if self._fsm.redo_source == "solver" and op.redo_queue_view():
                 self._fsm.redo_tainted = True
             if not op.animation_enabled:
                 # Animation OFF: apply instantly, transition FSM immediately
                 op.play(alg, animation=False)
-                has_redo = bool(op.redo_queue())
-                has_history = bool(op.history())
+                has_redo = bool(op.redo_queue_view())
+                has_history = bool(op.history_view())
                 self._fsm.send(FlowEvent.ANIM_DONE, has_redo=has_redo, has_history=has_history)
             else:
                 op.play(alg, animation=True)
@@ -1170,6 +1347,13 @@ class ClientSession:
 
     # -- Solve --
 
+    def _shorten_solution(self, alg: Alg) -> Alg:
+        """Simplify the solver's moves, cancelling commuting ones with config.optimize_solution."""
+        config = self._app.config
+        if not config.optimize_solution:
+            return alg.simplify()
+        return alg.optimize(config.optimize_solution_window, self._app.cube)
+
     def _solve_and_apply_instant(self) -> None:
         """Solve and apply all moves instantly (animation OFF path).
 
@@ -1179,22 +1363,21 @@ class ClientSession:
         app = self._app
         try:
             slv = app.slv
-            solution_alg = slv.solution()
-            solution_alg = solution_alg.simplify()
+            solution_alg = self._shorten_solution(slv.solution())
             steps = list(solution_alg.flatten())
             app.op.enqueue_redo(steps)
             self._fsm.redo_source = "solver"
             self._fsm.redo_tainted = False
             # Apply all moves instantly
-            while app.op.redo_queue():
+            while app.op.redo_queue_view():
                 app.op.redo(animation=False)
         except Exception as e:
             traceback.print_exc()
             app.set_error(f"Solve error: {e}")
         # Clear auto_play and transition to final state
         self._fsm._auto_play = False
-        has_redo = bool(app.op.redo_queue())
-        has_history = bool(app.op.history())
+        has_redo = bool(app.op.redo_queue_view())
+        has_history = bool(app.op.history_view())
         self._fsm.send(FlowEvent.SOLVE_DONE, has_redo=has_redo, has_history=has_history)
         self.send_state()
 
@@ -1203,31 +1386,124 @@ class ClientSession:
 
         The user can then step through with redo/next or fast-play.
         FSM must already be in SOLVING state before this is called.
+
+        With a running event loop the solution is streamed instead, see
+        _stream_solve(). Without one (tests, scripts) it is computed here.
         """
+        loop = self._event_loop._loop
+        if loop is not None:
+            self._start_stream_solve(loop)
+            return
         try:
             app = self._app
             slv = app.slv
-            solution_alg = slv.solution()
-            solution_alg = solution_alg.simplify()
+            solution_alg = self._shorten_solution(slv.solution())
             # Flatten into atomic steps and enqueue as redo
             steps = list(solution_alg.flatten())
             app.op.enqueue_redo(steps)
             self._fsm.redo_source = "solver"
             self._fsm.redo_tainted = False
             # SOLVE_DONE: transitions to READY (or PLAYING if auto_play)
-            has_redo = bool(app.op.redo_queue())
-            has_history = bool(app.op.history())
+            has_redo = bool(app.op.redo_queue_view())
+            has_history = bool(app.op.history_view())
             self._fsm.send(FlowEvent.SOLVE_DONE, has_redo=has_redo, has_history=has_history)
             self.send_state()
         except Exception as e:
             traceback.print_exc()
             self._app.set_error(f"Solve error: {e}")
             # On error, go back to IDLE/READY
-            has_redo = bool(self._app.op.redo_queue())
-            has_history = bool(self._app.op.history())
+            has_redo = bool(self._app.op.redo_queue_view())
+            has_history = bool(self._app.op.history_view())
             self._fsm.send(FlowEvent.SOLVE_DONE, has_redo=has_redo, has_history=has_history)
             self.send_state()
 
+    def _start_stream_solve(self, loop: asyncio.AbstractEventLoop) -> None:
+        from cube.application.SolutionStream import SolutionStream
+
+        op = self._app.op
+        op.clear_redo()
+        self._fsm.redo_source = "solver"
+        self._fsm.redo_tainted = False
+        stream = SolutionStream(self._app)
+        self._solve_stream = stream
+        self._solve_task = loop.create_task(self._stream_solve(stream))
+
+    async def _stream_solve(self, stream: "SolutionStream") -> None:
+        """Append solution moves to the redo queue as the solver produces them.
+
+        The solver runs on a copy of the cube (SolutionStream), so the user
+        can play the first moves while the rest is computed. The first chunk
+        ends SOLVING (SOLVE_DONE); a forward playback that reaches the end of
+        the queue before the solver does waits (_stream_stalled) instead of
+        ending. A new solve, scramble, reset or stop cancels the stream,
+        see _on_flow_transition(). If the solver fails, the moves it queued
+        and that were not played yet are removed from the redo queue.
+        """
+        from cube.domain.algs.Algs import Algs
+
+        op = self._app.op
+        fsm = self._fsm
+        # Redo entries queued by this stream, dropped if the solver fails
+        queued = 0
+        try:
+            async for chunk in stream.chunks():
+                moves = list(self._shorten_solution(Algs.alg(None, *chunk)).flatten())
+                op.extend_redo(moves)
+                queued += len(moves)
+                if fsm.state == FlowState.SOLVING:
+                    fsm.send(FlowEvent.SOLVE_DONE, has_redo=bool(op.redo_queue_view()),
+                             has_history=bool(op.history_view()))
+                self._resume_stalled_play()
+                self.send_state()
+        except Exception as e:
+            traceback.print_exc()
+            self._app.set_error(f"Solve error: {e}")
+            # Don't leave half a failed solution for a later redo. The stream's
+            # entries are redone last; moves already played stay in the history.
+            redo_len = len(op.redo_queue_view())
+            op.truncate_redo(max(0, redo_len - queued))
+
+        self._solve_stream = None
+        self._solve_task = None
+        if fsm.state == FlowState.SOLVING:
+            # No moves at all: solved already, or the solver failed
+            fsm.send(FlowEvent.SOLVE_DONE, has_redo=bool(op.redo_queue_view()),
+                     has_history=bool(op.history_view()))
+        # A waiting playback now reaches the end of the queue
+        self._resume_stalled_play()
+        self.send_state()
+
+    def _resume_stalled_play(self) -> None:
+        turbo = self._stream_stalled
+        if turbo is not None:
+            self._stream_stalled = None
+            self._handle_play_next(forward=True, turbo=turbo)
+
+    def _cancel_stream_solve(self) -> None:
+        stream, task = self._solve_stream, self._solve_task
+        self._solve_stream = None
+        self._solve_task = None
+        self._stream_stalled = None
+        if task is not None:
+            task.cancel()
+        if stream is not None:
+            stream.close()
+
+    # Events that discard or replace the redo queue the stream feeds
+    _STREAM_CANCEL_EVENTS = frozenset({
+        FlowEvent.SCRAMBLE, FlowEvent.SOLVE, FlowEvent.SOLVE_AND_PLAY, FlowEvent.RESET,
+        FlowEvent.RESET_SESSION, FlowEvent.SIZE_CHANGE,
+    })
+
+    def _on_flow_transition(self, new_state: FlowState, old_state: FlowState, event: FlowEvent) -> None:
+        if new_state != FlowState.PLAYING:
+            self._stream_stalled = None
+        if self._solve_stream is None:
+            return
+        if event in self._STREAM_CANCEL_EVENTS or (
+                event == FlowEvent.STOP and old_state == FlowState.SOLVING):
+            self._cancel_stream_solve()
+
     def _start_one_phase_solve(self) -> None:
         """Launch the solver in a background thread with blocking animation.
 
@@ -1263,8 +1539,8 @@ class ClientSession:
         # One-phase solve: moves are in history, not redo queue.
         # Clear auto_play since the solve IS the play.
         self._fsm._auto_play = False
-        has_redo = bool(self._app.op.redo_queue())
-        has_history = bool(self._app.op.history())
+        has_redo = bool(self._app.op.redo_queue_view())
+        has_history = bool(self._app.op.history_view())
         self._fsm.send(FlowEvent.SOLVE_DONE, has_redo=has_redo, has_history=has_history)
         self.send_state()
 
@@ -1272,13 +1548,16 @@ class ClientSession:
         """Run the solver — called from worker thread via asyncio.to_thread()."""
         self._app.slv.solve(animation=True)
 
-    def _handle_play_next(self, forward: bool) -> None:
+    def _handle_play_next(self, forward: bool, turbo: bool = False) -> None:
         """Handle client request for the next move in playback.
 
         Client-initiated pull model: the client requests each move one at a
         time. The play_next message also serves as an ack for the previous
         animation (like animation_done).
 
+        With ``turbo`` (client understands animation_batch), the next moves
+        are sent coalesced, see _play_batch().
+
         A single op.redo() can produce multiple AM-queued moves (when the alg
         flattens into several simple algs). The AM sends one animation_start
         at a time. Only when the AM is fully idle do we pop the next redo item.
@@ -1305,10 +1584,15 @@ class ClientSession:
             return
 
         # AM is idle — pop next redo/undo item from the operator queue
-        has_more: bool = bool(op.redo_queue()) if forward else bool(op.history())
+        has_more: bool = bool(op.redo_queue_view()) if forward else bool(op.history_view())
+        if not has_more and forward and self._solve_stream is not None:
+            # The solver is still producing moves — continue when they arrive
+            self._stream_stalled = turbo
+            self.send_state()
+            return
         if not has_more:
-            has_redo = bool(op.redo_queue())
-            has_history = bool(op.history())
+            has_redo = bool(op.redo_queue_view())
+            has_history = bool(op.history_view())
             fsm.send(FlowEvent.QUEUE_EMPTY, has_redo=has_redo, has_history=has_history)
             self.send_play_empty()
             self.send_state()
@@ -1317,18 +1601,21 @@ class ClientSession:
         # Handle animation disabled: apply all moves instantly
         if not op.animation_enabled:
             if forward:
-                while op.redo_queue():
+                while op.redo_queue_view():
                     op.redo(animation=False)
             else:
-                while op.history():
-                    op.undo(animation=False)
-            has_redo = bool(op.redo_queue())
-            has_history = bool(op.history())
+                op.rollback_to(0)
+            has_redo = bool(op.redo_queue_view())
+            has_history = bool(op.history_view())
             fsm.send(FlowEvent.QUEUE_EMPTY, has_redo=has_redo, has_history=has_history)
             self.send_play_empty()
             self.send_state()
             return
 
+        if turbo and self._app.config.animation_speed_config.turbo_max_batch > 1:
+            self._play_batch(forward)
+            return
+
         # Pop one move with animation — may queue multiple items in AM
         if forward:
             op.redo(animation=True)
@@ -1342,6 +1629,56 @@ class ClientSession:
             return
 
         self.send_state()
+
+    def _play_batch(self, forward: bool) -> None:
+        """Apply the next K redo/undo moves and send them as one message.
+
+        K comes from the TurboPacer (round trip time and speed index). The
+        animation_batch message carries the animation event and sticker
+        delta of every animatable move, and ``ack_index`` — the move at whose
+        start the client requests the next batch, so it arrives before the
+        client runs dry. One send_state() follows for history/counters and
+        the final cube state instead of one per move.
+        """
+        am = self._animation_manager
+        op = self._app.op
+        cfg = self._app.config
+
+        move_ms: float = am.animation_duration_ms
+        if cfg.assist_config.enabled:
+            move_ms += cfg.assist_config.delay_ms
+        k, lead = self._turbo_pacer.plan(move_ms, cfg.animation_speed_config.turbo_max_batch)
+
+        batch = _TurboBatch(sticker_cells(self._app.cube))
+        self._turbo_batch = batch
+        am.set_batch_mode(True)
+        try:
+            while len(batch.moves) < k:
+                if forward:
+                    if not op.redo_queue_view():
+                        break
+                    op.redo(animation=True)
+                else:
+                    if not op.history_view():
+                        break
+                    op.undo(animation=True)
+        finally:
+            am.set_batch_mode(False)
+            self._turbo_batch = None
+
+        if not batch.moves:
+            # Only non-animatable moves were left — reach empty
+            self._handle_play_next(forward, turbo=True)
+            return
+
+        self._send(json.dumps({
+            "type": "animation_batch",
+            "seq": self._turbo_pacer.sent(),
+            "ack_index": self._turbo_pacer.ack_index(len(batch.moves), lead),
+            "size": self._app.cube.size,
+            "moves": batch.moves,
+        }))
+        self.send_state()
     # -- Command injection --
 
     def inject_command(self, command: Command) -> None:
@@ -1355,10 +1692,11 @@ class ClientSession:
         if command is Commands.STOP_ANIMATION:
             if self._fsm.send(FlowEvent.STOP):
                 self._animation_manager.cancel_animation()
+                self._turbo_pacer.cancel()
                 if not self._animation_manager._blocking_mode:
                     # Queue mode: animation cancelled, immediately done.
-                    has_redo = bool(self._app.op.redo_queue())
-                    has_history = bool(self._app.op.history())
+                    has_redo = bool(self._app.op.redo_queue_view())
+                    has_history = bool(self._app.op.history_view())
                     self._fsm.send(FlowEvent.ANIM_DONE, has_redo=has_redo, has_history=has_history)
                     self.send_play_empty()
                 # Blocking mode: solver thread cleanup sends SOLVE_DONE
@@ -1383,7 +1721,7 @@ class ClientSession:
                     self.send_state()
                     return
 
-            history_len_before = len(self._app.op.history())
+            history_len_before = len(self._app.op.history_view())
             ctx = CommandContext.from_window(self)  # type: ignore[arg-type]
 
             command.execute(ctx)
@@ -1395,17 +1733,17 @@ class ClientSession:
                 return
 
             # If history grew, this was a cube move — tell the FSM
-            if len(self._app.op.history()) > history_len_before:
+            if len(self._app.op.history_view()) > history_len_before:
                 self._fsm.send(FlowEvent.FACE_TURN)
 
                 # Animation OFF: AM was bypassed, so manually fire ANIM_DONE
                 if not self._app.op.animation_enabled:
-                    has_redo = bool(self._app.op.redo_queue())
-                    has_history = bool(self._app.op.history())
+                    has_redo = bool(self._app.op.redo_queue_view())
+                    has_history = bool(self._app.op.history_view())
                     self._fsm.send(FlowEvent.ANIM_DONE, has_redo=has_redo, has_history=has_history)
 
                 # Detect manual move while solver redo queue exists → tainted
-                if self._fsm.redo_source == "solver" and self._app.op.redo_queue():
+                if self._fsm.redo_source == "solver" and self._app.op.redo_queue_view():
                     self._fsm.redo_tainted = True
 
             self.send_state()
@@ -1561,7 +1899,7 @@ class ClientSession:
         try:
             apply_cube_colors(self._app.cube, faces)
             self._app.op.clear_redo()
-            self._app.op._history.clear()
+            self._app.op.clear_history()
             self._fsm.redo_source = "undo"
             self._fsm.redo_tainted = False
             self._fsm.send(FlowEvent.RESET)
@@ -1577,6 +1915,7 @@ class ClientSession:
         pass
 
     def cleanup(self) -> None:
+        self._cancel_stream_solve()
         self._handle_console_unsubscribe()
         self._app.vs.logger.remove_stream(self._log_buffer.append)
         self._renderer.cleanup()
@@ -30,9 +30,12 @@ from cube.application.markers._outlined_circle_marker import OutlinedCircleMarke
 from cube.domain.model.Color import color2rgb_int
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from cube.domain.model.Cube import Cube
     from cube.domain.model.Face import Face
     from cube.domain.model.PartEdge import PartEdge
+    from cube.domain.model.PartSlice import PartSlice
 
 
 # Type alias for the face color as float RGB (0.0-1.0)
@@ -125,6 +128,65 @@ def extract_cube_state(cube: "Cube") -> dict[str, Any]:
     }
 
 
+def diff_cube_state(before: dict[str, Any], after: dict[str, Any]) -> dict[str, list[list[Any]]]:
+    """Sticker delta between two extract_cube_state() results of the same size.
+
+    Returns:
+        {"F": [[index, [r,g,b], markers], ...], ...}
+
+    Only faces with changed cells are present. ``index`` is the row-major
+    cell index, ``markers`` is the cell's new marker list (or None) — the
+    client patches its copy of ``before`` to get ``after``.
+    """
+    delta: dict[str, list[list[Any]]] = {}
+    for face_name, after_face in after["faces"].items():
+        before_face = before["faces"][face_name]
+        b_colors, a_colors = before_face["colors"], after_face["colors"]
+        b_markers, a_markers = before_face["markers"], after_face["markers"]
+        cells = [
+            [i, a_colors[i], a_markers[i]]
+            for i in range(len(a_colors))
+            if a_colors[i] != b_colors[i] or a_markers[i] != b_markers[i]
+        ]
+        if cells:
+            delta[face_name] = cells
+    return delta
+
+
+def sticker_cells(cube: "Cube") -> dict["PartEdge", tuple[str, int]]:
+    """Grid cell (face name, row-major index) of every sticker, for :func:`sticker_delta`.
+
+    Stickers are fixed positions of the model, colors move between them, so
+    the result stays valid until the cube is replaced or resized.
+    """
+    n = cube.size
+    return {
+        part_edge: (face.name.name, row * n + col)
+        for face in cube.faces
+        for row, col, part_edge in _face_grid(face, n)
+    }
+
+
+def sticker_delta(
+    cells: dict["PartEdge", tuple[str, int]],
+    part_slices: "Iterable[PartSlice]",
+) -> dict[str, list[list[Any]]]:
+    """Current color and markers of the stickers of ``part_slices``.
+
+    Same format as :func:`diff_cube_state`, but only the given slices are
+    read - after a move, the slices it rotated (``get_animation_objects``)
+    hold every sticker that changed, so this is the move's delta without
+    extracting the whole cube.
+    """
+    delta: dict[str, list[list[Any]]] = {}
+    for part_slice in part_slices:
+        for part_edge in part_slice.edges:
+            face_name, i = cells[part_edge]
+            rgb = list(color2rgb_int(part_edge.color))
+            delta.setdefault(face_name, []).append([i, rgb, _cell_markers(part_edge, rgb)])
+    return delta
+
+
 def _extract_face_data(face: "Face", n: int) -> dict[str, list[Any]]:
     """Extract NxN grid of RGB colors and markers for one face.
 
@@ -192,27 +254,10 @@ def _extract_face_data(face: "Face", n: int) -> dict[str, list[Any]]:
     flat_edges: list[PartEdge | None] = [item for row in edge_grid for item in row]
 
     # Build markers list from PartEdge references
-    flat_markers: list[list[dict[str, Any]] | None] = []
-    for i, part_edge in enumerate(flat_edges):
-        if part_edge is None:
-            flat_markers.append(None)
-            continue
-        marker_items = _get_markers_with_moveable_flag(part_edge)
-        if not marker_items:
-            flat_markers.append(None)
-            continue
-        # Resolve face color for complementary color lookup
-        face_color_float = (
-            flat_colors[i][0] / 255.0,
-            flat_colors[i][1] / 255.0,
-            flat_colors[i][2] / 255.0,
-        )
-        serialized = []
-        for m, moveable in marker_items:
-            d = _serialize_marker(m, face_color_float)
-            d["moveable"] = moveable
-            serialized.append(d)
-        flat_markers.append(serialized)
+    flat_markers: list[list[dict[str, Any]] | None] = [
+        None if part_edge is None else _cell_markers(part_edge, flat_colors[i])
+        for i, part_edge in enumerate(flat_edges)
+    ]
 
     return {
         "colors": flat_colors,
@@ -220,6 +265,21 @@ def _extract_face_data(face: "Face", n: int) -> dict[str, list[Any]]:
     }
 
 
+def _cell_markers(part_edge: "PartEdge", rgb: list[int]) -> list[dict[str, Any]] | None:
+    """Serialized markers of one sticker, None if it has none."""
+    marker_items = _get_markers_with_moveable_flag(part_edge)
+    if not marker_items:
+        return None
+    # Resolve face color for complementary color lookup
+    face_color_float = (rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0)
+    serialized = []
+    for m, moveable in marker_items:
+        d = _serialize_marker(m, face_color_float)
+        d["moveable"] = moveable
+        serialized.append(d)
+    return serialized
+
+
 def _set_cell(
     color_grid: list[list[list[int]]],
     edge_grid: list[list[PartEdge | None]],
@@ -373,7 +433,6 @@ def apply_cube_colors(cube: "Cube", faces: dict[str, list[str]]) -> None:
         ValueError: If a color name doesn't match any known Color.
     """
     from cube.domain.model.Color import Color
-    from cube.domain.model import Corner, Edge
 
     # Build name → Color lookup (lowercase)
     name_to_color: dict[str, Color] = {c.name.lower(): c for c in Color}
@@ -387,59 +446,69 @@ def apply_cube_colors(cube: "Cube", faces: dict[str, list[str]]) -> None:
 
         name_list = faces[face_name]
 
-        def _set_edge_color(part_edge: "PartEdge", row: int, col: int) -> None:
+        for row, col, part_edge in _face_grid(face, n):
             idx = row * n + col
-            color_name = name_list[idx].lower()
-            color = name_to_color.get(color_name)
+            color = name_to_color.get(name_list[idx].lower())
             if color is None:
                 raise ValueError(f"Unknown color '{name_list[idx]}' at {face_name}[{row},{col}]")
             part_edge._color = color
 
-        if n >= 2:
-            # Corners
-            for row, col, corner_attr in [
-                (0, 0, "corner_bottom_left"),
-                (0, n - 1, "corner_bottom_right"),
-                (n - 1, 0, "corner_top_left"),
-                (n - 1, n - 1, "corner_top_right"),
-            ]:
-                corner = getattr(face, corner_attr)
-                assert isinstance(corner, Corner)
-                edge_on_face = corner.slice.get_face_edge(face)
-                _set_edge_color(edge_on_face, row, col)
-
-        if n >= 3:
-            # Edges
-            edge_count = n - 2
-            for edge_attr, row, col_start, along_row in [
-                ("edge_bottom", 0, 1, True),
-                ("edge_top", n - 1, 1, True),
-                ("edge_left", 1, 0, False),
-                ("edge_right", 1, n - 1, False),
-            ]:
-                edge = getattr(face, edge_attr)
-                assert isinstance(edge, Edge)
-                for i in range(edge_count):
-                    edge_wing = edge.get_slice_by_ltr_index(face, i)
-                    edge_on_face = edge_wing.get_face_edge(face)
-                    if along_row:
-                        _set_edge_color(edge_on_face, row, col_start + i)
-                    else:
-                        _set_edge_color(edge_on_face, row + i, col_start)
-
-            # Centers
-            center = face.center
-            if n < 4:
-                center_slice = center.get_slice((0, 0))
-                edge_on_face = center_slice.get_face_edge(face)
-                _set_edge_color(edge_on_face, 1, 1)
-            else:
-                center_n = center.n_slices
-                for cy in range(center_n):
-                    for cx in range(center_n):
-                        center_slice = center.get_slice((cy, cx))
-                        edge_on_face = center_slice.get_face_edge(face)
-                        _set_edge_color(edge_on_face, 1 + cy, 1 + cx)
-
     # Invalidate all caches — colors changed outside normal rotation path
-    cube.reset_after_faces_changes()
+    cube.reset_after_colors_changes()
+
+
+def cube_color_names(cube: "Cube") -> dict[str, list[str]]:
+    """Inverse of :func:`apply_cube_colors`: lowercase color names per face."""
+    n = cube.size
+    faces: dict[str, list[str]] = {}
+    for face in cube.faces:
+        names = [""] * (n * n)
+        for row, col, part_edge in _face_grid(face, n):
+            names[row * n + col] = part_edge.color.name.lower()
+        faces[face.name.name] = names
+    return faces
+
+
+def _face_grid(face: "Face", n: int) -> "Iterator[tuple[int, int, PartEdge]]":
+    """(row, col, sticker) of every cell of a face, grid layout as in the module docstring."""
+    from cube.domain.model import Corner, Edge
+
+    if n >= 2:
+        # Corners
+        for row, col, corner_attr in [
+            (0, 0, "corner_bottom_left"),
+            (0, n - 1, "corner_bottom_right"),
+            (n - 1, 0, "corner_top_left"),
+            (n - 1, n - 1, "corner_top_right"),
+        ]:
+            corner = getattr(face, corner_attr)
+            assert isinstance(corner, Corner)
+            yield row, col, corner.slice.get_face_edge(face)
+
+    if n >= 3:
+        # Edges
+        edge_count = n - 2
+        for edge_attr, row, col_start, along_row in [
+            ("edge_bottom", 0, 1, True),
+            ("edge_top", n - 1, 1, True),
+            ("edge_left", 1, 0, False),
+            ("edge_right", 1, n - 1, False),
+        ]:
+            edge = getattr(face, edge_attr)
+            assert isinstance(edge, Edge)
+            for i in range(edge_count):
+                edge_on_face = edge.get_slice_by_ltr_index(face, i).get_face_edge(face)
+                if along_row:
+                    yield row, col_start + i, edge_on_face
+                else:
+                    yield row + i, col_start, edge_on_face
+
+        # Centers
+        center = face.center
+        if n < 4:
+            yield 1, 1, center.get_slice((0, 0)).get_face_edge(face)
+        else:
+            center_n = center.n_slices
+            for cy in range(center_n):
+                for cx in range(center_n):
+                    yield 1 + cy, 1 + cx, center.get_slice((cy, cx)).get_face_edge(face)
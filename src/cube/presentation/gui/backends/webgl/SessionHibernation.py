@@ -0,0 +1,116 @@
+"""Hibernation of dormant webgl sessions.
+
+A disconnected ClientSession waits up to ``keepalive_timeout`` for its client
+to come back. Kept live, it holds a whole AbstractApp (cube object graph,
+solver, operator, log buffer) - with many mobile clients dropping and
+reconnecting, dormant apps dominate memory.
+
+Hibernating keeps only what is needed to rebuild the session:
+
+    cube size + facelets    one byte per sticker (Cube.get_facelets)
+    history + redo queue    AlgHistory snapshots (4 bytes per move)
+    solver, toggles, flow   a few fields
+
+Usage (SessionManager)::
+
+    record = session.hibernate()
+    session.cleanup()                   # the live app can now be freed
+    evicted = store.put(record)         # over budget -> oldest records dropped
+    ...
+    record = store.pop(session_id)      # client is back
+    session = ClientSession.from_hibernated(record, ws, event_loop)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cube.application.commands.AlgHistory import AlgHistorySnapshot
+    from cube.domain.solver.SolverName import SolverName
+    from cube.presentation.gui.backends.webgl.ClientSession import ClientInfo
+
+# Rough per-record cost of the fields that are not sized below
+_RECORD_OVERHEAD = 1024
+# Rough cost of one side table entry (HeadingAlg, scramble ...)
+_SIDE_ENTRY_BYTES = 256
+
+
+@dataclass(frozen=True)
+class HibernatedSession:
+    """Compact state of a dormant session, see module docstring."""
+    client_info: ClientInfo
+    cube_size: int
+    facelets: bytes
+    queues: tuple[AlgHistorySnapshot, AlgHistorySnapshot]  # history, redo
+    solver: SolverName
+    animation_enabled: bool
+    speed_index: float
+    slice_start: int
+    slice_stop: int
+    config: dict[str, bool]
+    default_scramble: int | None
+    redo_source: str
+    redo_tainted: bool
+
+    @property
+    def session_id(self) -> str:
+        return self.client_info.session_id
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this record."""
+        n = _RECORD_OVERHEAD + len(self.facelets)
+        for codes, side, _ in self.queues:
+            n += codes.itemsize * len(codes) + _SIDE_ENTRY_BYTES * len(side)
+        return n
+
+
+class HibernationStore:
+    """Hibernated sessions by id, within a global byte budget.
+
+    When the budget is exceeded, the least recently hibernated records are
+    evicted - those clients get a fresh session if they come back.
+    """
+
+    __slots__ = ["_budget", "_records", "_nbytes"]
+
+    def __init__(self, budget: int) -> None:
+        self._budget = budget
+        self._records: OrderedDict[str, HibernatedSession] = OrderedDict()
+        self._nbytes = 0
+
+    def put(self, record: HibernatedSession) -> list[str]:
+        """Store a record, return the ids evicted to stay within the budget.
+
+        The new record itself is evicted if it alone exceeds the budget.
+        """
+        self.pop(record.session_id)
+        self._records[record.session_id] = record
+        self._nbytes += record.nbytes
+
+        evicted: list[str] = []
+        while self._nbytes > self._budget and self._records:
+            sid, old = self._records.popitem(last=False)
+            self._nbytes -= old.nbytes
+            evicted.append(sid)
+        return evicted
+
+    def pop(self, session_id: str) -> HibernatedSession | None:
+        record = self._records.pop(session_id, None)
+        if record is not None:
+            self._nbytes -= record.nbytes
+        return record
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by all records."""
+        return self._nbytes
@@ -6,6 +6,11 @@ lookup) and GeoIP resolution for connected clients.
 Supports dormant sessions: when a WebSocket disconnects, the session is kept
 alive for a configurable timeout (session_config.keepalive_timeout). If the
 client reconnects with the same session_id, the old session is restored.
+
+Dormant sessions are hibernated (session_config.hibernate_dormant): only a
+compact record is kept, within a global memory budget
+(session_config.dormant_memory_budget, LRU eviction), and the session is
+rebuilt on reconnect. See SessionHibernation.
 """
 
 from __future__ import annotations
@@ -15,6 +20,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 from cube.presentation.gui.backends.webgl.ClientSession import ClientInfo, ClientSession
+from cube.presentation.gui.backends.webgl.SessionHibernation import HibernationStore
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -31,11 +37,15 @@ class SessionManager:
     def __init__(self, event_loop: "WebglEventLoop", config: "ConfigProtocol",
                  gui_test_mode: bool = False) -> None:
         self._event_loop = event_loop
+        # Server settings, each session gets its own copy
+        self._config = config
         self._gui_test_mode = gui_test_mode
         self._sessions: dict[str, ClientSession] = {}
         self._ws_to_session: dict["WebSocketResponse", ClientSession] = {}
-        # Dormant sessions waiting for reconnect
+        # Dormant sessions waiting for reconnect: live (solve in progress) or hibernated
         self._dormant_sessions: dict[str, ClientSession] = {}
+        self._hibernate: bool = config.session_config.hibernate_dormant
+        self._hibernated: HibernationStore = HibernationStore(config.session_config.dormant_memory_budget)
         # Expiry callbacks per dormant session (so we can cancel on restore)
         self._dormant_timers: dict[str, Callable[[float], None]] = {}
         # How long to keep disconnected sessions alive (seconds)
@@ -49,6 +59,15 @@ class SessionManager:
         session_id: str | None = None,
     ) -> ClientSession:
         """Create a new session, or restore a dormant one if session_id matches."""
+        return await self.open_session(ws, self._get_client_ip(request), session_id)
+
+    async def open_session(
+        self, ws: "WebSocketResponse", ip: str, session_id: str | None = None,
+    ) -> ClientSession:
+        """Like create_session, for a client whose IP is already known.
+
+        Used by shard workers (SessionSharding), which see no HTTP request.
+        """
         # Try to restore a dormant session first
         if session_id:
             restored = self._try_restore_session(session_id, ws)
@@ -56,7 +75,6 @@ class SessionManager:
                 return restored
 
         new_id = uuid.uuid4().hex[:12]
-        ip = self._get_client_ip(request)
 
         city, country = await self._geoip_lookup(ip)
 
@@ -72,6 +90,7 @@ class SessionManager:
             event_loop=self._event_loop,
             client_info=client_info,
             gui_test_mode=self._gui_test_mode,
+            config=self._config,
         )
 
         self._sessions[new_id] = session
@@ -97,6 +116,9 @@ class SessionManager:
         The session is kept alive for ``_keepalive_timeout`` seconds. If the
         client reconnects with the same session_id within that window, the
         session is restored. Otherwise it is expired and cleaned up.
+
+        Unless a one-phase solve is running, the session is hibernated: its
+        app is freed and only a compact record is kept.
         """
         session = self._ws_to_session.pop(ws, None)
         if session is None:
@@ -109,7 +131,14 @@ class SessionManager:
         timeout = self._keepalive_timeout
         if timeout > 0:
             # Move to dormant instead of destroying
-            self._dormant_sessions[sid] = session
+            if self._hibernate and session.can_hibernate:
+                record = session.hibernate()
+                session.cleanup()
+                for evicted in self._hibernated.put(record):
+                    self._drop_dormant_timer(evicted)
+                    print(f"Session evicted (dormant memory budget): {evicted}", flush=True)
+            else:
+                self._dormant_sessions[sid] = session
 
             def _expire_cb(_dt: float) -> None:
                 self._expire_session(sid)
@@ -119,7 +148,8 @@ class SessionManager:
 
             print(
                 f"Session dormant: {sid} ({info.ip}, {info.city}, {info.country}), "
-                f"will expire in {timeout}s. Active: {len(self._sessions)}",
+                f"will expire in {timeout}s. Active: {len(self._sessions)}, "
+                f"hibernated: {len(self._hibernated)} ({self._hibernated.nbytes // 1024} KB)",
                 flush=True,
             )
         else:
@@ -136,29 +166,45 @@ class SessionManager:
     def _expire_session(self, session_id: str) -> None:
         """Expire and clean up a dormant session whose timeout has elapsed."""
         session = self._dormant_sessions.pop(session_id, None)
+        record = self._hibernated.pop(session_id)
         self._dormant_timers.pop(session_id, None)
         if session:
             session.cleanup()
+        if session or record:
             print(f"Session expired: {session_id}", flush=True)
 
+    def _drop_dormant_timer(self, session_id: str) -> None:
+        timer_cb = self._dormant_timers.pop(session_id, None)
+        if timer_cb:
+            self._event_loop.unschedule(timer_cb)
+
     def _try_restore_session(
         self, session_id: str, ws: "WebSocketResponse"
     ) -> ClientSession | None:
         """Try to restore a dormant session.
 
-        Returns the restored session, or None if the session_id is not found.
+        Returns the restored session, or None if the session_id is not found
+        (never seen, expired or evicted).
         """
         session = self._dormant_sessions.pop(session_id, None)
-        if session is None:
+        record = self._hibernated.pop(session_id) if session is None else None
+        if session is None and record is None:
             return None
 
         # Cancel the expiry timer
-        timer_cb = self._dormant_timers.pop(session_id, None)
-        if timer_cb:
-            self._event_loop.unschedule(timer_cb)
+        self._drop_dormant_timer(session_id)
 
-        # Reattach the new WebSocket
-        session.reattach(ws)
+        if session is not None:
+            # Reattach the new WebSocket
+            session.reattach(ws)
+        else:
+            assert record is not None
+            # Rebuild the app from the hibernated record
+            session = ClientSession.from_hibernated(
+                record, ws, self._event_loop, gui_test_mode=self._gui_test_mode,
+                config=self._config,
+            )
+            session.on_client_connected()
 
         # Add back to active sessions
         self._sessions[session_id] = session
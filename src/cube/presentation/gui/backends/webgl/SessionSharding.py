@@ -0,0 +1,557 @@
+"""Multi-process session sharding for the webgl backend.
+
+With session_config.workers = N > 0, the server process no longer hosts any
+ClientSession. It owns the aiohttp endpoints only (the *front*) and relays
+every websocket message, over a Unix socket, to one of N worker processes.
+Each worker runs its own WebglEventLoop + SessionManager, so cube models,
+solvers and JSON encoding of different sessions run on different cores.
+
+    browser --ws--> ShardFront --unix socket--> worker 0: SessionManager
+    browser --ws-->     |      --unix socket--> worker 1: SessionManager
+                    ShardRouter (sticky session -> worker)
+
+Routing (ShardRouter):
+    - a new connection goes to the healthy worker with the fewest connections
+    - a session is owned by the worker that created it; a reconnect with the
+      same session_id goes back to that worker, which restores the dormant
+      (or hibernated) session as in single-process mode
+    - when a worker dies its sessions are forgotten; its clients reconnect
+      and get a fresh session on another worker
+
+Health: the front pings every worker each worker_health_interval seconds.
+A worker whose process died, whose socket closed, or that has not answered
+for worker_health_timeout seconds is killed and restarted. So is a worker
+that has not said HELLO within start_timeout seconds of being spawned.
+
+Workers get a copy of the front's config when spawned, so their sessions
+run with the settings the server was started with.
+
+Wire format (both directions), see _write_frame/_read_frame::
+
+    kind: u8 | conn_id: u32 | length: u32 | payload: utf-8 bytes
+
+conn_id identifies one websocket connection, assigned by the front. The
+session_id is only known once the worker answers OPENED.
+
+Client count messages are per worker, each worker only sees its sessions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import multiprocessing
+import shutil
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cube.presentation.gui.backends.webgl.SessionManager import SessionManager
+from cube.presentation.gui.backends.webgl.WebglEventLoop import WebglEventLoop
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from aiohttp.web import BaseRequest, WebSocketResponse
+
+    from cube.utils.config_protocol import ConfigProtocol
+
+_HEADER = struct.Struct("!BII")
+# Max wait for a worker to start (imports) and for it to open a session
+_START_TIMEOUT = 60.0
+_OPEN_TIMEOUT = 30.0
+
+
+class _Frame(IntEnum):
+    HELLO = 1  # worker -> front, conn_id = worker index
+    OPEN = 2  # front -> worker, payload = {"ip", "session_id"}
+    OPENED = 3  # worker -> front, payload = session_id
+    MSG = 4  # both ways, payload = client JSON text
+    CLOSE = 5  # front -> worker: client gone; worker -> front: close the websocket
+    PING = 6  # front -> worker, conn_id = sequence number
+    PONG = 7  # worker -> front, conn_id = sequence number, payload = session count
+
+
+def _write_frame(writer: asyncio.StreamWriter, kind: _Frame, conn_id: int, payload: str = "") -> None:
+    data = payload.encode()
+    writer.write(_HEADER.pack(kind, conn_id, len(data)) + data)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> tuple[_Frame, int, str]:
+    kind, conn_id, n = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    payload = (await reader.readexactly(n)).decode() if n else ""
+    return _Frame(kind), conn_id, payload
+
+
+class ShardRouter:
+    """Sticky session -> worker routing.
+
+    Pure bookkeeping, no I/O: the front tells it which connections are open
+    on which worker, which worker owns which session, and which workers are
+    up.
+    """
+
+    __slots__ = ["_connections", "_healthy", "_owners", "_max_owners"]
+
+    def __init__(self, workers: int, max_owners: int = 100_000) -> None:
+        self._connections: list[int] = [0] * workers
+        self._healthy: list[bool] = [False] * workers
+        # session_id -> worker, oldest first. Kept after disconnect so a
+        # reconnect finds its dormant session; bounded by max_owners.
+        self._owners: OrderedDict[str, int] = OrderedDict()
+        self._max_owners = max_owners
+
+    def route(self, session_id: str | None) -> int | None:
+        """Worker for a new connection, None if no worker is up."""
+        if session_id is not None:
+            owner = self._owners.get(session_id)
+            if owner is not None and self._healthy[owner]:
+                return owner
+        candidates = [i for i, up in enumerate(self._healthy) if up]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda i: self._connections[i])
+
+    def owner(self, session_id: str) -> int | None:
+        return self._owners.get(session_id)
+
+    def assign(self, session_id: str, worker: int) -> None:
+        """Record that ``worker`` holds ``session_id`` (created or restored)."""
+        self._owners.pop(session_id, None)
+        self._owners[session_id] = worker
+        while len(self._owners) > self._max_owners:
+            self._owners.popitem(last=False)
+
+    def attach(self, worker: int) -> None:
+        self._connections[worker] += 1
+
+    def detach(self, worker: int) -> None:
+        self._connections[worker] -= 1
+
+    def connections(self, worker: int) -> int:
+        return self._connections[worker]
+
+    def worker_up(self, worker: int) -> None:
+        self._healthy[worker] = True
+
+    def worker_down(self, worker: int) -> None:
+        """Forget everything about ``worker``: its sessions are gone."""
+        self._healthy[worker] = False
+        self._connections[worker] = 0
+        for sid in [sid for sid, w in self._owners.items() if w == worker]:
+            del self._owners[sid]
+
+    def is_up(self, worker: int) -> bool:
+        return self._healthy[worker]
+
+
+@dataclass
+class _Worker:
+    index: int
+    process: "BaseProcess | None" = None
+    writer: asyncio.StreamWriter | None = None
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    spawned_at: float = 0.0
+    last_pong: float = 0.0
+    ping_seq: int = 0
+    session_count: int = 0
+    restarts: int = 0
+
+
+@dataclass
+class _Connection:
+    ws: Any  # WebSocketResponse, or anything with send_str/close coroutines
+    worker: int
+    opened: asyncio.Future[str]
+
+
+class ShardFront:
+    """Front process side: spawns workers and relays websocket traffic.
+
+    Wired by WebglAppWindow when session_config.workers > 0; WebglEventLoop
+    calls start/stop around its main loop and hands each websocket to serve().
+    """
+
+    def __init__(
+        self, workers: int, health_interval: float, health_timeout: float,
+        gui_test_mode: bool = False, config: "ConfigProtocol | None" = None,
+        start_timeout: float = _START_TIMEOUT,
+    ) -> None:
+        assert workers > 0
+        if config is None:
+            from cube.application.config_impl import AppConfig
+            config = AppConfig()
+        self._workers = [_Worker(i) for i in range(workers)]
+        self._router = ShardRouter(workers)
+        self._health_interval = health_interval
+        self._health_timeout = health_timeout
+        self._start_timeout = start_timeout
+        self._gui_test_mode = gui_test_mode
+        self._config = config
+        self._connections: dict[int, _Connection] = {}
+        self._conn_ids = itertools.count(1)
+        self._socket_dir: Path | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._health_task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    @property
+    def router(self) -> ShardRouter:
+        return self._router
+
+    def worker_pid(self, worker: int) -> int | None:
+        process = self._workers[worker].process
+        return process.pid if process is not None else None
+
+    # -- Lifecycle --
+
+    async def start(self) -> None:
+        """Spawn all workers and wait until they are connected."""
+        self._socket_dir = Path(tempfile.mkdtemp(prefix="cube-webgl-"))
+        self._server = await asyncio.start_unix_server(
+            self._on_worker_connected, path=str(self._socket_path),
+        )
+        for w in self._workers:
+            self._spawn(w)
+        await asyncio.wait_for(
+            asyncio.gather(*(w.ready.wait() for w in self._workers)), self._start_timeout,
+        )
+        self._health_task = asyncio.create_task(self._health_loop())
+        print(f"Session workers started: {len(self._workers)}", flush=True)
+
+    async def stop(self) -> None:
+        """Close all connections and stop the workers."""
+        self._stopping = True
+        if self._health_task:
+            self._health_task.cancel()
+        for conn_id in list(self._connections):
+            await self._close_client(conn_id)
+        for w in self._workers:
+            if w.writer is not None:
+                w.writer.close()  # worker exits on EOF
+        for w in self._workers:
+            if w.process is not None:
+                await asyncio.to_thread(w.process.join, 5.0)
+                if w.process.is_alive():
+                    w.process.kill()
+        if self._server is not None:
+            self._server.close()
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+
+    @property
+    def _socket_path(self) -> Path:
+        assert self._socket_dir is not None
+        return self._socket_dir / "workers.sock"
+
+    def _spawn(self, w: _Worker) -> None:
+        # spawn, not fork: the front runs an asyncio loop and aiohttp server
+        ctx = multiprocessing.get_context("spawn")
+        w.ready = asyncio.Event()
+        w.writer = None
+        w.spawned_at = time.monotonic()
+        w.process = ctx.Process(
+            target=run_worker,
+            args=(str(self._socket_path), w.index, self._gui_test_mode, self._config.copy()),
+            name=f"cube-webgl-worker-{w.index}", daemon=True,
+        )
+        w.process.start()
+
+    # -- Client side --
+
+    async def serve(self, ws: "WebSocketResponse", request: "BaseRequest") -> None:
+        """Relay one prepared websocket until it closes."""
+        from aiohttp import web
+
+        conn_id: int | None = None
+        try:
+            async for msg in ws:
+                if msg.type == web.WSMsgType.TEXT:
+                    if conn_id is None:
+                        # First message is always { type: 'connected', session_id? }
+                        data = json.loads(msg.data)
+                        old_sid = data.get("session_id") if isinstance(data, dict) else None
+                        conn_id = await self.connect(ws, SessionManager._get_client_ip(request), old_sid)
+                        if conn_id is None:
+                            break
+                    else:
+                        self.forward(conn_id, msg.data)
+                elif msg.type == web.WSMsgType.ERROR:
+                    print(f"WebSocket error: {ws.exception()}", flush=True)
+        finally:
+            if conn_id is not None:
+                self.disconnect(conn_id)
+
+    async def connect(self, ws: Any, ip: str, session_id: str | None) -> int | None:
+        """Open a session for ``ws`` on its worker, return the connection id.
+
+        Returns None (and closes ``ws``) if no worker could take it.
+        """
+        worker = self._router.route(session_id)
+        if worker is None:
+            print("No session worker available, closing connection", flush=True)
+            await ws.close()
+            return None
+
+        conn_id = next(self._conn_ids)
+        opened: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._connections[conn_id] = _Connection(ws, worker, opened)
+        self._router.attach(worker)
+        self._send(worker, _Frame.OPEN, conn_id, json.dumps({"ip": ip, "session_id": session_id}))
+
+        try:
+            sid = await asyncio.wait_for(opened, _OPEN_TIMEOUT)
+        except (asyncio.TimeoutError, ConnectionError):
+            await self._close_client(conn_id)
+            return None
+
+        self._router.assign(sid, worker)
+        return conn_id
+
+    def forward(self, conn_id: int, message: str) -> None:
+        """Relay a client message to the connection's worker."""
+        conn = self._connections.get(conn_id)
+        if conn is not None:
+            self._send(conn.worker, _Frame.MSG, conn_id, message)
+
+    def disconnect(self, conn_id: int) -> None:
+        """The client went away; the worker makes its session dormant."""
+        conn = self._connections.pop(conn_id, None)
+        if conn is not None:
+            self._router.detach(conn.worker)
+            self._send(conn.worker, _Frame.CLOSE, conn_id)
+
+    async def _close_client(self, conn_id: int) -> None:
+        conn = self._connections.pop(conn_id, None)
+        if conn is None:
+            return
+        self._router.detach(conn.worker)
+        if not conn.opened.done():
+            conn.opened.set_exception(ConnectionError("session worker lost"))
+        try:
+            await conn.ws.close()
+        except (ConnectionError, OSError):
+            pass
+
+    def status_line(self) -> str:
+        parts = [
+            f"w{w.index}:{'up' if self._router.is_up(w.index) else 'down'}"
+            f"/{self._router.connections(w.index)}c/{w.session_count}s"
+            for w in self._workers
+        ]
+        return "Session workers: " + " ".join(parts)
+
+    # -- Worker side --
+
+    def _send(self, worker: int, kind: _Frame, conn_id: int, payload: str = "") -> None:
+        writer = self._workers[worker].writer
+        if writer is not None and not writer.is_closing():
+            _write_frame(writer, kind, conn_id, payload)
+
+    async def _on_worker_connected(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            kind, index, _ = await _read_frame(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        assert kind is _Frame.HELLO
+        w = self._workers[index]
+        w.writer = writer
+        w.last_pong = time.monotonic()
+        self._router.worker_up(index)
+        w.ready.set()
+
+        try:
+            while True:
+                kind, conn_id, payload = await _read_frame(reader)
+                self._on_worker_frame(w, kind, conn_id, payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        if w.writer is writer and not self._stopping:
+            await self._worker_lost(w, "connection closed")
+
+    def _on_worker_frame(self, w: _Worker, kind: _Frame, conn_id: int, payload: str) -> None:
+        if kind is _Frame.PONG:
+            w.last_pong = time.monotonic()
+            w.session_count = int(payload)
+            return
+
+        conn = self._connections.get(conn_id)
+        if conn is None:
+            return  # client already gone
+        if kind is _Frame.MSG:
+            asyncio.create_task(WebglEventLoop._safe_send(conn.ws, payload))
+        elif kind is _Frame.OPENED:
+            if not conn.opened.done():
+                conn.opened.set_result(payload)
+        elif kind is _Frame.CLOSE:
+            asyncio.create_task(self._close_client(conn_id))
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            await self._check_workers(time.monotonic())
+
+    async def _check_workers(self, now: float) -> None:
+        """One health round: restart dead, hung and never started workers, ping the others."""
+        for w in self._workers:
+            if not self._router.is_up(w.index):
+                if w.process is not None and not w.process.is_alive():
+                    # A restarted worker died before saying hello
+                    w.restarts += 1
+                    self._spawn(w)
+                elif now - w.spawned_at > self._start_timeout:
+                    print(f"Session worker {w.index} did not start in "
+                          f"{now - w.spawned_at:.1f}s, restarting", flush=True)
+                    if w.process is not None:
+                        w.process.kill()
+                    w.restarts += 1
+                    self._spawn(w)
+                continue
+            if w.process is None or not w.process.is_alive():
+                await self._worker_lost(w, "process exited")
+            elif now - w.last_pong > self._health_timeout:
+                await self._worker_lost(w, f"no answer for {now - w.last_pong:.1f}s")
+            else:
+                w.ping_seq += 1
+                self._send(w.index, _Frame.PING, w.ping_seq)
+
+    async def _worker_lost(self, w: _Worker, reason: str) -> None:
+        """Drop a dead or hung worker and its clients, then restart it."""
+        if not self._router.is_up(w.index):
+            return
+        self._router.worker_down(w.index)
+        print(f"Session worker {w.index} lost ({reason})", flush=True)
+
+        if w.writer is not None:
+            w.writer.close()
+            w.writer = None
+        if w.process is not None and w.process.is_alive():
+            w.process.kill()
+        # Clients reconnect and are routed to a live worker
+        for conn_id in [c for c, conn in self._connections.items() if conn.worker == w.index]:
+            await self._close_client(conn_id)
+
+        if not self._stopping:
+            w.restarts += 1
+            w.session_count = 0
+            self._spawn(w)
+
+
+# -- Worker process --
+
+class _RelaySocket:
+    """Stand-in for the client's WebSocketResponse inside a worker.
+
+    Sessions send through it exactly as through a real websocket.
+    """
+
+    __slots__ = ["_loop", "_conn_id", "closed"]
+
+    def __init__(self, loop: "_WorkerEventLoop", conn_id: int) -> None:
+        self._loop = loop
+        self._conn_id = conn_id
+        self.closed = False
+
+    async def send_str(self, message: str) -> None:
+        if not self.closed:
+            self._loop.relay(_Frame.MSG, self._conn_id, message)
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._loop.relay(_Frame.CLOSE, self._conn_id)
+
+
+class _WorkerEventLoop(WebglEventLoop):
+    """WebglEventLoop fed by the front's Unix socket instead of aiohttp."""
+
+    def __init__(self, socket_path: str, index: int, gui_test_mode: bool) -> None:
+        super().__init__(gui_test_mode=gui_test_mode)
+        self._socket_path = socket_path
+        self._index = index
+        self._writer: asyncio.StreamWriter | None = None
+        self._sockets: dict[int, _RelaySocket] = {}
+
+    def relay(self, kind: _Frame, conn_id: int, payload: str = "") -> None:
+        if self._writer is not None and not self._writer.is_closing():
+            _write_frame(self._writer, kind, conn_id, payload)
+
+    async def _async_run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        reader, self._writer = await asyncio.open_unix_connection(self._socket_path)
+        self.relay(_Frame.HELLO, self._index)
+        reader_task = asyncio.create_task(self._read_front(reader))
+        try:
+            await self._run_ticks()
+        finally:
+            reader_task.cancel()
+            self._writer.close()
+
+    async def _read_front(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                kind, conn_id, payload = await _read_frame(reader)
+                try:
+                    self._on_frame(kind, conn_id, payload)
+                except Exception as e:
+                    # One bad client message must not stop the reader of all sessions
+                    print(f"Session worker {self._index}: bad {kind.name} frame "
+                          f"from connection {conn_id}: {e!r}", flush=True)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        # The front is gone, nobody can reach our sessions
+        self._has_exit = True
+
+    def _on_frame(self, kind: _Frame, conn_id: int, payload: str) -> None:
+        manager = self._session_manager
+        assert manager is not None
+
+        if kind is _Frame.PING:
+            self.relay(_Frame.PONG, conn_id, str(manager.session_count))
+        elif kind is _Frame.OPEN:
+            # Not awaited here: GeoIP lookup must not stall other sessions
+            asyncio.create_task(self._open(conn_id, json.loads(payload)))
+        elif kind is _Frame.MSG:
+            sock = self._sockets.get(conn_id)
+            session = manager.get_session(sock) if sock is not None else None  # type: ignore[arg-type]
+            if session is not None:
+                session.handle_message(json.loads(payload))
+        elif kind is _Frame.CLOSE:
+            sock = self._sockets.pop(conn_id, None)
+            if sock is not None:
+                sock.closed = True
+                manager.remove_session(sock)  # type: ignore[arg-type]
+
+    async def _open(self, conn_id: int, request: dict[str, Any]) -> None:
+        manager = self._session_manager
+        assert manager is not None
+        sock = _RelaySocket(self, conn_id)
+        self._sockets[conn_id] = sock
+        session = await manager.open_session(sock, request["ip"], request["session_id"])  # type: ignore[arg-type]
+        if sock.closed:
+            # Client left while the session was being opened
+            manager.remove_session(sock)  # type: ignore[arg-type]
+            return
+        self.relay(_Frame.OPENED, conn_id, session.client_info.session_id)
+
+
+def run_worker(socket_path: str, index: int, gui_test_mode: bool = False,
+               config: "ConfigProtocol | None" = None) -> None:
+    """Entry point of a worker process (see ShardFront._spawn).
+
+    ``config`` is the front's config, a fresh AppConfig if not given.
+    """
+    if config is None:
+        from cube.application.config_impl import AppConfig
+        config = AppConfig()
+
+    loop = _WorkerEventLoop(socket_path, index, gui_test_mode)
+    loop.set_session_manager(SessionManager(loop, config, gui_test_mode=gui_test_mode))
+    loop.run()
@@ -0,0 +1,334 @@
+"""Stateless HTTP solve endpoint for the webgl server.
+
+Solves a cube state without a websocket session or a per-client app::
+
+    POST /api/solve
+    {"size": 3, "solver": "cfop", "facelets": "UUUUUUUUURRR...", "deadline_ms": 5000}
+
+    200 {"size", "solver", "moves": ["R", "U'", ...], "alg": "R U' ...",
+         "move_count", "steps": {StepStats tree}, "wall_s"}
+    400 invalid request or cube state
+    422 the solver failed on this state
+    429 rate limited / queue full      (headers X-Queue-Depth, Retry-After)
+    503 solve pool restarted
+    504 deadline exceeded
+
+Facelet string - the Kociemba format, generalized to NxN:
+    faces in order U R F D L B, each face size*size characters, rows from
+    top to bottom, each row left to right (looking at the face). A
+    character names the face whose color the sticker has on the solved
+    cube, so a solved 3x3 is ``"U"*9 + "R"*9 + "F"*9 + "D"*9 + "L"*9 + "B"*9``.
+    See :func:`cube_to_facelets`.
+
+Solves run in a bounded process pool (solve_api_config.workers). Each pool
+process keeps one app per cube size and reuses it for every request of that
+size, so a request costs a color overwrite, not a cube build. At most
+``max_queue`` requests wait for a worker, and each client IP has a token
+bucket (``rate_per_minute``, ``burst``); beyond either the answer is 429.
+The client IP is the peer address, or behind a proxy (``trust_forwarded_for``)
+the last X-Forwarded-For entry.
+A request whose deadline passes while queued is dropped without solving.
+A solve that is already running cannot be interrupted: the client gets 504
+and the worker finishes it in the background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from cube.domain.solver.SolverName import SolverName
+
+if TYPE_CHECKING:
+    from aiohttp.web import Request, Response
+
+    from cube.domain.model.Cube import Cube
+    from cube.utils.config_protocol import SolveApiConfigProtocol
+
+_FACE_ORDER = "URFDLB"
+
+
+class SolveApiError(Exception):
+    """A request that cannot be served, with its HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
+
+
+@dataclass(frozen=True)
+class SolveRequest:
+    size: int
+    solver: SolverName
+    facelets: str
+    deadline_s: float
+
+
+def parse_solve_request(data: Any, config: "SolveApiConfigProtocol") -> SolveRequest:
+    """Validate a decoded request body, raise SolveApiError(400) if invalid."""
+    if not isinstance(data, dict):
+        raise SolveApiError(400, "Body must be a JSON object")
+
+    size = data.get("size", 3)
+    if not isinstance(size, int) or not 2 <= size <= config.max_cube_size:
+        raise SolveApiError(400, f"size must be an integer in [2, {config.max_cube_size}]")
+
+    try:
+        solver = SolverName.lookup(str(data.get("solver", SolverName.LBL.display_name)))
+    except ValueError as e:
+        raise SolveApiError(400, str(e)) from e
+    meta = solver.meta
+    if not meta.implemented or (meta.only_2x2 and size != 2) or (meta.only_3x3 and size != 3):
+        raise SolveApiError(400, f"Solver {solver.display_name} does not support size {size}")
+
+    facelets = data.get("facelets")
+    if not isinstance(facelets, str) or len(facelets) != 6 * size * size:
+        raise SolveApiError(400, f"facelets must be a string of {6 * size * size} characters")
+    for c in _FACE_ORDER:
+        if facelets.count(c) != size * size:
+            raise SolveApiError(400, f"facelets must contain {size * size} of each of {_FACE_ORDER}")
+
+    deadline_s = config.default_deadline
+    deadline_ms = data.get("deadline_ms")
+    if deadline_ms is not None:
+        if not isinstance(deadline_ms, (int, float)) or deadline_ms <= 0:
+            raise SolveApiError(400, "deadline_ms must be a positive number")
+        deadline_s = deadline_ms / 1000.0
+    deadline_s = min(deadline_s, config.max_deadline)
+
+    return SolveRequest(size, solver, facelets, deadline_s)
+
+
+# -- Facelet string <-> cube --
+
+def _scheme(cube: "Cube") -> dict[str, str]:
+    """Face letter -> lowercase color name, for the colors a solved ``cube`` has."""
+    return {face_name.name: color.name.lower() for face_name, color in cube.original_scheme.faces.items()}
+
+
+def _set_facelets(cube: "Cube", facelets: str, scheme: dict[str, str]) -> None:
+    from cube.presentation.gui.backends.webgl.CubeStateSerializer import apply_cube_colors
+
+    n = cube.size
+    faces: dict[str, list[str]] = {}
+    for k, face_name in enumerate(_FACE_ORDER):
+        chars = facelets[k * n * n:(k + 1) * n * n]
+        # Facelet rows are top first, apply_cube_colors rows are bottom first
+        rows = [chars[r * n:(r + 1) * n] for r in range(n)]
+        faces[face_name] = [scheme[c] for row in reversed(rows) for c in row]
+    apply_cube_colors(cube, faces)
+
+
+def cube_to_facelets(cube: "Cube", scheme: dict[str, str]) -> str:
+    """Facelet string of ``cube`` (module docstring); ``scheme`` as built by _scheme()."""
+    from cube.presentation.gui.backends.webgl.CubeStateSerializer import cube_color_names
+
+    letter = {color: face_name for face_name, color in scheme.items()}
+    n = cube.size
+    names = cube_color_names(cube)
+    result: list[str] = []
+    for face_name in _FACE_ORDER:
+        grid = names[face_name]
+        for r in reversed(range(n)):
+            result.extend(letter[c] for c in grid[r * n:(r + 1) * n])
+    return "".join(result)
+
+
+# -- Pool process side --
+
+# Pool kind of the reused apps, see cube.application.app_pool
+_POOL_KIND = "solve_api"
+
+
+def solve_job(request: SolveRequest, deadline: float) -> dict[str, Any]:
+    """Solve one request in a pool process. ``deadline`` is a time.time() value."""
+    if time.time() > deadline:
+        raise SolveApiError(504, "Deadline exceeded while queued")
+
+    from cube.application.app_pool import discard_pooled_app, pooled_app
+    from cube.domain.algs import AnnotationAlg
+    from cube.domain.algs.SeqAlg import SeqAlg
+
+    app = pooled_app(_POOL_KIND, request.size)
+    cube = app.cube
+    # Every sticker is overwritten, no need to rebuild the cube
+    try:
+        _set_facelets(cube, request.facelets, _scheme(cube))
+        valid = cube.is_sanity(force_check=True)
+    except Exception:
+        valid = False
+    if not valid:
+        raise SolveApiError(400, "facelets do not describe a valid cube")
+
+    app.switch_to_solver(request.solver)
+
+    start = time.perf_counter()
+    try:
+        results = app.slv.solve(animation=False, debug=False)
+    except Exception as e:
+        discard_pooled_app(_POOL_KIND, request.size)
+        raise SolveApiError(422, f"Solver failed: {e or type(e).__name__}") from e
+    wall_s = time.perf_counter() - start
+    if not cube.solved:
+        raise SolveApiError(422, "Solver did not reach a solved cube")
+
+    algs = [a for a in app.op.history_view() if not isinstance(a, AnnotationAlg)]
+    config = app.config
+    solution = SeqAlg(None, *algs)
+    if config.optimize_solution:
+        solution = solution.optimize(config.optimize_solution_window, cube)
+    else:
+        solution = solution.simplify()
+    moves = [str(a) for a in solution.algs]
+    steps = results.steps
+    return {
+        "size": request.size,
+        "solver": request.solver.display_name,
+        "moves": moves,
+        "alg": " ".join(moves),
+        "move_count": len(moves),
+        "steps": dataclasses.asdict(steps) if steps is not None else None,
+        "wall_s": wall_s,
+    }
+
+
+# -- Server side --
+
+class RateLimiter:
+    """Token bucket per client key: ``rate_per_minute`` sustained, ``burst`` at once."""
+
+    __slots__ = ["_rate", "_burst", "_clock", "_buckets"]
+
+    # Forget idle clients once this many are tracked
+    _MAX_CLIENTS = 10_000
+
+    def __init__(self, rate_per_minute: int, burst: int,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._rate = rate_per_minute / 60.0
+        self._burst = float(max(1, burst))
+        self._clock = clock
+        # key -> (tokens, last update)
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def acquire(self, key: str) -> float:
+        """Take a token. Returns 0 if allowed, else seconds until one is available."""
+        now = self._clock()
+        tokens, last = self._buckets.get(key, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - last) * self._rate)
+        if tokens < 1.0:
+            self._buckets[key] = (tokens, now)
+            return (1.0 - tokens) / self._rate if self._rate > 0 else float("inf")
+        self._buckets[key] = (tokens - 1.0, now)
+        if len(self._buckets) > self._MAX_CLIENTS:
+            self._prune(now)
+        return 0.0
+
+    def _prune(self, now: float) -> None:
+        # A client whose bucket refilled completely is indistinguishable from a new one
+        full = [k for k, (t, last) in self._buckets.items()
+                if t + (now - last) * self._rate >= self._burst]
+        for k in full:
+            del self._buckets[k]
+
+
+class SolveService:
+    """Serves POST /api/solve, see module docstring.
+
+    Wired by WebglAppWindow when solve_api_config.enabled; WebglEventLoop
+    routes the requests to handle() and calls stop() on exit. The pool is
+    created on the first request.
+    """
+
+    def __init__(self, config: "SolveApiConfigProtocol") -> None:
+        self._config = config
+        self._limiter = RateLimiter(config.rate_per_minute, config.burst)
+        self._executor: ProcessPoolExecutor | None = None
+        # Submitted and not finished (queued or running)
+        self._jobs: set[Future[dict[str, Any]]] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._jobs)
+
+    def stop(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def handle(self, request: "Request") -> "Response":
+        from aiohttp import web
+
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
+        status, body, headers = await self.solve(data, self.client_key(request))
+        return web.json_response(body, status=status, headers=headers)
+
+    def client_key(self, request: "Request") -> str:
+        """Rate limit key of ``request``: the address of the connected peer.
+
+        X-Forwarded-For is written by the client, so it is read only with
+        ``trust_forwarded_for``, and then only its last entry - the one
+        appended by the proxy in front of the server.
+        """
+        if self._config.trust_forwarded_for:
+            forwarded = request.headers.get("X-Forwarded-For")
+            if forwarded:
+                return forwarded.rsplit(",", 1)[-1].strip()
+        peername = request.transport.get_extra_info("peername") if request.transport else None
+        if peername:
+            return peername[0]
+        return "unknown"
+
+    async def solve(self, data: Any, client: str) -> tuple[int, dict[str, Any], dict[str, str]]:
+        """Serve one request body from ``client``: (status, JSON body, headers)."""
+        try:
+            request = parse_solve_request(data, self._config)
+        except SolveApiError as e:
+            return e.status, {"error": e.message}, {}
+
+        retry_after = self._limiter.acquire(client)
+        if retry_after > 0:
+            return 429, {"error": "Rate limit exceeded"}, self._busy_headers(retry_after)
+        if self.queue_depth >= self._config.workers + self._config.max_queue:
+            return 429, {"error": "Solve queue is full"}, self._busy_headers(1.0)
+
+        future = self._submit(request)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), request.deadline_s)
+        except asyncio.TimeoutError:
+            return 504, {"error": "Deadline exceeded"}, {}
+        except SolveApiError as e:
+            return e.status, {"error": e.message}, {}
+        except BrokenProcessPool:
+            # A pool process died (e.g. OOM); start a fresh pool for later requests
+            self.stop()
+            self._jobs.clear()
+            return 503, {"error": "Solve pool restarted, retry"}, {"Retry-After": "1"}
+        return 200, result, {}
+
+    def _submit(self, request: SolveRequest) -> Future[dict[str, Any]]:
+        if self._executor is None:
+            # spawn, not fork: the server process runs an asyncio loop and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._config.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        future = self._executor.submit(solve_job, request, time.time() + request.deadline_s)
+        self._jobs.add(future)
+        future.add_done_callback(self._jobs.discard)
+        return future
+
+    def _busy_headers(self, retry_after: float) -> dict[str, str]:
+        return {
+            "X-Queue-Depth": str(self.queue_depth),
+            "Retry-After": str(max(1, round(retry_after))),
+        }
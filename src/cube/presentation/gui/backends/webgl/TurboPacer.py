@@ -0,0 +1,106 @@
+"""Batch sizing for coalesced (turbo) redo/undo playback.
+
+Instead of one animation_start + state per move and one round trip per
+move, the server sends K moves in one ``animation_batch`` message. The
+client animates them back to back and asks for the next batch while
+``lead`` moves of the current batch are still to be played, so the next
+batch arrives before the queue drains:
+
+    lead = ceil(rtt / move_ms)                 moves that cover one round trip
+    K    = max(lead + 1, ceil(HORIZON / move_ms)), clamped to [1, max_batch]
+
+``move_ms`` follows the speed index (plus the assist preview, when on), so
+slow playback gets small batches and fast playback large ones.
+
+The round trip is measured per batch: the client echoes the batch ``seq``
+and how long it held the batch before asking for more (``hold_ms``); the
+rest of the elapsed time is network + server.
+
+Because the client asks for more before it finishes a batch, an ack can
+still be in flight when the user stops playback; :meth:`cancel` makes such
+acks stale so they don't restart it.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+
+# Round trip assumed until the first ack is measured
+_INITIAL_RTT_MS: float = 150.0
+# Weight of a new RTT sample in the moving average
+_RTT_ALPHA: float = 0.25
+# A batch should hold at least this much animation time
+_HORIZON_MS: float = 500.0
+
+
+class TurboPacer:
+    """Chooses batch size and ack point from the measured round trip time."""
+
+    __slots__ = ["_clock", "_rtt_ms", "_seq", "_sent_at", "_cancelled_seq"]
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._rtt_ms: float | None = None
+        self._seq: int = 0
+        self._sent_at: float | None = None
+        self._cancelled_seq: int = 0
+
+    @property
+    def rtt_ms(self) -> float:
+        """Smoothed round trip time, or the initial guess before any ack."""
+        return _INITIAL_RTT_MS if self._rtt_ms is None else self._rtt_ms
+
+    def plan(self, move_ms: float, max_batch: int) -> tuple[int, int]:
+        """Batch size and lead for the next batch.
+
+        :param move_ms: client time per move (animation + assist preview)
+        :param max_batch: upper bound on the batch size (config)
+        :return: ``(k, lead)`` — send up to ``k`` moves, ask the client to
+                 request more when ``lead`` moves are still queued after the
+                 current one, see :meth:`ack_index`
+        """
+        move_ms = max(1.0, move_ms)
+        lead = math.ceil(self.rtt_ms / move_ms)
+        k = max(lead + 1, math.ceil(_HORIZON_MS / move_ms))
+        return max(1, min(k, max_batch)), lead
+
+    @staticmethod
+    def ack_index(n_moves: int, lead: int) -> int:
+        """Index of the move whose start triggers the next request."""
+        return max(0, n_moves - 1 - lead)
+
+    def sent(self) -> int:
+        """Record that a batch was sent, return its sequence number."""
+        self._seq += 1
+        self._sent_at = self._clock()
+        return self._seq
+
+    def cancel(self) -> None:
+        """Playback stopped: acks of batches sent so far are stale."""
+        self._cancelled_seq = self._seq
+        self._sent_at = None
+
+    def on_ack(self, seq: object, hold_ms: object) -> bool:
+        """Client asked for the next batch: update the RTT estimate.
+
+        Requests without a ``seq`` (playback start) are always accepted.
+
+        :return: False if the ack belongs to a batch sent before
+                 :meth:`cancel`, the request must be ignored
+        """
+        if seq is None:
+            return True
+        if not isinstance(seq, int) or seq <= self._cancelled_seq:
+            return False
+        if seq == self._seq and self._sent_at is not None:
+            if not isinstance(hold_ms, (int, float)):
+                hold_ms = 0
+            sample = max(0.0, (self._clock() - self._sent_at) * 1000.0 - hold_ms)
+            self._sent_at = None
+            if self._rtt_ms is None:
+                self._rtt_ms = sample
+            else:
+                self._rtt_ms += _RTT_ALPHA * (sample - self._rtt_ms)
+        return True
@@ -13,6 +13,12 @@ Two modes of operation:
     3. Client sends animation_done when its animation finishes
     4. on_client_animation_done() calls _process_next() for the next move
 
+**Batch mode** (turbo playback, see ClientSession._play_batch):
+    Same as queue mode, but animatable moves don't wait for the client:
+    each one is handed to ClientSession.add_batched_animation() and the
+    queue keeps draining. No per-move state is sent; the session sends one
+    animation_batch message for all of them.
+
 **Blocking mode** (used during one-phase solve):
     1. run_animation() is called from solver worker thread
     2. Non-animatable: apply + send state, return immediately
@@ -69,6 +75,7 @@ class WebglAnimationManager(AnimationManager):
         "_on_queue_drained",
         "_blocking_mode",
         "_blocking_event",
+        "_batch_mode",
     ]
 
     def __init__(self, vs: "ApplicationAndViewState", operator: "Operator") -> None:
@@ -83,6 +90,7 @@ class WebglAnimationManager(AnimationManager):
         self._on_queue_drained: Callable[[], None] | None = None
         self._blocking_mode: bool = False
         self._blocking_event: threading.Event = threading.Event()
+        self._batch_mode: bool = False
 
     @property
     def is_idle(self) -> bool:
@@ -112,6 +120,14 @@ class WebglAnimationManager(AnimationManager):
             # Ensure event is set so no thread stays blocked
             self._blocking_event.set()
 
+    def set_batch_mode(self, enabled: bool) -> None:
+        """Enable or disable batch mode for turbo playback.
+
+        In batch mode, queued moves are applied and collected by the client
+        session instead of being sent one at a time.
+        """
+        self._batch_mode = enabled
+
     def cancel_animation(self) -> None:
         """Cancel all pending animations (graceful — client finishes current).
 
@@ -193,7 +209,7 @@ class WebglAnimationManager(AnimationManager):
             return
 
         # Animatable move: apply, send animation_start, BLOCK
-        duration_ms = self._get_animation_duration_ms()
+        duration_ms = self.animation_duration_ms
         self._apply_model_change(move)
 
         if self._web_window:
@@ -230,27 +246,35 @@ class WebglAnimationManager(AnimationManager):
             # Non-animatable moves: apply and continue immediately
             if isinstance(alg, algs.AnnotationAlg):
                 self._apply_model_change(move)
-                if self._web_window:
+                if self._web_window and not self._batch_mode:
                     self._web_window.send_state()
                 continue
 
             if not isinstance(alg, algs.AnimationAbleAlg):
                 self._apply_model_change(move)
                 if self._web_window:
-                    self._web_window.send_state()
+                    if self._batch_mode:
+                        self._web_window.add_batched_change()
+                    else:
+                        self._web_window.send_state()
                 continue
 
             if alg.n % 4 == 0:
                 self._apply_model_change(move)
-                if self._web_window:
+                if self._web_window and not self._batch_mode:
                     self._web_window.send_state()
                 continue
 
             # Animatable move: apply model change, send to client, WAIT
-            duration_ms = self._get_animation_duration_ms()
+            duration_ms = self.animation_duration_ms
 
             self._apply_model_change(move)
 
+            if self._batch_mode:
+                if self._web_window:
+                    self._web_window.add_batched_animation(alg, duration_ms, is_undo=self._is_undo)
+                continue
+
             if self._web_window:
                 self._web_window.send_animation_start(alg, duration_ms, is_undo=self._is_undo)
                 self._web_window.send_state()
@@ -270,8 +294,9 @@ class WebglAnimationManager(AnimationManager):
         with self._operator.with_animation(animation=False):
             move.op(move.alg, False)
 
-    def _get_animation_duration_ms(self) -> int:
-        """Get animation duration based on current speed setting.
+    @property
+    def animation_duration_ms(self) -> int:
+        """Animation duration of one move at the current speed setting.
 
         Uses the formula: D(I) = D0 * (DN/D0)^(I/7)
         where D0 and DN come from config.
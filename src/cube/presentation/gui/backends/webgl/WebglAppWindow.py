@@ -58,6 +58,22 @@ class WebglAppWindow(AppWindow):
         )
         self._event_loop.set_session_manager(self._session_manager)
 
+        # Optionally host the sessions in worker processes
+        session_config = app.config.session_config
+        if session_config.workers > 0:
+            from cube.presentation.gui.backends.webgl.SessionSharding import ShardFront
+            self._event_loop.set_shard_front(ShardFront(
+                session_config.workers,
+                health_interval=session_config.worker_health_interval,
+                health_timeout=session_config.worker_health_timeout,
+                gui_test_mode=app.config.gui_test_mode,
+                config=app.config,
+            ))
+
+        if app.config.solve_api_config.enabled:
+            from cube.presentation.gui.backends.webgl.SolveApi import SolveService
+            self._event_loop.set_solve_service(SolveService(app.config.solve_api_config))
+
     # -- AppWindow protocol properties --
 
     @property
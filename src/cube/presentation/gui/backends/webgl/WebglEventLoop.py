@@ -23,6 +23,8 @@ if TYPE_CHECKING:
     from aiohttp.web import WebSocketResponse
 
     from cube.presentation.gui.backends.webgl.SessionManager import SessionManager
+    from cube.presentation.gui.backends.webgl.SessionSharding import ShardFront
+    from cube.presentation.gui.backends.webgl.SolveApi import SolveService
 
 
 class WebglEventLoop(EventLoop):
@@ -44,6 +46,8 @@ class WebglEventLoop(EventLoop):
         self._open_browser = self.__class__._default_open_browser
         self._loop: asyncio.AbstractEventLoop | None = None
         self._session_manager: SessionManager | None = None
+        self._shard_front: ShardFront | None = None
+        self._solve_service: SolveService | None = None
         self._scheduled: list[tuple[float, Callable[[float], None], float | None]] = []
         self._start_time = time.monotonic()
         self._explicit_port = port
@@ -57,6 +61,17 @@ class WebglEventLoop(EventLoop):
         """Set the session manager for routing WebSocket connections."""
         self._session_manager = manager
 
+    def set_shard_front(self, front: "ShardFront") -> None:
+        """Relay WebSocket connections to session worker processes.
+
+        Takes precedence over the session manager, see SessionSharding.
+        """
+        self._shard_front = front
+
+    def set_solve_service(self, service: "SolveService") -> None:
+        """Serve POST /api/solve, see SolveApi."""
+        self._solve_service = service
+
     @staticmethod
     def _find_free_port() -> int:
         """Find an available port for the server."""
@@ -132,6 +147,11 @@ class WebglEventLoop(EventLoop):
             ws = web.WebSocketResponse()
             await ws.prepare(request)
 
+            if self._shard_front is not None:
+                # Sessions live in worker processes; just relay messages
+                await self._shard_front.serve(ws, request)
+                return ws
+
             session = None
             try:
                 async for msg in ws:
@@ -181,6 +201,8 @@ class WebglEventLoop(EventLoop):
 
         # Routes
         app.router.add_get('/ws', websocket_handler)
+        if self._solve_service is not None:
+            app.router.add_post('/api/solve', self._solve_service.handle)
         app.router.add_get('/', index_handler)
         app.router.add_get('/{path:.*}', static_handler)
 
@@ -216,17 +238,28 @@ class WebglEventLoop(EventLoop):
         if not self._gui_test_mode:
             logging_task = asyncio.create_task(self._log_clients_periodically())
 
+        if self._shard_front is not None:
+            await self._shard_front.start()
+
         # Main loop
         try:
-            while not self._has_exit:
-                await self._process_scheduled()
-                await self._process_pending()
-                await asyncio.sleep(0.016)  # ~60fps
+            await self._run_ticks()
         finally:
             if logging_task:
                 logging_task.cancel()
+            if self._shard_front is not None:
+                await self._shard_front.stop()
+            if self._solve_service is not None:
+                self._solve_service.stop()
             await runner.cleanup()
 
+    async def _run_ticks(self) -> None:
+        """Run scheduled and call_soon callbacks until stop() is requested."""
+        while not self._has_exit:
+            await self._process_scheduled()
+            await self._process_pending()
+            await asyncio.sleep(0.016)  # ~60fps
+
     async def _handle_message(self, websocket: "WebSocketResponse", message: str) -> None:
         """Handle incoming message — delegate to the session."""
         if not self._session_manager:
@@ -247,6 +280,8 @@ class WebglEventLoop(EventLoop):
         try:
             while True:
                 await asyncio.sleep(60)
+                if self._shard_front is not None:
+                    print(self._shard_front.status_line(), flush=True)
                 if self._session_manager and self._session_manager.session_count > 0:
                     print(f"Connected clients: {self._session_manager.session_count}", flush=True)
                     self._session_manager._log_all_clients()
@@ -6,10 +6,34 @@
  *
  * Assist mode: when assistDelayMs > 0, shows a brief move indicator
  * preview before each animation starts (via callbacks).
+ *
+ * Turbo playback: the server may send several playback moves in one
+ * animation_batch message (see enqueueBatch). They play back to back and
+ * the next batch is requested when the batch's ack move starts.
  */
 
 import * as THREE from 'three';
 
+/**
+ * Copy of a cube state with a server sticker delta applied.
+ * delta: {F: [[index, [r,g,b], markers], ...], ...} — only changed faces
+ * are copied, unchanged faces are shared with the input state.
+ */
+function applyStateDelta(state, delta) {
+    const faces = { ...state.faces };
+    for (const [faceName, cells] of Object.entries(delta || {})) {
+        const face = faces[faceName];
+        const colors = face.colors.slice();
+        const markers = face.markers ? face.markers.slice() : new Array(colors.length).fill(null);
+        for (const [i, color, cellMarkers] of cells) {
+            colors[i] = color;
+            markers[i] = cellMarkers;
+        }
+        faces[faceName] = { colors, markers };
+    }
+    return { ...state, faces };
+}
+
 export class AnimationQueue {
     constructor(cubeModel, sendFn, soundManager) {
         this.cubeModel = cubeModel;
@@ -18,6 +42,7 @@ export class AnimationQueue {
         this.queue = [];
         this.currentAnim = null;
         this.pendingState = null;  // State to apply after all animations
+        this._batchFinalState = null;  // Final state of the latest turbo batch
         this._stopRequested = false;
         this._onDebugUpdate = null;  // callback(alg, layers, count) for debug overlay
         this._onAllDone = null;      // callback() when queue drains and no animation
@@ -41,6 +66,15 @@ export class AnimationQueue {
         this._stopRequested = false;  // Clear stale stop from previous session
     }
 
+    /**
+     * Start playback mode and request the first move(s) from the server.
+     * @param {'forward' | 'backward'} direction
+     */
+    requestPlayback(direction) {
+        this.startPlayback(direction);
+        this._requestNext();
+    }
+
     /**
      * Stop playback mode — next _finishCurrent sends animation_done instead of play_next.
      */
@@ -58,6 +92,47 @@ export class AnimationQueue {
         }
     }
 
+    /**
+     * Enqueue an animation_batch message from the server.
+     *
+     * Each move carries a sticker delta; its state is rebuilt from the
+     * previous one, starting at baseState (the state before the batch).
+     * Returns the state after the last move.
+     */
+    enqueueBatch(msg, baseState) {
+        const states = [];
+        let prev = baseState;
+        for (const event of msg.moves) {
+            prev = applyStateDelta(prev, event.delta);
+            states.push(prev);
+        }
+        this._batchFinalState = prev;
+        if (this.playbackMode === null || this._stopRequested) {
+            // Stopped while the batch was in flight — the server applied it anyway
+            if (!this.isBusy) this.cubeModel.updateFromState(prev);
+            return prev;
+        }
+        const receivedAt = performance.now();
+        msg.moves.forEach((event, i) => {
+            event.batched = true;
+            if (i === msg.ack_index) event.ack = { seq: msg.seq, receivedAt };
+            this.queue.push({ event, state: states[i] });
+        });
+        if (!this.currentAnim && !this._previewState) {
+            this._processNext();
+        }
+        return prev;
+    }
+
+    /**
+     * Ask the server for the next playback move(s).
+     * @param {object} [extra] - ack fields for a turbo batch (seq, hold_ms)
+     */
+    _requestNext(extra) {
+        const type = this.playbackMode === 'backward' ? 'play_next_undo' : 'play_next_redo';
+        this._send({ type, turbo: true, ...extra });
+    }
+
     /**
      * Apply a state immediately (no animation).
      */
@@ -76,6 +151,7 @@ export class AnimationQueue {
         }
         this.queue = [];
         this._stopRequested = false;
+        this._batchFinalState = null;
         if (this.pendingState) {
             this.cubeModel.updateFromState(this.pendingState);
             this.pendingState = null;
@@ -157,14 +233,25 @@ export class AnimationQueue {
             return;
         }
 
-        // If queue is getting long, speed up
+        // If queue is getting long, speed up (a turbo batch is long by design)
         let speedMult = 1.0;
-        if (this.queue.length > 10) speedMult = 0.3;
-        else if (this.queue.length > 5) speedMult = 0.6;
+        if (!this.queue[0].event.batched) {
+            if (this.queue.length > 10) speedMult = 0.3;
+            else if (this.queue.length > 5) speedMult = 0.6;
+        }
 
         const { event, state } = this.queue.shift();
         this.pendingState = state;
 
+        // Turbo batch: request the next batch now, so it arrives while the
+        // rest of this one is still playing
+        if (event.ack && this.playbackMode !== null && !this._stopRequested) {
+            this._requestNext({
+                seq: event.ack.seq,
+                hold_ms: Math.round(performance.now() - event.ack.receivedAt),
+            });
+        }
+
         // Normalize face name: server may send uppercase X/Y/Z or bracket-prefixed "[2:2]M"
         let face = event.face;
         const caseMap = { 'X': 'x', 'Y': 'y', 'Z': 'z' };
@@ -247,6 +334,7 @@ export class AnimationQueue {
             duration: duration,
             startTime: performance.now(),
             state: state,
+            batched: !!event.batched,
         };
     }
 
@@ -274,19 +362,25 @@ export class AnimationQueue {
 
         if (this._stopRequested) {
             this._stopRequested = false;
+            // The server already applied the rest of the turbo batch:
+            // snap to its final state
+            if (anim.batched && this._batchFinalState) {
+                this.cubeModel.updateFromState(this._batchFinalState);
+            }
             // Send animation_done for the completed animation (server needs ack)
             this._send({ type: 'animation_done' });
             return;  // Don't process next or request more — stop was requested
         }
 
-        // In playback mode, request the next move from server
-        if (this.playbackMode === 'forward') {
-            this._send({ type: 'play_next_redo' });
-        } else if (this.playbackMode === 'backward') {
-            this._send({ type: 'play_next_undo' });
-        } else {
-            // Single move — tell server this animation is done
-            this._send({ type: 'animation_done' });
+        // In playback mode, request the next move from server.
+        // Turbo batch moves need no ack: the batch's ack move requested more.
+        if (!anim.batched) {
+            if (this.playbackMode !== null) {
+                this._requestNext();
+            } else {
+                // Single move — tell server this animation is done
+                this._send({ type: 'animation_done' });
+            }
         }
 
         this._processNext();
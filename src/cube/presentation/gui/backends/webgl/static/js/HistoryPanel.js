@@ -42,17 +42,19 @@ export class HistoryPanel {
         if (this._btnPlay) {
             this._btnPlay.addEventListener('click', () => {
                 if (this._animQueue) {
-                    this._animQueue.startPlayback('forward');
+                    this._animQueue.requestPlayback('forward');
+                } else {
+                    this._send({ type: 'play_next_redo' });
                 }
-                this._send({ type: 'play_next_redo' });
             });
         }
         if (this._btnRewind) {
             this._btnRewind.addEventListener('click', () => {
                 if (this._animQueue) {
-                    this._animQueue.startPlayback('backward');
+                    this._animQueue.requestPlayback('backward');
+                } else {
+                    this._send({ type: 'play_next_undo' });
                 }
-                this._send({ type: 'play_next_undo' });
             });
         }
         if (this._btnClear) {
@@ -245,15 +245,13 @@ export class Toolbar {
 
                 if (cmd === 'fast_play') {
                     // Client-initiated playback: start forward mode, request first move
-                    this._animQueue.startPlayback('forward');
-                    this._send({ type: 'play_next_redo' });
+                    this._animQueue.requestPlayback('forward');
                     return;
                 }
 
                 if (cmd === 'fast_rewind') {
                     // Client-initiated rewind: start backward mode, request first move
-                    this._animQueue.startPlayback('backward');
-                    this._send({ type: 'play_next_undo' });
+                    this._animQueue.requestPlayback('backward');
                     return;
                 }
 
@@ -444,7 +442,7 @@ export class Toolbar {
             if (e.key === 'ArrowRight') {
                 e.preventDefault();
                 if (e.shiftKey) {
-                    this._send({ type: 'play_next_redo' });
+                    this._animQueue.requestPlayback('forward');
                 } else {
                     this._send({ type: 'command', name: 'redo' });
                 }
@@ -455,7 +453,7 @@ export class Toolbar {
             if (e.key === 'ArrowLeft') {
                 e.preventDefault();
                 if (e.shiftKey) {
-                    this._send({ type: 'play_next_undo' });
+                    this._animQueue.requestPlayback('backward');
                 } else {
                     this._send({ type: 'command', name: 'undo' });
                 }
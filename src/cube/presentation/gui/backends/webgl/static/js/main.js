@@ -335,15 +335,17 @@ function handleMessage(msg) {
             // Sync client playback mode from server state machine
             const ms = state.machineState;
             if (ms === 'playing' && animQueue.playbackMode !== 'forward') {
-                animQueue.startPlayback('forward');
                 // If transitioning to PLAYING (e.g., solve_and_play), request first move
                 if (!wasPlaying) {
-                    send({ type: 'play_next_redo' });
+                    animQueue.requestPlayback('forward');
+                } else {
+                    animQueue.startPlayback('forward');
                 }
             } else if (ms === 'rewinding' && animQueue.playbackMode !== 'backward') {
-                animQueue.startPlayback('backward');
                 if (!wasPlaying) {
-                    send({ type: 'play_next_undo' });
+                    animQueue.requestPlayback('backward');
+                } else {
+                    animQueue.startPlayback('backward');
                 }
             } else if (ms !== 'playing' && ms !== 'rewinding' && ms !== 'animating' && ms !== 'stopping') {
                 if (animQueue.playbackMode !== null) {
@@ -363,6 +365,19 @@ function handleMessage(msg) {
             break;
         }
 
+        case 'animation_batch': {
+            // Turbo playback: several moves with sticker deltas. The final
+            // state follows in the next 'state' message.
+            if (moveIndicator.isVisible) moveIndicator.hide();
+            const baseState = state.latestState;
+            if (baseState && baseState.size === msg.size) {
+                state.latestState = animQueue.enqueueBatch(msg, baseState);
+            } else {
+                animQueue.stop();
+            }
+            break;
+        }
+
         case 'animation_stop':
             animQueue.stop();
             if (state.latestState) {
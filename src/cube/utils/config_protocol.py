@@ -35,6 +35,9 @@ class AnimationSpeedConfigProtocol(Protocol):
     @property
     def blocking_timeout(self) -> float: ...
 
+    @property
+    def turbo_max_batch(self) -> int: ...
+
 
 @runtime_checkable
 class AssistConfigProtocol(Protocol):
@@ -64,6 +67,106 @@ class SessionConfigProtocol(Protocol):
         """How long (seconds) to keep a disconnected session alive."""
         ...
 
+    @property
+    def hibernate_dormant(self) -> bool:
+        """Keep dormant sessions as compact records instead of live apps."""
+        ...
+
+    @property
+    def dormant_memory_budget(self) -> int:
+        """Global byte budget for hibernated session records (LRU eviction)."""
+        ...
+
+    @property
+    def workers(self) -> int:
+        """Number of session worker processes (0 = in-process sessions)."""
+        ...
+
+    @property
+    def worker_health_interval(self) -> float:
+        """Seconds between worker health pings."""
+        ...
+
+    @property
+    def worker_health_timeout(self) -> float:
+        """Seconds without a pong after which a worker is restarted."""
+        ...
+
+    @property
+    def metrics_control(self) -> bool:
+        """Clients may enable/disable and reset the process-wide metrics."""
+        ...
+
+
+@runtime_checkable
+class SolveApiConfigProtocol(Protocol):
+    """Protocol for the stateless HTTP solve endpoint configuration."""
+
+    @property
+    def enabled(self) -> bool:
+        """Serve POST /api/solve."""
+        ...
+
+    @property
+    def workers(self) -> int:
+        """Size of the solve process pool."""
+        ...
+
+    @property
+    def max_queue(self) -> int:
+        """Solves allowed to wait for a worker before answering 429."""
+        ...
+
+    @property
+    def rate_per_minute(self) -> int:
+        """Sustained requests per minute allowed per client."""
+        ...
+
+    @property
+    def burst(self) -> int:
+        """Requests a client may send at once."""
+        ...
+
+    @property
+    def trust_forwarded_for(self) -> bool:
+        """Identify clients by the last X-Forwarded-For entry, set by a trusted proxy."""
+        ...
+
+    @property
+    def default_deadline(self) -> float:
+        """Request deadline (seconds) when the client sends none."""
+        ...
+
+    @property
+    def max_deadline(self) -> float:
+        """Upper bound for client deadlines (seconds)."""
+        ...
+
+    @property
+    def max_cube_size(self) -> int:
+        """Largest cube size accepted."""
+        ...
+
+
+@runtime_checkable
+class BestOfConfigProtocol(Protocol):
+    """Protocol for best-of-N solving configuration."""
+
+    @property
+    def candidates(self) -> int:
+        """Number of variants solved (first face color x rotation)."""
+        ...
+
+    @property
+    def workers(self) -> int:
+        """Size of the candidate process pool, 0 = solve in the calling process."""
+        ...
+
+    @property
+    def time_budget(self) -> float:
+        """Seconds to wait for the candidates."""
+        ...
+
 
 @runtime_checkable
 class ArrowConfigProtocol(Protocol):
@@ -156,6 +259,20 @@ class ConfigProtocol(Protocol):
         """Set cube sanity check flag."""
         ...
 
+    @property
+    def check_cube_sanity_incremental(self) -> bool:
+        """Sanity re-checks only the orbits touched since the last check."""
+        ...
+
+    @check_cube_sanity_incremental.setter
+    def check_cube_sanity_incremental(self, value: bool) -> None:
+        ...
+
+    @property
+    def check_cube_sanity_full_every(self) -> int:
+        """In incremental mode, run a full check every N checks (0 = never)."""
+        ...
+
     @property
     def short_part_name(self) -> bool:
         """Use short names for parts."""
@@ -252,6 +369,16 @@ class ConfigProtocol(Protocol):
         """
         ...
 
+    @first_face_color.setter
+    def first_face_color(self, value: "Color") -> None:
+        """Set first face color."""
+        ...
+
+    @property
+    def best_of_config(self) -> "BestOfConfigProtocol":
+        """Best-of-N solving configuration (Solvers.best_of)."""
+        ...
+
     # ==========================================================================
     # Optimization settings
     # ==========================================================================
@@ -275,6 +402,35 @@ class ConfigProtocol(Protocol):
         """Search for blocks in big cube centers."""
         ...
 
+    @property
+    def optimize_big_cube_centers_lookahead_depth(self) -> int:
+        """Steps of lookahead when picking the next center (target, source) step, 0 keeps the fixed face order.
+
+        Each candidate is played in query mode, then this many steps minus one
+        of the fixed order, and scored by center pieces placed per move.
+        Costs about width * depth steps per step played.
+        """
+        ...
+
+    @property
+    def optimize_big_cube_centers_lookahead_width(self) -> int:
+        """Number of candidate center steps evaluated at each lookahead decision."""
+        ...
+
+    @property
+    def optimize_solution(self) -> bool:
+        """Shorten solutions by cancelling commuting moves (Alg.optimize) before playback."""
+        ...
+
+    @property
+    def optimize_solution_window(self) -> int:
+        """Sliding window of Alg.optimize() for solutions, 0 disables it.
+
+        Subsequences of up to this many moves that equal the identity or a
+        single move are replaced. Costs about window * 6n^2 per move.
+        """
+        ...
+
     # ==========================================================================
     # Viewer settings
     # ==========================================================================
@@ -390,6 +546,11 @@ class ConfigProtocol(Protocol):
         """WebGL session configuration (keepalive timeout, etc.)."""
         ...
 
+    @property
+    def solve_api_config(self) -> "SolveApiConfigProtocol":
+        """Stateless HTTP solve endpoint configuration."""
+        ...
+
     @property
     def show_file_algs(self) -> bool:
         """Show F1-F5 file algorithm buttons in toolbar."""
@@ -462,6 +623,21 @@ class ConfigProtocol(Protocol):
         """Path for operation log file."""
         ...
 
+    @property
+    def operation_log_binary_path(self) -> str | None:
+        """Path for the binary move stream of the operation log, None for none."""
+        ...
+
+    @property
+    def operation_log_flush_lines(self) -> int:
+        """Queued operation log entries that trigger an early write."""
+        ...
+
+    @property
+    def operation_log_flush_interval(self) -> float:
+        """Seconds between operation log writes."""
+        ...
+
     @property
     def operator_show_alg_annotation(self) -> bool:
         """Show algorithm annotations."""
@@ -561,6 +737,10 @@ class ConfigProtocol(Protocol):
         """Unregister a config change listener."""
         ...
 
+    def copy(self) -> "ConfigProtocol":
+        """Independent copy of all settings, without the change listeners."""
+        ...
+
     # ==========================================================================
     # Single-step mode settings
     # ==========================================================================
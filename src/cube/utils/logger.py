@@ -7,6 +7,7 @@ All logging functionality consolidated into a single Logger class:
 - Mutable prefix via set_prefix()
 - Level-based filtering via set_level()
 - Indented sections via tab()
+- Cached enabled state per logger/level, see Logger.invalidate()
 
 Environment Variables (for root logger):
     CUBE_QUIET_ALL: Set to "1", "true", or "yes" to suppress all debug output.
@@ -107,9 +108,20 @@ class Logger(ILogger):
         # Level filtering
         step_log.set_level(3)
         step_log.debug(None, "verbose", level=5)  # Hidden: 5 > 3
+
+    Enabled-state cache:
+        is_debug(None, level=...) is cached per logger and level, so a disabled
+        debug() costs a dict lookup. The cache is valid while the class-wide
+        generation is unchanged; anything that changes what a debug flag
+        returns (quiet_all, set_level, a solver's debug override, the
+        solver_debug config) must call invalidate().
     """
 
-    __slots__ = ["_delegate", "_root", "_prefix", "_debug_flag", "_level", "_quiet_all", "_debug_all", "_streams"]
+    __slots__ = ["_delegate", "_root", "_prefix", "_debug_flag", "_level", "_quiet_all", "_debug_all", "_streams",
+                 "_enabled", "_enabled_gen"]
+
+    # Bumped by invalidate(); a logger's _enabled is valid while _enabled_gen equals it
+    _generation: int = 0
 
     def __init__(
         self,
@@ -132,6 +144,8 @@ class Logger(ILogger):
         self._delegate = delegate
         self._prefix = prefix
         self._level: int | None = None
+        self._enabled: dict[int | None, bool] = {}
+        self._enabled_gen = Logger._generation
 
         if delegate is None:
             # Root logger: no debug_flag inheritance
@@ -194,6 +208,14 @@ class Logger(ILogger):
     def quiet_all(self, value: bool) -> None:
         """Set quiet_all mode on root logger."""
         self._root._quiet_all = value
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop the cached enabled state of all loggers.
+
+        Call after changing anything a debug flag depends on.
+        """
+        Logger._generation += 1
 
     # --- Stream methods ---
 
@@ -240,6 +262,23 @@ class Logger(ILogger):
             debug_on: Override debug flag. If None, uses this logger's debug_flag.
             level: Optional debug level. If set, also checks level <= threshold.
         """
+        if debug_on is not None:
+            return self._is_debug(debug_on, level)
+
+        if self._enabled_gen == Logger._generation:
+            enabled = self._enabled.get(level)
+            if enabled is not None:
+                return enabled
+        else:
+            self._enabled.clear()
+            self._enabled_gen = Logger._generation
+
+        enabled = self._is_debug(None, level)
+        self._enabled[level] = enabled
+        return enabled
+
+    def _is_debug(self, debug_on: bool | None, level: int | None) -> bool:
+        """Uncached is_debug()."""
         # Root's quiet_all always wins
         if self._root._quiet_all:
             return False
@@ -299,6 +338,7 @@ class Logger(ILogger):
             prefix: New prefix to use.
         """
         self._prefix = prefix
+        self.invalidate()
 
     def with_prefix(self, prefix: str, debug_flag: DebugFlagType = None) -> "Logger":
         """Create child logger with chained prefix.
@@ -330,6 +370,8 @@ class Logger(ILogger):
                    None means inherit from parent or no filtering.
         """
         self._level = level
+        # Children without a level of their own use this one
+        self.invalidate()
 
     # --- Indented sections ---
 
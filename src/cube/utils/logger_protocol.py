@@ -79,6 +79,14 @@ class ILogger(Protocol):
         """
         ...
 
+    def invalidate(self) -> None:
+        """Drop cached is_debug() results.
+
+        Call after changing anything a debug flag depends on, e.g. a
+        solver's debug override or the solver_debug config.
+        """
+        ...
+
     @property
     def prefix(self) -> str:
         """Return the raw prefix string (without 'DEBUG:' header)."""
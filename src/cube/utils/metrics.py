@@ -0,0 +1,139 @@
+"""Process-wide hot-path metrics: counters and timers.
+
+Replaces the print-only ``prof.w_prof`` with something that can be queried:
+how many quarter turns, 4-cycles, sanity passes, tracker scans and block
+searches a solve performed, and where the time went.
+
+Usage::
+
+    from cube.utils.metrics import METRICS
+
+    if METRICS.enabled:                      # guard keeps the disabled cost
+        METRICS.inc("face.quarter_turns")    # at one attribute lookup
+
+    with METRICS.timer("solver.solve"):      # shared no-op when disabled; hot
+        ...                                  # paths check METRICS.enabled first
+
+    snap = METRICS.snapshot()
+    ...
+    delta = METRICS.snapshot() - snap        # what happened in between
+
+Names are dotted strings, grouped by prefix in :meth:`MetricsSnapshot.format`.
+
+Environment Variables:
+    CUBE_METRICS: Set to "1", "true", or "yes" to enable at startup.
+"""
+from __future__ import annotations
+
+import os
+import time
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from types import TracebackType
+
+__all__ = ["Metrics", "MetricsSnapshot", "METRICS"]
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Immutable copy of the registry. ``timers`` values are (calls, total_ns)."""
+
+    counters: dict[str, int] = field(default_factory=dict)
+    timers: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def __sub__(self, other: MetricsSnapshot) -> MetricsSnapshot:
+        counters = {k: v - other.counters.get(k, 0) for k, v in self.counters.items()}
+        timers: dict[str, tuple[int, int]] = {}
+        for k, (n, ns) in self.timers.items():
+            on, ons = other.timers.get(k, (0, 0))
+            timers[k] = (n - on, ns - ons)
+        return MetricsSnapshot({k: v for k, v in counters.items() if v},
+                               {k: v for k, v in timers.items() if v[0]})
+
+    def __bool__(self) -> bool:
+        return bool(self.counters or self.timers)
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON friendly form, timer totals in seconds."""
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "timers": {k: {"calls": n, "total_s": ns / 1e9}
+                       for k, (n, ns) in sorted(self.timers.items())},
+        }
+
+    def format(self) -> str:
+        lines: list[str] = []
+        for k, v in sorted(self.counters.items()):
+            lines.append(f"  {k:<40} {v:>12}")
+        for k, (n, ns) in sorted(self.timers.items()):
+            lines.append(f"  {k:<40} {n:>12} calls {ns / 1e9:>10.4f}s")
+        return "\n".join(lines)
+
+
+class _Timer:
+    """Context manager adding elapsed time to one timer."""
+
+    __slots__ = ["_metrics", "_name", "_start"]
+
+    def __init__(self, metrics: Metrics, name: str) -> None:
+        self._metrics = metrics
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_val: BaseException | None,
+                 exc_tb: TracebackType | None) -> None:
+        self._metrics.add_time(self._name, time.perf_counter_ns() - self._start)
+
+
+_NO_TIMER: AbstractContextManager[None] = nullcontext()
+
+
+class Metrics:
+    """Registry of named counters and timers. See module docstring."""
+
+    __slots__ = ["enabled", "_counters", "_timers"]
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._counters: dict[str, int] = {}
+        self._timers: dict[str, list[int]] = {}
+
+    def inc(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to a counter. Callers on hot paths guard with ``if METRICS.enabled``."""
+        if self.enabled:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def add_time(self, name: str, ns: int) -> None:
+        if self.enabled:
+            t = self._timers.get(name)
+            if t is None:
+                self._timers[name] = [1, ns]
+            else:
+                t[0] += 1
+                t[1] += ns
+
+    def timer(self, name: str) -> AbstractContextManager[None]:
+        """Time a block, no-op when disabled."""
+        if not self.enabled:
+            return _NO_TIMER
+        return _Timer(self, name)
+
+    def snapshot(self) -> MetricsSnapshot:
+        return MetricsSnapshot(dict(self._counters),
+                               {k: (v[0], v[1]) for k, v in self._timers.items()})
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._timers.clear()
+
+
+def _env_enabled() -> bool:
+    return os.environ.get("CUBE_METRICS", "").lower() in ("1", "true", "yes")
+
+
+# The process-wide registry
+METRICS = Metrics(enabled=_env_enabled())
@@ -1,11 +1,15 @@
 import time
 from contextlib import contextmanager
 
+from cube.utils.metrics import METRICS
+
 
 @contextmanager
 def w_prof(topic: str, prof=True):
+    """Time a block: recorded as timer ``prof.<topic>`` in METRICS (when
+    enabled) and printed if ``prof``."""
 
-    if not prof:
+    if not prof and not METRICS.enabled:
 
         yield None
 
@@ -15,4 +19,6 @@ def w_prof(topic: str, prof=True):
             yield None
         finally:
             end = time.time_ns()
-            print(f"Profiling: {topic}: {(end-start) / 1e9}")
\ No newline at end of file
+            METRICS.add_time(f"prof.{topic}", end - start)
+            if prof:
+                print(f"Profiling: {topic}: {(end-start) / 1e9}")
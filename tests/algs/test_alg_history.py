@@ -0,0 +1,263 @@
+"""Tests for the compact alg codec and the array-backed Operator history."""
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.application.commands.AlgHistory import AlgHistory
+from cube.domain.algs import Algs
+from cube.domain.algs import alg_codec
+from cube.domain.algs.HeadingAlg import HeadingAlg
+from cube.domain.algs.SimpleAlg import SimpleAlg
+
+
+_ENCODABLE = [
+    "R", "R'", "R2", "L", "U", "D", "F", "B",
+    "[2:3]R", "[2]R'", "[1:]L2", "[:3]U",
+    "[:]M", "[:]E'", "[:]S2", "[1:2]M", "[2]E",
+    "M", "E'", "S2",
+    "x", "y'", "z2",
+    "Rw", "3Rw'", "r", "4l2", "[:-1]Rw", "[:-1]d'",
+    "[1,3]E", "[2,4,7]M2", "[1,3]R'", "[22]R",
+]
+
+
+@pytest.mark.parametrize("alg_str", _ENCODABLE)
+def test_codec_round_trip(alg_str: str) -> None:
+    for alg in Algs.parse(alg_str).flatten():
+        code = alg_codec.encode(alg)
+        assert code is not None, f"{alg} should be encodable"
+        assert 0 <= code < 2 ** 31
+        decoded = alg_codec.decode(code)
+        assert type(decoded) is type(alg)
+        assert str(decoded) == str(alg)
+
+
+def test_codec_rejects_non_simple_forms() -> None:
+    assert alg_codec.encode(HeadingAlg("L1")) is None
+    assert alg_codec.encode(Algs.AN) is None
+    # other slice lists keep their exact form in the side table
+    assert alg_codec.encode(Algs.R[[1, alg_codec.MAX_LIST_INDEX + 1]]) is None
+
+
+def test_history_stack_semantics() -> None:
+    scramble = Algs.scramble(5, seed=7)
+    heading = HeadingAlg("Centers", "F")
+    algs = [Algs.R, heading, scramble, *Algs.parse("[2:3]R' U2 M x").flatten()]
+
+    h = AlgHistory(algs)
+    assert len(h) == len(algs)
+    assert h.side_count == 2
+
+    assert [str(a) for a in h] == [str(a) for a in algs]
+    assert [str(a) for a in reversed(h)] == [str(a) for a in reversed(algs)]
+    assert h[1] is heading
+    assert h[2] is scramble
+
+    snap = h.snapshot()
+    h.truncate(2)
+    assert len(h) == 2 and h.side_count == 1
+    h.restore(snap)
+    assert len(h) == len(algs) and h.side_count == 2
+
+    popped = [h.pop() for _ in range(len(algs))]
+    assert [str(a) for a in popped] == [str(a) for a in reversed(algs)]
+    assert not h
+    assert h.side_count == 0
+
+
+def test_history_view_is_bounded_and_live() -> None:
+    h = AlgHistory(Algs.parse("R U F L").flatten())
+    view = h.view(last=2)
+    assert [str(a) for a in view] == ["F", "L"]
+    assert [str(a) for a in reversed(view)] == ["L", "F"]
+    assert str(view[-1]) == "L"
+
+    h.append(Algs.D)
+    assert [str(a) for a in view] == ["L", "D"]
+    assert len(h.view()) == 5
+
+
+def test_operator_history_round_trip() -> None:
+    app = AbstractApp.create_app(cube_size=4)
+    op = app.op
+
+    moves: list[SimpleAlg] = [*Algs.parse("R [2]U' Rw2 [:]M x F").flatten()]
+    for m in moves:
+        op.play(m)
+
+    state = app.cube.cqr.get_sate()
+    assert [str(a) for a in op.history()] == [str(m) for m in moves]
+    assert len(op.history_view()) == len(moves)
+
+    while op.history_view():
+        op.undo(animation=False)
+    assert app.cube.solved
+    assert len(op.redo_queue_view()) == len(moves)
+
+    while op.redo_queue_view():
+        op.redo(animation=False)
+    assert app.cube.cqr.compare_state(state)
+    assert [str(a) for a in op.history()] == [str(m) for m in moves]
+
+
+def test_history_keeps_move_count() -> None:
+    algs = [*Algs.parse("R U2 [2:3]R' M x").flatten(), HeadingAlg("L1"), Algs.scramble(4, seed=3)]
+    h = AlgHistory(algs)
+    assert h.moves == sum(a.count() for a in algs)
+
+    snap = h.snapshot()
+    h.truncate(2)
+    assert h.moves == algs[0].count() + algs[1].count()
+    h.restore(snap)
+    h.pop()
+    assert h.moves == sum(a.count() for a in algs[:-1])
+    h.clear()
+    assert h.moves == 0
+
+
+def test_history_extend_left_shifts_side_table() -> None:
+    tail = [Algs.U, HeadingAlg("L3"), Algs.F]
+    head = [HeadingAlg("L1"), Algs.R, Algs.scramble(3, seed=1)]
+    h = AlgHistory(tail)
+    h.extend_left(head)
+    assert [str(a) for a in h] == [str(a) for a in head + tail]
+    assert h.side_count == 3
+    assert h.moves == sum(a.count() for a in head + tail)
+    assert h[4] is tail[1]
+
+
+def test_history_extend_left_keeps_main_store() -> None:
+    h = AlgHistory([Algs.U, HeadingAlg("L3"), Algs.F])
+    codes = h._codes
+    chunks = [[Algs.R, HeadingAlg(f"C{i}"), Algs.L] for i in range(50)]
+    for chunk in chunks:
+        h.extend_left(chunk)
+    # Far-end inserts do not rebuild the existing entries
+    assert h._codes is codes and len(codes) == 3
+
+    expected = [*(a for c in reversed(chunks) for a in c), Algs.U, HeadingAlg("L3"), Algs.F]
+    assert [str(a) for a in h] == [str(a) for a in expected]
+    assert [str(a) for a in reversed(h)] == [str(a) for a in reversed(expected)]
+    assert [str(h[i]) for i in range(-len(h), len(h))] == [str(a) for a in expected * 2]
+    assert len(h) == len(expected) and h.side_count == 51
+    assert h.moves == sum(a.count() for a in expected)
+
+    popped = [h.pop() for _ in range(5)]
+    assert [str(a) for a in popped] == [str(a) for a in reversed(expected[-5:])]
+    assert str(h.peek()) == str(expected[-6])
+    h.truncate(4)
+    assert [str(a) for a in h] == [str(a) for a in expected[:4]]
+    assert h.moves == sum(a.count() for a in expected[:4])
+
+    snap = h.snapshot()
+    h.extend_left([Algs.D])
+    h.restore(snap)
+    assert [str(a) for a in h] == [str(a) for a in expected[:4]]
+
+
+def test_history_truncate_left() -> None:
+    h = AlgHistory([Algs.U, HeadingAlg("L3"), Algs.F, HeadingAlg("L4"), Algs.D])
+    h.extend_left([Algs.R, HeadingAlg("C1")])
+    h.extend_left([HeadingAlg("C0"), Algs.L])
+    expected = [HeadingAlg("C0"), Algs.L, Algs.R, HeadingAlg("C1"),
+                Algs.U, HeadingAlg("L3"), Algs.F, HeadingAlg("L4"), Algs.D]
+
+    for length in (8, 6, 4, 1, 0):
+        h.truncate_left(length)
+        expected = expected[len(expected) - length:]
+        assert [str(a) for a in h] == [str(a) for a in expected]
+        assert h.moves == sum(a.count() for a in expected)
+        assert h.side_count == sum(1 for a in expected if isinstance(a, HeadingAlg))
+        if expected:
+            assert str(h.peek()) == str(expected[-1])
+
+
+def test_operator_truncate_redo_keeps_the_next_moves() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    op = app.op
+    op.enqueue_redo([*Algs.parse("R U").flatten()])
+    op.extend_redo([*Algs.parse("F L D").flatten()])
+    op.redo(animation=False)
+    op.truncate_redo(1)
+    assert [str(a) for a in reversed(op.redo_queue_view())] == ["U"]
+
+
+def test_operator_redo_queue_flattens_in_play_order() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    op = app.op
+    op.enqueue_redo([Algs.parse("R U F")])
+    op.extend_redo([Algs.parse("L D"), Algs.B])
+    assert [str(a) for a in reversed(op.redo_queue_view())] == ["R", "U", "F", "L", "D", "B"]
+
+
+def test_operator_extend_redo_and_play_listener() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    op = app.op
+    op.enqueue_redo([*Algs.parse("R U").flatten()])
+    op.extend_redo([*Algs.parse("F L").flatten()])
+
+    played: list[str] = []
+    with op.with_play_listener(lambda a: played.append(str(a))):
+        while op.redo_queue_view():
+            op.redo(animation=False)  # redo is not reported
+        assert [str(a) for a in op.history()] == ["R", "U", "F", "L"]
+
+        with op.with_query_restore_state():
+            op.play(Algs.D)
+        op.play(HeadingAlg("L1"))
+        op.play(Algs.B)
+        op.undo(animation=False)
+
+    assert played == [str(HeadingAlg("L1")), "B"]
+
+
+def test_operator_undo_n_and_rollback_to() -> None:
+    app = AbstractApp.create_app(cube_size=4)
+    op = app.op
+    op.play(Algs.parse("R U"))
+    mark = len(op.history_view())
+    state = app.cube.cqr.get_sate()
+
+    played = [*Algs.parse("F [2]R' x").flatten(), HeadingAlg("L1"), Algs.parse("D B2")]
+    for a in played:
+        op.play(a)
+    # The sequence is recorded one move per entry
+    entries = [*played[:-1], *played[-1].flatten()]
+
+    assert [str(a) for a in op.undo_n(2)] == [str(a) for a in entries[-2:]]
+    assert [str(a) for a in op.rollback_to(mark)] == [str(a) for a in entries[:-2]]
+    assert app.cube.cqr.compare_state(state)
+    assert op.count == 2
+    assert op.undo_n(0) == []
+
+    # Same redo queue as undoing one by one
+    while op.redo_queue_view():
+        op.redo(animation=False)
+    assert [str(a) for a in op.history()][mark:] == [str(a) for a in entries]
+    assert op.undo_n(100) != [] and app.cube.solved and not op.history_view()
+
+
+def test_history_flattens_played_sequences() -> None:
+    h = AlgHistory([Algs.parse("[R U]2"), Algs.R.prime * 3, Algs.parse("[1,3]E'"), Algs.R * 4])
+    assert [str(a) for a in h] == ["R", "U", "R", "U", "R", "[1,3]E'"]
+    assert h.side_count == 0
+    assert h.moves == 6
+
+
+@pytest.mark.parametrize("solver, size", [("CFOP", 5), ("LBL_BIG", 7), ("CAGE", 5)])
+def test_history_after_solve_is_compact(solver: str, size: int) -> None:
+    from cube.domain.solver import Solvers
+    from cube.domain.solver.SolverName import SolverName
+
+    app = AbstractApp.create_app(cube_size=size)
+    app.config.solver_debug = False
+    app.scramble(1, None, animation=False, verbose=False)
+    Solvers.by_name(SolverName[solver], app.op).solve(animation=False)
+    assert app.cube.solved
+
+    history = app.op._history
+    side = history._side
+    # Only headings and the scramble are kept as objects
+    assert all(isinstance(a, HeadingAlg) or Algs.is_scramble(a) for a in side)
+    n_headings = sum(isinstance(a, HeadingAlg) for a in side)
+    assert history.side_count == n_headings + 1
+    assert len(history) > 5 * history.side_count
@@ -0,0 +1,53 @@
+"""Tests for the buffered operation log (OperationLog)."""
+from pathlib import Path
+
+from cube.application.AbstractApp import AbstractApp
+from cube.application.commands.OperationLog import OperationLog, read_moves
+from cube.domain.algs import Algs
+from cube.domain.algs.HeadingAlg import HeadingAlg
+from cube.domain.model.Cube import Cube
+from tests.test_utils import _test_sp
+
+
+def test_log_is_buffered_until_flush(tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "op.log"
+    log = OperationLog(str(path), flush_interval=60)
+
+    log.write("Operator", Algs.R)
+    log.write("Operator", Algs.parse("U F'"))
+    assert not path.exists()
+
+    log.flush()
+    assert path.read_text().splitlines() == ["Operator R", "Operator [U F']"]
+
+
+def test_binary_stream_replays_the_moves(tmp_path: Path) -> None:
+    bin_path = tmp_path / "op.bin"
+    log = OperationLog(str(tmp_path / "op.log"), str(bin_path), flush_interval=60)
+
+    moves = Algs.parse("R [2:3]U' Rw2 x") + Algs.F[[1, 3]] + HeadingAlg("L1") + Algs.scramble(5, 4)
+    log.write("Operator", moves)
+    log.flush()
+
+    expected = Cube(5, sp=_test_sp)
+    moves.play(expected)
+    replayed = Cube(5, sp=_test_sp)
+    for alg in read_moves(str(bin_path)):
+        alg.play(replayed)
+
+    assert replayed.get_facelets() == expected.get_facelets()
+
+
+def test_operator_logs_through_the_writer(tmp_path: Path) -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    path = tmp_path / "operation.log"
+    app.config._data.operation_log = True  # type: ignore[attr-defined]
+    app.config._data.operation_log_path = str(path)  # type: ignore[attr-defined]
+    app.config._data.operation_log_flush_lines = 2  # type: ignore[attr-defined]
+
+    op = app.op.__class__(app.cube, app.vs)
+    for alg in Algs.parse("R U R'").flatten():
+        op.play(alg)
+    OperationLog.flush_all()
+
+    assert path.read_text().splitlines() == ["Operator R", "Operator U", "Operator R'"]
@@ -0,0 +1,124 @@
+"""Tests for the commutation-aware optimizer (Alg.optimize)."""
+import random
+
+import pytest
+
+from cube.domain.algs import Alg, Algs
+from cube.domain.model.Cube import Cube
+from tests.test_utils import _test_sp
+
+
+def _assert_same_effect(cube_size: int, alg1: Alg, alg2: Alg) -> None:
+    cube = Cube(cube_size, sp=_test_sp)
+    scramble = Algs.scramble(cube_size, "1")
+
+    scramble.play(cube)
+    alg1.play(cube)
+    s1 = cube.cqr.get_sate()
+
+    cube.reset()
+    scramble.play(cube)
+    alg2.play(cube)
+
+    assert cube.cqr.compare_state(s1)
+
+
+@pytest.mark.parametrize("alg_str, expected", [
+    ("R L R'", "L"),
+    ("U D U D'", "U2"),
+    ("F B F B F B F B", "[]"),
+    ("R M x R' M' x'", "[]"),
+    ("R U R' U'", "[R U R' U']"),
+    ("Rw L Rw'", "L"),
+])
+def test_optimize_cancels_commuting_moves(alg_str: str, expected: str) -> None:
+    alg = Algs.parse(alg_str)
+    optimized = alg.optimize()
+
+    assert str(optimized) == expected
+    _assert_same_effect(4, alg, optimized)
+
+
+def test_optimize_keeps_annotations_as_barriers() -> None:
+    alg = Algs.R + Algs.AN + Algs.L + Algs.R.prime
+    # R and R' commute with L, but not across the annotation
+    assert alg.optimize().count() == 3
+
+
+def test_optimize_merges_disjoint_slices_across_run() -> None:
+    alg = Algs.R[2:2] + Algs.L + Algs.R[3:3]
+    optimized = alg.optimize()
+
+    assert optimized.count() == 2
+    _assert_same_effect(6, alg, optimized)
+
+
+@pytest.mark.parametrize("cube_size", [3, 4, 5])
+def test_optimize_random_sequences(cube_size: int) -> None:
+    rnd = random.Random(cube_size)
+    faces = [Algs.R, Algs.L, Algs.U, Algs.D, Algs.F, Algs.B, Algs.M, Algs.X]
+    for _ in range(8):
+        # Few axes, long same-axis runs
+        alg = Algs.seq_alg(None, *(rnd.choice(faces) * rnd.randint(1, 3) for _ in range(30)))
+        optimized = alg.optimize()
+
+        assert optimized.count() <= alg.simplify().count()
+        _assert_same_effect(cube_size, alg, optimized)
+
+
+def test_optimize_window_drops_identity_subsequences() -> None:
+    cube = Cube(4, sp=_test_sp)
+    alg = Algs.parse("F R U R' U' U R U' R' B")
+
+    assert Algs.parse("F R U R' U' U R U' R' B").optimize().count() == 2
+    assert str(Algs.parse("F R U F F' U' R' B").optimize(window=8, cube=cube)) == "[F B]"
+    _assert_same_effect(4, alg, alg.optimize(window=8, cube=cube))
+
+
+@pytest.mark.parametrize("cube_size", [3, 4])
+def test_optimize_window_random_sequences(cube_size: int) -> None:
+    cube = Cube(cube_size, sp=_test_sp)
+    rnd = random.Random(100 + cube_size)
+    moves = [Algs.R, Algs.U, Algs.F, Algs.R.prime, Algs.U.prime, Algs.F.prime]
+    for _ in range(5):
+        alg = Algs.seq_alg(None, *(rnd.choice(moves) for _ in range(40)))
+        optimized = alg.optimize(window=6, cube=cube)
+
+        assert optimized.count() <= alg.optimize().count()
+        _assert_same_effect(cube_size, alg, optimized)
+
+
+
+def test_optimize_window_from_several_threads() -> None:
+    import sys
+    import threading
+
+    from cube.domain.algs import optimizer
+
+    cube = Cube(7, sp=_test_sp)
+    rnd = random.Random(7)
+    # Each thread its own slice moves, so all of them play on the scratch cube
+    algs = []
+    for i in range(1, 7):
+        moves = [Algs.R[i:i], Algs.U[i:i], Algs.F[i:i], Algs.R[1:i], Algs.U[i:6], Algs.F.prime]
+        algs.append(Algs.seq_alg(None, *(rnd.choice(moves) * rnd.randint(1, 3) for _ in range(30))))
+    expected = [str(a.optimize(window=4, cube=cube)) for a in algs]
+
+    results: dict[int, str] = {}
+
+    def run(i: int) -> None:
+        results[i] = str(algs[i].optimize(window=4, cube=cube))
+
+    optimizer._PERMUTATIONS.pop(7, None)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(algs))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert [results[i] for i in range(len(algs))] == expected
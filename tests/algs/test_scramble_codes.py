@@ -0,0 +1,45 @@
+"""Tests for compact scramble codes and batched scramble application."""
+import pytest
+
+from cube.domain.algs import Algs
+from cube.domain.algs.Scramble import apply_scramble_codes
+from cube.domain.model.Cube import Cube
+from tests.test_utils import _test_sp
+
+
+@pytest.mark.parametrize("cube_size", [3, 4, 7])
+def test_codes_give_the_scramble_state(cube_size: int) -> None:
+    cube = Cube(cube_size, sp=_test_sp)
+    Algs.scramble(cube_size, 17).play(cube)
+
+    coded = Cube(cube_size, sp=_test_sp)
+    apply_scramble_codes(coded, Algs.scramble_codes(cube_size, 17))
+
+    assert coded.get_facelets() == cube.get_facelets()
+    coded.sanity(force_check=True)
+
+
+def test_codes_are_repeatable() -> None:
+    codes = Algs.scramble_codes(6, "abc")
+
+    assert codes == Algs.scramble_codes(6, "abc")
+    assert codes != Algs.scramble_codes(6, "abd")
+
+
+@pytest.mark.parametrize("cube_size", [3, 5, 8])
+def test_batch_rotations_matches_plain_play(cube_size: int) -> None:
+    alg = Algs.scramble(cube_size, 23)
+
+    cube = Cube(cube_size, sp=_test_sp)
+    alg.play(cube)
+
+    batched = Cube(cube_size, sp=_test_sp)
+    with batched.batch_rotations():
+        with batched.batch_rotations():
+            alg.play(batched)
+
+    assert batched.get_facelets() == cube.get_facelets()
+    # Part ids are valid again after the batch
+    assert [p.position_id for p in batched.edges] == [p.position_id for p in cube.edges]
+    assert [p.colors_id for p in batched.corners] == [p.colors_id for p in cube.corners]
+    assert batched.is3x3 == cube.is3x3
@@ -0,0 +1,83 @@
+"""Tests for ModernGLBoard's preallocated vertex buffers, headless (no GL context needed)."""
+import numpy as np
+import pytest
+
+pyglet = pytest.importorskip("pyglet")
+# Importing the pyglet2 package must not open a window
+pyglet.options["shadow_window"] = False
+
+from cube.application.AbstractApp import AbstractApp  # noqa: E402
+from cube.domain.algs import Algs  # noqa: E402
+from cube.domain.model.FaceName import FaceName  # noqa: E402
+from cube.presentation.gui.backends.pyglet2._modern_gl_board import ModernGLBoard  # noqa: E402
+
+
+def _set_shadow(app: AbstractApp, face: FaceName, on: bool) -> None:
+    if app.vs.get_draw_shadows_mode(face) != on:
+        app.vs.toggle_shadows_mode(face)  # type: ignore[arg-type]
+
+
+def _cell_geometry(board: ModernGLBoard, animated_parts=None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(faces, lines, animated faces, animated lines) generated cell by cell."""
+    faces: list[float] = []
+    lines: list[float] = []
+    animated_faces: list[float] = []
+    animated_lines: list[float] = []
+    for gl_face in board.faces.values():
+        for cell in gl_face.cells:
+            animated = animated_parts is not None and cell.part_slice in animated_parts
+            cell.generate_face_vertices(animated_faces if animated else faces)
+            cell.generate_line_vertices(animated_lines if animated else lines)
+    for gl_face in board._shadow_faces.values():
+        for cell in gl_face.cells:
+            cell.generate_face_vertices(faces)
+            cell.generate_line_vertices(lines)
+    return tuple(np.array(v, dtype=np.float32) for v in (faces, lines, animated_faces, animated_lines))  # type: ignore[return-value]
+
+
+@pytest.mark.parametrize("cube_size", [3, 5])
+def test_buffers_match_cell_vertices_after_moves(cube_size: int) -> None:
+    app = AbstractApp.create_app(cube_size=cube_size)
+    _set_shadow(app, FaceName.L, True)
+    board = ModernGLBoard(app.cube, app.vs)
+
+    for alg in [None, Algs.R, Algs.scramble(cube_size, 3)]:
+        if alg is not None:
+            app.op.play(alg)
+        board.update()
+        faces, lines, animated_faces, animated_lines, _, _ = board.generate_geometry()
+
+        expected_faces, expected_lines, _, _ = _cell_geometry(board)
+        np.testing.assert_array_equal(faces, expected_faces)
+        np.testing.assert_array_equal(lines, expected_lines)
+        assert animated_faces is None and animated_lines is None
+
+
+def test_animated_split_is_a_mask() -> None:
+    app = AbstractApp.create_app(cube_size=4)
+    board = ModernGLBoard(app.cube, app.vs)
+    app.op.play(Algs.scramble(4, 5))
+    board.update()
+
+    _, parts = Algs.U.get_animation_objects(app.cube)
+    animated_parts = set(parts)
+    faces, lines, animated_faces, animated_lines, _, _ = board.generate_geometry(animated_parts)
+
+    expected = _cell_geometry(board, animated_parts)
+    for actual, wanted in zip((faces, lines, animated_faces, animated_lines), expected):
+        np.testing.assert_array_equal(actual, wanted)
+
+
+def test_shadow_mode_change_rebuilds_buffers() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    _set_shadow(app, FaceName.B, False)
+    board = ModernGLBoard(app.cube, app.vs)
+    board.update()
+    n_before = len(board.generate_geometry()[0])
+
+    _set_shadow(app, FaceName.B, True)
+    board.update()
+    faces = board.generate_geometry()[0]
+
+    assert len(faces) == n_before + 9 * 6 * 9
+    np.testing.assert_array_equal(faces, _cell_geometry(board)[0])
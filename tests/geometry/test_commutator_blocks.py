@@ -1234,3 +1234,78 @@ class TestDimensionLimitedSearch:
             # End position within 2 rows/cols of start
             assert rc2[0] <= rc1[0] + 1, f"Block {block} height exceeds 2"
             assert rc2[1] <= rc1[1] + 1, f"Block {block} width exceeds 2"
+
+
+# =============================================================================
+# Batch Commutator Tests
+# =============================================================================
+
+class TestBatchCommutator:
+    """Several disjoint blocks moved by one commutator."""
+
+    @staticmethod
+    def _batch_candidates(helper: CommutatorHelper, source: Face, target: Face,
+                          src_rot: int) -> list[list[tuple[Block, Block]]]:
+        n = helper.n_slices
+        cells = [Point(r, c) for r in range(n) for c in range(n) if not helper.cube.cqr.is_center_in_odd((r, c))]
+        candidates = []
+        for i, t1 in enumerate(cells):
+            for t2 in cells[i + 1:]:
+                pairs = []
+                for t in (t1, t2):
+                    target_block = Block(t, t)
+                    natural = helper.execute_commutator(source, target, target_block, dry_run=True).natural_source_block
+                    pairs.append((natural.rotate_clockwise(n, src_rot), target_block))
+                candidates.append(pairs)
+        return candidates
+
+    @pytest.mark.parametrize("cube_size", [6, 7])
+    @pytest.mark.parametrize("pair", SUPPORTED_PAIRS[:6], ids=_face_pair_id)
+    @pytest.mark.parametrize("src_rot", [0, 1])
+    def test_batch_equals_sequential(self, cube_size: int, pair: tuple[FaceName, FaceName], src_rot: int):
+        source_name, target_name = pair
+        batch_app = create_app(cube_size)
+        seq_app = create_app(cube_size)
+        for app in (batch_app, seq_app):
+            app.op.play(Algs.scramble(cube_size, 11))
+
+        batch_helper = get_new_comm_helper(batch_app)
+        seq_helper = get_new_comm_helper(seq_app)
+        batch_cube = batch_app.cube
+        seq_cube = seq_app.cube
+
+        source, target = batch_cube.face(source_name), batch_cube.face(target_name)
+        candidates = self._batch_candidates(batch_helper, source, target, src_rot)
+        batches = [c for c in candidates if batch_helper.can_batch(source, target, c)]
+        assert batches, "expected some compatible pairs of cells"
+        assert len(batches) < len(candidates)
+
+        for batch in batches[:8]:
+            result = batch_helper.execute_commutator_batch(source, target, batch)
+            for source_block, target_block in batch:
+                seq_helper.execute_commutator(seq_cube.face(source_name), seq_cube.face(target_name),
+                                              target_block, source_block)
+
+            assert batch_cube.get_facelets() == seq_cube.get_facelets(), f"{batch} {result.algorithm}"
+            assert [r.target_block for r in result.results] == [t for _, t in batch]
+
+        stats = batch_helper.get_block_statistics().get_summary_stats()
+        assert stats == seq_helper.get_block_statistics().get_summary_stats()
+
+    def test_crossing_blocks_are_rejected(self):
+        app = create_app(7)
+        helper = get_new_comm_helper(app)
+        source, target = app.cube.up, app.cube.front
+
+        def _pair(t: Point) -> tuple[Block, Block]:
+            block = Block(t, t)
+            return helper.execute_commutator(source, target, block, dry_run=True).natural_source_block, block
+
+        # Columns {0, 1} x rows {0, 1} would also move (0, 1) and (1, 0)
+        crossing = [_pair(Point(0, 0)), _pair(Point(1, 1))]
+        assert not helper.can_batch(source, target, crossing)
+        with pytest.raises(ValueError):
+            helper.execute_commutator_batch(source, target, crossing)
+
+        # Same block twice
+        assert not helper.can_batch(source, target, [_pair(Point(0, 0))] * 2)
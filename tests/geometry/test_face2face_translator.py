@@ -396,3 +396,48 @@ class TestSliceMovementPrediction:
                     f"  expected marker: {expected_marker}\n"
                     f"  actual marker: {actual_marker}"
                 )
+
+
+# =============================================================================
+# Per-size lookup tables
+# =============================================================================
+
+@pytest.mark.parametrize("cube_size", [3, 4, 7])
+def test_tables_match_walking_info(cube_size: int) -> None:
+    """The cached index maps agree with the walking-info computation, point by point."""
+    cube = Cube(cube_size, sp=_test_sp)
+    n_slices = cube.n_slices
+    sized_layout = cube.sized_layout
+
+    for target_name, source_name in FACE_PAIRS:
+        target_face = cube.face(target_name)
+        source_face = cube.face(source_name)
+        for coord in product(range(n_slices), repeat=2):
+            for result in Face2FaceTranslator.translate_source_from_target(target_face, source_face, coord):
+                slice_result = result.slice_algorithm
+                slice_name = slice_result.whole_slice_alg.slice_name
+                walk_info = sized_layout.create_walking_info(slice_name)
+
+                assert slice_result.source_coord == walk_info.translate_point(target_face, source_face, coord)
+                assert slice_result.on_slice == sized_layout.get_slice(slice_name).compute_slice_index(
+                    target_name, coord, n_slices)
+
+                assert Face2FaceTranslator.translate_target_from_source(
+                    target_face, source_face, coord, slice_name) == slice_result.source_coord
+
+
+def test_tables_are_shared_per_size_and_translate_blocks() -> None:
+    cube1 = Cube(6, sp=_test_sp)
+    cube2 = Cube(6, sp=_test_sp)
+
+    map1 = Face2FaceTranslator.center_map(cube1, FaceName.F, FaceName.U, SliceName.M)
+    assert Face2FaceTranslator.center_map(cube2, FaceName.F, FaceName.U, SliceName.M) is map1
+    assert map1.shape == (4, 4, 2)
+
+    points = [(0, 0), (1, 3), (3, 2)]
+    assert Face2FaceTranslator.translate_points_target_from_source(
+        cube2.front, cube2.up, points, SliceName.M
+    ) == [Face2FaceTranslator.translate_target_from_source(cube2.front, cube2.up, p, SliceName.M) for p in points]
+
+    with pytest.raises(ValueError):
+        Face2FaceTranslator.translate_target_from_source(cube2.front, cube2.up, (4, 0), SliceName.M)
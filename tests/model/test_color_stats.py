@@ -0,0 +1,52 @@
+"""Tests for the live color counters behind Cube.solved / is3x3."""
+import random
+
+import pytest
+
+from cube.domain.model.Cube import Cube
+from cube.domain.model.SliceName import SliceName
+from tests.test_utils import TestServiceProvider
+
+_sp = TestServiceProvider()
+
+
+def _brute_is3x3(cube: Cube) -> bool:
+    for e in cube.edges:
+        colors = {(s.e1.color, s.e2.color) for s in e.all_slices}
+        if len(colors) > 1:
+            return False
+    for c in cube.centers:
+        if len({s.color for s in c.all_slices}) > 1:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5, 6])
+def test_counters_follow_rotations(size: int) -> None:
+    cube = Cube(size=size, sp=_sp)
+    assert cube.solved
+
+    rnd = random.Random(size)
+    for _ in range(60):
+        if rnd.random() < 0.5 or cube.n_slices == 0:
+            rnd.choice(list(cube.faces)).rotate(rnd.choice([1, -1, 2]))
+        else:
+            cube.rotate_slice(rnd.choice(list(SliceName)), 1, [rnd.randrange(cube.n_slices)])
+
+        assert cube.is3x3 == (_brute_is3x3(cube) and cube.match_original_scheme)
+        for e in cube.edges:
+            if e.n_slices:
+                assert e.is3x3 == (len({(s.e1.color, s.e2.color) for s in e.all_slices}) == 1)
+
+    cube.color_stats.verify()
+
+
+def test_direct_color_write_is_picked_up_after_modified() -> None:
+    cube = Cube(size=4, sp=_sp)
+    center = cube.front.center
+    center.get_center_slice((0, 0)).edge._color = cube.right.color
+    cube.modified()
+
+    assert not center.is3x3
+    assert not cube.is3x3
+    assert not cube.solved
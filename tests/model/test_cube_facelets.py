@@ -0,0 +1,55 @@
+"""Tests for Cube.get_facelets / set_facelets."""
+import random
+
+import pytest
+
+from cube.domain.exceptions import InternalSWError
+from cube.domain.model.Cube import Cube
+from cube.domain.model.SliceName import SliceName
+from tests.test_utils import TestServiceProvider
+
+_sp = TestServiceProvider()
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5])
+def test_facelets_round_trip(size: int) -> None:
+    cube = Cube(size=size, sp=_sp)
+    rnd = random.Random(size)
+    for _ in range(40):
+        cube.face(rnd.choice(list(cube._faces))).rotate(rnd.randint(1, 3))
+        if size > 2:
+            cube.get_slice(rnd.choice(list(SliceName))).rotate(1)
+
+    facelets = cube.get_facelets()
+    assert len(facelets) == 6 * size * size
+
+    other = Cube(size=size, sp=_sp)
+    other.set_facelets(facelets)
+    assert other.get_facelets() == facelets
+    assert other.is_sanity(force_check=True)
+    assert other.solved == cube.solved
+    for f in cube.faces:
+        assert other.face(f.name).color == f.color
+
+
+def test_facelets_size_mismatch() -> None:
+    with pytest.raises(InternalSWError):
+        Cube(size=3, sp=_sp).set_facelets(Cube(size=4, sp=_sp).get_facelets())
+
+
+def test_facelets_overwrite_used_cube() -> None:
+    """Cached colors ids of the previous state must not survive set_facelets."""
+    cube = Cube(size=3, sp=_sp)
+    solved = cube.get_facelets()
+    cube.front.rotate(1)
+    cube.right.rotate(1)
+    scrambled = cube.get_facelets()
+    assert cube.is_sanity(force_check=True)  # populates the caches
+
+    cube.set_facelets(solved)
+    assert cube.is_sanity(force_check=True)
+    assert cube.solved
+
+    cube.set_facelets(scrambled)
+    assert cube.is_sanity(force_check=True)
+    assert not cube.solved
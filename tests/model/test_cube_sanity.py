@@ -6,10 +6,13 @@ particularly wrong color distributions.
 
 import pytest
 
+from cube.domain.exceptions import InternalSWError
+
 from cube.domain.model.Cube import Cube
 from cube.domain.model.Cube3x3Colors import Cube3x3Colors, EdgeColors, CornerColors
 from cube.domain.model.Color import Color
 from cube.domain.model.FaceName import FaceName
+from cube.domain.model.SliceName import SliceName
 from cube.domain.model._part import EdgeName, CornerName
 from tests.test_utils import TestServiceProvider
 
@@ -151,3 +154,53 @@ class TestCubeSanityForceCheck:
         result = cube.is_sanity(force_check=True)
         assert isinstance(result, bool)
         assert result is True
+
+
+class TestIncrementalSanity:
+    """Incremental mode re-checks only orbits touched by the last rotations."""
+
+    @staticmethod
+    def _cube(size: int, full_every: int = 0) -> Cube:
+        sp = TestServiceProvider()
+        sp.config.check_cube_sanity = True
+        sp.config.check_cube_sanity_incremental = True
+        sp.config._data.check_cube_sanity_full_every = full_every  # type: ignore[attr-defined]
+        cube = Cube(size=size, sp=sp)
+        cube.front.rotate(1)  # first check after creation is a full one
+        return cube
+
+    @staticmethod
+    def _corrupt_center(cube: Cube, rc: tuple[int, int]) -> None:
+        # bypasses modified(), like a buggy rotation would
+        cube.front.center.get_center_slice(rc).edge._color = cube.right.color
+
+    def test_passes_on_random_moves(self) -> None:
+        cube = self._cube(6)
+        for face in cube.faces:
+            face.rotate(1)
+        for name in SliceName:
+            cube.rotate_slice(name, 1, [1])
+            cube.rotate_slice(name, -1)
+        cube.x_rotate(1)
+        cube.sanity()
+        assert cube.is_sanity(force_check=True)
+
+    def test_detects_corruption_in_touched_orbit(self) -> None:
+        cube = self._cube(5)
+        # middle M slice (index 1 of the 3x3 center grid) rotates column 1 of F
+        self._corrupt_center(cube, (0, 1))
+        with pytest.raises(InternalSWError, match="CENTER pieces"):
+            cube.rotate_slice(SliceName.M, 1, [1])
+
+    def test_untouched_orbit_is_left_to_full_check(self) -> None:
+        cube = self._cube(5)
+        self._corrupt_center(cube, (0, 0))
+        cube.rotate_slice(SliceName.M, 1, [1])  # orbits of column 1 only
+        assert not cube.is_sanity(force_check=True)
+
+    def test_periodic_full_check(self) -> None:
+        cube = self._cube(5, full_every=2)
+        self._corrupt_center(cube, (0, 0))
+        with pytest.raises(InternalSWError, match="CENTER pieces"):
+            for _ in range(3):
+                cube.rotate_slice(SliceName.M, 1, [1])
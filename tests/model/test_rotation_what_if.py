@@ -0,0 +1,53 @@
+"""Tests for the non-mutating rotation what-if evaluator (cube.cqr.what_if)."""
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.domain.algs import Alg, Algs
+from cube.domain.model.FaceName import FaceName
+from cube.domain.model.SliceName import SliceName
+
+
+def _algs(n_slices: int) -> list[Alg]:
+    algs: list[Alg] = [Algs.of_face(f) * n for f in FaceName for n in (1, 2, 3)]
+    algs += [Algs.of_slice(s)[i] * n for s in SliceName for i in range(1, n_slices + 1) for n in (1, -1)]
+    algs += [Algs.of_slice(s) for s in SliceName]
+    if n_slices > 1:
+        algs += [Algs.parse("[2]R'"), Algs.parse("[2:3]U")]
+    return algs
+
+
+@pytest.mark.parametrize("size", [3, 4, 5])
+def test_colors_match_played_rotations(size: int) -> None:
+    app = AbstractApp.create_app(cube_size=size)
+    app.op.play(Algs.scramble(size, seed=size))
+    cube = app.cube
+    stickers = [pe for p in cube.get_all_part_slices() for pe in p.edges]
+    pieces = list(cube.get_all_part_slices())
+    # scores compare against the face colors before the rotation
+    face_colors = {f.name: f.color for f in cube.faces}
+
+    for alg in _algs(cube.n_slices):
+        what_if = cube.cqr.what_if(alg)
+        predicted = [[what_if.color_after(pe, k) for pe in stickers] for k in range(4)]
+        scores = what_if.scores(pieces)
+
+        for k in range(4):
+            with app.op.with_query_restore_state():
+                for _ in range(k):
+                    app.op.play(alg)
+                assert [pe.color for pe in stickers] == predicted[k], f"{alg} x{k}"
+                n_match = sum(1 for p in pieces
+                              if all(pe.color == face_colors[pe.face.name] for pe in p.edges))
+                assert n_match == scores[k], f"{alg} x{k}"
+
+
+def test_evaluator_does_not_modify_cube() -> None:
+    app = AbstractApp.create_app(cube_size=4)
+    app.op.play(Algs.scramble(4, seed=1))
+    counter = app.cube._modify_counter
+    history = len(app.op.history_view())
+
+    app.cube.cqr.what_if(Algs.of_slice(SliceName.E)[2]).scores(app.cube.get_all_part_slices())
+
+    assert app.cube._modify_counter == counter
+    assert len(app.op.history_view()) == history
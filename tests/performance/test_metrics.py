@@ -0,0 +1,81 @@
+"""Tests for the hot-path metrics registry (cube.utils.metrics)."""
+from collections.abc import Iterator
+
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.domain.algs import Algs
+from cube.utils.metrics import METRICS, Metrics
+
+
+@pytest.fixture
+def metrics_on() -> Iterator[None]:
+    was = METRICS.enabled
+    METRICS.enabled = True
+    try:
+        yield
+    finally:
+        METRICS.enabled = was
+
+
+def test_disabled_registry_records_nothing() -> None:
+    m = Metrics(enabled=False)
+    m.inc("a")
+    with m.timer("t"):
+        pass
+    assert not m.snapshot()
+
+
+def test_snapshot_delta() -> None:
+    m = Metrics(enabled=True)
+    m.inc("a", 3)
+    with m.timer("t"):
+        pass
+    before = m.snapshot()
+    m.inc("a")
+    m.inc("b", 2)
+
+    delta = m.snapshot() - before
+    assert delta.counters == {"a": 1, "b": 2}
+    assert delta.timers == {}
+    assert "t" in m.snapshot().to_dict()["timers"]  # type: ignore[operator]
+
+
+def test_solve_reports_metrics(metrics_on: None) -> None:
+    app = AbstractApp.create_app(cube_size=4)
+    app.op.play(Algs.scramble(4, seed=1))
+
+    result = app.slv.solve(animation=False)
+
+    assert app.cube.solved
+    metrics = result.metrics
+    assert metrics is not None
+    assert metrics.counters["face.quarter_turns"] > 0
+    assert metrics.counters["model.4cycles"] > 0
+    assert metrics.counters["tracker.holders"] > 0
+    assert metrics.timers["operator.play"][0] > 0
+
+
+def test_solve_without_metrics() -> None:
+    was = METRICS.enabled
+    METRICS.enabled = False
+    try:
+        app = AbstractApp.create_app(cube_size=3)
+        app.op.play(Algs.scramble(3, seed=1))
+        assert app.slv.solve(animation=False).metrics is None
+    finally:
+        METRICS.enabled = was
+
+
+def test_disabled_metrics_create_no_timers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(METRICS, "enabled", False)
+    timers: list[str] = []
+    real_timer = Metrics.timer
+    monkeypatch.setattr(Metrics, "timer", lambda self, name: timers.append(name) or real_timer(self, name))
+
+    app = AbstractApp.create_app(cube_size=3)
+    app.op.play(Algs.scramble(3, seed=1))
+    app.slv.solve(animation=False)
+
+    assert app.cube.solved
+    assert timers == []
@@ -0,0 +1,65 @@
+"""Tests for best-of-N solving (Solvers.best_of)."""
+from __future__ import annotations
+
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.domain.model.Color import Color
+from cube.domain.solver import Solvers
+from cube.domain.solver.BestOfN import candidates
+from cube.domain.solver.SolverName import SolverName
+
+
+def _scrambled(size: int, seed: int) -> AbstractApp:
+    app = AbstractApp.create_app(cube_size=size)
+    app.scramble(seed, None, animation=False, verbose=False)
+    return app
+
+
+def test_candidates_start_with_the_plain_solve() -> None:
+    colors = [Color.YELLOW, Color.WHITE, Color.RED]
+
+    assert [c.name for c in candidates(colors, 5)] == ["YELLOW", "WHITE", "RED", "YELLOW y", "WHITE y"]
+    assert [c.name for c in candidates(colors, 0)] == ["YELLOW"]
+
+
+@pytest.mark.parametrize("solver, size", [(SolverName.LBL, 3), (SolverName.CFOP, 4)])
+def test_best_of_in_process(solver: SolverName, size: int) -> None:
+    app = _scrambled(size, 3)
+    facelets = app.cube.get_facelets()
+
+    solution, results = Solvers.best_of(app.op, solver, n=4, workers=0)
+
+    # The cube is not changed
+    assert app.cube.get_facelets() == facelets
+    assert app.op.count == 0
+
+    stats = results.candidates
+    assert stats is not None and len(stats) == 4
+    assert all(c.moves is not None and c.wall_s > 0 and not c.error for c in stats)
+    assert solution.count() == min(c.moves for c in stats if c.moves is not None)
+
+    solution.play(app.cube)
+    assert app.cube.solved
+
+
+def test_best_of_falls_back_to_plain_solve() -> None:
+    app = _scrambled(3, 5)
+
+    solution, results = Solvers.best_of(app.op, SolverName.LBL, n=2, time_budget=0, workers=0)
+
+    assert results.candidates is not None
+    assert [c.error for c in results.candidates] == ["timeout", "timeout"]
+    solution.play(app.cube)
+    assert app.cube.solved
+
+
+def test_best_of_process_pool() -> None:
+    app = _scrambled(3, 7)
+
+    solution, results = Solvers.best_of(app.op, SolverName.CFOP, n=3, time_budget=120, workers=2)
+
+    assert results.candidates is not None
+    assert all(c.moves is not None for c in results.candidates)
+    solution.play(app.cube)
+    assert app.cube.solved
@@ -0,0 +1,66 @@
+"""Tests for the lookahead mode of NxNCenters (optimize_big_cube_centers_lookahead_*)."""
+from __future__ import annotations
+
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.domain.algs import Algs
+from cube.domain.solver import Solvers
+from cube.domain.solver.SolverName import SolverName
+from cube.domain.solver.common.big_cube.NxNCenters import NxNCenters
+from cube.domain.tracker.FacesTrackerHolder import FacesTrackerHolder
+
+
+def _app(size: int, depth: int, width: int) -> AbstractApp:
+    app = AbstractApp.create_app(cube_size=size)
+    app.config.solver_debug = False
+    app.config._data.optimize_big_cube_centers_lookahead_depth = depth  # type: ignore[attr-defined]
+    app.config._data.optimize_big_cube_centers_lookahead_width = width  # type: ignore[attr-defined]
+    return app
+
+
+@pytest.mark.parametrize("solver, size", [
+    (SolverName.CFOP, 6),
+    (SolverName.CFOP, 7),
+    (SolverName.CAGE, 6),
+    (SolverName.CAGE, 7),
+])
+def test_lookahead_still_solves(solver: SolverName, size: int) -> None:
+    app = _app(size, depth=2, width=3)
+    slv = Solvers.by_name(solver, app.op)
+
+    for seed in range(2):
+        app.scramble(seed, None, animation=False, verbose=False)
+        slv.solve(animation=False)
+        assert app.cube.solved, f"{solver} {size}x{size} seed {seed}"
+
+
+@pytest.mark.parametrize("size", [6, 7])
+def test_trying_a_step_restores_cube_and_trackers(size: int) -> None:
+    app = _app(size, depth=3, width=4)
+    cube = app.cube
+    app.op.play(Algs.scramble(size, 3))
+    solver = Solvers.cage(app.op)
+
+    with FacesTrackerHolder(solver) as holder:
+        centers = NxNCenters(solver)
+        faces = list(holder)
+        colors = [s.color for f in cube.faces for s in f.center.all_slices]
+        face_colors = dict(holder.get_face_colors())
+        history = len(app.op.history())
+
+        steps = centers._candidate_steps(faces)
+        assert len(steps) == 4
+        for step in steps:
+            _, moves = centers._try_step(holder, step, faces)
+            assert moves > 0
+
+            assert [s.color for f in cube.faces for s in f.center.all_slices] == colors
+            assert holder.get_face_colors() == face_colors
+            assert len(app.op.history()) == history
+            assert centers.get_block_statistics().get_summary_stats() == {}
+
+        # The step played places pieces
+        placed_before = centers._count_placed(faces)
+        assert centers._do_best_step(holder, faces)
+        assert centers._count_placed(faces) > placed_before
@@ -0,0 +1,75 @@
+"""Tests for the logger's cached enabled state and guarded solver debug."""
+import re
+from pathlib import Path
+
+from cube.application.AbstractApp import AbstractApp
+from cube.domain.algs import Algs
+from cube.utils.logger import Logger
+
+_DOMAIN = Path(__file__).parents[2] / "src" / "cube" / "domain"
+
+
+def test_cached_state_follows_the_flag_after_invalidate() -> None:
+    enabled = [False]
+    log = Logger().with_prefix("A", lambda: enabled[0])
+
+    assert not log.is_debug()
+    enabled[0] = True
+    # Cached until something invalidates
+    assert not log.is_debug()
+    log.invalidate()
+    assert log.is_debug()
+
+
+def test_level_and_quiet_all_invalidate() -> None:
+    root = Logger()
+    parent = root.with_prefix("A", True)
+    child = parent.with_prefix("B")
+
+    assert child.is_debug(level=3)
+    parent.set_level(2)
+    assert not child.is_debug(level=3)
+    assert child.is_debug(level=2)
+
+    root.quiet_all = True
+    assert not child.is_debug(level=2)
+
+
+def test_disabled_debug_does_not_resolve_args() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    app.config.solver_debug = False
+    app.vs.quiet_all = False
+    solver = app.slv
+    calls: list[int] = []
+
+    solver.debug(lambda: calls.append(1))
+    assert calls == []
+
+    # Config changes reach the cached state
+    app.config.solver_debug = True
+    solver.debug(lambda: calls.append(1))
+    assert calls == [1]
+
+
+def test_solve_debug_override_reaches_the_logger() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    app.config.solver_debug = False
+    app.vs.quiet_all = False
+    solver = app.slv
+    lines: list[str] = []
+    app.vs.logger.add_stream(lines.append)
+
+    app.op.play(Algs.scramble(3, 1))
+    solver.solve(debug=True, animation=False)
+    assert lines
+
+    lines.clear()
+    solver.debug("after solve")
+    assert lines == []
+
+
+def test_domain_debug_calls_are_lazy() -> None:
+    # Commented-out code does not count
+    eager = re.compile(r"""^[^#\n]*\bself\.debug\(\s*f["']""", re.MULTILINE)
+    offenders = [f"{p.relative_to(_DOMAIN)}" for p in _DOMAIN.rglob("*.py") if eager.search(p.read_text())]
+    assert offenders == []
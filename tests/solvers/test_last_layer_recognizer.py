@@ -0,0 +1,92 @@
+"""Tests for the last-layer pattern tables (LastLayerRecognizer) and their users."""
+from __future__ import annotations
+
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.domain.algs import Algs
+from cube.domain.model import Part
+from cube.domain.solver import Solvers
+from cube.domain.solver.SolverName import SolverName
+from cube.domain.solver._3x3.cfop.CFOP3x3 import CFOP3x3
+from cube.domain.solver._3x3.cfop._PLL import PLL
+from cube.domain.solver.common.LastLayerRecognizer import auf_count
+
+
+def _cfop(app: AbstractApp) -> CFOP3x3:
+    return CFOP3x3(app.op, app.cube.sp.logger)
+
+
+def test_every_oll_case_is_recognized_and_solved() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    oll = _cfop(app).oll
+    cube = app.cube
+
+    for _, name, alg in oll._get_algs_db():
+        case = Algs.parse(alg, compat_3x3=True) if isinstance(alg, str) else alg
+        for turns in range(4):
+            cube.reset()
+            case.inv().play(cube)
+            if turns:
+                (Algs.U * turns).play(cube)
+
+            match = oll._get_table().lookup(cube)
+            assert match is not None, f"{name} after U*{turns}"
+            (match.pre + match.alg).play(cube)
+            assert oll.is_solved, f"{name} after U*{turns} matched {match.name}"
+
+
+def test_every_pll_case_is_recognized_and_solved() -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    pll = _cfop(app).pll
+    cube = app.cube
+
+    for name, alg in PLL._CASES:
+        case = Algs.parse(alg, compat_3x3=True)
+        for pre in [Algs.no_op(), Algs.U, Algs.Y + Algs.U * 2, Algs.Y.prime + Algs.U.prime]:
+            cube.reset()
+            case.inv().play(cube)
+            pre.play(cube)
+
+            match = PLL._get_table().lookup(cube)
+            assert match is not None, f"{name} after {pre}"
+            (match.pre + match.alg).play(cube)
+            assert pll.is_rotate_and_solved(), f"{name} after {pre} matched {match.name}"
+            assert pll._rotate_and_solve()
+            assert cube.solved
+
+
+@pytest.mark.parametrize("edges, corners", [(True, True), (True, False), (False, True)])
+def test_auf_count_matches_turning_the_face(edges: bool, corners: bool) -> None:
+    app = AbstractApp.create_app(cube_size=3)
+    cube = app.cube
+    up = cube.up
+
+    def _matches() -> bool:
+        parts = [*(up.edges if edges else []), *(up.corners if corners else [])]
+        return Part.all_match_faces(parts)
+
+    states = [Algs.U * k for k in range(4)]
+    states += [Algs.parse(alg, compat_3x3=True).inv() + Algs.U for _, alg in PLL._CASES]
+    states += [Algs.scramble(3, seed) for seed in range(5)]
+
+    for state in states:
+        cube.reset()
+        state.play(cube)
+        assert auf_count(up, edges, corners) == cube.cqr.rotate_face_and_check(up, _matches, app.op), str(state)
+
+
+@pytest.mark.parametrize("solver, size", [
+    (SolverName.CFOP, 3),
+    (SolverName.CFOP, 4),
+    (SolverName.LBL, 3),
+    (SolverName.TWO_BY_TWO_BEGINNER, 2),
+])
+def test_last_layer_solvers_still_solve(solver: SolverName, size: int) -> None:
+    app = AbstractApp.create_app(cube_size=size)
+    slv = Solvers.by_name(solver, app.op)
+
+    for seed in range(6):
+        app.scramble(seed, None, animation=False, verbose=False)
+        slv.solve(animation=False)
+        assert app.cube.solved, f"{solver} {size}x{size} seed {seed}"
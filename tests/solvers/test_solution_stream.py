@@ -0,0 +1,87 @@
+"""Tests for SolutionStream - solution moves delivered while solving."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.application.SolutionStream import SolutionStream
+from cube.domain.algs.Alg import Alg
+from cube.domain.algs.AnnotationAlg import AnnotationAlg
+
+
+def _scrambled(size: int, seed: int) -> AbstractApp:
+    app = AbstractApp.create_app(cube_size=size)
+    app.scramble(seed, None, animation=False, verbose=False)
+    return app
+
+
+def _play(app: AbstractApp, algs: list[Alg]) -> None:
+    for a in algs:
+        app.op.play(a, animation=False)
+
+
+@pytest.mark.parametrize("size", [3, 5])
+def test_stream_solves_the_snapshot(size: int) -> None:
+    app = _scrambled(size, 11)
+    state = app.cube.get_facelets()
+    stream = SolutionStream(app)
+
+    algs = list(stream)
+
+    assert stream.done
+    assert app.cube.get_facelets() == state  # the source cube is not touched
+    assert any(isinstance(a, AnnotationAlg) for a in algs)  # step headings
+    _play(app, algs)
+    assert app.cube.solved
+
+
+def test_stream_chunks_while_source_changes() -> None:
+    app = _scrambled(4, 3)
+    stream = SolutionStream(app)
+    state = app.cube.get_facelets()
+
+    async def consume() -> list[Alg]:
+        result: list[Alg] = []
+        async for chunk in stream.chunks():
+            assert chunk
+            result.extend(chunk)
+        return result
+
+    algs = asyncio.run(consume())
+    app.scramble(5, None, animation=False, verbose=False)  # snapshot was taken already
+    app.cube.set_facelets(state)
+    _play(app, algs)
+    assert app.cube.solved
+
+
+def test_close_aborts_the_solve() -> None:
+    app = _scrambled(6, 2)
+    stream = SolutionStream(app)
+    it = iter(stream)
+    first = next(it)
+    assert first is not None
+    it.close()  # type: ignore[attr-defined]
+
+    assert stream._thread is not None
+    stream._thread.join(timeout=60)
+    assert stream.done
+
+
+def test_stream_solves_with_the_source_settings() -> None:
+    app = _scrambled(5, 7)
+    app.config.solver_debug = False
+    app.config.operator_buffer_mode = True
+    app.config._data.optimize_big_cube_centers_lookahead_depth = 2  # type: ignore[attr-defined]
+
+    def moves(algs: list[Alg]) -> list[str]:
+        return [str(m) for a in algs for m in a.flatten() if not isinstance(m, AnnotationAlg)]
+
+    stream = SolutionStream(app)
+    streamed = moves(list(stream))
+
+    assert stream._app is not None
+    assert stream._app.config.operator_buffer_mode
+    assert stream._app.config is not app.config
+    assert streamed == moves([app.slv.solution()])
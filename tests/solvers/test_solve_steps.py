@@ -0,0 +1,59 @@
+"""Tests for the per-step timing and move breakdown in SolverResults.steps."""
+from __future__ import annotations
+
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.domain.solver import Solvers
+from cube.domain.solver.SolverName import SolverName
+from cube.domain.solver.solver import StepStats
+
+
+def _solve(solver_name: SolverName, size: int, seed: int) -> tuple[AbstractApp, StepStats]:
+    app = AbstractApp.create_app(cube_size=size)
+    solver = Solvers.by_name(solver_name, app.op)
+    app.scramble(seed, None, animation=False, verbose=False)
+    count_before = app.op.count
+
+    steps = solver.solve(animation=False).steps
+
+    assert app.cube.solved
+    assert steps is not None
+    assert steps.moves == app.op.count - count_before
+    return app, steps
+
+
+def test_orchestrator_records_reduction_and_layers() -> None:
+    _, root = _solve(SolverName.LBL, 4, 1)
+
+    assert root.name == "ALL"
+    assert root.wall_s > 0 and root.cpu_s > 0
+    assert root.quarter_turns >= root.moves > 0
+
+    reduce_step = root.find("reduce")
+    assert reduce_step is not None
+    assert [c.name for c in reduce_step.children] == ["NxNCenters", "NxNEdges"]
+
+    attempt = root.find("3x3#1")
+    assert attempt is not None
+    assert [c.name for c in attempt.children][:3] == ["L1x", "L1", "L2"]
+
+    # direct children do not overlap, so their moves add up to at most the total
+    assert sum(c.moves for c in root.children) <= root.moves
+    assert "NxNCenters" in root.format()
+
+
+def test_cfop_stages() -> None:
+    _, root = _solve(SolverName.CFOP, 3, 2)
+    attempt = root.find("3x3#1")
+    assert attempt is not None
+    assert [c.name for c in attempt.children] == ["L1x", "F2L", "OLL", "PLL"]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_parity_fixes_are_recorded(seed: int) -> None:
+    _, root = _solve(SolverName.LBL, 4, seed)
+    names = [s.name for _, s in root.walk()]
+    n_fixes = names.count("edge_parity_fix") + names.count("corner_parity_fix")
+    # every fix triggers one more 3x3 attempt
+    assert sum(1 for n in names if n.startswith("3x3#")) == n_fixes + 1
@@ -0,0 +1,79 @@
+"""Tests for the webgl 'get_metrics' admin message."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from cube.application.config_impl import AppConfig
+from cube.presentation.gui.backends.webgl.ClientSession import ClientInfo, ClientSession
+from cube.presentation.gui.backends.webgl.WebglEventLoop import WebglEventLoop
+from cube.utils.metrics import METRICS
+
+
+class _RecordingLoop(WebglEventLoop):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[dict[str, Any]] = []
+
+    def send_to(self, ws: Any, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+
+@pytest.fixture
+def session() -> Iterator[ClientSession]:
+    enabled = METRICS.enabled
+    METRICS.enabled = True
+    METRICS.inc("test.get_metrics")
+    yield ClientSession(ws=None, event_loop=_RecordingLoop(),  # type: ignore[arg-type]
+                        client_info=ClientInfo(session_id="metrics-test", ip="127.0.0.1"))
+    METRICS.enabled = enabled
+    METRICS.reset()
+
+
+def _get_metrics(s: ClientSession, **data: Any) -> dict[str, Any]:
+    sent = s._event_loop.sent  # type: ignore[attr-defined]
+    sent.clear()
+    s.handle_message({"type": "get_metrics", **data})
+    return next(m for m in sent if m["type"] == "metrics")
+
+
+def test_clients_only_read_metrics_by_default(session: ClientSession) -> None:
+    reply = _get_metrics(session, enable=False, reset=True)
+
+    assert "error" in reply
+    assert reply["enabled"] and METRICS.enabled
+    assert METRICS.snapshot().counters["test.get_metrics"] == 1
+
+    reply = _get_metrics(session)
+    assert "error" not in reply
+
+
+def test_metrics_control_allows_enable_and_reset(session: ClientSession) -> None:
+    session.app.config.session_config.metrics_control = True  # type: ignore[misc]
+
+    reply = _get_metrics(session, enable=False, reset=True)
+
+    assert "error" not in reply
+    assert not reply["enabled"] and not METRICS.enabled
+    assert "test.get_metrics" not in METRICS.snapshot().counters
+
+
+def test_sessions_get_the_server_metrics_control() -> None:
+    config = AppConfig()
+    config._data.session_config.metrics_control = True  # type: ignore[attr-defined]
+    s = ClientSession(ws=None, event_loop=_RecordingLoop(),  # type: ignore[arg-type]
+                      client_info=ClientInfo(session_id="metrics-server", ip="127.0.0.1"),
+                      config=config)
+    enabled = METRICS.enabled
+    try:
+        reply = _get_metrics(s, enable=True)
+        assert "error" not in reply
+        # The session has its own copy of the settings
+        assert s.app.config is not config
+    finally:
+        METRICS.enabled = enabled
+        METRICS.reset()
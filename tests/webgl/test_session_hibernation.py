@@ -0,0 +1,139 @@
+"""Tests for hibernation of dormant webgl sessions (SessionHibernation)."""
+
+from __future__ import annotations
+
+import json
+from array import array
+from typing import Any
+
+from cube.application.config_impl import AppConfig
+from cube.domain.solver.SolverName import SolverName
+from cube.presentation.gui.backends.webgl.ClientSession import ClientInfo, ClientSession
+from cube.presentation.gui.backends.webgl.FlowStateMachine import FlowState
+from cube.presentation.gui.backends.webgl.SessionHibernation import HibernatedSession, HibernationStore
+from cube.presentation.gui.backends.webgl.SessionManager import SessionManager
+from cube.presentation.gui.backends.webgl.WebglEventLoop import WebglEventLoop
+
+
+class _RecordingLoop(WebglEventLoop):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[dict[str, Any]] = []
+
+    def send_to(self, ws: Any, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+
+def _session(loop: WebglEventLoop, sid: str = "hib-test") -> ClientSession:
+    return ClientSession(ws=object(), event_loop=loop,  # type: ignore[arg-type]
+                         client_info=ClientInfo(session_id=sid, ip="127.0.0.1"))
+
+
+def _solving_session(loop: WebglEventLoop) -> ClientSession:
+    """4x4 session, scrambled, solution in the redo queue, a few moves redone."""
+    s = _session(loop)
+    s.handle_message({"type": "set_size", "value": 4})
+    s.handle_message({"type": "set_solver", "name": SolverName.CAGE.display_name})
+    s.handle_message({"type": "command", "name": "scramble"})
+    s.handle_message({"type": "command", "name": "solve"})
+    s.handle_message({"type": "set_speed", "value": 5.5})
+    s.handle_message({"type": "set_config", "settings": {"queue_heading_h2": False}})
+    for _ in range(5):
+        s.handle_message({"type": "command", "name": "redo"})
+        s.handle_message({"type": "animation_done"})
+    return s
+
+
+def test_round_trip_restores_session() -> None:
+    loop = _RecordingLoop()
+    s = _solving_session(loop)
+    app = s.app
+    history = [str(a) for a in app.op.history_view()]
+    redo = [str(a) for a in app.op.redo_queue_view()]
+    assert history and redo
+
+    record = s.hibernate()
+    s.cleanup()
+    restored = ClientSession.from_hibernated(record, object(), loop)  # type: ignore[arg-type]
+
+    r_app = restored.app
+    assert restored.client_info.session_id == "hib-test"
+    assert r_app.cube.size == 4
+    assert r_app.cube.get_facelets() == app.cube.get_facelets()
+    assert [str(a) for a in r_app.op.history_view()] == history
+    assert [str(a) for a in r_app.op.redo_queue_view()] == redo
+    assert r_app.op.count == app.op.count
+    assert r_app.slv.get_code is SolverName.CAGE
+    assert r_app.vs.get_speed_index == 5.5
+    assert not r_app.config.queue_heading_h2
+    assert restored._fsm.state is FlowState.READY
+    assert restored._fsm.redo_source == "solver"
+
+    # The restored session can finish the solution
+    with r_app.op.with_animation(animation=False):
+        while r_app.op.redo_queue_view():
+            r_app.op.redo(animation=False)
+    assert r_app.cube.solved
+
+
+def test_record_is_compact() -> None:
+    s = _solving_session(_RecordingLoop())
+    record = s.hibernate()
+    assert len(record.facelets) == 6 * 4 * 4
+    assert record.nbytes < 64 * 1024
+
+
+def _record(sid: str, n_facelets: int) -> HibernatedSession:
+    codes: array[int] = array("i")
+    return HibernatedSession(
+        client_info=ClientInfo(session_id=sid, ip="x"), cube_size=3,
+        facelets=bytes(n_facelets), queues=((codes, [], 0), (codes, [], 0)),
+        solver=SolverName.LBL, animation_enabled=True, speed_index=2,
+        slice_start=0, slice_stop=0, config={}, default_scramble=0,
+        redo_source="undo", redo_tainted=False,
+    )
+
+
+def test_store_evicts_least_recent_over_budget() -> None:
+    size = _record("a", 1000).nbytes
+    store = HibernationStore(budget=3 * size)
+
+    assert store.put(_record("a", 1000)) == []
+    assert store.put(_record("b", 1000)) == []
+    assert store.put(_record("c", 1000)) == []
+    assert store.nbytes == 3 * size
+
+    assert store.put(_record("d", 1000)) == ["a"]
+    assert "a" not in store and "d" in store
+
+    assert store.pop("b") is not None
+    assert store.put(_record("e", 1000)) == []
+    assert len(store) == 3
+
+
+def test_manager_hibernates_and_restores() -> None:
+    loop = _RecordingLoop()
+    manager = SessionManager(loop, AppConfig())
+    s = _solving_session(loop)
+    ws = object()
+    manager._sessions["hib-test"] = s
+    manager._ws_to_session[ws] = s  # type: ignore[index]
+    facelets = s.app.cube.get_facelets()
+
+    manager.remove_session(ws)  # type: ignore[arg-type]
+    assert "hib-test" in manager._hibernated
+    assert not manager._dormant_sessions
+    assert manager.session_count == 0
+
+    new_ws = object()
+    restored = manager._try_restore_session("hib-test", new_ws)  # type: ignore[arg-type]
+    assert restored is not None and restored is not s
+    assert restored.app.cube.get_facelets() == facelets
+    assert manager.get_session(new_ws) is restored  # type: ignore[arg-type]
+    assert "hib-test" not in manager._hibernated
+    assert not manager._dormant_timers
+
+    # expired records are gone
+    manager.remove_session(new_ws)  # type: ignore[arg-type]
+    manager._expire_session("hib-test")
+    assert manager._try_restore_session("hib-test", object()) is None  # type: ignore[arg-type]
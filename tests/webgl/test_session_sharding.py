@@ -0,0 +1,171 @@
+"""Tests for multi-process session sharding (SessionSharding).
+
+The integration test spawns real worker processes talking over a Unix
+socket; websockets are replaced by in-memory fakes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+import sys
+from typing import Any
+
+import pytest
+
+from cube.application.config_impl import AppConfig
+from cube.presentation.gui.backends.webgl.SessionSharding import ShardFront, ShardRouter
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets")
+
+
+def test_router_is_sticky_and_balances() -> None:
+    router = ShardRouter(3)
+    assert router.route(None) is None
+    for w in range(3):
+        router.worker_up(w)
+
+    router.attach(0)
+    router.attach(0)
+    router.attach(1)
+    assert router.route(None) == 2
+    assert router.route("unknown") == 2
+
+    router.assign("s1", 0)
+    assert router.route("s1") == 0  # owner wins over load
+
+    router.worker_down(0)
+    assert router.owner("s1") is None
+    assert router.route("s1") == 2
+    assert router.connections(0) == 0
+
+
+def test_router_bounds_owner_table() -> None:
+    router = ShardRouter(1, max_owners=2)
+    router.worker_up(0)
+    for sid in ("a", "b", "c"):
+        router.assign(sid, 0)
+    assert router.owner("a") is None
+    assert router.owner("c") == 0
+
+
+class _FakeWs:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+        self.closed = False
+
+    async def send_str(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def session_id(self) -> str:
+        states = [m for m in self.sent if m.get("type") == "state"]
+        return states[-1]["session_id"]
+
+
+async def _until(cond: Any, timeout: float = 30.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not cond():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.02)
+
+
+async def _scenario() -> None:
+    config = AppConfig()
+    config._data.session_config.metrics_control = True  # type: ignore[attr-defined]
+    front = ShardFront(2, health_interval=0.2, health_timeout=5.0, gui_test_mode=True, config=config)
+    await front.start()
+    try:
+        a, b = _FakeWs(), _FakeWs()
+        ca = await front.connect(a, "127.0.0.1", None)
+        cb = await front.connect(b, "127.0.0.1", None)
+        assert ca is not None and cb is not None
+        await _until(lambda: any(m.get("type") == "state" for m in a.sent) and
+                     any(m.get("type") == "state" for m in b.sent))
+        sid_a, sid_b = a.session_id(), b.session_id()
+        wa, wb = front.router.owner(sid_a), front.router.owner(sid_b)
+        assert {wa, wb} == {0, 1}  # balanced
+
+        # Messages reach the session on its worker
+        front.forward(ca, json.dumps({"type": "set_size", "value": 4}))
+        await _until(lambda: a.sent[-1].get("type") == "state" and a.sent[-1]["cube"]["size"] == 4)
+
+        # Sessions run with the front's config, not the worker's defaults
+        front.forward(ca, json.dumps({"type": "get_metrics", "reset": True}))
+        await _until(lambda: any(m.get("type") == "metrics" for m in a.sent))
+        assert "error" not in next(m for m in a.sent if m.get("type") == "metrics")
+
+        # Bad messages are logged, the worker keeps answering PING and MSG
+        front.forward(ca, "not json")
+        front.forward(ca, json.dumps([1, 2]))
+        pong = front._workers[wa].last_pong
+        await _until(lambda: front._workers[wa].last_pong > pong)
+        front.forward(ca, json.dumps({"type": "set_size", "value": 5}))
+        await _until(lambda: a.sent[-1].get("type") == "state" and a.sent[-1]["cube"]["size"] == 5)
+        front.forward(ca, json.dumps({"type": "set_size", "value": 4}))
+        await _until(lambda: a.sent[-1].get("type") == "state" and a.sent[-1]["cube"]["size"] == 4)
+
+        # Reconnect goes back to the owning worker and restores the session
+        front.disconnect(ca)
+        a2 = _FakeWs()
+        ca2 = await front.connect(a2, "127.0.0.1", sid_a)
+        assert ca2 is not None
+        await _until(lambda: any(m.get("type") == "state" for m in a2.sent))
+        assert a2.session_id() == sid_a
+        assert front.router.owner(sid_a) == wa
+        assert a2.sent[-1]["cube"]["size"] == 4
+
+        # A killed worker is detected, its clients closed, and it is restarted
+        pid = front.worker_pid(wb)
+        assert pid is not None
+        os.kill(pid, signal.SIGKILL)
+        await _until(lambda: b.closed)
+        assert front.router.owner(sid_b) is None
+        await _until(lambda: front.router.is_up(wb) and front.worker_pid(wb) != pid)
+
+        c = _FakeWs()
+        assert await front.connect(c, "127.0.0.1", sid_b) is not None
+        await _until(lambda: any(m.get("type") == "state" for m in c.sent))
+        assert c.session_id() != sid_b  # the old session died with its worker
+    finally:
+        await front.stop()
+
+
+def test_front_routes_reconnects_and_restarts_workers() -> None:
+    asyncio.run(asyncio.wait_for(_scenario(), 180))
+
+
+class _HungProcess:
+    """A worker process that is alive but never says HELLO."""
+
+    pid = 1
+
+    def __init__(self) -> None:
+        self.killed = False
+
+    def is_alive(self) -> bool:
+        return not self.killed
+
+    def kill(self) -> None:
+        self.killed = True
+
+
+def test_worker_that_never_says_hello_is_restarted() -> None:
+    front = ShardFront(1, health_interval=0.2, health_timeout=5.0, start_timeout=10.0)
+    spawned: list[int] = []
+    front._spawn = lambda w: spawned.append(w.index)  # type: ignore[method-assign]
+    w = front._workers[0]
+    hung = _HungProcess()
+    w.process = hung  # type: ignore[assignment]
+    w.spawned_at = 100.0
+
+    asyncio.run(front._check_workers(105.0))
+    assert not hung.killed and spawned == []
+
+    asyncio.run(front._check_workers(111.0))
+    assert hung.killed and spawned == [0] and w.restarts == 1
@@ -0,0 +1,197 @@
+"""Tests for the stateless solve endpoint (SolveApi)."""
+
+from __future__ import annotations
+
+import asyncio
+import types
+from typing import Any
+
+import pytest
+
+from cube.application.AbstractApp import AbstractApp
+from cube.application.config_impl import AppConfig
+from cube.domain.algs import Algs
+from cube.presentation.gui.backends.webgl.SolveApi import (
+    RateLimiter, SolveApiError, SolveService, _scheme, _set_facelets, cube_to_facelets,
+    parse_solve_request, solve_job,
+)
+
+_CONFIG = AppConfig().solve_api_config
+
+
+def _scrambled_facelets(size: int, seed: int) -> str:
+    app = AbstractApp.create_app(cube_size=size, quiet_all=True)
+    scheme = _scheme(app.cube)
+    app.scramble(seed, None, animation=False)
+    return cube_to_facelets(app.cube, scheme)
+
+
+def test_facelets_layout() -> None:
+    app = AbstractApp.create_app(cube_size=3, quiet_all=True)
+    scheme = _scheme(app.cube)
+    assert cube_to_facelets(app.cube, scheme) == "".join(c * 9 for c in "URFDLB")
+
+    Algs.R.play(app.cube)
+    facelets = cube_to_facelets(app.cube, scheme)
+    assert facelets[0:9] == "UUFUUFUUF"  # U right column shows F
+    assert facelets[9:18] == "R" * 9
+
+
+@pytest.mark.parametrize("size", [3, 4])
+def test_facelets_round_trip(size: int) -> None:
+    facelets = _scrambled_facelets(size, 7)
+    app = AbstractApp.create_app(cube_size=size, quiet_all=True)
+    scheme = _scheme(app.cube)
+    _set_facelets(app.cube, facelets, scheme)
+    assert app.cube.is_sanity(force_check=True)
+    assert cube_to_facelets(app.cube, scheme) == facelets
+
+
+@pytest.mark.parametrize("size", [3, 4])
+def test_solve_job_solves(size: int) -> None:
+    facelets = _scrambled_facelets(size, 3)
+    request = parse_solve_request({"size": size, "solver": "beginner", "facelets": facelets}, _CONFIG)
+
+    for _ in range(2):  # the second request reuses the pooled app
+        result = solve_job(request, deadline=float("inf"))
+        assert result["moves"] and result["alg"] == " ".join(result["moves"])
+        assert result["move_count"] == len(result["moves"])
+        assert result["steps"]["name"] == "ALL"
+
+        app = AbstractApp.create_app(cube_size=size, quiet_all=True)
+        _set_facelets(app.cube, facelets, _scheme(app.cube))
+        Algs.parse(result["alg"]).play(app.cube)
+        assert app.cube.solved
+
+
+def test_pooled_app_is_reused_with_empty_queues() -> None:
+    from cube.application.app_pool import discard_pooled_app, pooled_app
+
+    app = pooled_app("test", 3)
+    app.op.play(Algs.R)
+    app.op.enqueue_redo([Algs.U])
+    assert pooled_app("test", 3) is app
+    assert not app.op.history_view() and not app.op.redo_queue_view()
+    assert pooled_app("other", 3) is not app
+
+    discard_pooled_app("test", 3)
+    assert pooled_app("test", 3) is not app
+
+
+@pytest.mark.parametrize("data", [
+    None,
+    {"size": 99, "facelets": ""},
+    {"size": 3, "solver": "nope", "facelets": "U" * 54},
+    {"size": 3, "facelets": "U" * 54},
+    {"size": 3, "facelets": "".join(c * 9 for c in "URFDLB"), "deadline_ms": -1},
+])
+def test_invalid_requests(data: Any) -> None:
+    with pytest.raises(SolveApiError) as e:
+        parse_solve_request(data, _CONFIG)
+    assert e.value.status == 400
+
+
+@pytest.mark.parametrize("i, j, status", [
+    (1, 10, 400),  # an edge with two U stickers: not a cube
+    (8, 9, 422),  # a mirrored corner: a cube, but not a solvable one
+])
+def test_invalid_cube_state(i: int, j: int, status: int) -> None:
+    # Right letter counts, impossible cube
+    facelets = list("".join(c * 9 for c in "URFDLB"))
+    facelets[i], facelets[j] = facelets[j], facelets[i]
+    request = parse_solve_request({"size": 3, "facelets": "".join(facelets)}, _CONFIG)
+    with pytest.raises(SolveApiError) as e:
+        solve_job(request, deadline=float("inf"))
+    assert e.value.status == status
+
+
+def test_rate_limiter() -> None:
+    now = [0.0]
+    limiter = RateLimiter(rate_per_minute=60, burst=2, clock=lambda: now[0])
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == pytest.approx(1.0)
+    assert limiter.acquire("b") == 0  # per client
+    now[0] = 1.0
+    assert limiter.acquire("a") == 0
+
+
+class _Config:
+    enabled = True
+    workers = 1
+    max_queue = 0
+    rate_per_minute = 1
+    burst = 2
+    trust_forwarded_for = False
+    default_deadline = 60.0
+    max_deadline = 60.0
+    max_cube_size = 5
+
+
+def test_service_queue_limit_and_rate_limit() -> None:
+    facelets = _scrambled_facelets(3, 11)
+    body = {"size": 3, "facelets": facelets}
+
+    async def scenario() -> None:
+        service = SolveService(_Config())  # type: ignore[arg-type]
+        try:
+            first = asyncio.create_task(service.solve(body, "a"))
+            await asyncio.sleep(0)
+            status, _, headers = await service.solve(body, "b")
+            assert status == 429 and headers["X-Queue-Depth"] == "1"
+
+            status, result, _ = await first
+            assert status == 200 and result["moves"]
+
+            status, _, headers = await service.solve(body, "a")
+            assert status == 200
+            status, _, headers = await service.solve(body, "a")
+            assert status == 429 and "Retry-After" in headers
+        finally:
+            service.stop()
+
+    asyncio.run(asyncio.wait_for(scenario(), 120))
+
+
+class _Request:
+    """What SolveService.handle() reads from an aiohttp request."""
+
+    def __init__(self, body: Any, forwarded_for: str, peer: str = "10.0.0.7") -> None:
+        self.headers = {"X-Forwarded-For": forwarded_for}
+        self.transport = types.SimpleNamespace(get_extra_info=lambda name: (peer, 40000))
+        self._body = body
+
+    async def json(self) -> Any:
+        return self._body
+
+
+def test_rate_limit_ignores_spoofed_forwarded_for() -> None:
+    body = {"size": 3, "facelets": _scrambled_facelets(3, 12)}
+    config = _Config()
+    config.burst = 1
+
+    async def scenario() -> None:
+        service = SolveService(config)  # type: ignore[arg-type]
+        try:
+            response = await service.handle(_Request(body, "1.1.1.1"))  # type: ignore[arg-type]
+            assert response.status == 200
+            # A new X-Forwarded-For on each request is still the same peer
+            response = await service.handle(_Request(body, "2.2.2.2"))  # type: ignore[arg-type]
+            assert response.status == 429
+            response = await service.handle(_Request(body, "3.3.3.3, 4.4.4.4"))  # type: ignore[arg-type]
+            assert response.status == 429
+        finally:
+            service.stop()
+
+    asyncio.run(asyncio.wait_for(scenario(), 120))
+
+
+def test_client_key_behind_trusted_proxy() -> None:
+    config = _Config()
+    service = SolveService(config)  # type: ignore[arg-type]
+    request = _Request(None, "1.1.1.1, 203.0.113.5", peer="127.0.0.1")
+
+    assert service.client_key(request) == "127.0.0.1"  # type: ignore[arg-type]
+    config.trust_forwarded_for = True
+    # The proxy appends the address it saw, the earlier entries are the client's
+    assert service.client_key(request) == "203.0.113.5"  # type: ignore[arg-type]
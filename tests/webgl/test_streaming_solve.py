@@ -0,0 +1,161 @@
+"""Tests for the streaming two-phase solve of the webgl backend.
+
+Runs a ClientSession against a fake event loop that records sent messages
+(no browser, no WebSocket); the solver still runs in its worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from cube.domain.algs import Algs
+from cube.presentation.gui.backends.webgl.ClientSession import ClientInfo, ClientSession
+from cube.presentation.gui.backends.webgl.FlowStateMachine import FlowState
+from cube.presentation.gui.backends.webgl.WebglEventLoop import WebglEventLoop
+
+
+class _RecordingLoop(WebglEventLoop):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[dict[str, Any]] = []
+
+    def send_to(self, ws: Any, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+
+def _session(loop: asyncio.AbstractEventLoop | None) -> ClientSession:
+    event_loop = _RecordingLoop()
+    event_loop._loop = loop
+    s = ClientSession(ws=None, event_loop=event_loop,  # type: ignore[arg-type]
+                      client_info=ClientInfo(session_id="stream-test", ip="127.0.0.1"))
+    s.app.config.assist_enabled = False
+    return s
+
+
+def _sent(s: ClientSession) -> list[dict[str, Any]]:
+    return s._event_loop.sent  # type: ignore[attr-defined]
+
+
+async def _until(cond: Any, timeout: float = 60.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not cond():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_streamed_solution_fills_redo_queue() -> None:
+    async def scenario() -> None:
+        s = _session(asyncio.get_running_loop())
+        s.handle_message({"type": "set_size", "value": 5})
+        s.handle_message({"type": "command", "name": "scramble"})
+        s.handle_message({"type": "command", "name": "solve"})
+        assert s._fsm.state == FlowState.SOLVING
+        assert s._solve_stream is not None
+
+        await _until(lambda: s._fsm.state != FlowState.SOLVING)
+        assert s._fsm.state == FlowState.READY
+        assert s._fsm.redo_source == "solver"
+        await _until(lambda: s._solve_stream is None)
+
+        op = s.app.op
+        while op.redo_queue_view():
+            op.redo(animation=False)
+        assert s.app.cube.solved
+
+    asyncio.run(scenario())
+
+
+def test_new_scramble_cancels_the_stream() -> None:
+    async def scenario() -> None:
+        s = _session(asyncio.get_running_loop())
+        s.handle_message({"type": "set_size", "value": 6})
+        s.handle_message({"type": "command", "name": "scramble"})
+        s.handle_message({"type": "command", "name": "solve"})
+        stream = s._solve_stream
+        assert stream is not None
+        await _until(lambda: s._fsm.state == FlowState.READY)
+
+        s.handle_message({"type": "command", "name": "scramble"})
+        assert s._solve_stream is None
+        assert not s.app.op.redo_queue_view()
+        await asyncio.sleep(0.05)
+        assert not s.app.op.redo_queue_view()  # nothing from the cancelled stream
+        assert stream._thread is not None
+        await asyncio.to_thread(stream._thread.join, 60)
+        assert stream.done
+
+    asyncio.run(scenario())
+
+
+def test_playback_waits_for_streamed_moves() -> None:
+    s = _session(None)
+    op = s.app.op
+    op.toggle_animation_on(True)
+    # First chunk arrived, the stream is still producing
+    s._solve_stream = object()  # type: ignore[assignment]
+    op.enqueue_redo([Algs.F])
+    s._fsm.send_reconnect(has_redo=True)
+
+    s.handle_message({"type": "play_next_redo"})
+    assert s._fsm.state == FlowState.PLAYING
+    s.handle_message({"type": "play_next_redo"})  # ack of F, queue is empty
+    assert s._stream_stalled is False
+    assert s._fsm.state == FlowState.PLAYING
+    assert not any(m["type"] == "play_empty" for m in _sent(s))
+
+    op.extend_redo([Algs.R, Algs.U])
+    n_sent = len(_sent(s))
+    s._resume_stalled_play()
+    assert s._stream_stalled is None
+    assert any(m["type"] == "animation_start" for m in _sent(s)[n_sent:])
+
+    # Stopping forgets the waiting playback
+    s.handle_message({"type": "play_next_redo"})
+    s.handle_message({"type": "play_next_redo"})
+    assert s._stream_stalled is False
+    s.handle_message({"type": "command", "name": "stop"})
+    assert s._stream_stalled is None
+    s._solve_stream = None
+
+
+
+class _FailingStream:
+    """Delivers two chunks, the user plays in between, then the solver fails."""
+
+    def __init__(self, session: ClientSession) -> None:
+        self._session = session
+
+    async def chunks(self) -> Any:
+        op = self._session.app.op
+        yield [Algs.R, Algs.U]
+        op.redo(animation=False)
+        op.redo(animation=False)
+        for _ in range(3):  # U, R and B, played before the solve
+            op.undo(animation=False)
+        yield [Algs.F]
+        raise RuntimeError("solver failed")
+
+
+def test_failed_stream_leaves_no_partial_solution() -> None:
+    async def scenario() -> None:
+        s = _session(asyncio.get_running_loop())
+        op = s.app.op
+        op.toggle_animation_on(False)
+        op.play(Algs.D)
+        op.play(Algs.B)
+        s._fsm.redo_source = "solver"
+
+        stream = _FailingStream(s)
+        s._solve_stream = stream  # type: ignore[assignment]
+        await s._stream_solve(stream)  # type: ignore[arg-type]
+
+        assert s._solve_stream is None
+        assert s.app.error is not None
+        # R, U and F of the failed solution are gone, B undone by the user stays
+        assert [str(a) for a in op.history_view()] == ["D"]
+        assert [str(a) for a in reversed(op.redo_queue_view())] == ["B"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,193 @@
+"""Tests for coalesced (turbo) webgl playback.
+
+Runs a ClientSession against a fake event loop that records sent messages —
+no browser, no WebSocket.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+import pytest
+
+from cube.presentation.gui.backends.webgl.ClientSession import ClientInfo, ClientSession
+from cube.presentation.gui.backends.webgl.CubeStateSerializer import (
+    diff_cube_state,
+    extract_cube_state,
+    sticker_cells,
+    sticker_delta,
+)
+from cube.presentation.gui.backends.webgl.TurboPacer import TurboPacer
+from cube.presentation.gui.backends.webgl.WebglEventLoop import WebglEventLoop
+
+
+class _RecordingLoop(WebglEventLoop):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[dict[str, Any]] = []
+
+    def send_to(self, ws: Any, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+
+@pytest.fixture
+def session() -> ClientSession:
+    s = ClientSession(ws=None, event_loop=_RecordingLoop(),  # type: ignore[arg-type]
+                      client_info=ClientInfo(session_id="turbo-test", ip="127.0.0.1"))
+    s.app.config.assist_enabled = False
+    return s
+
+
+def _sent(s: ClientSession) -> list[dict[str, Any]]:
+    return s._event_loop.sent  # type: ignore[attr-defined]
+
+
+def _apply_delta(state: dict[str, Any], delta: dict[str, list[list[Any]]]) -> dict[str, Any]:
+    """Python twin of applyStateDelta in AnimationQueue.js."""
+    state = copy.deepcopy(state)
+    for face_name, cells in delta.items():
+        face = state["faces"][face_name]
+        for i, color, markers in cells:
+            face["colors"][i] = color
+            face["markers"][i] = markers
+    return state
+
+
+def _solve_to_redo(s: ClientSession) -> None:
+    s.handle_message({"type": "command", "name": "scramble"})
+    s.handle_message({"type": "command", "name": "solve"})
+    assert s.app.op.redo_queue_view()
+
+
+def test_pacer_adapts_to_rtt_and_speed() -> None:
+    now = [0.0]
+    pacer = TurboPacer(clock=lambda: now[0])
+
+    slow_k, _ = pacer.plan(move_ms=2000, max_batch=64)
+    fast_k, fast_lead = pacer.plan(move_ms=50, max_batch=64)
+    assert slow_k < fast_k
+    assert fast_k <= 64
+    assert pacer.ack_index(fast_k, fast_lead) == fast_k - 1 - fast_lead
+
+    # 1s elapsed, client held the batch for 600ms -> 400ms round trip
+    seq = pacer.sent()
+    now[0] = 1.0
+    assert pacer.on_ack(seq, 600)
+    assert pacer.rtt_ms == pytest.approx(400)
+    k, lead = pacer.plan(move_ms=100, max_batch=64)
+    assert lead == 4
+    assert k == 5
+
+    assert pacer.plan(move_ms=10, max_batch=8)[0] == 8
+
+
+def test_pacer_rejects_acks_after_cancel() -> None:
+    pacer = TurboPacer()
+    seq = pacer.sent()
+    pacer.cancel()
+    assert not pacer.on_ack(seq, 0)
+    assert pacer.on_ack(None, None)
+    assert pacer.on_ack(pacer.sent(), 0)
+
+
+def test_batches_replay_to_final_state(session: ClientSession) -> None:
+    _solve_to_redo(session)
+    n_redo = len(session.app.op.redo_queue_view())
+    client_state = extract_cube_state(session.app.cube)
+    _sent(session).clear()
+
+    session.handle_message({"type": "play_next_redo", "turbo": True})
+    n_moves = 0
+    n_batches = 0
+    for _ in range(n_redo + 1):
+        sent = list(_sent(session))
+        batches = [m for m in sent if m["type"] == "animation_batch"]
+        empty = any(m["type"] == "play_empty" for m in sent)
+        assert not any(m["type"] == "animation_start" for m in sent)
+        _sent(session).clear()
+        if empty:
+            break
+        assert len(batches) == 1
+        batch = batches[0]
+        assert "state" not in batch
+        n_batches += 1
+        for move in batch["moves"]:
+            client_state = _apply_delta(client_state, move["delta"])
+            n_moves += 1
+        # The final state is sent once, by the state message after the batch
+        states = [m for m in sent if m["type"] == "state"]
+        assert len(states) == 1 and sent.index(states[0]) > sent.index(batch)
+        assert client_state["faces"] == states[0]["cube"]["faces"]
+        assert 0 <= batch["ack_index"] < len(batch["moves"])
+        session.handle_message({"type": "play_next_redo", "turbo": True,
+                                "seq": batch["seq"], "hold_ms": 0})
+
+    assert session.app.cube.solved
+    assert not session.app.op.redo_queue_view()
+    assert n_batches < n_moves
+
+
+def test_stale_ack_after_stop_is_ignored(session: ClientSession) -> None:
+    _solve_to_redo(session)
+    session.handle_message({"type": "play_next_redo", "turbo": True})
+    batch = next(m for m in _sent(session) if m["type"] == "animation_batch")
+
+    session.handle_message({"type": "command", "name": "stop"})
+    n_redo = len(session.app.op.redo_queue_view())
+    _sent(session).clear()
+
+    session.handle_message({"type": "play_next_redo", "turbo": True,
+                            "seq": batch["seq"], "hold_ms": 0})
+    assert not _sent(session)
+    assert len(session.app.op.redo_queue_view()) == n_redo
+
+
+def test_batch_delta_reads_only_rotated_stickers(session: ClientSession) -> None:
+    from cube.domain.algs import Algs
+
+    cube = session.app.cube
+    before = extract_cube_state(cube)
+    cells = sticker_cells(cube)
+    assert len(cells) == 6 * cube.size * cube.size
+
+    alg = Algs.R
+    session.app.op.play(alg, animation=False)
+    _, parts = alg.get_animation_objects(cube)
+    delta = sticker_delta(cells, parts)
+
+    assert set(delta) == {"R", "U", "F", "D", "B"}
+    assert len(delta["R"]) == 9 and len(delta["U"]) == 3
+    assert _apply_delta(before, delta)["faces"] == extract_cube_state(cube)["faces"]
+
+
+def test_batch_delta_after_change_without_animation(session: ClientSession) -> None:
+    from cube.domain.algs import Algs
+    from cube.presentation.gui.backends.webgl.ClientSession import _TurboBatch
+
+    cube = session.app.cube
+    before = extract_cube_state(cube)
+    batch = _TurboBatch(sticker_cells(cube))
+    session._turbo_batch = batch
+
+    session.app.op.play(Algs.scramble(3, seed=4), animation=False)
+    session.add_batched_change()
+    session.app.op.play(Algs.R, animation=False)
+    session.add_batched_animation(Algs.R, 100)
+    session._turbo_batch = None
+
+    assert not batch.all_changed
+    assert _apply_delta(before, batch.moves[0]["delta"])["faces"] == extract_cube_state(cube)["faces"]
+
+
+def test_diff_cube_state_is_sparse(session: ClientSession) -> None:
+    from cube.domain.algs import Algs
+
+    before = extract_cube_state(session.app.cube)
+    session.app.op.play(Algs.R, animation=False)
+    after = extract_cube_state(session.app.cube)
+
+    delta = diff_cube_state(before, after)
+    assert "L" not in delta
+    assert _apply_delta(before, delta)["faces"] == after["faces"]